@@ -0,0 +1,93 @@
+"""Persist per-sample mean, range and standard deviation.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-02-17
+
+Adds sample.mean, sample.range_value and sample.std_dev so chart and
+control limit queries read the sample table only instead of joining
+every measurement row. Existing samples are backfilled in batches.
+"""
+import math
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _statistics(values: list[float]) -> dict:
+    """Mean, range and sample standard deviation (ddof=1) of one sample."""
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return {"mean": mean, "range_value": None, "std_dev": None}
+    variance = sum((v - mean) ** 2 for v in values) / (n - 1)
+    return {
+        "mean": mean,
+        "range_value": max(values) - min(values),
+        "std_dev": math.sqrt(variance),
+    }
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("sample") as batch_op:
+        batch_op.add_column(sa.Column("mean", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("range_value", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("std_dev", sa.Float(), nullable=True))
+
+    # Backfill from measurements, one batch of sample IDs at a time
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        sample_ids = [
+            row[0]
+            for row in conn.execute(
+                sa.text(
+                    "SELECT id FROM sample WHERE id > :last_id ORDER BY id LIMIT :batch"
+                ),
+                {"last_id": last_id, "batch": BACKFILL_BATCH_SIZE},
+            ).fetchall()
+        ]
+        if not sample_ids:
+            break
+
+        values: dict[int, list[float]] = {}
+        rows = conn.execute(
+            sa.text(
+                "SELECT sample_id, value FROM measurement "
+                "WHERE sample_id >= :first_id AND sample_id <= :last_id "
+                "ORDER BY sample_id, id"
+            ),
+            {"first_id": sample_ids[0], "last_id": sample_ids[-1]},
+        ).fetchall()
+        for sample_id, value in rows:
+            values.setdefault(sample_id, []).append(value)
+
+        updates = [
+            {"id": sample_id, **_statistics(sample_values)}
+            for sample_id, sample_values in values.items()
+        ]
+        if updates:
+            conn.execute(
+                sa.text(
+                    "UPDATE sample SET mean = :mean, range_value = :range_value, "
+                    "std_dev = :std_dev WHERE id = :id"
+                ),
+                updates,
+            )
+        last_id = sample_ids[-1]
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sample") as batch_op:
+        batch_op.drop_column("std_dev")
+        batch_op.drop_column("range_value")
+        batch_op.drop_column("mean")
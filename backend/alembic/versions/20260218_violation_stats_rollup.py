@@ -0,0 +1,74 @@
+"""Add violation statistics index and daily violation rollup.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-02-18
+
+Adds a covering index for GROUP BY violation statistics and the
+violation_daily_rollup table (violation count per characteristic, UTC day,
+rule and severity), backfilled from existing violations.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("violation") as batch_op:
+        batch_op.create_index(
+            "ix_violation_stats",
+            ["sample_id", "rule_id", "severity", "acknowledged", "requires_acknowledgement"],
+        )
+
+    op.create_table(
+        "violation_daily_rollup",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "char_id",
+            sa.Integer(),
+            sa.ForeignKey("characteristic.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("rule_id", sa.Integer(), nullable=False),
+        sa.Column("severity", sa.String(20), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.UniqueConstraint(
+            "char_id", "day", "rule_id", "severity", name="uq_violation_daily_rollup_key"
+        ),
+    )
+    op.create_index(
+        "ix_violation_daily_rollup_day", "violation_daily_rollup", ["day"]
+    )
+
+    # Backfill from existing violations, bucketed by UTC day like live inserts
+    conn = op.get_bind()
+    if conn.dialect.name == "sqlite":
+        day = "date(s.timestamp)"
+    elif conn.dialect.name == "postgresql":
+        # Casting timestamptz to DATE uses the session TimeZone, not UTC
+        day = "CAST(timezone('UTC', s.timestamp) AS DATE)"
+    else:
+        day = "CAST(s.timestamp AS DATE)"
+    conn.execute(
+        sa.text(
+            "INSERT INTO violation_daily_rollup (char_id, day, rule_id, severity, count) "
+            f"SELECT s.char_id, {day}, v.rule_id, v.severity, COUNT(*) "
+            "FROM violation v JOIN sample s ON s.id = v.sample_id "
+            f"GROUP BY s.char_id, {day}, v.rule_id, v.severity"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_violation_daily_rollup_day", table_name="violation_daily_rollup")
+    op.drop_table("violation_daily_rollup")
+    with op.batch_alter_table("violation") as batch_op:
+        batch_op.drop_index("ix_violation_stats")
@@ -4,21 +4,25 @@ Provides database sessions, repository instances, and auth dependencies for API
 """
 
 from collections.abc import AsyncGenerator
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from fastapi import Cookie, Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from openspc.core.alerts.manager import AlertManager
+from openspc.core.config import get_settings
 from openspc.db.database import get_session
-from openspc.db.models.user import User, UserPlantRole, UserRole
+from openspc.db.models.user import UserPlantRole, UserRole
 from openspc.db.repositories.characteristic import CharacteristicRepository
 from openspc.db.repositories.hierarchy import HierarchyRepository
 from openspc.db.repositories.sample import SampleRepository
 from openspc.db.repositories.user import UserRepository
 from openspc.db.repositories.violation import ViolationRepository
 
+if TYPE_CHECKING:
+    from openspc.core.auth.principal import Principal
+
 # Role hierarchy for comparison
 ROLE_HIERARCHY = {
     "operator": 1,
@@ -88,7 +92,11 @@ async def get_alert_manager(
     sample_repo: SampleRepository = Depends(get_sample_repo),
 ) -> AlertManager:
     """Get alert manager instance with broadcaster wired."""
-    manager = AlertManager(violation_repo, sample_repo)
+    manager = AlertManager(
+        violation_repo,
+        sample_repo,
+        use_rollup=get_settings().violation_stats_use_rollup,
+    )
     if hasattr(request.app.state, "broadcaster"):
         manager.add_notifier(request.app.state.broadcaster)
     return manager
@@ -97,18 +105,48 @@ async def get_alert_manager(
 # ---------------------------------------------------------------------------
 # Auth dependencies
 # ---------------------------------------------------------------------------
+async def get_principal(user_id: int, session: AsyncSession) -> "Principal | None":
+    """Get the cached Principal snapshot of an active user.
+
+    Loads the user with plant roles only on a cache miss.
+
+    Args:
+        user_id: User ID from the access token.
+        session: Database session.
+
+    Returns:
+        Principal snapshot, or None if the user is missing or inactive.
+    """
+    # Imported here: openspc.core.auth imports this module
+    from openspc.core.auth.principal import Principal, principal_cache
+
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        version = principal_cache.version(user_id)
+        user = await UserRepository(session).get_by_id(user_id)
+        if user is None or not user.is_active:
+            return None
+        principal = Principal.from_user(user)
+        principal_cache.put(principal, version)
+    return principal
+
+
 async def get_current_user(
     authorization: Optional[str] = Header(None),
     session: AsyncSession = Depends(get_db_session),
-) -> User:
+) -> "Principal":
     """Extract and validate the current user from JWT Bearer token.
 
+    The user is served from the principal cache, so most requests do not
+    query the database.
+
     Args:
         authorization: Authorization header value.
         session: Database session.
 
     Returns:
-        Authenticated User object with plant_roles loaded.
+        Principal snapshot of the authenticated user with plant_roles (an
+        immutable stand-in for User; load the User to modify it).
 
     Raises:
         HTTPException: 401 if token is invalid, missing, or user not found.
@@ -131,11 +169,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id = int(payload["sub"])
-    repo = UserRepository(session)
-    user = await repo.get_by_id(user_id)
+    user = await get_principal(int(payload["sub"]), session)
 
-    if user is None or not user.is_active:
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
@@ -146,8 +182,8 @@ async def get_current_user(
 
 
 async def get_current_admin(
-    user: User = Depends(get_current_user),
-) -> User:
+    user: "Principal" = Depends(get_current_user),
+) -> "Principal":
     """Require the current user to be an admin at any plant."""
     for pr in user.plant_roles:
         if pr.role == UserRole.admin:
@@ -160,8 +196,8 @@ async def get_current_admin(
 
 
 async def get_current_engineer(
-    user: User = Depends(get_current_user),
-) -> User:
+    user: "Principal" = Depends(get_current_user),
+) -> "Principal":
     """Require the current user to be at least engineer at any plant."""
     for pr in user.plant_roles:
         if ROLE_HIERARCHY.get(pr.role.value, 0) >= ROLE_HIERARCHY["engineer"]:
@@ -177,7 +213,7 @@ def require_role(min_role: str):
     """Factory that returns a dependency checking if user has >= min_role at any plant."""
     min_level = ROLE_HIERARCHY.get(min_role, 0)
 
-    async def check_role(user: User = Depends(get_current_user)) -> User:
+    async def check_role(user: "Principal" = Depends(get_current_user)) -> "Principal":
         for pr in user.plant_roles:
             if ROLE_HIERARCHY.get(pr.role.value, 0) >= min_level:
                 return user
@@ -192,7 +228,7 @@ def require_role(min_role: str):
 # ---------------------------------------------------------------------------
 # Plant-scoped RBAC helpers
 # ---------------------------------------------------------------------------
-def get_user_role_level_for_plant(user: User, plant_id: int) -> int:
+def get_user_role_level_for_plant(user: "Principal", plant_id: int) -> int:
     """Get the user's effective role level for a specific plant.
 
     Admin users at any plant are treated as admin everywhere.
@@ -215,7 +251,7 @@ def get_user_role_level_for_plant(user: User, plant_id: int) -> int:
     return max_level
 
 
-def check_plant_role(user: User, plant_id: int, min_role: str) -> None:
+def check_plant_role(user: "Principal", plant_id: int, min_role: str) -> None:
     """Verify user has at least min_role for a specific plant. Raises 403 if not."""
     min_level = ROLE_HIERARCHY.get(min_role, 0)
     if get_user_role_level_for_plant(user, plant_id) < min_level:
@@ -232,7 +268,7 @@ async def get_current_user_or_api_key(
 ):
     """Dual auth: try JWT first, fall back to API key.
 
-    Returns either a User object (JWT) or an APIKey object (API key).
+    Returns either a Principal snapshot (JWT) or an APIKey object (API key).
     """
     # Try JWT first
     if authorization and authorization.startswith("Bearer "):
@@ -241,10 +277,8 @@ async def get_current_user_or_api_key(
         token = authorization.split(" ", 1)[1]
         payload = _verify_access(token)
         if payload is not None:
-            user_id = int(payload["sub"])
-            repo = UserRepository(session)
-            user = await repo.get_by_id(user_id)
-            if user and user.is_active:
+            user = await get_principal(int(payload["sub"]), session)
+            if user is not None:
                 return user
 
     # Fall back to API key (lazy import to avoid circular dependency)
@@ -268,23 +302,22 @@ async def resolve_plant_id_for_characteristic(
     characteristic_id: int,
     session: AsyncSession,
 ) -> int:
-    """Resolve the plant_id that a characteristic belongs to via hierarchy."""
-    from sqlalchemy import select as sa_select
+    """Resolve the plant_id that a characteristic belongs to via hierarchy.
 
-    from openspc.db.models.characteristic import Characteristic
-    from openspc.db.models.hierarchy import Hierarchy
+    Served from the characteristic cache, so repeated requests for the same
+    characteristic do not query the database.
+    """
+    from openspc.core.engine.char_cache import characteristic_cache
+    from openspc.db.repositories import CharacteristicRepository
 
-    row = (
-        await session.execute(
-            sa_select(Hierarchy.plant_id)
-            .join(Characteristic, Characteristic.hierarchy_id == Hierarchy.id)
-            .where(Characteristic.id == characteristic_id)
-        )
-    ).scalar_one_or_none()
+    snapshot = await characteristic_cache.get(
+        CharacteristicRepository(session), characteristic_id
+    )
 
-    if row is None:
+    # A characteristic whose hierarchy has no plant cannot be authorized
+    if snapshot is None or snapshot.plant_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Characteristic {characteristic_id} not found",
         )
-    return row
+    return snapshot.plant_id
@@ -9,6 +9,8 @@ from openspc.api.schemas.characteristic import (
     CharacteristicResponse,
     CharacteristicSummary,
     CharacteristicUpdate,
+    ChartDataBatchRequest,
+    ChartDataBatchResponse,
     ChartDataResponse,
     ChartSample,
     ControlLimits,
@@ -65,6 +67,8 @@ __all__ = [
     "CharacteristicUpdate",
     "CharacteristicResponse",
     "CharacteristicSummary",
+    "ChartDataBatchRequest",
+    "ChartDataBatchResponse",
     "ChartDataResponse",
     "ChartSample",
     "ControlLimits",
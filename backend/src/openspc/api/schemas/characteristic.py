@@ -3,6 +3,7 @@
 Schemas for SPC characteristic configuration and chart data.
 """
 
+from datetime import datetime
 from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -240,6 +241,8 @@ class ChartDataResponse(BaseModel):
         subgroup_mode: Subgroup handling mode for this characteristic
         nominal_subgroup_size: Expected/nominal subgroup size
         decimal_precision: Number of decimal places for display formatting
+        total_points: Number of samples matched before downsampling
+        downsampled: Whether data_points is a downsampled subset
     """
 
     characteristic_id: int
@@ -252,6 +255,41 @@ class ChartDataResponse(BaseModel):
     nominal_subgroup_size: int = 1
     decimal_precision: int = 3
     stored_sigma: float | None = None
+    total_points: int = 0
+    downsampled: bool = False
+
+
+class ChartDataBatchRequest(BaseModel):
+    """Schema for fetching chart data of many characteristics at once.
+
+    The window / date range options are shared by all characteristics and
+    behave like the query parameters of the single chart-data endpoint.
+
+    Attributes:
+        characteristic_ids: Characteristics to chart (response keeps this order)
+        limit: Number of recent samples per characteristic
+        start_date: Start date for filtering samples
+        end_date: End date for filtering samples
+        max_points: Downsample each chart to about this many points
+    """
+
+    characteristic_ids: list[int] = Field(..., min_length=1, max_length=100)
+    limit: int = Field(default=100, ge=1, le=1000)
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+    max_points: int | None = Field(default=None, ge=10, le=10000)
+
+
+class ChartDataBatchResponse(BaseModel):
+    """Schema for batched chart data.
+
+    Attributes:
+        charts: Chart data per found characteristic, in request order
+        missing_ids: Requested characteristic IDs that do not exist
+    """
+
+    charts: list[ChartDataResponse]
+    missing_ids: list[int] = Field(default_factory=list)
 
 
 class NelsonRuleConfig(BaseModel):
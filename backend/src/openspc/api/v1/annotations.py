@@ -15,10 +15,10 @@ from openspc.api.schemas.annotation import (
     AnnotationResponse,
     AnnotationUpdate,
 )
+from openspc.core.auth.principal import Principal
 from openspc.db.models.annotation import Annotation, AnnotationHistory
 from openspc.db.models.characteristic import Characteristic
 from openspc.db.models.sample import Sample
-from openspc.db.models.user import User
 
 # TODO: This router shares the /api/v1/characteristics prefix with the main
 # characteristics router. Consider moving annotation routes to a dedicated
@@ -37,7 +37,7 @@ async def list_annotations(
     characteristic_id: int,
     annotation_type: str | None = Query(None, description="Filter by annotation type (point or period)"),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[AnnotationResponse]:
     """List annotations for a characteristic.
 
@@ -84,7 +84,7 @@ async def create_annotation(
     characteristic_id: int,
     data: AnnotationCreate,
     session: AsyncSession = Depends(get_db_session),
-    user: User = Depends(require_role("supervisor")),
+    user: Principal = Depends(require_role("supervisor")),
 ) -> AnnotationResponse:
     """Create an annotation for a characteristic.
 
@@ -181,7 +181,7 @@ async def update_annotation(
     annotation_id: int,
     data: AnnotationUpdate,
     session: AsyncSession = Depends(get_db_session),
-    user: User = Depends(require_role("supervisor")),
+    user: Principal = Depends(require_role("supervisor")),
 ) -> AnnotationResponse:
     """Update an annotation's text or color.
 
@@ -241,7 +241,7 @@ async def delete_annotation(
     characteristic_id: int,
     annotation_id: int,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(require_role("supervisor")),
+    _user: Principal = Depends(require_role("supervisor")),
 ) -> None:
     """Delete an annotation.
 
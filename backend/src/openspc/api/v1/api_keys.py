@@ -1,5 +1,6 @@
 """API Key management endpoints."""
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 
@@ -9,9 +10,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from openspc.api.deps import get_current_admin, get_current_engineer, get_db_session
+from openspc.core.auth.principal import Principal
 from openspc.db.models.api_key import APIKey
-from openspc.db.models.user import User
-from openspc.core.auth.api_key import APIKeyAuth
+from openspc.core.auth.api_key import APIKeyAuth, verified_key_cache
 
 router = APIRouter(prefix="/api/v1/api-keys", tags=["api-keys"])
 
@@ -58,7 +59,7 @@ class APIKeyUpdate(BaseModel):
 @router.get("/", response_model=list[APIKeyResponse])
 async def list_api_keys(
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> list[APIKeyResponse]:
     """List all API keys (without exposing the actual keys)."""
     stmt = select(APIKey).order_by(APIKey.created_at.desc())
@@ -71,7 +72,7 @@ async def list_api_keys(
 async def create_api_key(
     data: APIKeyCreate,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> APIKeyCreateResponse:
     """Create a new API key.
 
@@ -80,7 +81,7 @@ async def create_api_key(
     """
     # Generate a new key
     plain_key = APIKeyAuth.generate_key()
-    key_hash = APIKeyAuth.hash_key(plain_key)
+    key_hash = await asyncio.to_thread(APIKeyAuth.hash_key, plain_key)
 
     # Create the API key record
     api_key = APIKey(
@@ -111,7 +112,7 @@ async def create_api_key(
 async def get_api_key(
     key_id: str,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> APIKeyResponse:
     """Get API key details by ID."""
     stmt = select(APIKey).where(APIKey.id == key_id)
@@ -132,7 +133,7 @@ async def update_api_key(
     key_id: str,
     data: APIKeyUpdate,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> APIKeyResponse:
     """Update API key settings."""
     stmt = select(APIKey).where(APIKey.id == key_id)
@@ -151,6 +152,7 @@ async def update_api_key(
         setattr(api_key, key, value)
 
     await session.commit()
+    verified_key_cache.invalidate(key_id)
     await session.refresh(api_key)
 
     return APIKeyResponse.model_validate(api_key)
@@ -160,7 +162,7 @@ async def update_api_key(
 async def delete_api_key(
     key_id: str,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> None:
     """Delete (revoke) an API key permanently."""
     stmt = select(APIKey).where(APIKey.id == key_id)
@@ -175,13 +177,14 @@ async def delete_api_key(
 
     await session.delete(api_key)
     await session.commit()
+    verified_key_cache.invalidate(key_id)
 
 
 @router.post("/{key_id}/revoke", response_model=APIKeyResponse)
 async def revoke_api_key(
     key_id: str,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> APIKeyResponse:
     """Revoke an API key (set is_active=False) without deleting it."""
     stmt = select(APIKey).where(APIKey.id == key_id)
@@ -196,6 +199,7 @@ async def revoke_api_key(
 
     api_key.is_active = False
     await session.commit()
+    verified_key_cache.invalidate(key_id)
     await session.refresh(api_key)
 
     return APIKeyResponse.model_validate(api_key)
@@ -22,6 +22,7 @@ from openspc.api.schemas.user import (
 )
 from openspc.core.auth.jwt import create_access_token, create_refresh_token, verify_refresh_token
 from openspc.core.auth.passwords import verify_password
+from openspc.core.auth.principal import Principal, principal_cache
 from openspc.core.config import get_settings
 from openspc.db.models.user import User
 from openspc.db.repositories.user import UserRepository
@@ -34,7 +35,7 @@ REFRESH_COOKIE_PATH = "/api/v1/auth"
 REFRESH_COOKIE_KEY = "refresh_token"
 
 
-def _build_user_response(user: User) -> UserWithRolesResponse:
+def _build_user_response(user: User | Principal) -> UserWithRolesResponse:
     """Build a user response with plant roles."""
     plant_roles = []
     for pr in user.plant_roles:
@@ -188,7 +189,7 @@ async def logout(response: Response) -> dict:
 
 @router.get("/me", response_model=UserWithRolesResponse)
 async def get_me(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> UserWithRolesResponse:
     """Get the current authenticated user with all plant roles."""
     return _build_user_response(current_user)
@@ -197,7 +198,7 @@ async def get_me(
 @router.post("/change-password")
 async def change_password(
     data: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_db_session),
 ) -> dict:
     """Change the current user's password.
@@ -205,7 +206,15 @@ async def change_password(
     Verifies the current password, then updates to the new password
     and clears the must_change_password flag.
     """
-    if not verify_password(data.current_password, current_user.hashed_password):
+    # The current user is a cached snapshot; load the model to modify it
+    user = await UserRepository(session).get_by_id(current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found or inactive",
+        )
+
+    if not verify_password(data.current_password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
@@ -218,8 +227,9 @@ async def change_password(
         )
 
     from openspc.core.auth.passwords import hash_password
-    current_user.hashed_password = hash_password(data.new_password)
-    current_user.must_change_password = False
+    user.hashed_password = hash_password(data.new_password)
+    user.must_change_password = False
     await session.commit()
+    principal_cache.invalidate(user.id)
 
     return {"message": "Password changed successfully"}
@@ -23,9 +23,10 @@ from openspc.api.schemas.broker import (
     TopicTreeNodeResponse,
 )
 from openspc.api.schemas.common import PaginatedResponse
+from openspc.core.auth.principal import Principal
+from openspc.core.publish import outbound_broker_cache
 from openspc.db.dialects import encrypt_password, get_encryption_key
 from openspc.db.models.broker import MQTTBroker
-from openspc.db.models.user import User
 from openspc.db.repositories import BrokerRepository
 
 router = APIRouter(prefix="/api/v1/brokers", tags=["brokers"])
@@ -46,7 +47,7 @@ async def list_brokers(
     offset: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> PaginatedResponse[BrokerResponse]:
     """List MQTT broker configurations with optional filtering.
 
@@ -88,7 +89,7 @@ async def create_broker(
     data: BrokerCreate,
     repo: BrokerRepository = Depends(get_broker_repository),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> BrokerResponse:
     """Create a new MQTT broker configuration.
 
@@ -113,6 +114,7 @@ async def create_broker(
 
     broker = await repo.create(**create_data)
     await session.commit()
+    outbound_broker_cache.invalidate()
 
     return BrokerResponse.model_validate(broker)
 
@@ -126,7 +128,7 @@ async def create_broker(
 async def get_all_broker_status(
     plant_id: int | None = Query(None, description="Filter by plant ID"),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> BrokerAllStatesResponse:
     """Get connection status of all configured brokers.
 
@@ -174,7 +176,7 @@ async def get_all_broker_status(
 
 @router.get("/current/status", response_model=BrokerConnectionStatus)
 async def get_current_connection_status(
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> BrokerConnectionStatus:
     """Get status of the currently connected broker.
 
@@ -206,7 +208,7 @@ async def get_current_connection_status(
 
 @router.post("/disconnect", response_model=dict)
 async def disconnect_broker(
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> dict:
     """Disconnect from the current MQTT broker.
 
@@ -222,7 +224,7 @@ async def disconnect_broker(
 @router.post("/test", response_model=BrokerTestResponse)
 async def test_broker_connection(
     data: BrokerTestRequest,
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> BrokerTestResponse:
     """Test connection to an MQTT broker.
 
@@ -278,7 +280,7 @@ async def test_broker_connection(
 async def get_broker(
     broker_id: int,
     repo: BrokerRepository = Depends(get_broker_repository),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> BrokerResponse:
     """Get MQTT broker configuration by ID.
 
@@ -300,7 +302,7 @@ async def update_broker(
     data: BrokerUpdate,
     repo: BrokerRepository = Depends(get_broker_repository),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> BrokerResponse:
     """Update MQTT broker configuration.
 
@@ -336,6 +338,7 @@ async def update_broker(
         setattr(broker, key, value)
 
     await session.commit()
+    outbound_broker_cache.invalidate()
     await session.refresh(broker)
 
     return BrokerResponse.model_validate(broker)
@@ -346,7 +349,7 @@ async def delete_broker(
     broker_id: int,
     repo: BrokerRepository = Depends(get_broker_repository),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> None:
     """Delete MQTT broker configuration.
 
@@ -361,6 +364,7 @@ async def delete_broker(
 
     await session.delete(broker)
     await session.commit()
+    outbound_broker_cache.invalidate()
 
 
 @router.post("/{broker_id}/activate", response_model=BrokerResponse)
@@ -368,7 +372,7 @@ async def activate_broker(
     broker_id: int,
     repo: BrokerRepository = Depends(get_broker_repository),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> BrokerResponse:
     """Set a broker as the active connection.
 
@@ -382,6 +386,7 @@ async def activate_broker(
         )
 
     await session.commit()
+    outbound_broker_cache.invalidate()
     return BrokerResponse.model_validate(broker)
 
 
@@ -389,7 +394,7 @@ async def activate_broker(
 async def get_broker_status(
     broker_id: int,
     repo: BrokerRepository = Depends(get_broker_repository),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> BrokerConnectionStatus:
     """Get connection status for a broker.
 
@@ -433,7 +438,7 @@ async def connect_to_broker(
     broker_id: int,
     repo: BrokerRepository = Depends(get_broker_repository),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> BrokerConnectionStatus:
     """Connect to a specific broker.
 
@@ -453,6 +458,7 @@ async def connect_to_broker(
     # Set as active and connect
     await repo.set_active(broker_id)
     await session.commit()
+    outbound_broker_cache.invalidate()
 
     # Connect via MQTT manager
     success = await mqtt_manager.switch_broker(broker_id, session)
@@ -477,7 +483,7 @@ async def connect_to_broker(
 async def start_discovery(
     broker_id: int,
     repo: BrokerRepository = Depends(get_broker_repository),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> dict:
     """Start topic discovery on a broker.
 
@@ -518,7 +524,7 @@ async def start_discovery(
 async def stop_discovery(
     broker_id: int,
     repo: BrokerRepository = Depends(get_broker_repository),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> dict:
     """Stop topic discovery on a broker."""
     from openspc.mqtt import mqtt_manager
@@ -566,7 +572,7 @@ async def get_topics(
     format: Literal["flat", "tree"] = Query("flat", description="Response format: flat or tree"),
     search: str | None = Query(None, description="Filter topics by substring"),
     repo: BrokerRepository = Depends(get_broker_repository),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> list[DiscoveredTopicResponse] | TopicTreeNodeResponse:
     """Get discovered topics for a broker.
 
@@ -9,11 +9,11 @@ from openspc.api.deps import (
     get_current_engineer,
     get_db_session,
 )
-from openspc.db.models.user import User
 from openspc.api.schemas.characteristic_config import (
     CharacteristicConfigResponse,
     CharacteristicConfigUpdate,
 )
+from openspc.core.auth.principal import Principal
 from openspc.db.repositories.characteristic import CharacteristicRepository
 from openspc.db.repositories.characteristic_config import CharacteristicConfigRepository
 
@@ -32,7 +32,7 @@ async def get_characteristic_config(
     char_id: int,
     config_repo: CharacteristicConfigRepository = Depends(get_config_repo),
     char_repo: CharacteristicRepository = Depends(get_char_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ):
     """Get configuration for a characteristic.
 
@@ -73,7 +73,7 @@ async def update_characteristic_config(
     session: AsyncSession = Depends(get_db_session),
     config_repo: CharacteristicConfigRepository = Depends(get_config_repo),
     char_repo: CharacteristicRepository = Depends(get_char_repo),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ):
     """Create or update configuration for a characteristic.
 
@@ -125,7 +125,7 @@ async def delete_characteristic_config(
     char_id: int,
     session: AsyncSession = Depends(get_db_session),
     config_repo: CharacteristicConfigRepository = Depends(get_config_repo),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ):
     """Delete configuration for a characteristic.
 
@@ -7,7 +7,7 @@ for SPC characteristics.
 from datetime import datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -18,6 +18,8 @@ from openspc.api.schemas.characteristic import (
     CharacteristicCreate,
     CharacteristicResponse,
     CharacteristicUpdate,
+    ChartDataBatchRequest,
+    ChartDataBatchResponse,
     ChartDataResponse,
     ChartSample,
     ControlLimits,
@@ -37,12 +39,14 @@ from openspc.api.deps import (
     resolve_plant_id_for_characteristic,
 )
 from openspc.api.schemas.common import PaginatedResponse, PaginationParams
+from openspc.core.auth.principal import Principal
+from openspc.core.engine.chart_cache import chart_data_cache, etag_matches
 from openspc.core.engine.control_limits import ControlLimitService
 from openspc.core.engine.nelson_rules import NELSON_RULE_IDS
-from openspc.db.models.user import User
 from openspc.core.engine.rolling_window import RollingWindowManager
 from openspc.db.models.characteristic import Characteristic, CharacteristicRule
 from openspc.db.repositories import CharacteristicRepository, SampleRepository
+from openspc.db.repositories.sample import ChartPoint
 
 router = APIRouter(prefix="/api/v1/characteristics", tags=["characteristics"])
 
@@ -68,7 +72,7 @@ async def list_characteristics(
     page: int | None = Query(None, ge=1, description="Page number (1-indexed, alternative to offset)"),
     per_page: int | None = Query(None, ge=1, le=1000, description="Items per page (alternative to limit)"),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> PaginatedResponse[CharacteristicResponse]:
     """List characteristics with filtering and pagination.
 
@@ -197,7 +201,7 @@ async def list_characteristics(
 async def create_characteristic(
     data: CharacteristicCreate,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> CharacteristicResponse:
     """Create a new characteristic.
 
@@ -242,7 +246,7 @@ async def create_characteristic(
 async def get_characteristic(
     char_id: int,
     repo: CharacteristicRepository = Depends(get_characteristic_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> CharacteristicResponse:
     """Get characteristic details by ID."""
     characteristic = await repo.get_with_data_source(char_id)
@@ -261,7 +265,7 @@ async def update_characteristic(
     data: CharacteristicUpdate,
     repo: CharacteristicRepository = Depends(get_characteristic_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> CharacteristicResponse:
     """Update characteristic configuration.
 
@@ -287,6 +291,12 @@ async def update_characteristic(
 
     await session.commit()
 
+    from openspc.core.events import CharacteristicUpdatedEvent, event_bus
+
+    await event_bus.publish(
+        CharacteristicUpdatedEvent(characteristic_id=char_id, changes=update_data)
+    )
+
     # Re-load with data_source relationship
     characteristic = await repo.get_with_data_source(char_id)
 
@@ -300,7 +310,7 @@ async def delete_characteristic(
     char_id: int,
     repo: CharacteristicRepository = Depends(get_characteristic_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> None:
     """Delete characteristic.
 
@@ -319,87 +329,108 @@ async def delete_characteristic(
     plant_id = await resolve_plant_id_for_characteristic(char_id, session)
     check_plant_role(_user, plant_id, "engineer")
 
-    # Check if characteristic has samples
-    sample_repo = SampleRepository(session)
-    samples = await sample_repo.get_by_characteristic(char_id)
-    if samples:
+    # Check if characteristic has samples (count only, no sample rows loaded)
+    from openspc.db.models.sample import Sample as SampleModel
+
+    sample_count = (
+        await session.execute(
+            select(func.count(SampleModel.id)).where(SampleModel.char_id == char_id)
+        )
+    ).scalar_one()
+    if sample_count:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"Cannot delete characteristic {char_id} with {len(samples)} existing samples"
+            detail=f"Cannot delete characteristic {char_id} with {sample_count} existing samples"
         )
 
     # Delete characteristic (will cascade to rules via database)
+    name = characteristic.name
     await session.delete(characteristic)
     await session.commit()
 
+    from openspc.core.events import CharacteristicDeletedEvent, event_bus
 
-@router.get("/{char_id}/chart-data", response_model=ChartDataResponse)
-async def get_chart_data(
-    char_id: int,
-    limit: int = Query(100, ge=1, le=1000, description="Number of recent samples to return"),
-    start_date: datetime | None = Query(None, description="Start date for filtering samples"),
-    end_date: datetime | None = Query(None, description="End date for filtering samples"),
-    repo: CharacteristicRepository = Depends(get_characteristic_repo),
-    sample_repo: SampleRepository = Depends(get_sample_repo),
-    session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
-) -> ChartDataResponse:
-    """Get chart rendering data with samples, limits, and zones.
+    await event_bus.publish(CharacteristicDeletedEvent(characteristic_id=char_id, name=name))
 
-    Returns recent samples with zone classification, control limits,
-    and zone boundaries for chart visualization.
-    """
-    # Get characteristic
-    characteristic = await repo.get_by_id(char_id)
-    if characteristic is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Characteristic {char_id} not found"
-        )
 
-    # If control limits are not defined, return empty chart data
-    if characteristic.ucl is None or characteristic.lcl is None:
-        return ChartDataResponse(
-            characteristic_id=char_id,
-            characteristic_name=characteristic.name,
-            data_points=[],
-            control_limits=ControlLimits(center_line=None, ucl=None, lcl=None),
-            spec_limits=SpecLimits(
-                usl=characteristic.usl,
-                lsl=characteristic.lsl,
-                target=characteristic.target_value,
-            ),
-            zone_boundaries=ZoneBoundaries(
-                plus_1_sigma=None,
-                plus_2_sigma=None,
-                plus_3_sigma=None,
-                minus_1_sigma=None,
-                minus_2_sigma=None,
-                minus_3_sigma=None,
-            ),
-            subgroup_mode=characteristic.subgroup_mode,
-            nominal_subgroup_size=characteristic.subgroup_size,
-            decimal_precision=characteristic.decimal_precision,
-        )
-
-    # Get samples
-    if start_date or end_date:
-        samples = await sample_repo.get_by_characteristic(
-            char_id=char_id,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        # Limit to most recent N samples if exceeded
-        if len(samples) > limit:
-            samples = samples[-limit:]
+def _empty_chart_data(characteristic: Characteristic) -> ChartDataResponse:
+    """Chart data for a characteristic without control limits (no points)."""
+    return ChartDataResponse(
+        characteristic_id=characteristic.id,
+        characteristic_name=characteristic.name,
+        data_points=[],
+        control_limits=ControlLimits(center_line=None, ucl=None, lcl=None),
+        spec_limits=SpecLimits(
+            usl=characteristic.usl,
+            lsl=characteristic.lsl,
+            target=characteristic.target_value,
+        ),
+        zone_boundaries=ZoneBoundaries(
+            plus_1_sigma=None,
+            plus_2_sigma=None,
+            plus_3_sigma=None,
+            minus_1_sigma=None,
+            minus_2_sigma=None,
+            minus_3_sigma=None,
+        ),
+        subgroup_mode=characteristic.subgroup_mode,
+        nominal_subgroup_size=characteristic.subgroup_size,
+        decimal_precision=characteristic.decimal_precision,
+    )
+
+
+def _downsample_chart_points(
+    characteristic: Characteristic,
+    points: list[ChartPoint],
+    max_points: int,
+    violation_sample_ids: set[int],
+) -> list[ChartPoint]:
+    """Downsample chart points, always keeping out-of-control and violation points."""
+    import numpy as np
+    from openspc.utils.downsampling import downsample_indices
+
+    if characteristic.subgroup_mode == "STANDARDIZED":
+        plotted = np.array([p.z_score if p.z_score is not None else 0.0 for p in points])
+        out_of_control = np.abs(plotted) > 3
     else:
-        samples = await sample_repo.get_rolling_window(
-            char_id=char_id,
-            window_size=limit,
-            exclude_excluded=True,
-        )
+        plotted = np.array([p.mean if p.mean is not None else 0.0 for p in points])
+        ucl = np.array([
+            p.effective_ucl if p.effective_ucl is not None else characteristic.ucl
+            for p in points
+        ])
+        lcl = np.array([
+            p.effective_lcl if p.effective_lcl is not None else characteristic.lcl
+            for p in points
+        ])
+        out_of_control = (plotted > ucl) | (plotted < lcl)
+
+    has_violation = np.fromiter(
+        (p.id in violation_sample_ids for p in points), dtype=bool, count=len(points)
+    )
+    selected = downsample_indices(
+        np.arange(len(points)), plotted, max_points, keep=out_of_control | has_violation
+    )
+    return [points[i] for i in selected]
 
+
+def _build_chart_data(
+    characteristic: Characteristic,
+    points: list[ChartPoint],
+    total_points: int,
+    violations_by_sample: dict[int, list],
+    display_keys: dict[int, str],
+) -> ChartDataResponse:
+    """Classify chart points and assemble the chart data response.
+
+    Args:
+        characteristic: Characteristic with control limits set
+        points: Chart points to return (after any downsampling)
+        total_points: Number of samples matched before downsampling
+        violations_by_sample: Violations of the returned samples by sample ID
+        display_keys: YYMMDD-NNN display keys by sample ID
+    """
     import math as _math
+    from openspc.utils.statistics import classify_zone
 
     # Use stored parameters if available (set by recalculate-limits),
     # otherwise derive from control limits for backward compatibility
@@ -427,50 +458,9 @@ async def get_chart_data(
         minus_3_sigma=center_line - 3 * sigma_xbar,
     )
 
-    # Batch-load all violations for all samples in one query (avoids N+1)
-    from openspc.db.repositories import ViolationRepository
-    violation_repo = ViolationRepository(session)
-    sample_ids = [s.id for s in samples]
-    violations_by_sample = await violation_repo.get_by_sample_ids(sample_ids)
-
-    # Convert samples to chart samples
-    from openspc.utils.statistics import classify_zone, calculate_mean_range
-    import numpy as np
-
-    # Compute display keys (YYMMDD-NNN) — count ALL preceding samples per day
-    # (including excluded) so keys match the single-sample endpoint exactly.
-    from openspc.db.models.sample import Sample as SampleModel
-    from sqlalchemy import and_
-
-    _display_keys: dict[int, str] = {}
-    for sample in samples:
-        day_str = sample.timestamp.strftime('%y%m%d')
-        day_start = sample.timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start.replace(hour=23, minute=59, second=59, microsecond=999999)
-        count_stmt = select(func.count()).select_from(
-            select(SampleModel.id).where(
-                and_(
-                    SampleModel.char_id == sample.char_id,
-                    SampleModel.timestamp >= day_start,
-                    SampleModel.timestamp <= day_end,
-                    (SampleModel.timestamp < sample.timestamp)
-                    | (
-                        (SampleModel.timestamp == sample.timestamp)
-                        & (SampleModel.id < sample.id)
-                    ),
-                )
-            ).subquery()
-        )
-        preceding = (await session.execute(count_stmt)).scalar_one()
-        _display_keys[sample.id] = f"{day_str}-{preceding + 1:03d}"
-
     chart_samples = []
-    for sample in samples:
-        values = [m.value for m in sample.measurements]
-        value, range_value = calculate_mean_range(values)
-        std_dev_value: float | None = None
-        if len(values) >= 2:
-            std_dev_value = float(np.std(values, ddof=1))
+    for sample in points:
+        value = sample.mean if sample.mean is not None else 0.0
 
         # Classify zone using shared utility
         zone = classify_zone(value, zones, center_line)
@@ -488,20 +478,20 @@ async def get_chart_data(
             sample_id=sample.id,
             timestamp=sample.timestamp.isoformat(),
             mean=value,
-            range=range_value,
-            std_dev=std_dev_value,
+            range=sample.range_value,
+            std_dev=sample.std_dev,
             excluded=sample.is_excluded,
             violation_ids=violation_ids,
             unacknowledged_violation_ids=unacknowledged_violation_ids,
             violation_rules=violation_rules,
             zone=zone,
-            actual_n=sample.actual_n or len(values),
+            actual_n=sample.actual_n,
             is_undersized=sample.is_undersized,
             effective_ucl=sample.effective_ucl,
             effective_lcl=sample.effective_lcl,
             z_score=sample.z_score,
             display_value=sample.z_score if characteristic.subgroup_mode == "STANDARDIZED" else value,
-            display_key=_display_keys.get(sample.id, ""),
+            display_key=display_keys.get(sample.id, ""),
         ))
 
     control_limits = ControlLimits(
@@ -517,7 +507,7 @@ async def get_chart_data(
     )
 
     return ChartDataResponse(
-        characteristic_id=char_id,
+        characteristic_id=characteristic.id,
         characteristic_name=characteristic.name,
         data_points=chart_samples,
         control_limits=control_limits,
@@ -527,6 +517,219 @@ async def get_chart_data(
         nominal_subgroup_size=characteristic.subgroup_size,
         decimal_precision=characteristic.decimal_precision,
         stored_sigma=characteristic.stored_sigma,
+        total_points=total_points,
+        downsampled=len(chart_samples) < total_points,
+    )
+
+
+@router.post("/chart-data/batch", response_model=ChartDataBatchResponse)
+async def get_chart_data_batch(
+    request: ChartDataBatchRequest,
+    repo: CharacteristicRepository = Depends(get_characteristic_repo),
+    sample_repo: SampleRepository = Depends(get_sample_repo),
+    session: AsyncSession = Depends(get_db_session),
+    _user: Principal = Depends(get_current_user),
+) -> ChartDataBatchResponse:
+    """Get chart data for many characteristics in one request.
+
+    Intended for dashboards showing many control charts at once. The
+    characteristics, their samples, violations and display keys are each
+    fetched with one query (per chunk of IDs), so the number of queries
+    does not grow with the number of charts. Each chart matches what
+    GET /{char_id}/chart-data returns for the same options.
+
+    Example Request:
+        ```json
+        {
+            "characteristic_ids": [1, 2, 3],
+            "limit": 50
+        }
+        ```
+    """
+    from openspc.db.repositories import ViolationRepository
+    violation_repo = ViolationRepository(session)
+
+    char_ids = list(dict.fromkeys(request.characteristic_ids))
+    definitions = await repo.get_definitions(char_ids)
+    characteristics = {
+        char_id: definitions[char_id][0] for char_id in char_ids if char_id in definitions
+    }
+    charted_ids = [
+        char_id for char_id, char in characteristics.items()
+        if char.ucl is not None and char.lcl is not None
+    ]
+
+    # Same sample selection as the single-characteristic endpoint
+    if request.start_date or request.end_date:
+        points_by_char = await sample_repo.get_chart_points_many(
+            charted_ids,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            limit=request.limit if request.max_points is None else None,
+        )
+    else:
+        points_by_char = await sample_repo.get_chart_points_many(
+            charted_ids,
+            limit=request.limit,
+            exclude_excluded=True,
+        )
+    totals = {char_id: len(points) for char_id, points in points_by_char.items()}
+
+    # Downsample long series with one violation query for all of them
+    oversized = [
+        char_id for char_id, points in points_by_char.items()
+        if request.max_points is not None and len(points) > request.max_points
+    ]
+    if oversized:
+        violation_sample_ids = await violation_repo.get_sample_ids_with_violations_many(
+            oversized,
+            start_date=min(points_by_char[c][0].timestamp for c in oversized),
+            end_date=max(points_by_char[c][-1].timestamp for c in oversized),
+        )
+        for char_id in oversized:
+            points_by_char[char_id] = _downsample_chart_points(
+                characteristics[char_id],
+                points_by_char[char_id],
+                request.max_points,
+                violation_sample_ids,
+            )
+
+    all_points = [p for points in points_by_char.values() for p in points]
+    violations_by_sample = await violation_repo.get_by_sample_ids([p.id for p in all_points])
+    display_keys = await sample_repo.get_display_keys(all_points)
+
+    charts = [
+        _build_chart_data(
+            char,
+            points_by_char[char_id],
+            totals[char_id],
+            violations_by_sample,
+            display_keys,
+        )
+        if char_id in points_by_char
+        else _empty_chart_data(char)
+        for char_id, char in characteristics.items()
+    ]
+    return ChartDataBatchResponse(
+        charts=charts,
+        missing_ids=[char_id for char_id in char_ids if char_id not in characteristics],
+    )
+
+
+@router.get("/{char_id}/chart-data", response_model=ChartDataResponse)
+async def get_chart_data(
+    char_id: int,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000, description="Number of recent samples to return"),
+    start_date: datetime | None = Query(None, description="Start date for filtering samples"),
+    end_date: datetime | None = Query(None, description="End date for filtering samples"),
+    max_points: int | None = Query(
+        None,
+        ge=10,
+        le=10000,
+        description=(
+            "Downsample to about this many points; out-of-control and violation "
+            "points are always kept. With a date range, the whole range is returned "
+            "instead of the most recent `limit` samples."
+        ),
+    ),
+    if_none_match: str | None = Header(None),
+    repo: CharacteristicRepository = Depends(get_characteristic_repo),
+    sample_repo: SampleRepository = Depends(get_sample_repo),
+    session: AsyncSession = Depends(get_db_session),
+    _user: Principal = Depends(get_current_user),
+) -> ChartDataResponse:
+    """Get chart rendering data with samples, limits, and zones.
+
+    Returns recent samples with zone classification, control limits,
+    and zone boundaries for chart visualization. With ``max_points``,
+    long series are downsampled server-side (LTTB) while keeping every
+    out-of-control and violation point.
+
+    Responses are cached per characteristic version and carry an ``ETag``;
+    a request whose ``If-None-Match`` matches the current version gets
+    ``304 Not Modified`` without any database query.
+    """
+    params = (limit, start_date, end_date, max_points)
+    version = chart_data_cache.version(char_id)
+    etag = chart_data_cache.etag(char_id, params, version)
+    if etag_matches(if_none_match, etag):
+        chart_data_cache.not_modified += 1
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    chart_data = chart_data_cache.get(char_id, params)
+    if chart_data is None:
+        chart_data = await _load_chart_data(
+            char_id, limit, start_date, end_date, max_points, repo, sample_repo, session
+        )
+        chart_data_cache.put(char_id, params, version, chart_data)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return chart_data
+
+
+async def _load_chart_data(
+    char_id: int,
+    limit: int,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    max_points: int | None,
+    repo: CharacteristicRepository,
+    sample_repo: SampleRepository,
+    session: AsyncSession,
+) -> ChartDataResponse:
+    """Build the chart-data response of one characteristic from the database."""
+    # Get characteristic
+    characteristic = await repo.get_by_id(char_id)
+    if characteristic is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Characteristic {char_id} not found"
+        )
+
+    # If control limits are not defined, return empty chart data
+    if characteristic.ucl is None or characteristic.lcl is None:
+        return _empty_chart_data(characteristic)
+
+    # Get the needed sample columns as plain tuples (no ORM objects and no
+    # measurement rows are needed to draw the chart)
+    if start_date or end_date:
+        points = await sample_repo.get_chart_points(
+            char_id=char_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit if max_points is None else None,
+        )
+    else:
+        points = await sample_repo.get_chart_points(
+            char_id=char_id,
+            limit=limit,
+            exclude_excluded=True,
+        )
+    total_points = len(points)
+
+    from openspc.db.repositories import ViolationRepository
+    violation_repo = ViolationRepository(session)
+
+    # Downsample long series, always keeping out-of-control and violation points
+    if max_points is not None and total_points > max_points:
+        violation_sample_ids = await violation_repo.get_sample_ids_with_violations(
+            char_id, start_date=points[0].timestamp, end_date=points[-1].timestamp
+        )
+        points = _downsample_chart_points(
+            characteristic, points, max_points, violation_sample_ids
+        )
+
+    # Batch-load all violations for the returned samples (avoids N+1)
+    violations_by_sample = await violation_repo.get_by_sample_ids([p.id for p in points])
+
+    # Compute display keys (YYMMDD-NNN) in one query — the per-day sequence
+    # counts ALL samples (including excluded) so keys match the single-sample endpoint.
+    _display_keys = await sample_repo.get_display_keys(points)
+
+    return _build_chart_data(
+        characteristic, points, total_points, violations_by_sample, _display_keys
     )
 
 
@@ -541,7 +744,7 @@ async def recalculate_limits(
     service: ControlLimitService = Depends(get_control_limit_service),
     repo: CharacteristicRepository = Depends(get_characteristic_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> dict:
     """Recalculate control limits from historical data.
 
@@ -617,7 +820,7 @@ async def set_limits(
     repo: CharacteristicRepository = Depends(get_characteristic_repo),
     sample_repo: SampleRepository = Depends(get_sample_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> ControlLimitsResponse:
     """Manually set control limits from an external capability study.
 
@@ -685,7 +888,7 @@ async def set_limits(
 async def get_rules(
     char_id: int,
     repo: CharacteristicRepository = Depends(get_characteristic_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[NelsonRuleConfig]:
     """Get Nelson Rule configuration for characteristic.
 
@@ -727,7 +930,7 @@ async def update_rules(
     rules: list[NelsonRuleConfig],
     repo: CharacteristicRepository = Depends(get_characteristic_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> list[NelsonRuleConfig]:
     """Update Nelson Rule configuration.
 
@@ -767,6 +970,13 @@ async def update_rules(
 
     await session.commit()
 
+    from openspc.core.events import CharacteristicUpdatedEvent, event_bus
+
+    await event_bus.publish(CharacteristicUpdatedEvent(
+        characteristic_id=char_id,
+        changes={"rules": [rule.model_dump() for rule in rules]},
+    ))
+
     # Return updated rules
     await session.refresh(characteristic)
     return [
@@ -786,7 +996,7 @@ async def change_subgroup_mode(
     repo: CharacteristicRepository = Depends(get_characteristic_repo),
     sample_repo: SampleRepository = Depends(get_sample_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> ChangeModeResponse:
     """Change subgroup mode with historical sample migration.
 
@@ -891,6 +1101,13 @@ async def change_subgroup_mode(
     # Commit all changes atomically
     await session.commit()
 
+    from openspc.core.events import CharacteristicUpdatedEvent, event_bus
+
+    await event_bus.publish(CharacteristicUpdatedEvent(
+        characteristic_id=char_id,
+        changes={"subgroup_mode": new_mode},
+    ))
+
     # Re-load with data_source relationship
     characteristic = await repo.get_with_data_source(char_id)
 
@@ -23,10 +23,13 @@ from openspc.api.schemas.data_entry import (
     DataEntryResponse,
     SchemaResponse,
 )
+from openspc.core.engine.char_cache import characteristic_cache
+from openspc.core.engine.chart_cache import chart_data_cache
+from openspc.core.engine.group_commit import sample_writer
 from openspc.core.engine.nelson_rules import NelsonRuleLibrary
 from openspc.core.engine.rolling_window import RollingWindowManager
 from openspc.core.engine.spc_engine import SPCEngine
-from openspc.core.providers.protocol import SampleContext
+from openspc.core.providers.protocol import SampleContext, SampleEvent
 from openspc.db.models.api_key import APIKey
 from openspc.db.repositories import (
     CharacteristicRepository,
@@ -58,6 +61,7 @@ async def get_spc_engine(session: AsyncSession) -> SPCEngine:
         violation_repo=violation_repo,
         window_manager=window_manager,
         rule_library=rule_library,
+        char_cache=characteristic_cache,
     )
 
 
@@ -123,6 +127,9 @@ async def submit_sample(
 
         # Commit the transaction
         await session.commit()
+        # The engine's event may have been handled before the commit
+        chart_data_cache.invalidate(data.characteristic_id)
+        await sample_writer.invalidate(data.characteristic_id)
 
         # Get violations for the sample
         violation_repo = ViolationRepository(session)
@@ -163,7 +170,10 @@ async def submit_sample(
     response_model=BatchEntryResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Submit multiple samples",
-    description="Submit multiple samples in a single request. Each sample is processed independently.",
+    description=(
+        "Submit multiple samples in a single request. "
+        "Samples are validated independently and persisted in bulk."
+    ),
 )
 async def submit_batch(
     data: BatchEntryRequest,
@@ -172,8 +182,10 @@ async def submit_batch(
 ) -> BatchEntryResponse:
     """Submit multiple samples in a single request.
 
-    Processes each sample independently - failures in one sample don't
-    affect others. Returns results for successful samples and error
+    Samples are processed independently - failures in one sample don't
+    affect others. Valid samples are persisted and evaluated through
+    SPCEngine.process_batch(), which groups them by characteristic and uses
+    batched INSERTs. Returns results for successful samples and error
     messages for failed ones.
 
     Args:
@@ -188,61 +200,69 @@ async def submit_batch(
         HTTPException: 401 if API key is invalid.
     """
     engine = await get_spc_engine(session)
-    violation_repo = ViolationRepository(session)
     results: list[DataEntryResponse] = []
     errors: list[str] = []
 
+    # Check permission for each characteristic (API key only), then hand all
+    # permitted samples to the engine as one batch
+    events: list[SampleEvent] = []
+    event_indices: list[int] = []
     for idx, sample in enumerate(data.samples):
-        # Check permission for each characteristic (API key only)
         if isinstance(auth, APIKey) and not auth.can_access_characteristic(sample.characteristic_id):
             errors.append(
                 f"Sample {idx}: No permission for characteristic {sample.characteristic_id}"
             )
             continue
 
-        try:
-            context = SampleContext(
-                batch_number=sample.batch_number,
-                operator_id=sample.operator_id,
-                source="API",
-                metadata=sample.metadata,
-            )
-
-            result = await engine.process_sample(
+        events.append(
+            SampleEvent(
                 characteristic_id=sample.characteristic_id,
                 measurements=sample.measurements,
-                context=context,
+                timestamp=sample.timestamp,
+                context=SampleContext(
+                    batch_number=sample.batch_number,
+                    operator_id=sample.operator_id,
+                    source="API",
+                ),
             )
+        )
+        event_indices.append(idx)
 
-            # Get violations for the sample
-            violations = await violation_repo.get_by_sample(result.sample_id)
-
-            results.append(
-                DataEntryResponse(
-                    sample_id=result.sample_id,
-                    characteristic_id=sample.characteristic_id,
-                    timestamp=result.timestamp,
-                    mean=result.mean,
-                    range_value=result.range_value,
-                    zone=result.zone,
-                    in_control=result.in_control,
-                    violations=[
-                        {
-                            "rule_id": v.rule_id,
-                            "rule_name": v.rule_name,
-                            "severity": v.severity,
-                        }
-                        for v in violations
-                    ],
-                )
-            )
+    # A database error only fails the affected samples
+    batch = await engine.process_batch(events, isolate_failures=True)
 
-        except Exception:
-            logger.exception("Unexpected error processing data entry sample %d", idx)
-            errors.append(f"Sample {idx}: Unexpected error")
+    for pos, idx in enumerate(event_indices):
+        if pos in batch.errors:
+            errors.append(f"Sample {idx}: {batch.errors[pos]}")
+            continue
+
+        result = batch.results[pos]
+        results.append(
+            DataEntryResponse(
+                sample_id=result.sample_id,
+                characteristic_id=result.characteristic_id,
+                timestamp=result.timestamp,
+                mean=result.mean,
+                range_value=result.range_value,
+                zone=result.zone,
+                in_control=result.in_control,
+                violations=[
+                    {
+                        "rule_id": v.rule_id,
+                        "rule_name": v.rule_name,
+                        "severity": v.severity,
+                    }
+                    for v in result.violations
+                ],
+            )
+        )
 
     # Commit all successful samples
     await session.commit()
+    # The engine's events may have been handled before the commit
+    for char_id in {result.characteristic_id for result in batch.results.values()}:
+        chart_data_cache.invalidate(char_id)
+        await sample_writer.invalidate(char_id)
 
     return BatchEntryResponse(
         total=len(data.samples),
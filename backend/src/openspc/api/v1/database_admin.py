@@ -22,6 +22,7 @@ from openspc.api.schemas.database import (
     DatabaseStatusResponse,
     MigrationStatusResponse,
 )
+from openspc.core.auth.principal import Principal
 from openspc.core.rate_limit import limiter
 from openspc.db.database import get_database
 from openspc.db.dialects import (
@@ -35,7 +36,6 @@ from openspc.db.dialects import (
     save_db_config,
     validate_connection_options,
 )
-from openspc.db.models.user import User
 
 logger = structlog.get_logger(__name__)
 audit_log = structlog.get_logger("audit")
@@ -47,7 +47,7 @@ router = APIRouter(prefix="/api/v1/database", tags=["database"])
 @limiter.limit("60/minute")
 async def get_config(
     request: Request,
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> DatabaseConfigResponse:
     """Get current database configuration (password excluded)."""
     config = load_db_config()
@@ -82,7 +82,7 @@ async def get_config(
 async def update_config(
     request: Request,
     data: DatabaseConfigRequest,
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> DatabaseConfigResponse:
     """Update database configuration.
 
@@ -150,7 +150,7 @@ async def update_config(
 async def test_connection(
     request: Request,
     data: ConnectionTestRequest,
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> ConnectionTestResult:
     """Test a database connection without saving configuration.
 
@@ -276,7 +276,7 @@ async def test_connection(
 async def get_status(
     request: Request,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> DatabaseStatusResponse:
     """Get current database status including dialect, version, and migration info."""
     db = get_database()
@@ -392,7 +392,7 @@ async def get_status(
 async def backup_database(
     request: Request,
     backup_dir: str | None = None,
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> dict:
     """Create a database backup.
 
@@ -474,7 +474,7 @@ async def backup_database(
 async def vacuum_database(
     request: Request,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> dict:
     """Run VACUUM/ANALYZE/OPTIMIZE per dialect."""
     db = get_database()
@@ -520,7 +520,7 @@ async def vacuum_database(
 @limiter.limit("60/minute")
 async def get_migration_status(
     request: Request,
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> MigrationStatusResponse:
     """Get migration status: current revision, head revision, pending count."""
     db = get_database()
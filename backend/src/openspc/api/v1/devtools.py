@@ -15,6 +15,9 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from openspc.api.deps import get_current_admin
+from openspc.core.auth.principal import principal_cache
+from openspc.core.engine import characteristic_cache, chart_data_cache, sample_writer
+from openspc.core.hierarchy_cache import hierarchy_path_cache
 from openspc.db.database import get_database, reset_singleton
 
 logger = structlog.get_logger(__name__)
@@ -160,6 +163,12 @@ async def reset_and_seed(body: SeedRequest, user=Depends(get_current_admin)):
         )
     finally:
         root_logger.removeHandler(capture_handler)
+        # User, characteristic and hierarchy IDs are reused by the re-seeded database
+        principal_cache.invalidate_all()
+        characteristic_cache.clear()
+        chart_data_cache.invalidate_all()
+        hierarchy_path_cache.clear()
+        await sample_writer.invalidate_all()
 
     output = log_capture.getvalue()
     logger.info("Seed script completed successfully")
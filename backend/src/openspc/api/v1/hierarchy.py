@@ -19,7 +19,7 @@ from openspc.api.deps import (
     get_db_session,
     get_hierarchy_repo,
 )
-from openspc.db.models.user import User
+from openspc.core.auth.principal import Principal
 from openspc.db.models.characteristic import Characteristic
 from openspc.api.schemas.characteristic import CharacteristicResponse
 from openspc.api.schemas.hierarchy import (
@@ -28,6 +28,7 @@ from openspc.api.schemas.hierarchy import (
     HierarchyTreeNode,
     HierarchyUpdate,
 )
+from openspc.core.hierarchy_cache import hierarchy_path_cache
 from openspc.db.repositories.characteristic import CharacteristicRepository
 from openspc.db.repositories.hierarchy import HierarchyRepository
 from openspc.db.repositories.plant import PlantRepository
@@ -53,11 +54,21 @@ async def validate_plant(
     return plant_id
 
 
+async def _commit_and_invalidate(repo: HierarchyRepository, plant_id: int | None) -> None:
+    """Commit a hierarchy change and drop the plant's cached node map.
+
+    Committing first keeps a concurrent request from re-caching the
+    pre-change names and parents.
+    """
+    await repo.session.commit()
+    hierarchy_path_cache.invalidate(plant_id)
+
+
 @router.get("/", response_model=list[HierarchyTreeNode])
 async def get_hierarchy_tree(
     repo: HierarchyRepository = Depends(get_hierarchy_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[HierarchyTreeNode]:
     """Get full hierarchy as nested tree structure.
 
@@ -124,7 +135,7 @@ async def get_hierarchy_tree(
 async def create_hierarchy_node(
     data: HierarchyCreate,
     repo: HierarchyRepository = Depends(get_hierarchy_repo),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> HierarchyResponse:
     """Create a new hierarchy node.
 
@@ -188,7 +199,7 @@ async def create_hierarchy_node(
 async def get_hierarchy_node(
     node_id: int,
     repo: HierarchyRepository = Depends(get_hierarchy_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> HierarchyResponse:
     """Get a single hierarchy node by ID.
 
@@ -227,7 +238,7 @@ async def update_hierarchy_node(
     node_id: int,
     data: HierarchyUpdate,
     repo: HierarchyRepository = Depends(get_hierarchy_repo),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> HierarchyResponse:
     """Update a hierarchy node.
 
@@ -282,6 +293,8 @@ async def update_hierarchy_node(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Hierarchy node {node_id} not found",
             )
+        # Renames and moves change the paths of the node and its descendants
+        await _commit_and_invalidate(repo, node.plant_id)
         return HierarchyResponse.model_validate(node)
     except IntegrityError:
         logger.exception("Database integrity error in hierarchy operation")
@@ -295,7 +308,7 @@ async def update_hierarchy_node(
 async def delete_hierarchy_node(
     node_id: int,
     repo: HierarchyRepository = Depends(get_hierarchy_repo),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> None:
     """Delete a hierarchy node.
 
@@ -336,6 +349,7 @@ async def delete_hierarchy_node(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hierarchy node {node_id} not found",
         )
+    await _commit_and_invalidate(repo, node.plant_id)
 
 
 @router.get("/{node_id}/characteristics", response_model=list[CharacteristicResponse])
@@ -344,7 +358,7 @@ async def get_node_characteristics(
     include_descendants: bool = False,
     hierarchy_repo: HierarchyRepository = Depends(get_hierarchy_repo),
     char_repo: CharacteristicRepository = Depends(get_characteristic_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[CharacteristicResponse]:
     """Get characteristics under a hierarchy node.
 
@@ -445,7 +459,7 @@ async def get_plant_hierarchy_tree(
     plant_id: int,
     repo: HierarchyRepository = Depends(get_hierarchy_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[HierarchyTreeNode]:
     """Get hierarchy tree for a specific plant.
 
@@ -496,7 +510,7 @@ async def create_plant_hierarchy_node(
     plant_id: int,
     repo: HierarchyRepository = Depends(get_hierarchy_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> HierarchyResponse:
     """Create a hierarchy node in a specific plant.
 
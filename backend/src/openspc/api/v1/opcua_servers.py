@@ -23,9 +23,9 @@ from openspc.api.schemas.opcua_server import (
     OPCUAServerTestResponse,
     OPCUAServerUpdate,
 )
+from openspc.core.auth.principal import Principal
 from openspc.db.dialects import encrypt_password, get_encryption_key
 from openspc.db.models.opcua_server import OPCUAServer
-from openspc.db.models.user import User
 from openspc.db.repositories.opcua_server import OPCUAServerRepository
 
 router = APIRouter(prefix="/api/v1/opcua-servers", tags=["opcua-servers"])
@@ -46,7 +46,7 @@ async def list_opcua_servers(
     offset: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> PaginatedResponse[OPCUAServerResponse]:
     """List OPC-UA server configurations with optional filtering.
 
@@ -86,7 +86,7 @@ async def create_opcua_server(
     data: OPCUAServerCreate,
     repo: OPCUAServerRepository = Depends(get_opcua_server_repository),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> OPCUAServerResponse:
     """Create a new OPC-UA server configuration.
 
@@ -128,7 +128,7 @@ async def create_opcua_server(
 @router.post("/test", response_model=OPCUAServerTestResponse)
 async def test_opcua_connection(
     data: OPCUAServerTestRequest,
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> OPCUAServerTestResponse:
     """Test connection to an OPC-UA server.
 
@@ -188,7 +188,7 @@ async def test_opcua_connection(
 async def get_all_opcua_status(
     plant_id: int | None = Query(None, description="Filter by plant ID"),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> OPCUAAllStatesResponse:
     """Get connection status of all configured OPC-UA servers.
 
@@ -243,7 +243,7 @@ async def get_all_opcua_status(
 async def get_opcua_server(
     server_id: int,
     repo: OPCUAServerRepository = Depends(get_opcua_server_repository),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> OPCUAServerResponse:
     """Get OPC-UA server configuration by ID.
 
@@ -265,7 +265,7 @@ async def update_opcua_server(
     data: OPCUAServerUpdate,
     repo: OPCUAServerRepository = Depends(get_opcua_server_repository),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> OPCUAServerResponse:
     """Update OPC-UA server configuration.
 
@@ -311,7 +311,7 @@ async def delete_opcua_server(
     server_id: int,
     repo: OPCUAServerRepository = Depends(get_opcua_server_repository),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> None:
     """Delete OPC-UA server configuration.
 
@@ -338,7 +338,7 @@ async def connect_opcua_server(
     server_id: int,
     repo: OPCUAServerRepository = Depends(get_opcua_server_repository),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> OPCUAServerConnectionStatus:
     """Connect to a specific OPC-UA server."""
     from openspc.opcua.manager import opcua_manager
@@ -368,7 +368,7 @@ async def connect_opcua_server(
 async def disconnect_opcua_server(
     server_id: int,
     repo: OPCUAServerRepository = Depends(get_opcua_server_repository),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> OPCUAServerConnectionStatus:
     """Disconnect from a specific OPC-UA server."""
     from openspc.opcua.manager import opcua_manager
@@ -398,7 +398,7 @@ async def disconnect_opcua_server(
 async def get_opcua_server_status(
     server_id: int,
     repo: OPCUAServerRepository = Depends(get_opcua_server_repository),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> OPCUAServerConnectionStatus:
     """Get connection status for an OPC-UA server."""
     from openspc.opcua.manager import opcua_manager
@@ -439,7 +439,7 @@ async def browse_opcua_nodes(
     server_id: int,
     parent_node_id: str | None = Query(None, description="Parent node ID to browse children of. Omit for root Objects folder."),
     repo: OPCUAServerRepository = Depends(get_opcua_server_repository),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> list[BrowsedNodeResponse]:
     """Browse OPC-UA server address space.
 
@@ -501,7 +501,7 @@ async def read_opcua_node_value(
     server_id: int,
     node_id: str = Query(..., description="OPC-UA Node ID string (e.g. 'ns=2;i=1234')"),
     repo: OPCUAServerRepository = Depends(get_opcua_server_repository),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> NodeValueResponse:
     """Read current value of an OPC-UA node.
 
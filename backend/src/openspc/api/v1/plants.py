@@ -8,7 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from openspc.api.deps import get_current_user, get_current_admin, get_db_session
 from openspc.api.schemas.plant import PlantCreate, PlantResponse, PlantUpdate
-from openspc.db.models.user import User, UserPlantRole, UserRole
+from openspc.core.auth.principal import Principal, principal_cache
+from openspc.db.models.user import UserPlantRole, UserRole
 from openspc.db.repositories.plant import PlantRepository
 from openspc.db.repositories.user import UserRepository
 
@@ -28,7 +29,7 @@ async def get_plant_repo(
 async def list_plants(
     active_only: bool = Query(False, description="Only return active plants"),
     repo: PlantRepository = Depends(get_plant_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[PlantResponse]:
     """List all plants.
 
@@ -42,7 +43,7 @@ async def list_plants(
 async def create_plant(
     data: PlantCreate,
     repo: PlantRepository = Depends(get_plant_repo),
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
     session: AsyncSession = Depends(get_db_session),
 ) -> PlantResponse:
     """Create a new plant.
@@ -73,7 +74,11 @@ async def create_plant(
         if admin_count > 0:
             logger.info("auto_assigned_admins", count=admin_count, plant=plant.name)
 
-        return PlantResponse.model_validate(plant)
+        response = PlantResponse.model_validate(plant)
+        await session.commit()
+        # Admins gained a role at the new plant
+        principal_cache.invalidate_all()
+        return response
     except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -85,7 +90,7 @@ async def create_plant(
 async def get_plant(
     plant_id: int,
     repo: PlantRepository = Depends(get_plant_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> PlantResponse:
     """Get a plant by ID.
 
@@ -105,7 +110,7 @@ async def update_plant(
     plant_id: int,
     data: PlantUpdate,
     repo: PlantRepository = Depends(get_plant_repo),
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> PlantResponse:
     """Update a plant.
 
@@ -128,7 +133,11 @@ async def update_plant(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Plant {plant_id} not found",
             )
-        return PlantResponse.model_validate(plant)
+        response = PlantResponse.model_validate(plant)
+        await repo.session.commit()
+        # Cached principals carry plant names and codes
+        principal_cache.invalidate_all()
+        return response
     except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -140,7 +149,7 @@ async def update_plant(
 async def delete_plant(
     plant_id: int,
     repo: PlantRepository = Depends(get_plant_repo),
-    _user: User = Depends(get_current_admin),
+    _user: Principal = Depends(get_current_admin),
 ) -> None:
     """Delete a plant.
 
@@ -166,3 +175,6 @@ async def delete_plant(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Plant {plant_id} not found",
         )
+    await repo.session.commit()
+    # Role assignments at the plant were deleted with it
+    principal_cache.invalidate_all()
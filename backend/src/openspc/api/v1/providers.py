@@ -10,7 +10,7 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from openspc.api.deps import get_current_user, get_current_engineer, get_db_session
-from openspc.db.models.user import User
+from openspc.core.auth.principal import Principal
 
 router = APIRouter(prefix="/api/v1/providers", tags=["providers"])
 
@@ -24,6 +24,8 @@ class TagProviderStatusResponse(BaseModel):
     samples_processed: int
     last_sample_time: datetime | None
     error_message: str | None
+    pending_messages: int = 0
+    pending_samples: int = 0
 
 
 class MQTTStatusResponse(BaseModel):
@@ -46,7 +48,7 @@ class ProviderStatusResponse(BaseModel):
 
 @router.get("/status", response_model=ProviderStatusResponse)
 async def get_provider_status(
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> ProviderStatusResponse:
     """Get status of all data providers.
 
@@ -74,6 +76,8 @@ async def get_provider_status(
             samples_processed=tag_state.samples_processed,
             last_sample_time=tag_state.last_sample_time,
             error_message=tag_state.error_message,
+            pending_messages=tag_state.pending_messages,
+            pending_samples=tag_state.pending_samples,
         ),
     )
 
@@ -81,7 +85,7 @@ async def get_provider_status(
 @router.post("/tag/restart", response_model=TagProviderStatusResponse)
 async def restart_tag_provider(
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> TagProviderStatusResponse:
     """Restart the TAG provider.
 
@@ -119,7 +123,7 @@ async def restart_tag_provider(
 @router.post("/tag/refresh", response_model=dict)
 async def refresh_tag_subscriptions(
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> dict:
     """Refresh TAG provider subscriptions.
 
@@ -26,9 +26,9 @@ from openspc.api.schemas.retention import (
     RetentionPolicyResponse,
     RetentionPolicySet,
 )
+from openspc.core.auth.principal import Principal
 from openspc.db.models.characteristic import Characteristic
 from openspc.db.models.hierarchy import Hierarchy
-from openspc.db.models.user import User
 from openspc.db.repositories.purge_history import PurgeHistoryRepository
 from openspc.db.repositories.retention import RetentionRepository
 
@@ -49,7 +49,7 @@ async def get_retention_repo(
 
 async def _resolve_plant_id(
     plant_id: int | None,
-    user: User,
+    user: Principal,
 ) -> int:
     """Resolve plant_id from query parameter or user context.
 
@@ -72,7 +72,7 @@ async def _resolve_plant_id(
 async def get_global_default(
     plant_id: int = Query(..., description="Plant ID"),
     repo: RetentionRepository = Depends(get_retention_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> RetentionPolicyResponse | None:
     """Get the global default retention policy for a plant.
 
@@ -90,7 +90,7 @@ async def set_global_default(
     plant_id: int = Query(..., description="Plant ID"),
     repo: RetentionRepository = Depends(get_retention_repo),
     session: AsyncSession = Depends(get_db_session),
-    user: User = Depends(get_current_engineer),
+    user: Principal = Depends(get_current_engineer),
 ) -> RetentionPolicyResponse:
     """Set the global default retention policy for a plant.
 
@@ -118,7 +118,7 @@ async def get_hierarchy_policy(
     hierarchy_id: int,
     repo: RetentionRepository = Depends(get_retention_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> RetentionPolicyResponse | None:
     """Get the retention override for a hierarchy node.
 
@@ -148,7 +148,7 @@ async def set_hierarchy_policy(
     data: RetentionPolicySet,
     repo: RetentionRepository = Depends(get_retention_repo),
     session: AsyncSession = Depends(get_db_session),
-    user: User = Depends(get_current_engineer),
+    user: Principal = Depends(get_current_engineer),
 ) -> RetentionPolicyResponse:
     """Set a retention override for a hierarchy node. Requires engineer+."""
     hierarchy = (
@@ -180,7 +180,7 @@ async def delete_hierarchy_policy(
     hierarchy_id: int,
     repo: RetentionRepository = Depends(get_retention_repo),
     session: AsyncSession = Depends(get_db_session),
-    user: User = Depends(get_current_engineer),
+    user: Principal = Depends(get_current_engineer),
 ) -> None:
     """Remove a hierarchy-level retention override. Requires engineer+."""
     hierarchy = (
@@ -218,7 +218,7 @@ async def get_characteristic_policy(
     characteristic_id: int,
     repo: RetentionRepository = Depends(get_retention_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> RetentionPolicyResponse | None:
     """Get the retention override for a characteristic.
 
@@ -250,7 +250,7 @@ async def set_characteristic_policy(
     data: RetentionPolicySet,
     repo: RetentionRepository = Depends(get_retention_repo),
     session: AsyncSession = Depends(get_db_session),
-    user: User = Depends(get_current_engineer),
+    user: Principal = Depends(get_current_engineer),
 ) -> RetentionPolicyResponse:
     """Set a retention override for a characteristic. Requires engineer+."""
     plant_id = await resolve_plant_id_for_characteristic(characteristic_id, session)
@@ -275,7 +275,7 @@ async def delete_characteristic_policy(
     characteristic_id: int,
     repo: RetentionRepository = Depends(get_retention_repo),
     session: AsyncSession = Depends(get_db_session),
-    user: User = Depends(get_current_engineer),
+    user: Principal = Depends(get_current_engineer),
 ) -> None:
     """Remove a characteristic-level retention override. Requires engineer+."""
     plant_id = await resolve_plant_id_for_characteristic(characteristic_id, session)
@@ -303,7 +303,7 @@ async def get_effective_policy(
     characteristic_id: int,
     repo: RetentionRepository = Depends(get_retention_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> EffectiveRetentionResponse:
     """Resolve the effective retention policy for a characteristic.
 
@@ -335,7 +335,7 @@ async def list_overrides(
     plant_id: int = Query(..., description="Plant ID"),
     repo: RetentionRepository = Depends(get_retention_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[RetentionOverrideResponse]:
     """List all non-global retention overrides for a plant."""
     overrides = await repo.list_overrides(plant_id)
@@ -389,7 +389,7 @@ async def get_purge_activity(
     plant_id: int = Query(..., description="Plant ID"),
     limit: int = Query(20, ge=1, le=100),
     repo: PurgeHistoryRepository = Depends(get_purge_history_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[PurgeHistoryResponse]:
     """List recent purge runs for a plant."""
     runs = await repo.list_history(plant_id, limit=limit)
@@ -401,7 +401,7 @@ async def get_next_purge(
     plant_id: int = Query(..., description="Plant ID"),
     request: Request = None,
     repo: PurgeHistoryRepository = Depends(get_purge_history_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> NextPurgeResponse:
     """Get info about the next scheduled purge run."""
     purge_engine = getattr(request.app.state, "purge_engine", None)
@@ -426,7 +426,7 @@ async def trigger_purge(
     plant_id: int = Query(..., description="Plant ID"),
     request: Request = None,
     repo: PurgeHistoryRepository = Depends(get_purge_history_repo),
-    user: User = Depends(get_current_admin),
+    user: Principal = Depends(get_current_admin),
 ) -> PurgeHistoryResponse:
     """Manually trigger a purge for a plant. Admin only."""
     check_plant_role(user, plant_id, "admin")
@@ -24,7 +24,6 @@ from openspc.api.deps import (
     require_role,
     resolve_plant_id_for_characteristic,
 )
-from openspc.db.models.user import User
 from openspc.api.schemas.common import PaginatedResponse, PaginationParams
 from openspc.api.schemas.sample import (
     SampleCreate,
@@ -33,17 +32,28 @@ from openspc.api.schemas.sample import (
     SampleUpdate,
     SampleEditHistoryResponse,
 )
+from openspc.core.auth.principal import Principal
+from openspc.core.engine.char_cache import characteristic_cache
+from openspc.core.engine.chart_cache import chart_data_cache
+from openspc.core.engine.group_commit import sample_writer
 from openspc.core.engine.nelson_rules import NelsonRuleLibrary
 from openspc.core.engine.rolling_window import RollingWindowManager
 from openspc.core.engine.spc_engine import SPCEngine
 from openspc.core.providers.manual import ManualProvider
-from openspc.core.providers.protocol import SampleContext
+from openspc.core.providers.protocol import SampleContext, SampleEvent
 from openspc.db.repositories import (
     CharacteristicRepository,
     SampleRepository,
     ViolationRepository,
 )
-from openspc.utils.statistics import calculate_mean_range, calculate_zones, classify_zone, ZoneBoundaries
+from openspc.db.repositories.sample import display_sequence_subquery, format_display_key
+from openspc.utils.statistics import (
+    calculate_mean_range,
+    calculate_sample_statistics,
+    calculate_zones,
+    classify_zone,
+    ZoneBoundaries,
+)
 
 router = APIRouter(prefix="/api/v1/samples", tags=["samples"])
 
@@ -122,6 +132,7 @@ async def get_spc_engine(
         violation_repo=violation_repo,
         window_manager=window_manager,
         rule_library=rule_library,
+        char_cache=characteristic_cache,
     )
 
 
@@ -154,7 +165,7 @@ async def list_samples(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
     sort_dir: str = Query("desc", pattern="^(asc|desc)$", description="Sort direction for timestamp (asc or desc)"),
     sample_repo: SampleRepository = Depends(get_sample_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> PaginatedResponse[SampleResponse]:
     """List samples with filtering and pagination.
 
@@ -196,44 +207,43 @@ async def list_samples(
     count_stmt = select(sa_func.count()).select_from(base_stmt.subquery())
     total = (await sample_repo.session.execute(count_stmt)).scalar_one()
 
-    # Paginate at SQL level
-    paginated_stmt = (
+    order = Sample.timestamp.desc() if sort_dir == "desc" else Sample.timestamp.asc()
+    page_stmt = (
         base_stmt
         .options(
             selectinload(Sample.measurements),
             selectinload(Sample.edit_history),
         )
-        .order_by(Sample.timestamp.desc() if sort_dir == "desc" else Sample.timestamp.asc())
+        .order_by(order)
         .offset(offset)
         .limit(limit)
         .execution_options(populate_existing=True)
     )
-    result = await sample_repo.session.execute(paginated_stmt)
-    paginated_samples = list(result.scalars().all())
-
-    # Compute display keys (YYMMDD-NNN) for paginated samples
-    # For paginated results, compute sequence within day using a count query
-    from sqlalchemy import func as sa_func, and_
-    from openspc.db.models.sample import Sample as SampleModelForKey
-
-    _display_keys: dict[int, str] = {}
-    for sample in paginated_samples:
-        day_str = sample.timestamp.strftime('%y%m%d')
-        day_start = sample.timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day_start.replace(hour=23, minute=59, second=59, microsecond=999999)
-        count_stmt = select(sa_func.count()).select_from(
-            select(SampleModelForKey.id).where(
-                and_(
-                    SampleModelForKey.char_id == sample.char_id,
-                    SampleModelForKey.timestamp >= day_start,
-                    SampleModelForKey.timestamp <= day_end,
-                    (SampleModelForKey.timestamp < sample.timestamp) |
-                    ((SampleModelForKey.timestamp == sample.timestamp) & (SampleModelForKey.id < sample.id))
-                )
-            ).subquery()
+    if characteristic_id is not None:
+        # Paginate at SQL level, computing display keys (YYMMDD-NNN) in the
+        # same query with a per-day ROW_NUMBER() window
+        display_seq = display_sequence_subquery(
+            char_ids=[characteristic_id],
+            start_date=start_date,
+            end_date=end_date,
+        )
+        result = await sample_repo.session.execute(
+            page_stmt
+            .add_columns(display_seq.c.day_seq)
+            .join(display_seq, display_seq.c.id == Sample.id)
         )
-        preceding = (await sample_repo.session.execute(count_stmt)).scalar_one()
-        _display_keys[sample.id] = f"{day_str}-{preceding + 1:03d}"
+        rows = result.all()
+        paginated_samples = [sample for sample, _ in rows]
+        _display_keys = {
+            sample.id: format_display_key(sample.timestamp, day_seq)
+            for sample, day_seq in rows
+        }
+    else:
+        # Unfiltered, the window would number the whole sample table; number
+        # only the page's characteristics and days instead
+        result = await sample_repo.session.execute(page_stmt)
+        paginated_samples = list(result.scalars().all())
+        _display_keys = await sample_repo.get_display_keys(paginated_samples)
 
     # Convert to response models
     response_items = []
@@ -288,7 +298,7 @@ async def submit_sample(
     session: AsyncSession = Depends(get_db_session),
     engine: SPCEngine = Depends(get_spc_engine),
     provider: ManualProvider = Depends(get_manual_provider),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> SampleProcessingResult:
     """Submit a manual sample for SPC processing.
 
@@ -330,6 +340,9 @@ async def submit_sample(
 
         # Commit the transaction
         await session.commit()
+        # The engine's event may have been handled before the commit
+        chart_data_cache.invalidate(data.characteristic_id)
+        await sample_writer.invalidate(data.characteristic_id)
 
         # Convert violations to API response format
         # The violations were already created in the engine
@@ -376,7 +389,7 @@ async def submit_sample(
 async def get_sample(
     sample_id: int,
     sample_repo: SampleRepository = Depends(get_sample_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> SampleResponse:
     """Get a sample by ID with measurements.
 
@@ -406,25 +419,8 @@ async def get_sample(
     mean, range_value = calculate_mean_range(measurements)
 
     # Compute display key (YYMMDD-NNN)
-    from sqlalchemy import func as sa_func, and_, select
-    from openspc.db.models.sample import Sample as SampleModelForKey
-
-    day_str = sample.timestamp.strftime('%y%m%d')
-    day_start = sample.timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
-    day_end = day_start.replace(hour=23, minute=59, second=59, microsecond=999999)
-    count_stmt = select(sa_func.count()).select_from(
-        select(SampleModelForKey.id).where(
-            and_(
-                SampleModelForKey.char_id == sample.char_id,
-                SampleModelForKey.timestamp >= day_start,
-                SampleModelForKey.timestamp <= day_end,
-                (SampleModelForKey.timestamp < sample.timestamp) |
-                ((SampleModelForKey.timestamp == sample.timestamp) & (SampleModelForKey.id < sample.id))
-            )
-        ).subquery()
-    )
-    preceding = (await sample_repo.session.execute(count_stmt)).scalar_one()
-    display_key = f"{day_str}-{preceding + 1:03d}"
+    display_keys = await sample_repo.get_display_keys([sample])
+    display_key = display_keys.get(sample.id, "")
 
     return SampleResponse(
         id=sample.id,
@@ -446,7 +442,7 @@ async def toggle_exclude(
     data: SampleExclude,
     session: AsyncSession = Depends(get_db_session),
     sample_repo: SampleRepository = Depends(get_sample_repo),
-    _user: User = Depends(require_role("supervisor")),
+    _user: Principal = Depends(require_role("supervisor")),
 ) -> SampleResponse:
     """Mark sample as excluded from calculations.
 
@@ -492,6 +488,8 @@ async def toggle_exclude(
         # This ensures the excluded sample is not used in rule evaluation
         window_manager = RollingWindowManager(sample_repo)
         await window_manager.invalidate(sample.char_id)
+        chart_data_cache.invalidate(sample.char_id)
+        await sample_writer.invalidate(sample.char_id)
 
         # Calculate statistics
         measurements = [m.value for m in sample.measurements]
@@ -527,7 +525,7 @@ async def delete_sample(
     session: AsyncSession = Depends(get_db_session),
     sample_repo: SampleRepository = Depends(get_sample_repo),
     window_manager: RollingWindowManager = Depends(get_window_manager),
-    _user: User = Depends(require_role("supervisor")),
+    _user: Principal = Depends(require_role("supervisor")),
 ) -> None:
     """Delete a sample and its measurements permanently.
 
@@ -558,13 +556,17 @@ async def delete_sample(
         check_plant_role(_user, plant_id, "supervisor")
 
         char_id = sample.char_id
+        timestamp = sample.timestamp
 
         # Delete the sample (measurements and violations cascade via FK)
         await session.delete(sample)
+        await ViolationRepository(session).refresh_rollup(char_id, timestamp, timestamp)
         await session.commit()
 
         # Invalidate the rolling window to trigger rebuild
         await window_manager.invalidate(char_id)
+        chart_data_cache.invalidate(char_id)
+        await sample_writer.invalidate(char_id)
 
     except HTTPException:
         await session.rollback()
@@ -587,7 +589,7 @@ async def update_sample(
     char_repo: CharacteristicRepository = Depends(get_char_repo),
     window_manager: RollingWindowManager = Depends(get_window_manager),
     violation_repo: ViolationRepository = Depends(get_violation_repo),
-    _user: User = Depends(require_role("supervisor")),
+    _user: Principal = Depends(require_role("supervisor")),
 ) -> SampleProcessingResult:
     """Update sample measurements and recalculate statistics.
 
@@ -677,8 +679,11 @@ async def update_sample(
         )
         session.add(edit_history)
 
-        # Mark sample as modified
+        # Mark sample as modified and refresh its persisted statistics
         sample.is_modified = True
+        sample.mean, sample.range_value, sample.std_dev = calculate_sample_statistics(
+            data.measurements
+        )
 
         await session.flush()
 
@@ -739,10 +744,14 @@ async def update_sample(
                         )
                     )
 
+        # Old violations were deleted and new ones added directly
+        await violation_repo.refresh_rollup(sample.char_id, sample.timestamp, sample.timestamp)
         await session.commit()
 
         # Invalidate rolling window
         await window_manager.invalidate(sample.char_id)
+        chart_data_cache.invalidate(sample.char_id)
+        await sample_writer.invalidate(sample.char_id)
 
         processing_time_ms = (time.perf_counter() - start_time) * 1000
 
@@ -774,7 +783,7 @@ async def get_sample_edit_history(
     sample_id: int,
     session: AsyncSession = Depends(get_db_session),
     sample_repo: SampleRepository = Depends(get_sample_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[SampleEditHistoryResponse]:
     """Get edit history for a sample.
 
@@ -855,12 +864,13 @@ async def batch_import(
     request: BatchImportRequest,
     session: AsyncSession = Depends(get_db_session),
     engine: SPCEngine = Depends(get_spc_engine),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> BatchImportResult:
     """Batch import samples (for historical data migration).
 
     Import multiple samples in a single transaction. This is useful for
-    migrating historical data or bulk data entry. Optionally skip Nelson
+    migrating historical data or bulk data entry. Samples are persisted with
+    batched INSERTs through SPCEngine.process_batch(). Optionally skip Nelson
     Rule evaluation for performance during large imports.
 
     Accepts a wrapped format: { characteristic_id, samples: [{measurements, timestamp?}], skip_rule_evaluation? }
@@ -879,52 +889,42 @@ async def batch_import(
     plant_id = await resolve_plant_id_for_characteristic(char_id, session)
     check_plant_role(_user, plant_id, "operator")
 
-    skip_rule_evaluation = request.skip_rule_evaluation
     total = len(request.samples)
-    successful = 0
-    failed = 0
     errors: list[str] = []
 
-    for idx, sample_dict in enumerate(request.samples):
-        try:
-            measurements = sample_dict.get("measurements", [])
-            batch_number = sample_dict.get("batch_number")
-            operator_id = sample_dict.get("operator_id")
-
-            if skip_rule_evaluation:
-                # Direct database insertion without rule evaluation
-                sample_repo = SampleRepository(session)
-                await sample_repo.create_with_measurements(
-                    char_id=char_id,
-                    values=measurements,
-                    batch_number=batch_number,
-                    operator_id=operator_id,
-                )
-            else:
-                # Full SPC processing with rule evaluation
-                context = SampleContext(
-                    batch_number=batch_number,
-                    operator_id=operator_id,
+    events: list[SampleEvent] = []
+    for sample_dict in request.samples:
+        timestamp = sample_dict.get("timestamp")
+        if isinstance(timestamp, str):
+            try:
+                timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            except ValueError:
+                timestamp = None
+        events.append(
+            SampleEvent(
+                characteristic_id=char_id,
+                measurements=sample_dict.get("measurements", []),
+                timestamp=timestamp,
+                context=SampleContext(
+                    batch_number=sample_dict.get("batch_number"),
+                    operator_id=sample_dict.get("operator_id"),
                     source="MANUAL",
-                )
-
-                await engine.process_sample(
-                    characteristic_id=char_id,
-                    measurements=measurements,
-                    context=context,
-                )
+                ),
+            )
+        )
 
-            successful += 1
+    # A database error only fails the affected samples
+    batch = await engine.process_batch(
+        events,
+        evaluate_rules=not request.skip_rule_evaluation,
+        isolate_failures=True,
+    )
 
-        except ValueError as e:
-            # SPC engine validation errors are safe to surface (e.g., measurement count mismatch)
-            failed += 1
-            errors.append(f"Sample {idx + 1}: {str(e)}")
-        except Exception:
-            # Unexpected error
-            logger.exception("Unexpected error processing sample %d in batch import", idx + 1)
-            failed += 1
-            errors.append(f"Sample {idx + 1}: Unexpected error")
+    # SPC engine validation errors are safe to surface (e.g., measurement count mismatch)
+    for idx in sorted(batch.errors):
+        errors.append(f"Sample {idx + 1}: {batch.errors[idx]}")
+    successful = batch.successful
+    failed = batch.failed
 
     # Commit all successful samples
     try:
@@ -936,6 +936,8 @@ async def batch_import(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to commit batch import",
         )
+    chart_data_cache.invalidate(char_id)
+    await sample_writer.invalidate(char_id)
 
     return BatchImportResult(
         total=total,
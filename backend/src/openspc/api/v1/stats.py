@@ -0,0 +1,48 @@
+"""Runtime metrics REST endpoint for OpenSPC.
+
+Reports the in-process caches and the ingestion and outbound publishing
+machinery (hit rates, queue depths, pending deadlines, commit groups) so
+operators can tune cache sizes and TTLs and spot backlogs. WebSocket
+fan-out metrics are served separately by ``/api/v1/websocket/stats``.
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, Request
+
+from openspc.api.deps import get_current_admin
+from openspc.core.auth.api_key import verified_key_cache
+from openspc.core.auth.principal import Principal, principal_cache
+from openspc.core.engine import characteristic_cache, chart_data_cache, sample_writer
+from openspc.core.events import event_bus
+from openspc.core.hierarchy_cache import hierarchy_path_cache
+from openspc.core.providers import opcua_provider_manager, tag_provider_manager
+from openspc.core.publish import outbound_broker_cache
+from openspc.mqtt import mqtt_manager
+
+router = APIRouter(prefix="/api/v1/stats", tags=["stats"])
+
+
+@router.get("/")
+async def get_runtime_stats(
+    request: Request,
+    _user: Principal = Depends(get_current_admin),
+) -> dict[str, Any]:
+    """Return cache, event dispatch, ingestion and outbound publishing metrics."""
+    publisher = getattr(request.app.state, "mqtt_publisher", None)
+    return {
+        "caches": {
+            "characteristics": characteristic_cache.get_stats(),
+            "chart_data": chart_data_cache.get_stats(),
+            "hierarchy_paths": hierarchy_path_cache.get_stats(),
+            "api_keys": verified_key_cache.get_stats(),
+            "principals": principal_cache.get_stats(),
+            "outbound_brokers": outbound_broker_cache.get_stats(),
+        },
+        "event_bus": event_bus.get_stats(),
+        "sample_writer": sample_writer.get_stats(),
+        "tag_provider": tag_provider_manager.get_stats(),
+        "opcua_provider": opcua_provider_manager.get_stats(),
+        "mqtt_subscriptions": mqtt_manager.get_stats(),
+        "mqtt_publisher": publisher.get_stats() if publisher is not None else {},
+    }
@@ -21,10 +21,10 @@ from openspc.api.schemas.tag import (
     TagPreviewResponse,
     TagPreviewValue,
 )
+from openspc.core.auth.principal import Principal
 from openspc.db.models.broker import MQTTBroker
 from openspc.db.models.characteristic import Characteristic
 from openspc.db.models.data_source import DataSource, MQTTDataSource
-from openspc.db.models.user import User
 from openspc.db.repositories.data_source import DataSourceRepository
 
 logger = structlog.get_logger(__name__)
@@ -37,7 +37,7 @@ async def list_mappings(
     plant_id: int | None = Query(None, description="Filter by plant ID"),
     broker_id: int | None = Query(None, description="Filter by broker ID"),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> list[TagMappingResponse]:
     """List all MQTT tag-to-characteristic mappings."""
     from openspc.db.models.hierarchy import Hierarchy
@@ -88,7 +88,7 @@ async def list_mappings(
 async def create_mapping(
     data: TagMappingCreate,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> TagMappingResponse:
     """Create or update a tag-to-characteristic mapping.
 
@@ -159,7 +159,7 @@ async def create_mapping(
 async def delete_mapping(
     characteristic_id: int,
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> None:
     """Remove a tag mapping from a characteristic.
 
@@ -187,7 +187,7 @@ async def delete_mapping(
 @router.post("/preview", response_model=TagPreviewResponse)
 async def preview_topic(
     data: TagPreviewRequest,
-    _user: User = Depends(get_current_engineer),
+    _user: Principal = Depends(get_current_engineer),
 ) -> TagPreviewResponse:
     """Preview live values on an MQTT topic.
 
@@ -259,7 +259,7 @@ async def preview_topic(
         await asyncio.sleep(data.duration_seconds)
     finally:
         try:
-            await client.unsubscribe(data.topic)
+            await client.unsubscribe(data.topic, on_preview_message)
         except Exception:
             pass
 
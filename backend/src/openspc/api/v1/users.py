@@ -18,6 +18,7 @@ from openspc.api.schemas.user import (
     UserWithRolesResponse,
 )
 from openspc.core.auth.passwords import hash_password
+from openspc.core.auth.principal import Principal, principal_cache
 from openspc.db.models.user import User, UserRole
 from openspc.db.repositories.user import UserRepository
 
@@ -26,6 +27,16 @@ logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/api/v1/users", tags=["users"])
 
 
+async def _commit_and_invalidate(repo: UserRepository, user_id: int) -> None:
+    """Commit a user or role change and drop the user's cached principal.
+
+    Committing first keeps a concurrent request from re-caching the
+    pre-change roles.
+    """
+    await repo.session.commit()
+    principal_cache.invalidate(user_id)
+
+
 def _build_user_with_roles(user: User) -> UserWithRolesResponse:
     """Build a user response with plant roles."""
     plant_roles = []
@@ -52,7 +63,7 @@ def _build_user_with_roles(user: User) -> UserWithRolesResponse:
 async def list_users(
     search: str = Query(None, description="Search by username or email"),
     active_only: bool = Query(False, description="Only return active users"),
-    current_user: User = Depends(get_current_admin),
+    current_user: Principal = Depends(get_current_admin),
     repo: UserRepository = Depends(get_user_repo),
 ) -> list[UserWithRolesResponse]:
     """List all users with optional filters. Admin only."""
@@ -63,7 +74,7 @@ async def list_users(
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     data: UserCreate,
-    current_user: User = Depends(get_current_admin),
+    current_user: Principal = Depends(get_current_admin),
     repo: UserRepository = Depends(get_user_repo),
 ) -> UserResponse:
     """Create a new user. Admin only."""
@@ -85,7 +96,7 @@ async def create_user(
 @router.get("/{user_id}", response_model=UserWithRolesResponse)
 async def get_user(
     user_id: int,
-    current_user: User = Depends(get_current_admin),
+    current_user: Principal = Depends(get_current_admin),
     repo: UserRepository = Depends(get_user_repo),
 ) -> UserWithRolesResponse:
     """Get a user by ID with plant roles. Admin only."""
@@ -102,7 +113,7 @@ async def get_user(
 async def update_user(
     user_id: int,
     data: UserUpdate,
-    current_user: User = Depends(get_current_admin),
+    current_user: Principal = Depends(get_current_admin),
     repo: UserRepository = Depends(get_user_repo),
 ) -> UserResponse:
     """Update a user. Admin only."""
@@ -130,7 +141,9 @@ async def update_user(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User {user_id} not found",
             )
-        return UserResponse.model_validate(user)
+        response = UserResponse.model_validate(user)
+        await _commit_and_invalidate(repo, user_id)
+        return response
     except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -141,7 +154,7 @@ async def update_user(
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def deactivate_user(
     user_id: int,
-    current_user: User = Depends(get_current_admin),
+    current_user: Principal = Depends(get_current_admin),
     repo: UserRepository = Depends(get_user_repo),
 ) -> None:
     """Deactivate a user (soft delete). Admin only.
@@ -160,12 +173,13 @@ async def deactivate_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User {user_id} not found",
         )
+    await _commit_and_invalidate(repo, user_id)
 
 
 @router.delete("/{user_id}/permanent", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user_permanent(
     user_id: int,
-    current_user: User = Depends(get_current_admin),
+    current_user: Principal = Depends(get_current_admin),
     repo: UserRepository = Depends(get_user_repo),
 ) -> None:
     """Permanently delete a deactivated user. Admin only.
@@ -193,13 +207,14 @@ async def delete_user_permanent(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User {user_id} not found",
         )
+    await _commit_and_invalidate(repo, user_id)
 
 
 @router.post("/{user_id}/roles", response_model=UserWithRolesResponse)
 async def assign_plant_role(
     user_id: int,
     data: PlantRoleAssign,
-    current_user: User = Depends(get_current_admin),
+    current_user: Principal = Depends(get_current_admin),
     repo: UserRepository = Depends(get_user_repo),
 ) -> UserWithRolesResponse:
     """Assign or update a user's role at a plant. Admin only."""
@@ -221,6 +236,7 @@ async def assign_plant_role(
         )
 
     await repo.assign_plant_role(user_id, data.plant_id, role)
+    await _commit_and_invalidate(repo, user_id)
 
     # Reload user with updated roles
     user = await repo.get_by_id(user_id)
@@ -231,7 +247,7 @@ async def assign_plant_role(
 async def remove_plant_role(
     user_id: int,
     plant_id: int,
-    current_user: User = Depends(get_current_admin),
+    current_user: Principal = Depends(get_current_admin),
     repo: UserRepository = Depends(get_user_repo),
 ) -> None:
     """Remove a user's role at a plant. Admin only.
@@ -253,3 +269,4 @@ async def remove_plant_role(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No role assignment found for user {user_id} at plant {plant_id}",
         )
+    await _commit_and_invalidate(repo, user_id)
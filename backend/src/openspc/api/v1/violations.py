@@ -17,8 +17,8 @@ from openspc.api.deps import (
     get_violation_repo,
     resolve_plant_id_for_characteristic,
 )
+from openspc.core.auth.principal import Principal
 from openspc.db.models.sample import Sample
-from openspc.db.models.user import User
 from openspc.api.schemas.common import PaginatedResponse, PaginationParams
 from openspc.api.schemas.violation import (
     AcknowledgeResultItem,
@@ -29,6 +29,9 @@ from openspc.api.schemas.violation import (
     ViolationStats,
 )
 from openspc.core.alerts.manager import AlertManager
+from openspc.core.engine.chart_cache import chart_data_cache
+from openspc.core.engine.group_commit import sample_writer
+from openspc.core.hierarchy_cache import hierarchy_path_cache
 from openspc.db.repositories.violation import ViolationRepository
 from openspc.db.repositories.hierarchy import HierarchyRepository
 
@@ -39,24 +42,14 @@ async def build_hierarchy_path(
     hierarchy_repo: HierarchyRepository, hierarchy_id: int
 ) -> str:
     """Build hierarchy path string like 'Plant > Line > Machine'."""
-    path_parts = []
-    current_id: int | None = hierarchy_id
-
-    while current_id is not None:
-        node = await hierarchy_repo.get_by_id(current_id)
-        if node is None:
-            break
-        path_parts.insert(0, node.name)
-        current_id = node.parent_id
-
-    return " > ".join(path_parts) if path_parts else ""
+    return await hierarchy_path_cache.get_path(hierarchy_repo, hierarchy_id)
 
 
 @router.get("/", response_model=PaginatedResponse[ViolationResponse])
 async def list_violations(
     repo: ViolationRepository = Depends(get_violation_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
     characteristic_id: int | None = None,
     sample_id: int | None = None,
     acknowledged: bool | None = None,
@@ -132,9 +125,15 @@ async def list_violations(
         limit=limit,
     )
 
-    # Build response with characteristic context
-    hierarchy_repo = HierarchyRepository(session)
-    hierarchy_cache: dict[int, str] = {}  # Cache paths to avoid repeated queries
+    # Resolve all hierarchy paths on the page from cached plant node maps
+    hierarchy_paths = await hierarchy_path_cache.get_paths(
+        HierarchyRepository(session),
+        [
+            v.sample.characteristic.hierarchy_id
+            for v in violations
+            if v.sample and v.sample.characteristic
+        ],
+    )
 
     items: list[ViolationResponse] = []
     for v in violations:
@@ -148,12 +147,7 @@ async def list_violations(
             char_id = char.id
             char_name = char.name
 
-            # Build or get cached hierarchy path
-            if char.hierarchy_id not in hierarchy_cache:
-                hierarchy_cache[char.hierarchy_id] = await build_hierarchy_path(
-                    hierarchy_repo, char.hierarchy_id
-                )
-            hierarchy_path = hierarchy_cache[char.hierarchy_id]
+            hierarchy_path = hierarchy_paths.get(char.hierarchy_id, "")
 
         items.append(
             ViolationResponse(
@@ -185,7 +179,7 @@ async def list_violations(
 @router.get("/stats", response_model=ViolationStats)
 async def get_violation_stats(
     manager: AlertManager = Depends(get_alert_manager),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
     characteristic_id: int | None = None,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
@@ -237,7 +231,7 @@ async def get_violation_stats(
 
 @router.get("/reason-codes", response_model=list[str])
 async def get_reason_codes(
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> list[str]:
     """Get list of standard acknowledgment reason codes.
 
@@ -271,7 +265,7 @@ async def get_reason_codes(
 async def get_violation(
     violation_id: int,
     repo: ViolationRepository = Depends(get_violation_repo),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> ViolationResponse:
     """Get violation details.
 
@@ -317,7 +311,7 @@ async def acknowledge_violation(
     manager: AlertManager = Depends(get_alert_manager),
     repo: ViolationRepository = Depends(get_violation_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> ViolationResponse:
     """Acknowledge a violation.
 
@@ -394,6 +388,13 @@ async def acknowledge_violation(
             reason=data.reason,
             exclude_sample=data.exclude_sample,
         )
+        if char_id is not None:
+            # Commit before bumping the chart version so a concurrent chart
+            # request cannot cache the unacknowledged state under it
+            await session.commit()
+            chart_data_cache.invalidate(char_id)
+            if data.exclude_sample:
+                await sample_writer.invalidate(char_id)
 
         # Publish ViolationAcknowledgedEvent to EventBus for MQTT outbound
         from openspc.core.events import event_bus, ViolationAcknowledgedEvent
@@ -430,12 +431,15 @@ async def batch_acknowledge(
     manager: AlertManager = Depends(get_alert_manager),
     repo: ViolationRepository = Depends(get_violation_repo),
     session: AsyncSession = Depends(get_db_session),
-    _user: User = Depends(get_current_user),
+    _user: Principal = Depends(get_current_user),
 ) -> BatchAcknowledgeResult:
     """Acknowledge multiple violations at once.
 
     Processes acknowledgment for multiple violations in a single operation.
     Handles partial success - returns detailed results for each violation.
+    Authorization uses one query for all violations and acknowledgement is
+    a set-based UPDATE, so large batches take a constant number of queries
+    per chunk of IDs.
 
     Args:
         request: Batch acknowledgment request with violation IDs and acknowledgment data
@@ -479,58 +483,58 @@ async def batch_acknowledge(
         }
         ```
     """
-    results: list[AcknowledgeResultItem] = []
-    successful = 0
-    failed = 0
+    # One query (per chunk of IDs) loads what authorization needs
+    context = await repo.get_acknowledgement_context(request.violation_ids)
 
+    results: list[AcknowledgeResultItem] = []
+    to_acknowledge: list[int] = []
+    changed_char_ids: set[int] = set()
+    role_errors: dict[int | None, str | None] = {}
     for violation_id in request.violation_ids:
-        try:
-            # Plant-scoped authorization per violation
-            violation_obj = await repo.get_by_id(violation_id)
-            if violation_obj is None:
-                raise ValueError(f"Violation {violation_id} not found")
-            # Resolve plant via direct query (avoids async lazy-loading)
-            char_id = (await session.execute(
-                select(Sample.char_id).where(Sample.id == violation_obj.sample_id)
-            )).scalar_one_or_none()
-            if char_id is not None:
-                plant_id = await resolve_plant_id_for_characteristic(
-                    char_id, session
-                )
-                check_plant_role(_user, plant_id, "supervisor")
-
-            await manager.acknowledge(
+        error: str | None = None
+        info = context.get(violation_id)
+        if info is None:
+            error = f"Violation {violation_id} not found"
+        else:
+            acknowledged, char_id, plant_id = info
+            # Plant-scoped authorization, checked once per plant
+            if plant_id not in role_errors:
+                try:
+                    check_plant_role(_user, plant_id, "supervisor")
+                    role_errors[plant_id] = None
+                except HTTPException as e:
+                    role_errors[plant_id] = e.detail
+            error = role_errors[plant_id]
+            if error is None and acknowledged:
+                error = f"Violation {violation_id} is already acknowledged"
+
+        if error is None:
+            # Repeated IDs fail as already acknowledged, as they would one by one
+            context[violation_id] = (True, char_id, plant_id)
+            to_acknowledge.append(violation_id)
+            changed_char_ids.add(char_id)
+        results.append(
+            AcknowledgeResultItem(
                 violation_id=violation_id,
-                user=request.user,
-                reason=request.reason,
-                exclude_sample=request.exclude_sample,
-            )
-            results.append(
-                AcknowledgeResultItem(
-                    violation_id=violation_id,
-                    success=True,
-                    error=None,
-                )
-            )
-            successful += 1
-        except HTTPException as e:
-            results.append(
-                AcknowledgeResultItem(
-                    violation_id=violation_id,
-                    success=False,
-                    error=e.detail,
-                )
+                success=error is None,
+                error=error,
             )
-            failed += 1
-        except ValueError as e:
-            results.append(
-                AcknowledgeResultItem(
-                    violation_id=violation_id,
-                    success=False,
-                    error=str(e),
-                )
-            )
-            failed += 1
+        )
+    successful = len(to_acknowledge)
+    failed = len(results) - successful
+
+    if to_acknowledge:
+        await manager.acknowledge_many(
+            to_acknowledge,
+            user=request.user,
+            reason=request.reason,
+            exclude_sample=request.exclude_sample,
+        )
+        await session.commit()
+        for char_id in changed_char_ids:
+            chart_data_cache.invalidate(char_id)
+            if request.exclude_sample:
+                await sample_writer.invalidate(char_id)
 
     # Build frontend-friendly fields
     acknowledged_ids = [r.violation_id for r in results if r.success]
@@ -3,24 +3,130 @@
 This module provides WebSocket endpoints and connection management for real-time
 communication between the server and clients. Clients can subscribe to specific
 characteristics and receive updates about new samples, violations, and acknowledgments.
+
+Broadcasts never wait on clients: each message is serialized once and placed on
+a bounded outbound queue per connection, drained by a dedicated writer task. A
+slow client only fills its own queue, and the configured overflow policy decides
+what happens when it is full.
 """
 
 import asyncio
 import structlog
 import json
 import uuid
+from collections import deque
+from collections.abc import Hashable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from enum import Enum
 from typing import Any
 
-from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
+from openspc.api.deps import get_current_admin
+from openspc.core.auth.principal import Principal
+from openspc.core.config import get_settings
+
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(tags=["websocket"])
 
 
+# Message types where only the latest message per characteristic matters
+# when a client falls behind (used by the COALESCE overflow policy)
+COALESCIBLE_MESSAGE_TYPES = frozenset({"sample", "limits_update"})
+
+# Subscription modes: "live" sends every sample immediately, "batch" buffers
+# sample and violation messages per characteristic and sends one
+# "samples_batch" message per tick
+SUBSCRIPTION_MODES = ("live", "batch")
+
+# A pending batch is flushed early once it holds this many samples
+MAX_BATCH_SAMPLES = 500
+
+# Close code sent to clients disconnected by the DISCONNECT overflow policy
+# (1013 = "Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a connection's outbound queue is full.
+
+    - DROP_OLDEST: discard the oldest queued message
+    - COALESCE: replace the queued message of the same type for the same
+      characteristic (sample / limits updates); otherwise drop the oldest
+    - DISCONNECT: close the slow connection
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+def serialize_message(message: dict[str, Any]) -> str:
+    """Serialize a message once for all recipients (same format as send_json)."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class OutboundQueue:
+    """Bounded FIFO of serialized messages for one connection.
+
+    Each entry carries an optional coalesce key. put() never blocks; when the
+    queue is full the overflow policy is applied and counted.
+
+    Attributes:
+        maxsize: Maximum number of queued messages
+        policy: Overflow policy applied when full
+        dropped: Messages discarded by DROP_OLDEST (or COALESCE fallback)
+        coalesced: Messages replaced by a newer one with the same key
+    """
+
+    def __init__(self, maxsize: int, policy: OverflowPolicy):
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.coalesced = 0
+        self._items: deque[tuple[Hashable | None, str]] = deque()
+        self._not_empty = asyncio.Event()
+
+    def put(self, payload: str, key: Hashable | None = None) -> bool:
+        """Queue a payload, applying the overflow policy if full.
+
+        Args:
+            payload: Serialized message
+            key: Coalesce key (e.g. ("sample", char_id)), or None
+
+        Returns:
+            False if the queue is full and the policy is DISCONNECT, True otherwise
+        """
+        if len(self._items) >= self.maxsize:
+            if self.policy == OverflowPolicy.DISCONNECT:
+                return False
+            if self.policy == OverflowPolicy.COALESCE and key is not None:
+                for i, (queued_key, _) in enumerate(self._items):
+                    if queued_key == key:
+                        self._items[i] = (key, payload)
+                        self.coalesced += 1
+                        return True
+            self._items.popleft()
+            self.dropped += 1
+
+        self._items.append((key, payload))
+        self._not_empty.set()
+        return True
+
+    async def get(self) -> str:
+        """Wait for and remove the oldest payload."""
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._items.popleft()[1]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 @dataclass
 class WSConnection:
     """Represents a WebSocket connection.
@@ -29,13 +135,21 @@ class WSConnection:
         websocket: The FastAPI WebSocket instance
         connected_at: Timestamp when the connection was established
         subscribed_characteristics: Set of characteristic IDs this connection subscribes to
+        batched_characteristics: Subset of subscribed_characteristics in "batch" mode
         last_heartbeat: Timestamp of the last received heartbeat/ping
+        outbound: Bounded queue of serialized messages awaiting delivery
+        writer_task: Task draining the outbound queue to the socket
+        sent: Number of messages delivered by the writer task
     """
 
     websocket: WebSocket
     connected_at: datetime
     subscribed_characteristics: set[int] = field(default_factory=set)
+    batched_characteristics: set[int] = field(default_factory=set)
     last_heartbeat: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    outbound: OutboundQueue | None = None
+    writer_task: asyncio.Task | None = None
+    sent: int = 0
 
 
 class ConnectionManager:
@@ -45,51 +159,88 @@ class ConnectionManager:
     establishment, subscription management, message broadcasting, and cleanup
     of stale connections.
 
+    Broadcasting only enqueues: every connection has its own bounded outbound
+    queue and writer task, so one slow client cannot delay the others or the
+    event bus handler that triggered the broadcast.
+
     Attributes:
         _connections: Mapping of connection IDs to WSConnection instances
         _char_subscribers: Mapping of characteristic IDs to sets of connection IDs
         _heartbeat_interval: Seconds between cleanup checks
         _heartbeat_timeout: Seconds before a connection is considered stale
         _cleanup_task: Background task for connection cleanup
+        _send_queue_size: Capacity of each connection's outbound queue
+        _overflow_policy: Policy applied when an outbound queue is full
     """
 
     def __init__(
         self,
         heartbeat_interval: int = 30,
         heartbeat_timeout: int = 90,
+        send_queue_size: int = 256,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        batch_interval: float = 0.2,
     ):
         """Initialize the connection manager.
 
         Args:
             heartbeat_interval: Seconds between cleanup checks (default: 30)
             heartbeat_timeout: Seconds before considering a connection stale (default: 90)
+            send_queue_size: Outbound messages buffered per connection (default: 256)
+            overflow_policy: Policy when a connection's queue is full (default: drop oldest)
+            batch_interval: Seconds between samples_batch flushes for
+                "batch" mode subscriptions (default: 0.2)
         """
+        if send_queue_size < 1:
+            raise ValueError(f"send_queue_size must be at least 1, got {send_queue_size}")
+
         self._connections: dict[str, WSConnection] = {}
         self._char_subscribers: dict[int, set[str]] = {}
         self._heartbeat_interval = heartbeat_interval
         self._heartbeat_timeout = heartbeat_timeout
         self._cleanup_task: asyncio.Task | None = None
+        self._send_queue_size = send_queue_size
+        self._overflow_policy = OverflowPolicy(overflow_policy)
+
+        # Counters kept across connection lifetimes
+        self._total_sent = 0
+        self._total_dropped = 0
+        self._total_coalesced = 0
+        self._slow_disconnects = 0
+        self._closing_tasks: set[asyncio.Task] = set()
+
+        # Batch-mode buffers: char_id -> {"samples": [...], "violations": [...]}
+        self._batch_interval = batch_interval
+        self._pending_batches: dict[int, dict[str, list[dict[str, Any]]]] = {}
+        self._batch_task: asyncio.Task | None = None
 
     async def start(self) -> None:
         """Start background tasks.
 
-        Launches the cleanup loop that periodically removes stale connections.
+        Launches the cleanup loop that periodically removes stale connections
+        and the loop that flushes batch-mode subscriptions.
         Should be called during application startup.
         """
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        self._batch_task = asyncio.create_task(self._batch_loop())
 
     async def stop(self) -> None:
         """Stop background tasks.
 
-        Cancels the cleanup task and performs any necessary cleanup.
+        Cancels the cleanup task and the per-connection writer tasks.
         Should be called during application shutdown.
         """
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._cleanup_task, self._batch_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        for conn in self._connections.values():
+            if conn.writer_task is not None:
+                conn.writer_task.cancel()
 
     async def connect(self, websocket: WebSocket, connection_id: str) -> None:
         """Accept and register a new WebSocket connection.
@@ -99,10 +250,13 @@ class ConnectionManager:
             connection_id: Unique identifier for this connection
         """
         await websocket.accept()
-        self._connections[connection_id] = WSConnection(
+        conn = WSConnection(
             websocket=websocket,
             connected_at=datetime.now(timezone.utc),
+            outbound=OutboundQueue(self._send_queue_size, self._overflow_policy),
         )
+        conn.writer_task = asyncio.create_task(self._writer_loop(connection_id, conn))
+        self._connections[connection_id] = conn
 
     async def disconnect(self, connection_id: str) -> None:
         """Remove a connection and clean up all subscriptions.
@@ -113,33 +267,77 @@ class ConnectionManager:
         Args:
             connection_id: ID of the connection to remove
         """
-        if connection_id in self._connections:
-            conn = self._connections[connection_id]
-            # Remove from all characteristic subscriptions
-            for char_id in conn.subscribed_characteristics:
-                if char_id in self._char_subscribers:
-                    self._char_subscribers[char_id].discard(connection_id)
-                    # Clean up empty subscriber sets
-                    if not self._char_subscribers[char_id]:
-                        del self._char_subscribers[char_id]
-            del self._connections[connection_id]
-
-    async def subscribe(self, connection_id: str, characteristic_ids: list[int]) -> None:
+        conn = self._remove_connection(connection_id)
+        if conn is None:
+            return
+
+        # Stop the writer (unless the writer itself is disconnecting)
+        task = conn.writer_task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _remove_connection(self, connection_id: str) -> WSConnection | None:
+        """Unregister a connection and its subscriptions without awaiting.
+
+        Args:
+            connection_id: ID of the connection to remove
+
+        Returns:
+            The removed connection, or None if it was not registered
+        """
+        conn = self._connections.pop(connection_id, None)
+        if conn is None:
+            return None
+
+        # Remove from all characteristic subscriptions
+        for char_id in conn.subscribed_characteristics:
+            if char_id in self._char_subscribers:
+                self._char_subscribers[char_id].discard(connection_id)
+                # Clean up empty subscriber sets
+                if not self._char_subscribers[char_id]:
+                    del self._char_subscribers[char_id]
+
+        # Fold per-connection counters into the manager totals
+        if conn.outbound is not None:
+            self._total_dropped += conn.outbound.dropped
+            self._total_coalesced += conn.outbound.coalesced
+        self._total_sent += conn.sent
+        return conn
+
+    async def subscribe(
+        self, connection_id: str, characteristic_ids: list[int], mode: str = "live"
+    ) -> None:
         """Subscribe a connection to updates for specific characteristics.
 
         After subscribing, the connection will receive all messages broadcast
-        to any of the subscribed characteristics.
+        to any of the subscribed characteristics. In "batch" mode, sample and
+        violation messages are delivered as one samples_batch message per
+        characteristic per batch interval instead.
 
         Args:
             connection_id: ID of the connection to subscribe
             characteristic_ids: List of characteristic IDs to subscribe to
+            mode: "live" (default) or "batch"
+
+        Raises:
+            ValueError: If mode is not a known subscription mode
         """
+        if mode not in SUBSCRIPTION_MODES:
+            raise ValueError(f"Unknown subscription mode: {mode}")
         if connection_id not in self._connections:
             return
 
         conn = self._connections[connection_id]
         for char_id in characteristic_ids:
             conn.subscribed_characteristics.add(char_id)
+            if mode == "batch":
+                conn.batched_characteristics.add(char_id)
+            else:
+                conn.batched_characteristics.discard(char_id)
             if char_id not in self._char_subscribers:
                 self._char_subscribers[char_id] = set()
             self._char_subscribers[char_id].add(connection_id)
@@ -160,6 +358,7 @@ class ConnectionManager:
         conn = self._connections[connection_id]
         for char_id in characteristic_ids:
             conn.subscribed_characteristics.discard(char_id)
+            conn.batched_characteristics.discard(char_id)
             if char_id in self._char_subscribers:
                 self._char_subscribers[char_id].discard(connection_id)
                 # Clean up empty subscriber sets
@@ -169,45 +368,216 @@ class ConnectionManager:
     async def broadcast_to_characteristic(self, char_id: int, message: dict[str, Any]) -> None:
         """Send a message to all subscribers of a specific characteristic.
 
-        Dead connections (those that raise exceptions during send) are automatically
-        disconnected and cleaned up.
+        The message is serialized once and queued for each subscriber; this
+        method does not wait for delivery, but yields once so that writer
+        tasks can drain their queues between back-to-back broadcasts. Dead
+        connections (those that raise
+        exceptions during send) are disconnected by their writer task.
+
+        Batch-mode subscribers get sample and violation messages buffered into
+        the characteristic's pending samples_batch; any other message first
+        flushes that batch so ordering is preserved.
 
         Args:
             char_id: ID of the characteristic to broadcast to
             message: Message dictionary to send as JSON
         """
-        if char_id not in self._char_subscribers:
+        subscribers = self._char_subscribers.get(char_id)
+        if not subscribers:
             return
 
-        dead_connections = []
-        for conn_id in self._char_subscribers[char_id]:
-            if conn_id in self._connections:
-                try:
-                    await self._connections[conn_id].websocket.send_json(message)
-                except Exception:
-                    dead_connections.append(conn_id)
+        message_type = message.get("type")
+        live_ids = []
+        has_batched = False
+        for conn_id in subscribers:
+            conn = self._connections.get(conn_id)
+            if conn is not None and char_id in conn.batched_characteristics:
+                has_batched = True
+            else:
+                live_ids.append(conn_id)
+
+        if has_batched:
+            if message_type == "sample":
+                batch = self._pending_batch(char_id)
+                batch["samples"].append(message["sample"])
+                batch["violations"].extend(message.get("violations") or [])
+                if len(batch["samples"]) >= MAX_BATCH_SAMPLES:
+                    self._flush_batch(char_id)
+            elif message_type == "violation":
+                self._pending_batch(char_id)["violations"].append(message["violation"])
+            else:
+                self._flush_batch(char_id)
+                live_ids = list(subscribers)
+
+        if not live_ids:
+            return
+
+        payload = serialize_message(message)
+        key = (message_type, char_id) if message_type in COALESCIBLE_MESSAGE_TYPES else None
+        for conn_id in live_ids:
+            self._enqueue(conn_id, payload, key)
+        # Let writer tasks run so a burst does not overflow healthy clients
+        await asyncio.sleep(0)
 
-        # Clean up dead connections
-        for conn_id in dead_connections:
-            await self.disconnect(conn_id)
+    def _pending_batch(self, char_id: int) -> dict[str, list[dict[str, Any]]]:
+        """Get or create the pending samples_batch buffer for a characteristic."""
+        batch = self._pending_batches.get(char_id)
+        if batch is None:
+            batch = {"samples": [], "violations": []}
+            self._pending_batches[char_id] = batch
+        return batch
+
+    def _flush_batch(self, char_id: int) -> None:
+        """Send a characteristic's pending batch to its batch-mode subscribers.
+
+        The batch is serialized once; samples keep their arrival order and
+        only violations raised since the previous flush are included.
+
+        Args:
+            char_id: ID of the characteristic to flush
+        """
+        batch = self._pending_batches.pop(char_id, None)
+        if batch is None or not (batch["samples"] or batch["violations"]):
+            return
+
+        payload = serialize_message({
+            "type": "samples_batch",
+            "characteristic_id": char_id,
+            "samples": batch["samples"],
+            "violations": batch["violations"],
+        })
+        for conn_id in list(self._char_subscribers.get(char_id, ())):
+            conn = self._connections.get(conn_id)
+            if conn is not None and char_id in conn.batched_characteristics:
+                self._enqueue(conn_id, payload, None)
+
+    def flush_batches(self) -> None:
+        """Flush all pending samples_batch buffers immediately."""
+        for char_id in list(self._pending_batches):
+            self._flush_batch(char_id)
+
+    async def _batch_loop(self) -> None:
+        """Background task that flushes batch-mode buffers every batch interval."""
+        while True:
+            try:
+                await asyncio.sleep(self._batch_interval)
+                self.flush_batches()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.warning("WebSocket batch flush error", exc_info=True)
 
     async def broadcast_to_all(self, message: dict[str, Any]) -> None:
         """Send a message to all connected clients.
 
-        Dead connections are automatically disconnected and cleaned up.
+        The message is serialized once and queued for each connection; dead
+        connections are disconnected by their writer task. Like
+        broadcast_to_characteristic(), yields once after queueing.
 
         Args:
             message: Message dictionary to send as JSON
         """
-        dead_connections = []
-        for conn_id, conn in self._connections.items():
-            try:
-                await conn.websocket.send_json(message)
-            except Exception:
-                dead_connections.append(conn_id)
+        payload = serialize_message(message)
+        for conn_id in list(self._connections):
+            self._enqueue(conn_id, payload, None)
+        await asyncio.sleep(0)
+
+    def _enqueue(self, connection_id: str, payload: str, key: Hashable | None) -> None:
+        """Queue a serialized message for one connection, applying the overflow policy.
+
+        Args:
+            connection_id: Target connection
+            payload: Serialized message
+            key: Coalesce key, or None if the message must not be coalesced
+        """
+        conn = self._connections.get(connection_id)
+        if conn is None or conn.outbound is None:
+            return
+
+        if not conn.outbound.put(payload, key):
+            # DISCONNECT policy: the client cannot keep up
+            logger.warning(
+                "websocket_slow_consumer_disconnected",
+                connection_id=connection_id,
+                queue_size=self._send_queue_size,
+            )
+            self._slow_disconnects += 1
+            self._remove_connection(connection_id)
+            if conn.writer_task is not None:
+                conn.writer_task.cancel()
+            task = asyncio.create_task(
+                self._close_quietly(conn.websocket, SLOW_CONSUMER_CLOSE_CODE)
+            )
+            self._closing_tasks.add(task)
+            task.add_done_callback(self._closing_tasks.discard)
+
+    async def _writer_loop(self, connection_id: str, conn: WSConnection) -> None:
+        """Deliver queued messages to one connection until it fails or is cancelled.
+
+        Args:
+            connection_id: ID of the connection
+            conn: Connection whose outbound queue to drain
+        """
+        assert conn.outbound is not None
+        try:
+            while True:
+                payload = await conn.outbound.get()
+                await conn.websocket.send_text(payload)
+                conn.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug("websocket_send_failed", connection_id=connection_id)
+            await self.disconnect(connection_id)
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket, code: int) -> None:
+        """Close a websocket, ignoring errors from already-closed sockets."""
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        """Wait until every outbound queue has been delivered.
+
+        Intended for tests and graceful shutdown.
 
-        for conn_id in dead_connections:
-            await self.disconnect(conn_id)
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while any(
+            conn.outbound is not None and len(conn.outbound) > 0
+            for conn in self._connections.values()
+        ):
+            if loop.time() >= deadline:
+                return
+            await asyncio.sleep(0.001)
+        # Let writers finish the send they are currently awaiting
+        await asyncio.sleep(0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get outbound queue and delivery metrics.
+
+        Returns:
+            Dictionary with connection count, queue depths and counters for
+            sent, dropped, coalesced messages and slow-consumer disconnects
+        """
+        live = [c for c in self._connections.values() if c.outbound is not None]
+        depths = [len(c.outbound) for c in live]
+        return {
+            "connections": len(self._connections),
+            "overflow_policy": self._overflow_policy.value,
+            "send_queue_size": self._send_queue_size,
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "messages_sent": self._total_sent + sum(c.sent for c in self._connections.values()),
+            "messages_dropped": self._total_dropped + sum(c.outbound.dropped for c in live),
+            "messages_coalesced": self._total_coalesced + sum(c.outbound.coalesced for c in live),
+            "slow_consumer_disconnects": self._slow_disconnects,
+        }
 
     def update_heartbeat(self, connection_id: str) -> None:
         """Update the last heartbeat timestamp for a connection.
@@ -284,7 +654,19 @@ class ConnectionManager:
 # Global connection manager instance
 # In production, you might want to use FastAPI's dependency injection
 # or store this in app.state
-manager = ConnectionManager()
+manager = ConnectionManager(
+    send_queue_size=get_settings().ws_send_queue_size,
+    overflow_policy=OverflowPolicy(get_settings().ws_overflow_policy),
+    batch_interval=get_settings().ws_batch_interval_ms / 1000,
+)
+
+
+@router.get("/api/v1/websocket/stats")
+async def websocket_stats(
+    _user: Principal = Depends(get_current_admin),
+) -> dict[str, Any]:
+    """Return WebSocket fan-out metrics (queue depths, drop counters)."""
+    return manager.get_stats()
 
 
 @router.websocket("/ws/samples")
@@ -300,11 +682,13 @@ async def websocket_endpoint(
     Message Protocol:
         Client -> Server:
             - {"type": "subscribe", "characteristic_ids": [1, 2, 3]}
+            - {"type": "subscribe", "characteristic_ids": [1], "mode": "batch"}
             - {"type": "unsubscribe", "characteristic_ids": [1]}
             - {"type": "ping"}
 
         Server -> Client:
             - {"type": "sample", "characteristic_id": ..., "sample": {...}, "violations": [...]}
+            - {"type": "samples_batch", "characteristic_id": ..., "samples": [...], "violations": [...]}
             - {"type": "violation", "violation": {...}}
             - {"type": "ack_update", "violation_id": ..., ...}
             - {"type": "limits_update", "characteristic_id": ..., ...}
@@ -363,10 +747,19 @@ async def websocket_endpoint(
                 if not isinstance(char_ids, list):
                     char_ids = [char_ids]
 
-                await manager.subscribe(connection_id, char_ids)
+                mode = data.get("mode", "live")
+                if mode not in SUBSCRIPTION_MODES:
+                    await websocket.send_json({
+                        "type": "error",
+                        "message": f"Unknown subscription mode: {mode}"
+                    })
+                    continue
+
+                await manager.subscribe(connection_id, char_ids, mode=mode)
                 await websocket.send_json({
                     "type": "subscribed",
-                    "characteristic_ids": char_ids
+                    "characteristic_ids": char_ids,
+                    "mode": mode,
                 })
 
             # Handle unsubscribe message
@@ -521,6 +914,8 @@ async def notify_acknowledgment(
 __all__ = [
     "router",
     "ConnectionManager",
+    "OutboundQueue",
+    "OverflowPolicy",
     "WSConnection",
     "manager",
     "notify_sample",
@@ -153,6 +153,7 @@ class AlertManager:
         violation_repo: ViolationRepository,
         sample_repo: SampleRepository,
         notifiers: list[AlertNotifier] | None = None,
+        use_rollup: bool = False,
     ):
         """Initialize alert manager.
 
@@ -160,10 +161,13 @@ class AlertManager:
             violation_repo: Repository for violation operations
             sample_repo: Repository for sample operations
             notifiers: Optional list of notifiers for event broadcasting
+            use_rollup: Read whole days of violation statistics from the
+                daily rollup table
         """
         self._violation_repo = violation_repo
         self._sample_repo = sample_repo
         self._notifiers = notifiers or []
+        self._use_rollup = use_rollup
 
     def add_notifier(self, notifier: AlertNotifier) -> None:
         """Add a notifier for alert broadcasting.
@@ -215,11 +219,8 @@ class AlertManager:
         if sample is None:
             raise ValueError(f"Sample {sample_id} not found")
 
-        for result in rule_results:
-            # Only create violations for triggered rules
-            if not result.triggered:
-                continue
-
+        triggered = [result for result in rule_results if result.triggered]
+        for result in triggered:
             # Create violation record
             violation = Violation(
                 sample_id=sample_id,
@@ -231,9 +232,12 @@ class AlertManager:
             self._violation_repo.session.add(violation)
             await self._violation_repo.session.flush()
             await self._violation_repo.session.refresh(violation)
-
             violations.append(violation)
 
+        # Count all of the sample's violations in the daily rollup at once
+        await self._violation_repo.add_to_rollup(violations)
+
+        for violation, result in zip(violations, triggered, strict=True):
             # Broadcast event to all notifiers
             event = ViolationCreated(
                 violation_id=violation.id,
@@ -321,6 +325,53 @@ class AlertManager:
 
         return violation
 
+    async def acknowledge_many(
+        self,
+        violation_ids: list[int],
+        user: str,
+        reason: str,
+        exclude_sample: bool = False,
+    ) -> datetime:
+        """Acknowledge many violations with set-based updates.
+
+        The caller is responsible for having checked that the violations
+        exist, are unacknowledged and may be acknowledged by the user.
+        Notifiers implementing ``notify_violations_acknowledged`` receive all
+        events in one call; others are notified once per violation.
+
+        Args:
+            violation_ids: IDs of the violations to acknowledge
+            user: User performing acknowledgment
+            reason: Reason code or description
+            exclude_sample: If True, mark the associated samples as excluded
+
+        Returns:
+            Acknowledgement timestamp recorded on the violations
+        """
+        ack_timestamp = datetime.now(timezone.utc)
+        await self._violation_repo.acknowledge_many(violation_ids, user, reason, ack_timestamp)
+        if exclude_sample:
+            await self._violation_repo.exclude_samples(violation_ids)
+
+        events = [
+            ViolationAcknowledged(
+                violation_id=violation_id,
+                user=user,
+                reason=reason,
+                timestamp=ack_timestamp,
+            )
+            for violation_id in violation_ids
+        ]
+        for notifier in self._notifiers:
+            notify_many = getattr(notifier, "notify_violations_acknowledged", None)
+            if notify_many is not None:
+                await notify_many(events)
+            else:
+                for event in events:
+                    await notifier.notify_violation_acknowledged(event)
+
+        return ack_timestamp
+
     async def get_unacknowledged_count(
         self, characteristic_id: int | None = None
     ) -> int:
@@ -351,7 +402,9 @@ class AlertManager:
         """Get violation statistics for dashboard.
 
         Provides aggregate statistics including total violations,
-        unacknowledged count, and breakdowns by rule and severity.
+        unacknowledged count, and breakdowns by rule and severity. Counts
+        are aggregated in the database (and from the daily rollup when
+        enabled), so no violation rows are loaded.
 
         Args:
             characteristic_id: Optional ID to filter by characteristic
@@ -366,50 +419,23 @@ class AlertManager:
             >>> print(f"Total: {stats.total}, Unacknowledged: {stats.unacknowledged}")
             >>> print(f"By severity: {stats.by_severity}")
         """
-        from openspc.db.models.sample import Sample
-        from sqlalchemy import and_, select
-
-        # Build query
-        stmt = select(Violation).join(Sample, Violation.sample_id == Sample.id)
-
-        # Apply filters
-        filters = []
-        if characteristic_id is not None:
-            filters.append(Sample.char_id == characteristic_id)
-        if start_date is not None:
-            filters.append(Sample.timestamp >= start_date)
-        if end_date is not None:
-            filters.append(Sample.timestamp <= end_date)
-
-        if filters:
-            stmt = stmt.where(and_(*filters))
-
-        # Execute query
-        result = await self._violation_repo.session.execute(stmt)
-        violations = list(result.scalars().all())
-
-        # Calculate statistics
-        total = len(violations)
-        # Unacknowledged = requires acknowledgement AND not acknowledged
-        unacknowledged = sum(
-            1 for v in violations
-            if not v.acknowledged and v.requires_acknowledgement
-        )
-        # Informational = does NOT require acknowledgement AND not acknowledged
-        informational = sum(
-            1 for v in violations
-            if not v.acknowledged and not v.requires_acknowledgement
+        counts = await self._violation_repo.get_violation_counts(
+            characteristic_id=characteristic_id,
+            start_date=start_date,
+            end_date=end_date,
+            use_rollup=self._use_rollup,
         )
 
-        # Group by rule
+        # Group by rule and by severity
         by_rule: dict[int, int] = {}
-        for v in violations:
-            by_rule[v.rule_id] = by_rule.get(v.rule_id, 0) + 1
-
-        # Group by severity
         by_severity: dict[str, int] = {}
-        for v in violations:
-            by_severity[v.severity] = by_severity.get(v.severity, 0) + 1
+        for (rule_id, severity), count in counts.by_rule_severity.items():
+            by_rule[rule_id] = by_rule.get(rule_id, 0) + count
+            by_severity[severity] = by_severity.get(severity, 0) + count
+
+        total = sum(by_rule.values())
+        unacknowledged = counts.unacknowledged
+        informational = counts.informational
 
         return ViolationStats(
             total=total,
@@ -1,6 +1,11 @@
 """Authentication module for OpenSPC."""
 
-from openspc.core.auth.api_key import APIKeyAuth, verify_api_key
+from openspc.core.auth.api_key import (
+    APIKeyAuth,
+    VerifiedKeyCache,
+    verified_key_cache,
+    verify_api_key,
+)
 from openspc.core.auth.jwt import (
     create_access_token,
     create_refresh_token,
@@ -8,16 +13,23 @@ from openspc.core.auth.jwt import (
     verify_refresh_token,
 )
 from openspc.core.auth.passwords import hash_password, needs_rehash, verify_password
+from openspc.core.auth.principal import Principal, PrincipalCache, principal_cache
 
 __all__ = [
     # API Key auth
     "APIKeyAuth",
+    "VerifiedKeyCache",
+    "verified_key_cache",
     "verify_api_key",
     # JWT auth
     "create_access_token",
     "create_refresh_token",
     "verify_access_token",
     "verify_refresh_token",
+    # Principal cache
+    "Principal",
+    "PrincipalCache",
+    "principal_cache",
     # Password hashing
     "hash_password",
     "verify_password",
@@ -1,17 +1,37 @@
-"""API key authentication for data entry endpoints."""
+"""API key authentication for data entry endpoints.
 
-from datetime import datetime, timezone
-from typing import Optional
+bcrypt verification deliberately costs tens of milliseconds, which caps
+data-entry throughput when line PLCs post many times per second with the
+same key. Successful verifications are therefore remembered for a short
+time in VerifiedKeyCache, keyed by an HMAC of the presented key so the
+plain key is never held in memory. Cache hits still load the key row by
+primary key and re-check that it is active and unexpired, so revocation,
+deactivation and expiry take effect on the next request; the management
+endpoints additionally drop the key's entries. Remaining bcrypt calls run
+in a worker thread so they do not block the event loop.
+"""
+
+import asyncio
+import hashlib
+import hmac
 import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Optional
 
 import bcrypt
+import structlog
 from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from openspc.api.deps import get_db_session
+from openspc.core.cache_stats import hit_stats
 from openspc.db.models.api_key import APIKey
 
+logger = structlog.get_logger(__name__)
+
 
 class APIKeyAuth:
     """API key authentication handler.
@@ -79,6 +99,133 @@ class APIKeyAuth:
         return plain_key[:8]
 
 
+class VerifiedKeyCache:
+    """Size-bounded, short-TTL cache of successful API key verifications.
+
+    Maps an HMAC-SHA256 digest of the presented key (keyed with a random
+    per-process secret) to the matched key's ID and stored hash.
+
+    Args:
+        max_size: Maximum number of cached verifications
+        ttl_seconds: Maximum age of a verification (0 disables the cache)
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float = 60.0) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._secret = secrets.token_bytes(32)
+        self._entries: OrderedDict[bytes, tuple[str, str, float]] = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def configure(
+        self, max_size: int | None = None, ttl_seconds: float | None = None
+    ) -> None:
+        """Update the cache size and TTL and drop all entries.
+
+        Args:
+            max_size: Maximum number of cached verifications
+            ttl_seconds: Maximum age of a verification (0 disables the cache)
+        """
+        if max_size is not None:
+            self.max_size = max_size
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds
+        self.clear()
+
+    def _digest(self, plain_key: str) -> bytes:
+        """Keyed fast hash of a presented key."""
+        return hmac.new(self._secret, plain_key.encode("utf-8"), hashlib.sha256).digest()
+
+    def get(self, plain_key: str) -> tuple[str, str] | None:
+        """Return the verified key for a presented key, if cached and fresh.
+
+        Args:
+            plain_key: API key from the request header
+
+        Returns:
+            Tuple of (key ID, key hash at verification time), or None
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        digest = self._digest(plain_key)
+        entry = self._entries.get(digest)
+        if entry is not None:
+            key_id, key_hash, verified_at = entry
+            if time.monotonic() - verified_at < self.ttl_seconds:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return key_id, key_hash
+            del self._entries[digest]
+        self.misses += 1
+        return None
+
+    def put(self, plain_key: str, key_id: str, key_hash: str) -> None:
+        """Remember a successful verification.
+
+        Args:
+            plain_key: API key from the request header
+            key_id: ID of the matched key
+            key_hash: Stored bcrypt hash the key was verified against
+        """
+        if self.ttl_seconds <= 0:
+            return
+        digest = self._digest(plain_key)
+        self._entries[digest] = (key_id, key_hash, time.monotonic())
+        self._entries.move_to_end(digest)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key_id: str) -> None:
+        """Drop all verifications of an API key.
+
+        Args:
+            key_id: ID of the revoked, updated or deleted key
+        """
+        stale = [digest for digest, entry in self._entries.items() if entry[0] == key_id]
+        for digest in stale:
+            del self._entries[digest]
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached verifications."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            **hit_stats(self.hits, self.misses),
+            "invalidations": self.invalidations,
+        }
+
+
+# Global cache shared by API key authenticated requests
+verified_key_cache = VerifiedKeyCache()
+
+
+async def _get_cached_key(session: AsyncSession, plain_key: str) -> Optional[APIKey]:
+    """Load the key of a cached verification if it is still usable.
+
+    Entries whose key was deleted, deactivated or re-hashed are dropped.
+    """
+    cached = verified_key_cache.get(plain_key)
+    if cached is None:
+        return None
+    key_id, key_hash = cached
+    api_key = await session.get(APIKey, key_id)
+    if api_key is None or not api_key.is_active or api_key.key_hash != key_hash:
+        verified_key_cache.invalidate(key_id)
+        return None
+    return api_key
+
+
 async def verify_api_key(
     x_api_key: str = Header(..., alias="X-API-Key"),
     session: AsyncSession = Depends(get_db_session),
@@ -86,7 +233,9 @@ async def verify_api_key(
     """FastAPI dependency to verify API key from header.
 
     Validates the API key from the X-API-Key header against stored keys.
-    Updates last_used_at on successful authentication.
+    Recently verified keys skip bcrypt (see VerifiedKeyCache) but are still
+    re-checked for being active and unexpired. Updates last_used_at on
+    successful authentication.
 
     Args:
         x_api_key: API key from X-API-Key header.
@@ -98,6 +247,32 @@ async def verify_api_key(
     Raises:
         HTTPException: 401 if key is invalid, expired, or inactive.
     """
+    matched_key = await _get_cached_key(session, x_api_key)
+    if matched_key is None:
+        matched_key = await _verify_uncached(session, x_api_key)
+
+    # Check expiration
+    if matched_key.is_expired():
+        verified_key_cache.invalidate(matched_key.id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="API key has expired",
+            headers={"WWW-Authenticate": "ApiKey"},
+        )
+
+    # Update last_used_at timestamp
+    matched_key.last_used_at = datetime.now(timezone.utc)
+    await session.flush()
+
+    return matched_key
+
+
+async def _verify_uncached(session: AsyncSession, x_api_key: str) -> APIKey:
+    """Find the active key matching a presented key using bcrypt.
+
+    Raises:
+        HTTPException: 401 if no active key matches.
+    """
     # Use key prefix for O(1) candidate narrowing when available
     prefix = APIKeyAuth.extract_prefix(x_api_key)
     stmt = select(APIKey).where(APIKey.is_active == True)  # noqa: E712
@@ -113,10 +288,10 @@ async def verify_api_key(
         fallback_result = await session.execute(fallback_stmt)
         api_keys = list(fallback_result.scalars().all())
 
-    # Verify against candidate(s) using bcrypt
+    # Verify against candidate(s) using bcrypt, off the event loop
     matched_key: Optional[APIKey] = None
     for api_key in api_keys:
-        if APIKeyAuth.verify_key(x_api_key, api_key.key_hash):
+        if await asyncio.to_thread(APIKeyAuth.verify_key, x_api_key, api_key.key_hash):
             # Backfill prefix if missing (one-time migration)
             if api_key.key_prefix is None:
                 api_key.key_prefix = prefix
@@ -124,22 +299,12 @@ async def verify_api_key(
             break
 
     if matched_key is None:
+        logger.debug("api_key_rejected", prefix=prefix, candidates=len(api_keys))
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    # Check expiration
-    if matched_key.is_expired():
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="API key has expired",
-            headers={"WWW-Authenticate": "ApiKey"},
-        )
-
-    # Update last_used_at timestamp
-    matched_key.last_used_at = datetime.now(timezone.utc)
-    await session.flush()
-
+    verified_key_cache.put(x_api_key, matched_key.id, matched_key.key_hash)
     return matched_key
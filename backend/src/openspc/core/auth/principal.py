@@ -0,0 +1,226 @@
+"""Authenticated principal snapshots and their in-process cache.
+
+Every JWT-authenticated request used to load the User with its plant roles
+from the database. Dashboards poll many endpoints per second, so
+get_current_user instead resolves the token's user ID to an immutable
+Principal snapshot cached by PrincipalCache. Authorization helpers such as
+check_plant_role only read ``id``, ``username`` and ``plant_roles``, which
+the snapshot provides without a query.
+
+Each user has a principal version that invalidate() bumps whenever the
+user, its roles or its plant assignments change. A snapshot is only stored
+if the version it was loaded under is still current, so a lookup racing an
+invalidation cannot cache stale roles. A TTL bounds staleness for changes
+made by other processes.
+
+Example:
+    >>> version = principal_cache.version(user.id)
+    >>> principal = principal_cache.get(user.id)
+    >>> if principal is None:
+    ...     principal = Principal.from_user(await repo.get_by_id(user.id))
+    ...     principal_cache.put(principal, version)
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+import structlog
+
+from openspc.core.cache_stats import hit_stats
+from openspc.db.models.user import User, UserRole
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PlantSnapshot:
+    """Name and code of a plant a user is assigned to."""
+
+    name: str
+    code: str
+
+
+@dataclass(frozen=True)
+class PlantRoleSnapshot:
+    """A user's role at one plant."""
+
+    plant_id: int
+    role: UserRole
+    plant: Optional[PlantSnapshot] = None
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Immutable snapshot of an authenticated user and its plant roles.
+
+    Exposes the User attributes endpoints read, so it can be used wherever
+    the current user is needed. Endpoints that modify the user must load
+    the User model instead.
+    """
+
+    id: int
+    username: str
+    email: Optional[str]
+    is_active: bool
+    must_change_password: bool
+    created_at: datetime
+    updated_at: datetime
+    plant_roles: tuple[PlantRoleSnapshot, ...]
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Build a snapshot of a user loaded with plant roles and plants.
+
+        Args:
+            user: User with ``plant_roles`` and their ``plant`` loaded
+
+        Returns:
+            Principal snapshot
+        """
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=user.is_active,
+            must_change_password=user.must_change_password,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            plant_roles=tuple(
+                PlantRoleSnapshot(
+                    plant_id=pr.plant_id,
+                    role=pr.role,
+                    plant=(
+                        PlantSnapshot(name=pr.plant.name, code=pr.plant.code)
+                        if pr.plant else None
+                    ),
+                )
+                for pr in user.plant_roles
+            ),
+        )
+
+
+class PrincipalCache:
+    """LRU cache of Principal snapshots with per-user versions.
+
+    Args:
+        max_size: Maximum number of cached principals
+        ttl_seconds: Maximum age of a snapshot (0 disables the cache)
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float = 60.0) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._versions: dict[int, int] = {}
+        self._generation = 0
+        self._entries: OrderedDict[int, tuple[int, Principal, float]] = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def configure(
+        self, max_size: int | None = None, ttl_seconds: float | None = None
+    ) -> None:
+        """Update the cache size and TTL and drop all entries.
+
+        Args:
+            max_size: Maximum number of cached principals
+            ttl_seconds: Maximum age of a snapshot (0 disables the cache)
+        """
+        if max_size is not None:
+            self.max_size = max_size
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds
+        self.clear()
+
+    def version(self, user_id: int) -> int:
+        """Return the current principal version of a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Version counter (0 until the first invalidation); bumped by
+            both invalidate() and invalidate_all()
+        """
+        return self._generation + self._versions.get(user_id, 0)
+
+    def get(self, user_id: int) -> Principal | None:
+        """Return the cached principal of a user if current and fresh.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Cached Principal, or None on a miss
+        """
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            version, principal, loaded_at = entry
+            if (
+                version == self.version(user_id)
+                and time.monotonic() - loaded_at < self.ttl_seconds
+            ):
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return principal
+            del self._entries[user_id]
+        self.misses += 1
+        return None
+
+    def put(self, principal: Principal, version: int) -> None:
+        """Store a principal, evicting the least recently used one if full.
+
+        ``version`` must be read before the user is loaded; if the user was
+        invalidated in the meantime the snapshot is not stored.
+
+        Args:
+            principal: Snapshot to cache
+            version: Version read before loading the user
+        """
+        if self.ttl_seconds <= 0 or version != self.version(principal.id):
+            return
+        self._entries[principal.id] = (version, principal, time.monotonic())
+        self._entries.move_to_end(principal.id)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop a user's principal after its account or roles changed.
+
+        Args:
+            user_id: ID of the changed user
+        """
+        self._versions[user_id] = self._versions.get(user_id, 0) + 1
+        self._entries.pop(user_id, None)
+        self.invalidations += 1
+        logger.debug("principal_invalidated", user_id=user_id)
+
+    def invalidate_all(self) -> None:
+        """Drop all principals, e.g. after plants were created or deleted."""
+        self._generation += 1
+        self._entries.clear()
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached principals."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            **hit_stats(self.hits, self.misses),
+            "invalidations": self.invalidations,
+        }
+
+
+# Global cache shared by the authentication dependencies
+principal_cache = PrincipalCache()
@@ -14,8 +14,10 @@ from typing import TYPE_CHECKING
 
 from openspc.core.alerts.manager import ViolationAcknowledged, ViolationCreated
 from openspc.core.events import (
+    BackpressurePolicy,
     ControlLimitsUpdatedEvent,
     EventBus,
+    HandlerQueue,
     SampleProcessedEvent,
 )
 
@@ -52,15 +54,20 @@ class WebSocketBroadcaster:
         self,
         connection_manager: "ConnectionManager",
         event_bus: EventBus,
+        queue_size: int = 1000,
     ):
         """Initialize the WebSocket broadcaster.
 
         Args:
             connection_manager: WebSocket connection manager instance
             event_bus: Event bus instance for event subscriptions
+            queue_size: Bound of the event dispatch queue
         """
         self._manager = connection_manager
         self._event_bus = event_bus
+        self._queue = HandlerQueue(
+            "websocket_broadcast", maxsize=queue_size, policy=BackpressurePolicy.BLOCK
+        )
         self._setup_subscriptions()
         logger.info("WebSocketBroadcaster initialized")
 
@@ -71,13 +78,20 @@ class WebSocketBroadcaster:
         - SampleProcessedEvent: Broadcast sample updates to subscribed clients
         - ControlLimitsUpdatedEvent: Broadcast limit changes to subscribed clients
 
+        Both share one bounded queue with a single worker so samples and
+        limit updates reach clients in publish order. Publishers block when
+        the queue is full (batch-mode clients need every point); slow clients
+        are handled by the per-connection queues in the ConnectionManager.
+
         Note: ViolationCreated and ViolationAcknowledged events are handled via
         the AlertNotifier protocol methods (notify_violation_created and
         notify_violation_acknowledged).
         """
-        self._event_bus.subscribe(SampleProcessedEvent, self._on_sample_processed)
         self._event_bus.subscribe(
-            ControlLimitsUpdatedEvent, self._on_limits_updated
+            SampleProcessedEvent, self._on_sample_processed, queue=self._queue
+        )
+        self._event_bus.subscribe(
+            ControlLimitsUpdatedEvent, self._on_limits_updated, queue=self._queue
         )
         logger.debug(
             "Subscribed to SampleProcessedEvent and ControlLimitsUpdatedEvent"
@@ -253,5 +267,42 @@ class WebSocketBroadcaster:
         # Broadcast to all clients (acknowledgments are important for everyone)
         await self._manager.broadcast_to_all(message)
 
+    async def notify_violations_acknowledged(
+        self, events: list[ViolationAcknowledged]
+    ) -> None:
+        """Broadcast one acknowledgment update for a batch of violations.
+
+        Used by batch acknowledgement so clients receive one message instead
+        of one per violation.
+
+        Args:
+            events: ViolationAcknowledged events sharing user and reason
+
+        Message Format:
+            {
+                "type": "ack_update",
+                "violation_ids": [int, ...],
+                "ack_user": str,
+                "ack_reason": str
+            }
+        """
+        if not events:
+            return
+
+        message = {
+            "type": "ack_update",
+            "violation_ids": [event.violation_id for event in events],
+            "ack_user": events[0].user,
+            "ack_reason": events[0].reason,
+        }
+
+        logger.info(
+            "broadcasting_batch_acknowledgment",
+            count=len(events),
+            user=events[0].user,
+        )
+
+        await self._manager.broadcast_to_all(message)
+
 
 __all__ = ["WebSocketBroadcaster"]
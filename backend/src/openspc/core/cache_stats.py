@@ -0,0 +1,29 @@
+"""Hit/miss metrics shared by the in-process caches.
+
+Each cache counts its own hits and misses; hit_stats() formats them for
+the cache's get_stats(), which the admin ``/api/v1/stats`` endpoint reports.
+
+Example:
+    >>> hit_stats(hits=3, misses=1)
+    {'hits': 3, 'misses': 1, 'hit_rate': 0.75}
+"""
+
+from typing import Any
+
+
+def hit_stats(hits: int, misses: int) -> dict[str, Any]:
+    """Return hit/miss counters and the hit rate of a cache.
+
+    Args:
+        hits: Lookups served from the cache
+        misses: Lookups that had to load or compute the value
+
+    Returns:
+        Dict with ``hits``, ``misses`` and ``hit_rate`` (0.0 before any lookup)
+    """
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+    }
@@ -43,6 +43,64 @@ class Settings(BaseSettings):
     rate_limit_login: str = "5/minute"
     rate_limit_default: str = "60/minute"
 
+    # WebSocket fan-out: per-connection outbound queue and overflow policy
+    # ("drop_oldest", "coalesce" or "disconnect")
+    ws_send_queue_size: int = 256
+    ws_overflow_policy: str = "drop_oldest"
+    # Tick for "batch" mode subscriptions (one samples_batch message per tick)
+    ws_batch_interval_ms: int = 200
+
+    # TAG provider ingestion pipeline: SPC processing workers (samples of one
+    # characteristic are always handled by the same worker) and queue bounds
+    tag_pipeline_workers: int = 4
+    tag_pipeline_queue_size: int = 1000
+
+    # Group commit for live provider samples: commit after this many rows or
+    # this many ms, whichever comes first; pending queue bound
+    sample_commit_max_rows: int = 500
+    sample_commit_interval_ms: float = 20.0
+    sample_commit_queue_size: int = 5000
+
+    # Preload rolling windows of characteristics with active data sources
+    # before providers start
+    window_warmup_on_startup: bool = True
+
+    # Characteristic definition cache (SPC engine and plant authorization):
+    # max entries and max entry age in seconds (0 = no expiry)
+    characteristic_cache_size: int = 10000
+    characteristic_cache_ttl_seconds: float = 300.0
+
+    # Chart-data response cache: max cached responses (versioned per
+    # characteristic, invalidated by sample and control limit events) and
+    # max age in seconds of a characteristic's version (0 = no expiry)
+    chart_cache_size: int = 1000
+    chart_cache_ttl_seconds: float = 300.0
+
+    # Hierarchy path cache (violation lists): max age in seconds of a
+    # plant's hierarchy node map (0 = no expiry)
+    hierarchy_path_cache_ttl_seconds: float = 300.0
+
+    # Verified API key cache (skips bcrypt for recently verified keys):
+    # max entries and max entry age in seconds (0 = disabled)
+    api_key_cache_size: int = 1000
+    api_key_cache_ttl_seconds: float = 60.0
+
+    # Authenticated principal cache (JWT user and plant role snapshots):
+    # max entries and max entry age in seconds (0 = disabled)
+    principal_cache_size: int = 1000
+    principal_cache_ttl_seconds: float = 60.0
+
+    # Outbound MQTT publishing: max age in seconds of the cached list of
+    # outbound-enabled brokers (invalidated by broker changes; 0 = no cache)
+    outbound_broker_cache_ttl_seconds: float = 30.0
+
+    # Violation statistics: read whole days from the violation_daily_rollup
+    # table (maintained on every write) instead of aggregating violations
+    violation_stats_use_rollup: bool = True
+
+    # Event bus: bound of each queued subscription (broadcaster, MQTT publisher)
+    event_queue_size: int = 1000
+
     # Logging
     log_format: str = "console"  # "console" or "json"
 
@@ -1,6 +1,13 @@
 """SPC Engine - Statistical Process Control calculations."""
 
+from .char_cache import (
+    CharacteristicCache,
+    CharacteristicSnapshot,
+    characteristic_cache,
+)
+from .chart_cache import ChartDataCache, chart_data_cache, etag_matches
 from .control_limits import CalculationResult, ControlLimitService
+from .group_commit import BufferedEventBus, GroupCommitWriter, sample_writer
 from .nelson_rules import (
     NelsonRuleLibrary,
     Rule1Outlier,
@@ -14,14 +21,20 @@ from .nelson_rules import (
     RuleResult,
     Severity,
 )
+from .nelson_incremental import IncrementalNelsonEvaluator, IncrementalRuleState
+from .nelson_vectorized import VectorizedNelsonEvaluator, window_to_arrays
 from .rolling_window import (
+    WINDOW_DTYPE,
+    ZONE_CODES,
     RollingWindow,
     RollingWindowManager,
     WindowSample,
     Zone,
     ZoneBoundaries,
+    classify_zone_codes,
 )
 from .spc_engine import (
+    BatchProcessingResult,
     ProcessingResult,
     SampleContext,
     SPCEngine,
@@ -33,7 +46,20 @@ __all__ = [
     "SPCEngine",
     "SampleContext",
     "ProcessingResult",
+    "BatchProcessingResult",
     "ViolationInfo",
+    # Characteristic cache
+    "CharacteristicCache",
+    "CharacteristicSnapshot",
+    "characteristic_cache",
+    # Chart-data cache
+    "ChartDataCache",
+    "chart_data_cache",
+    "etag_matches",
+    # Group commit
+    "BufferedEventBus",
+    "GroupCommitWriter",
+    "sample_writer",
     # Control Limits
     "ControlLimitService",
     "CalculationResult",
@@ -49,10 +75,17 @@ __all__ = [
     "Rule8Mixture",
     "RuleResult",
     "Severity",
+    "IncrementalNelsonEvaluator",
+    "IncrementalRuleState",
+    "VectorizedNelsonEvaluator",
+    "window_to_arrays",
     # Rolling Window
     "RollingWindow",
     "RollingWindowManager",
     "WindowSample",
     "Zone",
     "ZoneBoundaries",
+    "WINDOW_DTYPE",
+    "ZONE_CODES",
+    "classify_zone_codes",
 ]
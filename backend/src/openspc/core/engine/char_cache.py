@@ -0,0 +1,292 @@
+"""In-process cache of characteristic definitions for the SPC hot path.
+
+Every ingested sample needs its characteristic's subgroup configuration,
+control limits and Nelson Rule settings, and request handlers need the plant
+the characteristic belongs to for authorization. These rarely change between
+samples, so CharacteristicCache keeps immutable CharacteristicSnapshot objects
+keyed by characteristic ID and loads them with a single repository call on a
+miss.
+
+Entries are invalidated by CharacteristicUpdatedEvent (configuration and rule
+changes), ControlLimitsUpdatedEvent and CharacteristicDeletedEvent once the
+cache is subscribed to the event bus. A TTL bounds staleness for changes made
+outside this process.
+
+Example:
+    >>> characteristic_cache.subscribe(event_bus)
+    >>> snapshot = await characteristic_cache.get(char_repo, 1)
+    >>> snapshot.enabled_rules
+    frozenset({1, 2, 3, 4, 5, 6, 7, 8})
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from openspc.core.cache_stats import hit_stats
+from openspc.core.events import (
+    CharacteristicDeletedEvent,
+    CharacteristicUpdatedEvent,
+    ControlLimitsUpdatedEvent,
+    EventBus,
+)
+
+if TYPE_CHECKING:
+    from openspc.db.models.characteristic import Characteristic
+    from openspc.db.repositories import CharacteristicRepository
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CharacteristicSnapshot:
+    """Immutable view of the characteristic fields used by the SPC engine.
+
+    Attributes:
+        id: Characteristic ID
+        hierarchy_id: Owning hierarchy node
+        plant_id: Plant of the owning hierarchy node (None if unknown)
+        name: Characteristic name
+        subgroup_mode: Subgroup mode (SubgroupMode value)
+        subgroup_size: Nominal subgroup size
+        min_measurements: Minimum measurements per sample
+        warn_below_count: Undersized-sample warning threshold
+        ucl: Upper control limit
+        lcl: Lower control limit
+        stored_sigma: Process sigma for Mode A/B
+        stored_center_line: Process center line for Mode A/B
+        enabled_rules: IDs of enabled Nelson Rules
+        rule_require_ack: Mapping of rule ID to require_acknowledgement
+    """
+    id: int
+    hierarchy_id: int
+    plant_id: int | None
+    name: str
+    subgroup_mode: str
+    subgroup_size: int
+    min_measurements: int
+    warn_below_count: int | None
+    ucl: float | None
+    lcl: float | None
+    stored_sigma: float | None
+    stored_center_line: float | None
+    enabled_rules: frozenset[int]
+    rule_require_ack: Mapping[int, bool]
+
+    @classmethod
+    def from_model(
+        cls, char: "Characteristic", plant_id: int | None = None
+    ) -> "CharacteristicSnapshot":
+        """Build a snapshot from a Characteristic with rules loaded.
+
+        Args:
+            char: Characteristic ORM object (rules eagerly loaded)
+            plant_id: Plant of the owning hierarchy node
+
+        Returns:
+            Snapshot detached from the ORM session
+        """
+        return cls(
+            id=char.id,
+            hierarchy_id=char.hierarchy_id,
+            plant_id=plant_id,
+            name=char.name,
+            subgroup_mode=char.subgroup_mode,
+            subgroup_size=char.subgroup_size,
+            min_measurements=char.min_measurements,
+            warn_below_count=char.warn_below_count,
+            ucl=char.ucl,
+            lcl=char.lcl,
+            stored_sigma=char.stored_sigma,
+            stored_center_line=char.stored_center_line,
+            enabled_rules=frozenset(r.rule_id for r in char.rules if r.is_enabled),
+            rule_require_ack=MappingProxyType(
+                {r.rule_id: r.require_acknowledgement for r in char.rules}
+            ),
+        )
+
+
+class CharacteristicCache:
+    """LRU cache of CharacteristicSnapshot objects with event invalidation.
+
+    Args:
+        max_size: Maximum number of cached characteristics
+        ttl_seconds: Maximum age of an entry (None = no expiry)
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float | None = 300.0) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, tuple[CharacteristicSnapshot, float]] = OrderedDict()
+        # Bumped on every invalidation so loads racing an update are not cached
+        self._generation = 0
+        self._subscribed: set[int] = set()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def configure(
+        self,
+        max_size: int | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Update cache limits and drop all entries.
+
+        Args:
+            max_size: Maximum number of cached characteristics
+            ttl_seconds: Maximum age of an entry (0 disables expiry)
+        """
+        if max_size is not None:
+            self.max_size = max_size
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds or None
+        self.clear()
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Invalidate entries on characteristic and control limit events.
+
+        Safe to call more than once for the same bus.
+
+        Args:
+            event_bus: Bus publishing characteristic events
+        """
+        if id(event_bus) in self._subscribed:
+            return
+        self._subscribed.add(id(event_bus))
+        for event_type in (
+            CharacteristicUpdatedEvent,
+            ControlLimitsUpdatedEvent,
+            CharacteristicDeletedEvent,
+        ):
+            event_bus.subscribe(event_type, self._on_characteristic_changed)
+
+    async def get(
+        self,
+        char_repo: "CharacteristicRepository",
+        char_id: int,
+    ) -> CharacteristicSnapshot | None:
+        """Return the snapshot for a characteristic, loading it on a miss.
+
+        Args:
+            char_repo: Repository used to load missing entries
+            char_id: Characteristic ID
+
+        Returns:
+            CharacteristicSnapshot, or None if the characteristic does not exist
+        """
+        entry = self._entries.get(char_id)
+        if entry is not None:
+            snapshot, loaded_at = entry
+            if self.ttl_seconds is None or time.monotonic() - loaded_at < self.ttl_seconds:
+                self._entries.move_to_end(char_id)
+                self.hits += 1
+                return snapshot
+            del self._entries[char_id]
+
+        self.misses += 1
+        generation = self._generation
+        row = await char_repo.get_definition(char_id)
+        if row is None:
+            return None
+
+        char, plant_id = row
+        snapshot = CharacteristicSnapshot.from_model(char, plant_id)
+        if generation == self._generation:
+            self._store(char_id, snapshot)
+        return snapshot
+
+    def _store(self, char_id: int, snapshot: CharacteristicSnapshot) -> None:
+        """Insert a snapshot, evicting the least recently used entry if full."""
+        self._entries[char_id] = (snapshot, time.monotonic())
+        self._entries.move_to_end(char_id)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_many(
+        self,
+        char_repo: "CharacteristicRepository",
+        char_ids: Iterable[int],
+    ) -> dict[int, CharacteristicSnapshot]:
+        """Return snapshots for many characteristics, loading misses in bulk.
+
+        Args:
+            char_repo: Repository used to load missing entries
+            char_ids: Characteristic IDs
+
+        Returns:
+            Dict mapping char_id to snapshot; IDs that do not exist are omitted
+        """
+        snapshots: dict[int, CharacteristicSnapshot] = {}
+        missing: list[int] = []
+        now = time.monotonic()
+        for char_id in dict.fromkeys(char_ids):
+            entry = self._entries.get(char_id)
+            if entry is not None and (
+                self.ttl_seconds is None or now - entry[1] < self.ttl_seconds
+            ):
+                self._entries.move_to_end(char_id)
+                snapshots[char_id] = entry[0]
+            else:
+                missing.append(char_id)
+        self.hits += len(snapshots)
+        if not missing:
+            return snapshots
+
+        self.misses += len(missing)
+        generation = self._generation
+        definitions = await char_repo.get_definitions(missing)
+        for char_id, (char, plant_id) in definitions.items():
+            snapshot = CharacteristicSnapshot.from_model(char, plant_id)
+            snapshots[char_id] = snapshot
+            if generation == self._generation:
+                self._store(char_id, snapshot)
+        return snapshots
+
+    def invalidate(self, char_id: int) -> None:
+        """Drop the cached snapshot of one characteristic.
+
+        Args:
+            char_id: Characteristic ID
+        """
+        self._generation += 1
+        self.invalidations += 1
+        self._entries.pop(char_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached snapshots."""
+        self._generation += 1
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            **hit_stats(self.hits, self.misses),
+            "invalidations": self.invalidations,
+        }
+
+    async def _on_characteristic_changed(
+        self,
+        event: CharacteristicUpdatedEvent | ControlLimitsUpdatedEvent | CharacteristicDeletedEvent,
+    ) -> None:
+        """Event handler: invalidate the affected characteristic."""
+        self.invalidate(event.characteristic_id)
+        logger.debug(
+            "characteristic_cache_invalidated",
+            characteristic_id=event.characteristic_id,
+            event_type=type(event).__name__,
+        )
+
+
+# Global cache shared by the SPC engines and request handlers
+characteristic_cache = CharacteristicCache()
@@ -0,0 +1,272 @@
+"""Versioned in-process cache of chart-data responses.
+
+Dashboards poll GET /characteristics/{id}/chart-data far more often than
+new samples arrive, and every poll rebuilds the same response from several
+queries. ChartDataCache keeps the built responses keyed by characteristic
+and query options, together with a per-characteristic version counter.
+
+Any change that can alter a chart bumps the characteristic's version:
+SampleProcessedEvent, ControlLimitsUpdatedEvent, CharacteristicUpdatedEvent
+and CharacteristicDeletedEvent once the cache is subscribed to the event
+bus, plus explicit invalidate() calls from the endpoints that edit, exclude,
+delete or acknowledge outside the SPC engine and from the retention purge.
+Entries built for an older version are never served. A TTL bounds staleness
+for changes made outside this process: a version older than the TTL is
+bumped on its next use, which expires its entries and ETags together.
+
+The version is also part of the response's ETag, so a client revalidating
+with If-None-Match can be answered with 304 Not Modified without touching
+the database. ETags embed a random per-process epoch because versions
+restart at zero with the process.
+
+Example:
+    >>> chart_data_cache.subscribe(event_bus)
+    >>> version = chart_data_cache.version(1)
+    >>> etag = chart_data_cache.etag(1, params, version)
+    >>> cached = chart_data_cache.get(1, params)
+    >>> if cached is None:
+    ...     chart_data_cache.put(1, params, version, build_response())
+"""
+
+import hashlib
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import structlog
+
+from openspc.core.cache_stats import hit_stats
+from openspc.core.events import (
+    CharacteristicDeletedEvent,
+    CharacteristicUpdatedEvent,
+    ControlLimitsUpdatedEvent,
+    EventBus,
+    SampleProcessedEvent,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison of RFC 9110: ``W/`` prefixes are ignored, the
+    header may list several tags, and ``*`` matches any current tag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value (None if absent)
+        etag: Current (quoted) entity tag
+
+    Returns:
+        True if the client's cached representation is current
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ChartDataCache:
+    """LRU cache of chart-data responses with per-characteristic versions.
+
+    Args:
+        max_size: Maximum number of cached responses
+        ttl_seconds: Maximum age of a version (None = no expiry)
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float | None = 300.0) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._epoch = secrets.token_hex(4)
+        # char_id -> (version, when the version started)
+        self._versions: dict[int, tuple[int, float]] = {}
+        self._entries: OrderedDict[tuple[int, Hashable], tuple[int, Any]] = OrderedDict()
+        self._subscribed: set[int] = set()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+
+    def configure(
+        self,
+        max_size: int | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Update cache limits and drop all entries.
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl_seconds: Maximum age of a version (0 disables expiry)
+        """
+        if max_size is not None:
+            self.max_size = max_size
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds or None
+        self.clear()
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Bump versions on sample, control limit and characteristic events.
+
+        Safe to call more than once for the same bus.
+
+        Args:
+            event_bus: Bus publishing SPC engine and characteristic events
+        """
+        if id(event_bus) in self._subscribed:
+            return
+        self._subscribed.add(id(event_bus))
+        for event_type in (
+            SampleProcessedEvent,
+            ControlLimitsUpdatedEvent,
+            CharacteristicUpdatedEvent,
+            CharacteristicDeletedEvent,
+        ):
+            event_bus.subscribe(event_type, self._on_chart_changed)
+
+    def version(self, char_id: int) -> int:
+        """Return the current data version of a characteristic.
+
+        Args:
+            char_id: Characteristic ID
+
+        Returns:
+            Version counter (0 until the first invalidation or expiry)
+        """
+        now = time.monotonic()
+        entry = self._versions.get(char_id)
+        if entry is None:
+            self._versions[char_id] = (0, now)
+            return 0
+        version, started_at = entry
+        if self.ttl_seconds is not None and now - started_at >= self.ttl_seconds:
+            version += 1
+            self._versions[char_id] = (version, now)
+        return version
+
+    def etag(self, char_id: int, params: Hashable, version: int) -> str:
+        """Build the ETag of a chart-data response.
+
+        Args:
+            char_id: Characteristic ID
+            params: Normalized query options of the request
+            version: Characteristic version the response was built from
+
+        Returns:
+            Quoted strong entity tag
+        """
+        digest = hashlib.blake2b(repr(params).encode(), digest_size=6).hexdigest()
+        return f'"{self._epoch}-{char_id}-{version}-{digest}"'
+
+    def get(self, char_id: int, params: Hashable) -> Any | None:
+        """Return the cached response for the current version, if any.
+
+        Args:
+            char_id: Characteristic ID
+            params: Normalized query options of the request
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        key = (char_id, params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] == self.version(char_id):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, char_id: int, params: Hashable, version: int, response: Any) -> None:
+        """Store a response, evicting the least recently used entry if full.
+
+        ``version`` must be read before the response is built; if the
+        characteristic changed in the meantime the response is not stored.
+
+        Args:
+            char_id: Characteristic ID
+            params: Normalized query options of the request
+            version: Version read before building the response
+            response: Response to cache (treated as immutable)
+        """
+        if version != self.version(char_id):
+            return
+        key = (char_id, params)
+        self._entries[key] = (version, response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, char_id: int) -> None:
+        """Bump the version of a characteristic so its entries are not served.
+
+        Stale entries are dropped lazily on lookup or by LRU eviction.
+
+        Args:
+            char_id: Characteristic ID
+        """
+        self._versions[char_id] = (self.version(char_id) + 1, time.monotonic())
+        self.invalidations += 1
+
+    def invalidate_all(self) -> None:
+        """Invalidate every response and ETag, e.g. after the database was reseeded.
+
+        Rotates the ETag epoch, as versions may repeat for reused IDs.
+        """
+        self._epoch = secrets.token_hex(4)
+        self._versions.clear()
+        self._entries.clear()
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached responses.
+
+        Versions are kept so ETags issued before the clear stay invalid once
+        the characteristic changes.
+        """
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            **hit_stats(self.hits, self.misses),
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+        }
+
+    async def _on_chart_changed(
+        self,
+        event: (
+            SampleProcessedEvent
+            | ControlLimitsUpdatedEvent
+            | CharacteristicUpdatedEvent
+            | CharacteristicDeletedEvent
+        ),
+    ) -> None:
+        """Event handler: bump the affected characteristic's version."""
+        self.invalidate(event.characteristic_id)
+        logger.debug(
+            "chart_data_cache_invalidated",
+            characteristic_id=event.characteristic_id,
+            event_type=type(event).__name__,
+        )
+
+
+# Global cache shared by the chart-data endpoints
+chart_data_cache = ChartDataCache()
@@ -144,8 +144,8 @@ class ControlLimitService:
         if characteristic is None:
             raise ValueError(f"Characteristic {characteristic_id} not found")
 
-        # Fetch samples (optionally filtered by date range)
-        all_samples = await self._sample_repo.get_by_characteristic(
+        # Fetch samples with their persisted statistics (optionally filtered by date range)
+        all_samples = await self._sample_repo.get_samples_with_statistics(
             characteristic_id,
             start_date=start_date,
             end_date=end_date,
@@ -325,7 +325,7 @@ class ControlLimitService:
         - LCL = X-bar - 3*sigma
 
         Args:
-            samples: List of Sample objects with measurements
+            samples: List of Sample objects with persisted statistics
 
         Returns:
             Tuple of (center_line, ucl, lcl, sigma)
@@ -337,12 +337,8 @@ class ControlLimitService:
             - sigma = 1.773
             - UCL = 16.52, LCL = 5.88
         """
-        # Extract individual values (mean of each sample's measurements)
-        values = []
-        for sample in samples:
-            measurement_values = [m.value for m in sample.measurements]
-            if measurement_values:
-                values.append(float(np.mean(measurement_values)))
+        # Extract individual values (persisted mean of each sample)
+        values = [sample.mean for sample in samples if sample.mean is not None]
 
         # Calculate center line (X-bar)
         center_line = float(np.mean(values))
@@ -373,7 +369,7 @@ class ControlLimitService:
         which is needed for Mode A/B variable subgroup calculations.
 
         Args:
-            samples: List of Sample objects with measurements
+            samples: List of Sample objects with persisted statistics
             subgroup_size: Size of subgroups
 
         Returns:
@@ -384,11 +380,9 @@ class ControlLimitService:
         subgroup_ranges = []
 
         for sample in samples:
-            measurement_values = [m.value for m in sample.measurements]
-            if measurement_values:
-                arr = np.asarray(measurement_values, dtype=np.float64)
-                subgroup_means.append(float(np.mean(arr)))
-                subgroup_ranges.append(float(np.ptp(arr)))
+            if sample.mean is not None:
+                subgroup_means.append(sample.mean)
+                subgroup_ranges.append(sample.range_value or 0.0)
 
         # Calculate center line (X-double-bar)
         center_line = float(np.mean(subgroup_means))
@@ -420,7 +414,7 @@ class ControlLimitService:
         which is needed for Mode A/B variable subgroup calculations.
 
         Args:
-            samples: List of Sample objects with measurements
+            samples: List of Sample objects with persisted statistics
             subgroup_size: Size of subgroups
 
         Returns:
@@ -431,11 +425,9 @@ class ControlLimitService:
         subgroup_stds = []
 
         for sample in samples:
-            measurement_values = [m.value for m in sample.measurements]
-            if measurement_values and len(measurement_values) > 1:
-                arr = np.asarray(measurement_values, dtype=np.float64)
-                subgroup_means.append(float(np.mean(arr)))
-                subgroup_stds.append(float(np.std(arr, ddof=1)))
+            if sample.std_dev is not None:
+                subgroup_means.append(sample.mean)
+                subgroup_stds.append(sample.std_dev)
 
         # Calculate center line (X-double-bar)
         center_line = float(np.mean(subgroup_means))
@@ -0,0 +1,413 @@
+"""Group-commit writer for live provider samples.
+
+Committing every live sample on its own costs one fsync per sample on SQLite
+and one round trip per sample on server databases. The GroupCommitWriter
+collects samples submitted by all data providers (TAG, OPC-UA) for a short
+window, processes them with SPCEngine.process_batch() and commits them in a
+single transaction.
+
+Per-sample results and the events published while processing
+(SampleProcessedEvent, ViolationCreatedEvent) are held back until the
+commit has succeeded, so subscribers never see a sample that is later
+rolled back.
+
+The writer's rolling windows live as long as the writer. They are dropped
+on characteristic and control limit events, and through invalidate() by
+code paths that change stored samples (exclude, edit, delete, purge).
+
+Example:
+    >>> await sample_writer.start(db.session_factory)
+    >>> future = await sample_writer.submit(event)
+    >>> result = await future  # resolved once the sample is committed
+    >>> await sample_writer.stop()
+"""
+
+import asyncio
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.core.engine.char_cache import characteristic_cache
+from openspc.core.engine.nelson_rules import NelsonRuleLibrary
+from openspc.core.engine.rolling_window import RollingWindowManager
+from openspc.core.engine.spc_engine import ProcessingResult, SPCEngine
+from openspc.core.events import (
+    CharacteristicDeletedEvent,
+    CharacteristicUpdatedEvent,
+    ControlLimitsUpdatedEvent,
+    Event,
+    EventBus,
+)
+from openspc.core.providers.protocol import SampleEvent
+from openspc.db.repositories import (
+    CharacteristicRepository,
+    SampleRepository,
+    ViolationRepository,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Events after which a cached window has stale limits or settings
+_WINDOW_EVENTS: tuple[type[Event], ...] = (
+    ControlLimitsUpdatedEvent,
+    CharacteristicUpdatedEvent,
+    CharacteristicDeletedEvent,
+)
+
+
+class BufferedEventBus(EventBus):
+    """Event bus facade that holds published events until released.
+
+    Args:
+        target: Bus that receives the events on release()
+    """
+
+    def __init__(self, target: EventBus) -> None:
+        super().__init__()
+        self._target = target
+        self._buffer: list[Event] = []
+
+    async def publish(self, event: Event) -> None:
+        """Buffer an event instead of dispatching it."""
+        self._buffer.append(event)
+
+    async def release(self) -> None:
+        """Publish buffered events to the target bus, in order."""
+        events, self._buffer = self._buffer, []
+        for event in events:
+            await self._target.publish(event)
+
+    def discard(self) -> None:
+        """Drop buffered events (e.g. after a rollback)."""
+        self._buffer.clear()
+
+
+class GroupCommitWriter:
+    """Processes and commits live samples in groups.
+
+    Samples are committed when ``max_rows`` samples are pending or
+    ``max_delay_ms`` has passed since the first pending sample, whichever
+    comes first. Samples are processed in submission order, so per
+    characteristic ordering is preserved.
+
+    Args:
+        max_rows: Maximum samples per transaction
+        max_delay_ms: Maximum time a sample waits for its group to fill
+        queue_size: Maximum pending samples; submit() waits when full
+    """
+
+    def __init__(
+        self,
+        max_rows: int = 500,
+        max_delay_ms: float = 20.0,
+        queue_size: int = 5000,
+    ) -> None:
+        self.max_rows = max_rows
+        self.max_delay_ms = max_delay_ms
+        self.queue_size = queue_size
+        self._queue: asyncio.Queue[tuple[SampleEvent, asyncio.Future]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._session: AsyncSession | None = None
+        self._engine: SPCEngine | None = None
+        self._window_manager: RollingWindowManager | None = None
+        self._events: BufferedEventBus | None = None
+        self._event_bus: EventBus | None = None
+        # Serializes use of the writer session (commit loop vs warm-up)
+        self._lock = asyncio.Lock()
+
+        # Metrics
+        self.commits = 0
+        self.samples_committed = 0
+        self.failed_commits = 0
+        self.window_invalidations = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the writer accepts samples."""
+        return self._task is not None
+
+    @property
+    def pending(self) -> int:
+        """Number of samples waiting for their group commit."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def configure(
+        self,
+        max_rows: int | None = None,
+        max_delay_ms: float | None = None,
+        queue_size: int | None = None,
+    ) -> None:
+        """Update batching limits (takes effect on the next start()).
+
+        Args:
+            max_rows: Maximum samples per transaction
+            max_delay_ms: Maximum time a sample waits for its group to fill
+            queue_size: Maximum pending samples
+        """
+        if max_rows is not None:
+            self.max_rows = max_rows
+        if max_delay_ms is not None:
+            self.max_delay_ms = max_delay_ms
+        if queue_size is not None:
+            self.queue_size = queue_size
+
+    async def start(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        event_bus: EventBus | None = None,
+    ) -> None:
+        """Open the writer session and start the commit loop.
+
+        Args:
+            session_factory: Factory for the writer's database session
+            event_bus: Bus that receives events after commit (global if None)
+        """
+        if self._task is not None:
+            return
+        if event_bus is None:
+            from openspc.core.events import event_bus as global_bus
+
+            event_bus = global_bus
+
+        self._session = session_factory()
+        sample_repo = SampleRepository(self._session)
+        self._window_manager = RollingWindowManager(sample_repo)
+        self._events = BufferedEventBus(event_bus)
+        self._engine = SPCEngine(
+            sample_repo=sample_repo,
+            char_repo=CharacteristicRepository(self._session),
+            violation_repo=ViolationRepository(self._session),
+            window_manager=self._window_manager,
+            rule_library=NelsonRuleLibrary(),
+            event_bus=self._events,
+            char_cache=characteristic_cache,
+        )
+        self._event_bus = event_bus
+        for event_type in _WINDOW_EVENTS:
+            event_bus.subscribe(event_type, self._on_characteristic_changed)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            "group_commit_writer_started",
+            max_rows=self.max_rows,
+            max_delay_ms=self.max_delay_ms,
+        )
+
+    async def stop(self) -> None:
+        """Commit pending samples, stop the commit loop and close the session."""
+        if self._task is None:
+            return
+        assert self._queue is not None
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._event_bus is not None:
+            for event_type in _WINDOW_EVENTS:
+                self._event_bus.unsubscribe(event_type, self._on_characteristic_changed)
+            self._event_bus = None
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+        self._engine = None
+        self._window_manager = None
+        logger.info("group_commit_writer_stopped", commits=self.commits)
+
+    async def submit(self, event: SampleEvent) -> asyncio.Future[ProcessingResult]:
+        """Queue a sample for the next group commit.
+
+        Waits only while the pending queue is full.
+
+        Args:
+            event: Sample to process
+
+        Returns:
+            Future resolved with the ProcessingResult after the commit, or
+            failed with the processing / database error
+
+        Raises:
+            RuntimeError: If the writer is not running
+        """
+        if self._task is None or self._queue is None:
+            raise RuntimeError("Group commit writer is not running")
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((event, future))
+        return future
+
+    async def process(self, event: SampleEvent) -> ProcessingResult:
+        """Submit a sample and wait until it is committed.
+
+        Args:
+            event: Sample to process
+
+        Returns:
+            ProcessingResult for the committed sample
+        """
+        return await (await self.submit(event))
+
+    async def warm_up(self, characteristic_ids: Iterable[int]) -> int:
+        """Preload definitions and rolling windows of live characteristics.
+
+        Call after start() and before data providers begin submitting, so
+        the first sample of each characteristic does not pay a cold load.
+
+        Args:
+            characteristic_ids: Characteristics fed by data providers
+
+        Returns:
+            Number of rolling windows loaded
+
+        Raises:
+            RuntimeError: If the writer is not running
+        """
+        if self._engine is None or self._session is None:
+            raise RuntimeError("Group commit writer is not running")
+        async with self._lock:
+            try:
+                loaded = await self._engine.warm_up(characteristic_ids)
+            finally:
+                # End the read transaction and drop the loaded ORM objects
+                await self._session.rollback()
+                self._session.expunge_all()
+        logger.info("group_commit_writer_warmed_up", windows=loaded)
+        return loaded
+
+    async def invalidate(self, char_id: int) -> None:
+        """Drop the cached rolling window of a characteristic.
+
+        Call after committing changes to a characteristic's stored samples,
+        so the next live sample reloads the window from the database.
+        No-op while the writer is not running.
+
+        Args:
+            char_id: Characteristic ID
+        """
+        if self._window_manager is None:
+            return
+        await self._window_manager.invalidate(char_id)
+        self.window_invalidations += 1
+
+    async def invalidate_all(self) -> None:
+        """Drop every cached rolling window (e.g. after the database was reseeded).
+
+        No-op while the writer is not running.
+        """
+        if self._window_manager is None:
+            return
+        await self._window_manager.invalidate_all()
+        self.window_invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth and commit counters."""
+        return {
+            "pending": self.pending,
+            "commits": self.commits,
+            "samples_committed": self.samples_committed,
+            "failed_commits": self.failed_commits,
+            "window_invalidations": self.window_invalidations,
+            "avg_group_size": (
+                round(self.samples_committed / self.commits, 1) if self.commits else 0.0
+            ),
+        }
+
+    async def _on_characteristic_changed(self, event: Event) -> None:
+        """Drop the window so it is reloaded with the new definition and limits."""
+        await self.invalidate(event.characteristic_id)
+
+    async def _run(self) -> None:
+        """Commit loop: collect a group, process it, commit, release."""
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            group = [await queue.get()]
+            self._drain(group)
+            if len(group) < self.max_rows and self.max_delay_ms > 0:
+                await asyncio.sleep(self.max_delay_ms / 1000)
+                self._drain(group)
+            try:
+                async with self._lock:
+                    await self._commit_group(group)
+            except Exception as e:
+                logger.error("group_commit_loop_error", error=str(e), exc_info=True)
+                for _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in group:
+                    queue.task_done()
+
+    def _drain(self, group: list[tuple[SampleEvent, asyncio.Future]]) -> None:
+        """Move already-queued samples into the group, up to max_rows."""
+        assert self._queue is not None
+        while len(group) < self.max_rows and not self._queue.empty():
+            group.append(self._queue.get_nowait())
+
+    async def _commit_group(self, group: list[tuple[SampleEvent, asyncio.Future]]) -> None:
+        """Process and commit one group, falling back to per-sample commits.
+
+        A database or processing error aborts the whole transaction. The
+        group is then retried one sample at a time so a single bad sample
+        (e.g. a characteristic without enough data for limits) does not fail
+        the samples committed alongside it.
+        """
+        try:
+            await self._process_and_commit(group)
+        except Exception as e:
+            self.failed_commits += 1
+            logger.warning("group_commit_failed", size=len(group), error=str(e))
+            if len(group) == 1:
+                group[0][1].set_exception(e)
+                return
+            for item in group:
+                try:
+                    await self._process_and_commit([item])
+                except Exception as item_error:
+                    if not item[1].done():
+                        item[1].set_exception(item_error)
+
+    async def _process_and_commit(
+        self, group: list[tuple[SampleEvent, asyncio.Future]]
+    ) -> None:
+        """Process a group in one transaction and resolve its futures."""
+        assert self._engine is not None and self._session is not None
+        assert self._events is not None
+        events = [event for event, _ in group]
+        try:
+            batch = await self._engine.process_batch(events)
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            self._events.discard()
+            await self._invalidate_windows(events)
+            raise
+
+        # Committed: drop ORM state, then release events and results
+        self._session.expunge_all()
+        self.commits += 1
+        self.samples_committed += len(batch.results)
+        await self._events.release()
+
+        for index, (_, future) in enumerate(group):
+            if future.done():
+                continue
+            if index in batch.results:
+                future.set_result(batch.results[index])
+            else:
+                future.set_exception(
+                    ValueError(batch.errors.get(index, "Sample was not processed"))
+                )
+
+    async def _invalidate_windows(self, events: list[SampleEvent]) -> None:
+        """Drop cached windows that may contain rolled-back samples."""
+        assert self._window_manager is not None
+        for char_id in {event.characteristic_id for event in events}:
+            await self._window_manager.invalidate(char_id)
+
+
+# Global writer shared by all data providers
+sample_writer = GroupCommitWriter()
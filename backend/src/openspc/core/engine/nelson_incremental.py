@@ -0,0 +1,288 @@
+"""Incremental Nelson Rules evaluation for the live ingestion path.
+
+Instead of rescanning the tail of the window for every rule on each new
+point, this module keeps a small set of run-length and sliding-window
+counters per characteristic (stored on the cached RollingWindow) and
+updates them in constant time as samples arrive:
+
+- Rule 1: zone of the latest point
+- Rule 2: run length on the same side of the center line
+- Rule 3: run of strictly increasing / decreasing steps
+- Rule 4: run of alternating steps
+- Rule 5: Zone A-or-beyond counts in the last 3 points, per side
+- Rule 6: Zone B-or-beyond counts in the last 5 points, per side
+- Rule 7: Zone C streak
+- Rule 8: outside-Zone-C streak
+
+The state is rebuilt with a full rescan of the window whenever it is missing
+or out of sync (new window, reclassified boundaries, cleared window, or
+samples appended without being evaluated). Results are identical to
+NelsonRuleLibrary.check_all() for windows of at least MAX_RULE_LENGTH samples.
+
+Example:
+    >>> evaluator = IncrementalNelsonEvaluator()
+    >>> window.append(sample)
+    >>> violations = evaluator.check_latest(window, enabled_rules={1, 2, 3})
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+
+from openspc.core.engine.nelson_rules import (
+    NELSON_RULE_IDS,
+    Rule1Outlier,
+    Rule2Shift,
+    Rule3Trend,
+    Rule4Alternator,
+    Rule5ZoneA,
+    Rule6ZoneB,
+    Rule7Stratification,
+    Rule8Mixture,
+    RuleResult,
+)
+from openspc.core.engine.nelson_vectorized import MAX_RULE_LENGTH
+from openspc.core.engine.rolling_window import RollingWindow
+
+_RULES = {
+    rule.rule_id: rule
+    for rule in (
+        Rule1Outlier(),
+        Rule2Shift(),
+        Rule3Trend(),
+        Rule4Alternator(),
+        Rule5ZoneA(),
+        Rule6ZoneB(),
+        Rule7Stratification(),
+        Rule8Mixture(),
+    )
+}
+
+
+@dataclass(slots=True)
+class IncrementalRuleState:
+    """Run-length counters describing the window ending at the latest point.
+
+    Attributes:
+        appended_count: RollingWindow.appended_count the state is synced to
+        recent: (sample_id, value, zone code) of the last MAX_RULE_LENGTH points
+        seen: Number of points pushed (capped at MAX_RULE_LENGTH)
+        side_run: Consecutive points on the same side of the center line
+        up_run: Consecutive strictly increasing steps
+        down_run: Consecutive strictly decreasing steps
+        alternating_run: Consecutive pairs of steps with opposite direction
+        last_step: Difference between the last two values
+        zone_a_upper: Points in Zone A or beyond (upper) among the last 3
+        zone_a_lower: Points in Zone A or beyond (lower) among the last 3
+        zone_b_upper: Points in Zone B or beyond (upper) among the last 5
+        zone_b_lower: Points in Zone B or beyond (lower) among the last 5
+        zone_c_run: Consecutive points in Zone C
+        outside_c_run: Consecutive points outside Zone C
+    """
+    appended_count: int = 0
+    recent: deque = field(default_factory=lambda: deque(maxlen=MAX_RULE_LENGTH))
+    seen: int = 0
+    side_run: int = 0
+    up_run: int = 0
+    down_run: int = 0
+    alternating_run: int = 0
+    last_step: float | None = None
+    zone_a_upper: int = 0
+    zone_a_lower: int = 0
+    zone_b_upper: int = 0
+    zone_b_lower: int = 0
+    zone_c_run: int = 0
+    outside_c_run: int = 0
+
+    def push(self, sample_id: int, value: float, zone: int) -> None:
+        """Advance all counters by one point.
+
+        Args:
+            sample_id: Sample ID of the new point
+            value: Chart value of the new point
+            zone: Signed zone code of the new point
+        """
+        recent = self.recent
+        if recent:
+            _, prev_value, prev_zone = recent[-1]
+            self.side_run = self.side_run + 1 if (zone > 0) == (prev_zone > 0) else 1
+
+            step = value - prev_value
+            self.up_run = self.up_run + 1 if step > 0 else 0
+            self.down_run = self.down_run + 1 if step < 0 else 0
+            if self.last_step is not None and self.last_step * step < 0:
+                self.alternating_run += 1
+            else:
+                self.alternating_run = 0
+            self.last_step = step
+        else:
+            self.side_run = 1
+
+        # Sliding counts: add the new point, drop the one leaving the window
+        self.zone_a_upper += zone >= 3
+        self.zone_a_lower += zone <= -3
+        self.zone_b_upper += zone >= 2
+        self.zone_b_lower += zone <= -2
+        if len(recent) >= 3:
+            leaving = recent[-3][2]
+            self.zone_a_upper -= leaving >= 3
+            self.zone_a_lower -= leaving <= -3
+        if len(recent) >= 5:
+            leaving = recent[-5][2]
+            self.zone_b_upper -= leaving >= 2
+            self.zone_b_lower -= leaving <= -2
+
+        in_zone_c = abs(zone) == 1
+        self.zone_c_run = self.zone_c_run + 1 if in_zone_c else 0
+        self.outside_c_run = 0 if in_zone_c else self.outside_c_run + 1
+
+        recent.append((sample_id, value, zone))
+        self.seen = min(self.seen + 1, MAX_RULE_LENGTH)
+
+    def triggered(self, rule_id: int) -> bool:
+        """Return True if the rule is violated at the latest point."""
+        if rule_id == 1:
+            return bool(self.recent) and abs(self.recent[-1][2]) == 4
+        if rule_id == 2:
+            return self.side_run >= 9
+        if rule_id == 3:
+            return self.up_run >= 5 or self.down_run >= 5
+        if rule_id == 4:
+            return self.alternating_run >= 12
+        if rule_id == 5:
+            return self.seen >= 3 and (self.zone_a_upper >= 2 or self.zone_a_lower >= 2)
+        if rule_id == 6:
+            return self.seen >= 5 and (self.zone_b_upper >= 4 or self.zone_b_lower >= 4)
+        if rule_id == 7:
+            return self.zone_c_run >= 15
+        if rule_id == 8:
+            return self.outside_c_run >= 8
+        return False
+
+    def tail_ids(self, n: int) -> list[int]:
+        """Return the sample IDs of the last n points (oldest first)."""
+        return [entry[0] for entry in list(self.recent)[-n:]]
+
+
+class IncrementalNelsonEvaluator:
+    """Evaluates Nelson Rules for the latest point in O(1) per rule.
+
+    State lives on each RollingWindow (``window.rule_state``), so it is cached
+    and evicted together with the window. The evaluator itself is stateless
+    and can be shared between characteristics.
+    """
+
+    def check_latest(
+        self,
+        window: RollingWindow,
+        enabled_rules: set[int] | None = None,
+    ) -> list[RuleResult]:
+        """Update the window's rule state and return violations at the latest point.
+
+        Equivalent to NelsonRuleLibrary.check_all() on the same window.
+
+        Args:
+            window: Rolling window whose latest sample should be evaluated
+            enabled_rules: Rule IDs to evaluate (None = all 8)
+
+        Returns:
+            List of RuleResult objects for violated rules
+        """
+        state = self.sync(window)
+        if window.size == 0:
+            return []
+
+        rule_ids = NELSON_RULE_IDS if enabled_rules is None else enabled_rules
+        return [
+            self._build_result(rule_id, state)
+            for rule_id in rule_ids
+            if rule_id in _RULES and state.triggered(rule_id)
+        ]
+
+    def sync(self, window: RollingWindow) -> IncrementalRuleState:
+        """Bring the window's rule state up to date with its samples.
+
+        Pushes only the newest sample when exactly one was appended since the
+        last sync; otherwise rebuilds the state from the whole window.
+
+        Args:
+            window: Rolling window to sync
+
+        Returns:
+            The window's up-to-date rule state
+        """
+        state = window.rule_state
+        target = window.appended_count
+
+        if state is not None and state.appended_count == target:
+            return state
+
+        view = window.view()
+        if state is not None and state.appended_count == target - 1:
+            latest = view[-1]
+            state.push(int(latest["sample_id"]), float(latest["value"]), int(latest["zone"]))
+        else:
+            # Full rescan (new, reclassified or out-of-sync window)
+            state = IncrementalRuleState()
+            for sample_id, value, zone in zip(
+                view["sample_id"].tolist(),
+                view["value"].tolist(),
+                view["zone"].tolist(),
+                strict=True,
+            ):
+                state.push(sample_id, value, zone)
+            window.rule_state = state
+
+        state.appended_count = target
+        return state
+
+    @staticmethod
+    def _build_result(rule_id: int, state: IncrementalRuleState) -> RuleResult:
+        """Build a RuleResult matching the per-rule classes."""
+        rule = _RULES[rule_id]
+        latest_id, latest_value, latest_zone = state.recent[-1]
+
+        if rule_id == 1:
+            involved = [latest_id]
+            message = f"Point at {latest_value:.4f} is beyond 3sigma from center"
+        elif rule_id == 2:
+            involved = state.tail_ids(9)
+            side = "above" if latest_zone > 0 else "below"
+            message = f"9 consecutive points {side} center line"
+        elif rule_id == 3:
+            involved = state.tail_ids(6)
+            direction = "increasing" if state.up_run >= 5 else "decreasing"
+            message = f"6 consecutive points {direction}"
+        elif rule_id == 4:
+            involved = state.tail_ids(14)
+            message = "14 consecutive points alternating up and down"
+        elif rule_id == 5:
+            upper = state.zone_a_upper >= 2
+            side = "upper" if upper else "lower"
+            involved = [
+                sample_id for sample_id, _, zone in list(state.recent)[-3:]
+                if (zone >= 3 if upper else zone <= -3)
+            ]
+            message = f"2 of 3 consecutive points in Zone A or beyond ({side} side)"
+        elif rule_id == 6:
+            upper = state.zone_b_upper >= 4
+            side = "upper" if upper else "lower"
+            involved = [
+                sample_id for sample_id, _, zone in list(state.recent)[-5:]
+                if (zone >= 2 if upper else zone <= -2)
+            ]
+            message = f"4 of 5 consecutive points in Zone B or beyond ({side} side)"
+        elif rule_id == 7:
+            involved = state.tail_ids(15)
+            message = "15 consecutive points within Zone C (hugging mean)"
+        else:
+            involved = state.tail_ids(8)
+            message = "8 consecutive points outside Zone C (mixture pattern)"
+
+        return RuleResult(
+            rule_id=rule_id,
+            rule_name=rule.rule_name,
+            triggered=True,
+            severity=rule.severity,
+            involved_sample_ids=involved,
+            message=message,
+        )
@@ -0,0 +1,319 @@
+"""Vectorized Nelson Rules evaluation over NumPy arrays.
+
+This module evaluates all 8 Nelson Rules over a whole series of chart points
+in a single pass, using contiguous arrays of values and signed zone codes
+instead of scanning WindowSample objects. It is intended for re-evaluating
+rules over long histories (backfill, limit changes) and for batch ingestion,
+where calling NelsonRuleLibrary.check_all() once per point is too slow.
+
+Results are identical to NelsonRuleLibrary.check_all() applied to a rolling
+window ending at the same point (for any window of at least 15 samples, the
+longest rule length).
+
+Zone codes are signed integers: the sign is the side of the center line and
+the magnitude is the zone (1 = C, 2 = B, 3 = A, 4 = beyond the limits).
+
+Example:
+    >>> evaluator = VectorizedNelsonEvaluator()
+    >>> zones = classify_zone_codes(values, boundaries)
+    >>> masks = evaluator.check_series(values, zones)
+    >>> outliers = np.flatnonzero(masks[1])
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from openspc.core.engine.nelson_rules import (
+    NELSON_RULE_IDS,
+    Rule1Outlier,
+    Rule2Shift,
+    Rule3Trend,
+    Rule4Alternator,
+    Rule5ZoneA,
+    Rule6ZoneB,
+    Rule7Stratification,
+    Rule8Mixture,
+    RuleResult,
+)
+from openspc.core.engine.rolling_window import RollingWindow
+
+# Longest rule window (Rule 7: 15 points). Windows at least this long give
+# identical results to the per-rule classes.
+MAX_RULE_LENGTH = 15
+
+_RULES = {
+    rule.rule_id: rule
+    for rule in (
+        Rule1Outlier(),
+        Rule2Shift(),
+        Rule3Trend(),
+        Rule4Alternator(),
+        Rule5ZoneA(),
+        Rule6ZoneB(),
+        Rule7Stratification(),
+        Rule8Mixture(),
+    )
+}
+
+
+def window_to_arrays(window: RollingWindow) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Extract values, zone codes and sample IDs from a rolling window.
+
+    Args:
+        window: Rolling window (oldest sample first)
+
+    Returns:
+        Tuple of (values float64, zone codes int8, sample_ids int64). These
+        are zero-copy views of the window buffer, valid until it changes.
+    """
+    values = window.get_column("value")
+    zones = window.get_column("zone")
+    sample_ids = window.get_column("sample_id")
+    return values, zones, sample_ids
+
+
+def _window_count(mask: np.ndarray, n: int) -> np.ndarray:
+    """Count True values in each trailing window of length n.
+
+    Positions with fewer than n preceding points (including themselves)
+    get a count of -1 so they never satisfy a threshold.
+    """
+    counts = np.full(mask.shape[0], -1, dtype=np.int64)
+    if mask.shape[0] < n:
+        return counts
+    csum = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+    counts[n - 1:] = csum[n:] - csum[:-n]
+    return counts
+
+
+class VectorizedNelsonEvaluator:
+    """Evaluates Nelson Rules over whole series of chart points at once.
+
+    Two modes are supported:
+    - check_latest(): rules for the last point only (live ingestion path)
+    - check_series() / check_history(): rules at every point (re-evaluation,
+      backfill), returning per-rule boolean trigger masks or RuleResults
+
+    The evaluator is stateless and can be shared between characteristics.
+    """
+
+    def check_series(
+        self,
+        values: np.ndarray,
+        zones: np.ndarray,
+        enabled_rules: Iterable[int] | None = None,
+    ) -> dict[int, np.ndarray]:
+        """Compute trigger masks for every enabled rule at every point.
+
+        mask[i] is True when the rule is violated by the window of points
+        ending at index i.
+
+        Args:
+            values: Chart point values (oldest first)
+            zones: Signed zone codes, same length as values
+            enabled_rules: Rule IDs to evaluate (None = all 8)
+
+        Returns:
+            Dict mapping rule_id -> boolean array of length len(values)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        zones = np.asarray(zones, dtype=np.int8)
+        rule_ids = NELSON_RULE_IDS if enabled_rules is None else enabled_rules
+        masks: dict[int, np.ndarray] = {}
+        for rule_id in rule_ids:
+            if rule_id in _RULES:
+                masks[rule_id] = self._rule_mask(rule_id, values, zones)
+        return masks
+
+    def check_latest(
+        self,
+        values: np.ndarray,
+        zones: np.ndarray,
+        sample_ids: np.ndarray,
+        enabled_rules: Iterable[int] | None = None,
+    ) -> list[RuleResult]:
+        """Evaluate enabled rules for the most recent point only.
+
+        Equivalent to NelsonRuleLibrary.check_all() on a window holding the
+        same points.
+
+        Args:
+            values: Chart point values (oldest first)
+            zones: Signed zone codes, same length as values
+            sample_ids: Sample IDs, same length as values
+            enabled_rules: Rule IDs to evaluate (None = all 8)
+
+        Returns:
+            List of RuleResult objects for violated rules
+        """
+        values = np.asarray(values, dtype=np.float64)
+        zones = np.asarray(zones, dtype=np.int8)
+        # Only the longest rule's tail matters for the latest point
+        tail = MAX_RULE_LENGTH
+        masks = self.check_series(values[-tail:], zones[-tail:], enabled_rules)
+        return self.results_at(
+            -1, values[-tail:], zones[-tail:], np.asarray(sample_ids)[-tail:], masks
+        )
+
+    def check_history(
+        self,
+        values: np.ndarray,
+        zones: np.ndarray,
+        sample_ids: np.ndarray,
+        enabled_rules: Iterable[int] | None = None,
+        start: int = 0,
+    ) -> dict[int, list[RuleResult]]:
+        """Evaluate enabled rules at every point and build results where triggered.
+
+        Args:
+            values: Chart point values (oldest first)
+            zones: Signed zone codes, same length as values
+            sample_ids: Sample IDs, same length as values
+            enabled_rules: Rule IDs to evaluate (None = all 8)
+            start: Only report points at index >= start (earlier points
+                still provide context for the rules)
+
+        Returns:
+            Dict mapping point index -> list of RuleResults (only points
+            with at least one violation are included)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        zones = np.asarray(zones, dtype=np.int8)
+        sample_ids = np.asarray(sample_ids)
+        masks = self.check_series(values, zones, enabled_rules)
+        if not masks:
+            return {}
+
+        any_triggered = np.zeros(values.shape[0], dtype=bool)
+        for mask in masks.values():
+            any_triggered |= mask
+        any_triggered[:start] = False
+
+        return {
+            int(i): self.results_at(int(i), values, zones, sample_ids, masks)
+            for i in np.flatnonzero(any_triggered)
+        }
+
+    def results_at(
+        self,
+        index: int,
+        values: np.ndarray,
+        zones: np.ndarray,
+        sample_ids: np.ndarray,
+        masks: dict[int, np.ndarray],
+    ) -> list[RuleResult]:
+        """Build RuleResult objects for the rules triggered at one point.
+
+        Args:
+            index: Point index (negative indices allowed)
+            values: Chart point values
+            zones: Signed zone codes
+            sample_ids: Sample IDs
+            masks: Trigger masks from check_series()
+
+        Returns:
+            RuleResults matching those produced by the per-rule classes
+        """
+        n = values.shape[0]
+        if n == 0:
+            return []
+        if index < 0:
+            index += n
+
+        results = []
+        for rule_id, mask in masks.items():
+            if mask[index]:
+                results.append(self._build_result(rule_id, index, values, zones, sample_ids))
+        return results
+
+    @staticmethod
+    def _rule_mask(rule_id: int, values: np.ndarray, zones: np.ndarray) -> np.ndarray:
+        """Compute the trigger mask for a single rule."""
+        n = values.shape[0]
+        if rule_id == 1:
+            return np.abs(zones) == 4
+        if rule_id == 2:
+            upper = _window_count(zones > 0, 9) == 9
+            lower = _window_count(zones < 0, 9) == 9
+            return upper | lower
+        if rule_id == 3:
+            mask = np.zeros(n, dtype=bool)
+            if n >= 6:
+                diffs = np.diff(values)
+                inc = _window_count(diffs > 0, 5) == 5
+                dec = _window_count(diffs < 0, 5) == 5
+                mask[1:] = inc | dec
+            return mask
+        if rule_id == 4:
+            mask = np.zeros(n, dtype=bool)
+            if n >= 14:
+                diffs = np.diff(values)
+                alternating = (diffs[:-1] * diffs[1:]) < 0
+                mask[2:] = _window_count(alternating, 12) == 12
+            return mask
+        if rule_id == 5:
+            return (_window_count(zones >= 3, 3) >= 2) | (_window_count(zones <= -3, 3) >= 2)
+        if rule_id == 6:
+            return (_window_count(zones >= 2, 5) >= 4) | (_window_count(zones <= -2, 5) >= 4)
+        if rule_id == 7:
+            return _window_count(np.abs(zones) == 1, 15) == 15
+        if rule_id == 8:
+            return _window_count(np.abs(zones) != 1, 8) == 8
+        return np.zeros(n, dtype=bool)
+
+    @staticmethod
+    def _build_result(
+        rule_id: int,
+        index: int,
+        values: np.ndarray,
+        zones: np.ndarray,
+        sample_ids: np.ndarray,
+    ) -> RuleResult:
+        """Build the RuleResult for a rule triggered at index.
+
+        Messages and involved samples mirror the per-rule classes in
+        nelson_rules.py exactly.
+        """
+        rule = _RULES[rule_id]
+        length = rule.min_samples_required
+        lo = index - length + 1
+        tail_zones = zones[lo:index + 1]
+        tail_ids = [int(s) for s in sample_ids[lo:index + 1]]
+
+        if rule_id == 1:
+            message = f"Point at {float(values[index]):.4f} is beyond 3sigma from center"
+        elif rule_id == 2:
+            side = "above" if tail_zones[0] > 0 else "below"
+            message = f"9 consecutive points {side} center line"
+        elif rule_id == 3:
+            direction = "increasing" if values[index] > values[index - 1] else "decreasing"
+            message = f"6 consecutive points {direction}"
+        elif rule_id == 4:
+            message = "14 consecutive points alternating up and down"
+        elif rule_id in (5, 6):
+            threshold, required = (3, 2) if rule_id == 5 else (2, 4)
+            upper = tail_zones >= threshold
+            lower = tail_zones <= -threshold
+            if int(upper.sum()) >= required:
+                side, involved = "upper", upper
+            else:
+                side, involved = "lower", lower
+            tail_ids = [sid for sid, hit in zip(tail_ids, involved, strict=True) if hit]
+            if rule_id == 5:
+                message = f"2 of 3 consecutive points in Zone A or beyond ({side} side)"
+            else:
+                message = f"4 of 5 consecutive points in Zone B or beyond ({side} side)"
+        elif rule_id == 7:
+            message = "15 consecutive points within Zone C (hugging mean)"
+        else:
+            message = "8 consecutive points outside Zone C (mixture pattern)"
+
+        return RuleResult(
+            rule_id=rule.rule_id,
+            rule_name=rule.rule_name,
+            triggered=True,
+            severity=rule.severity,
+            involved_sample_ids=tail_ids,
+            message=message,
+        )
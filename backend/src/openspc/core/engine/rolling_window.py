@@ -4,23 +4,29 @@ This module provides in-memory caching of recent samples with zone classificatio
 LRU eviction, and lazy loading from the database.
 
 Key features:
-- Fixed-size rolling window with FIFO eviction
+- Fixed-size rolling window with FIFO eviction, stored as a compact NumPy
+  ring buffer (O(1) append, zero-copy chronological column views)
 - Zone classification (A, B, C, Beyond) for each sample
 - LRU cache manager for multiple characteristics
 - Thread-safe async operations with per-characteristic locks
-- Lazy loading from database on first access
+- Lazy loading from database on first access; concurrent cold loads are
+  coalesced into one query, and warm_up() bulk-loads many windows at once
 """
 
 import asyncio
 from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from openspc.utils.statistics import ZoneBoundaries as BaseZoneBoundaries
 
 if TYPE_CHECKING:
+    from openspc.core.engine.nelson_incremental import IncrementalRuleState
     from openspc.db.models.sample import Sample
     from openspc.db.repositories.sample import SampleRepository
 
@@ -96,6 +102,79 @@ class ZoneBoundaries(BaseZoneBoundaries):
     sigma: float
 
 
+# Signed zone codes: sign = side of center line, magnitude = zone
+# (1 = C, 2 = B, 3 = A, 4 = beyond the limits)
+ZONE_CODES: dict[Zone, int] = {
+    Zone.BEYOND_LCL: -4,
+    Zone.ZONE_A_LOWER: -3,
+    Zone.ZONE_B_LOWER: -2,
+    Zone.ZONE_C_LOWER: -1,
+    Zone.ZONE_C_UPPER: 1,
+    Zone.ZONE_B_UPPER: 2,
+    Zone.ZONE_A_UPPER: 3,
+    Zone.BEYOND_UCL: 4,
+}
+ZONES_BY_CODE: dict[int, Zone] = {code: zone for zone, code in ZONE_CODES.items()}
+
+# Row layout of the rolling window ring buffer (71 bytes per sample).
+# Optional floats (range_value, effective limits, z_score) use NaN for None.
+WINDOW_DTYPE = np.dtype([
+    ("sample_id", np.int64),
+    ("timestamp", "datetime64[us]"),
+    ("value", np.float64),
+    ("range_value", np.float64),
+    ("sigma_distance", np.float64),
+    ("effective_ucl", np.float64),
+    ("effective_lcl", np.float64),
+    ("z_score", np.float64),
+    ("actual_n", np.int32),
+    ("zone", np.int8),
+    ("is_above_center", np.bool_),
+    ("is_undersized", np.bool_),
+])
+
+
+def classify_zone_codes(values: np.ndarray, boundaries: ZoneBoundaries) -> np.ndarray:
+    """Classify an array of values into signed zone codes.
+
+    Uses the same inclusive lower bounds as RollingWindow.classify_value().
+
+    Args:
+        values: Chart point values
+        boundaries: Zone boundaries for classification
+
+    Returns:
+        int8 array of zone codes, same length as values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    b = boundaries
+    thresholds = np.array(
+        [
+            b.minus_3_sigma,
+            b.minus_2_sigma,
+            b.minus_1_sigma,
+            b.center_line,
+            b.plus_1_sigma,
+            b.plus_2_sigma,
+            b.plus_3_sigma,
+        ]
+    )
+    # Number of thresholds each value is >= to: 0 (beyond LCL) .. 7 (beyond UCL)
+    bucket = np.searchsorted(thresholds, values, side="right")
+    codes = np.array([-4, -3, -2, -1, 1, 2, 3, 4], dtype=np.int8)
+    return codes[bucket]
+
+
+def _optional(value: float | None) -> float:
+    """Encode an optional float for the ring buffer (None -> NaN)."""
+    return np.nan if value is None else value
+
+
+def _from_optional(value: float) -> float | None:
+    """Decode an optional float from the ring buffer (NaN -> None)."""
+    return None if value != value else value
+
+
 class RollingWindow:
     """Maintains a fixed-size window of recent samples with zone classification.
 
@@ -103,6 +182,13 @@ class RollingWindow:
     automatically evicts the oldest sample when full. All samples are
     classified into zones based on their distance from the center line.
 
+    Samples are stored column-wise in a structured NumPy ring buffer
+    (WINDOW_DTYPE) rather than as WindowSample objects. The buffer holds
+    every row twice (at i and i + max_size), so the samples in chronological
+    order are always one contiguous slice: get_column() and view() return
+    zero-copy views, and append() is O(1). WindowSample objects are only
+    built on demand by get_samples() / get_recent().
+
     Args:
         max_size: Maximum number of samples to retain (default: 25)
 
@@ -143,10 +229,18 @@ class RollingWindow:
         if max_size < 1:
             raise ValueError(f"max_size must be at least 1, got {max_size}")
 
-        self._samples: list[WindowSample] = []
         self._max_size = max_size
+        self._buffer = np.zeros(2 * max_size, dtype=WINDOW_DTYPE)
+        self._head = 0  # Buffer index of the oldest sample
+        self._count = 0
+        self._tz: timezone | None = None  # Set when timestamps are tz-aware
+        self._appended = 0  # Total appends, used to keep rule_state in sync
         self._boundaries: ZoneBoundaries | None = None
 
+        # Incremental Nelson Rule counters for this window, maintained by
+        # IncrementalNelsonEvaluator; reset whenever samples are reclassified
+        self.rule_state: "IncrementalRuleState | None" = None
+
     def append(self, sample: WindowSample) -> WindowSample | None:
         """Add sample to window, evicting oldest if full.
 
@@ -158,19 +252,95 @@ class RollingWindow:
         """
         evicted = None
 
-        if len(self._samples) >= self._max_size:
-            evicted = self._samples.pop(0)  # Remove oldest (FIFO)
-
-        self._samples.append(sample)
+        if self._count >= self._max_size:
+            # Overwrite the oldest slot (FIFO)
+            evicted = self._to_sample(self._head)
+            index = self._head
+            self._head = (self._head + 1) % self._max_size
+        else:
+            index = (self._head + self._count) % self._max_size
+            self._count += 1
+
+        timestamp = sample.timestamp
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+            self._tz = timezone.utc
+
+        row = (
+            sample.sample_id,
+            np.datetime64(timestamp, "us"),
+            sample.value,
+            _optional(sample.range_value),
+            sample.sigma_distance,
+            _optional(sample.effective_ucl),
+            _optional(sample.effective_lcl),
+            _optional(sample.z_score),
+            sample.actual_n,
+            ZONE_CODES[sample.zone],
+            sample.is_above_center,
+            sample.is_undersized,
+        )
+        self._buffer[index] = row
+        self._buffer[index + self._max_size] = row
+        self._appended += 1
         return evicted
 
+    def _to_sample(self, index: int) -> WindowSample:
+        """Build a WindowSample from one buffer row."""
+        (
+            sample_id, timestamp, value, range_value, sigma_distance,
+            effective_ucl, effective_lcl, z_score, actual_n, zone,
+            is_above_center, is_undersized,
+        ) = self._buffer[index].item()
+        if self._tz is not None:
+            timestamp = timestamp.replace(tzinfo=self._tz)
+        return WindowSample(
+            sample_id=sample_id,
+            timestamp=timestamp,
+            value=value,
+            range_value=_from_optional(range_value),
+            zone=ZONES_BY_CODE[zone],
+            is_above_center=is_above_center,
+            sigma_distance=sigma_distance,
+            actual_n=actual_n,
+            is_undersized=is_undersized,
+            effective_ucl=_from_optional(effective_ucl),
+            effective_lcl=_from_optional(effective_lcl),
+            z_score=_from_optional(z_score),
+        )
+
+    def view(self) -> np.ndarray:
+        """Return the samples as a read-only structured array (oldest first).
+
+        The array is a zero-copy view of the ring buffer with WINDOW_DTYPE
+        fields. It is only valid until the next append(), set_boundaries()
+        or clear(); copy it if it needs to outlive the window state.
+
+        Returns:
+            Structured NumPy array of length size
+        """
+        view = self._buffer[self._head:self._head + self._count]
+        view.flags.writeable = False
+        return view
+
+    def get_column(self, name: str) -> np.ndarray:
+        """Return one column of the window as a read-only view (oldest first).
+
+        Args:
+            name: WINDOW_DTYPE field name (e.g. "value", "zone", "sample_id")
+
+        Returns:
+            NumPy array view of length size
+        """
+        return self.view()[name]
+
     def get_samples(self) -> list[WindowSample]:
         """Return all samples in chronological order (oldest first).
 
         Returns:
             List of WindowSample objects ordered by timestamp
         """
-        return self._samples.copy()
+        return [self._to_sample(self._head + i) for i in range(self._count)]
 
     def get_recent(self, n: int) -> list[WindowSample]:
         """Return last n samples in reverse chronological order (most recent first).
@@ -181,7 +351,8 @@ class RollingWindow:
         Returns:
             List of up to n most recent samples (newest first)
         """
-        return list(reversed(self._samples[-n:]))
+        positions = range(self._count)[-n:]
+        return [self._to_sample(self._head + i) for i in reversed(positions)]
 
     def set_boundaries(self, boundaries: ZoneBoundaries) -> None:
         """Set zone boundaries and reclassify all samples.
@@ -190,13 +361,20 @@ class RollingWindow:
             boundaries: Zone boundaries for classification
         """
         self._boundaries = boundaries
-
-        # Reclassify all existing samples
-        for sample in self._samples:
-            zone, is_above, sigma_dist = self.classify_value(sample.value)
-            sample.zone = zone
-            sample.is_above_center = is_above
-            sample.sigma_distance = sigma_dist
+        self.rule_state = None
+        if self._count == 0:
+            return
+
+        # Reclassify all existing samples (both copies of each buffer row)
+        index = (self._head + np.arange(self._count)) % self._max_size
+        values = self._buffer["value"][index]
+        zones = classify_zone_codes(values, boundaries)
+        is_above = values >= boundaries.center_line
+        sigma_dist = np.abs(values - boundaries.center_line) / boundaries.sigma
+        for rows in (index, index + self._max_size):
+            self._buffer["zone"][rows] = zones
+            self._buffer["is_above_center"][rows] = is_above
+            self._buffer["sigma_distance"][rows] = sigma_dist
 
     def classify_value(self, value: float) -> tuple[Zone, bool, float]:
         """Classify a value into zone, above/below center, and sigma distance.
@@ -332,7 +510,9 @@ class RollingWindow:
 
     def clear(self) -> None:
         """Clear all samples (for invalidation)."""
-        self._samples.clear()
+        self._head = 0
+        self._count = 0
+        self.rule_state = None
 
     @property
     def is_ready(self) -> bool:
@@ -342,13 +522,23 @@ class RollingWindow:
     @property
     def size(self) -> int:
         """Current number of samples in window."""
-        return len(self._samples)
+        return self._count
 
     @property
     def max_size(self) -> int:
         """Maximum capacity of window."""
         return self._max_size
 
+    @property
+    def appended_count(self) -> int:
+        """Total number of samples appended since the window was created."""
+        return self._appended
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the sample buffer, in bytes."""
+        return self._buffer.nbytes
+
 
 class RollingWindowManager:
     """Manages rolling windows for multiple characteristics with LRU caching.
@@ -400,6 +590,9 @@ class RollingWindowManager:
         self._max_cached = max_cached_windows
         self._window_size = window_size
         self._locks: dict[int, asyncio.Lock] = {}
+        # Cold loads waiting for the next batch query
+        self._pending_loads: dict[int, asyncio.Future[RollingWindow]] = {}
+        self._batch_loader: asyncio.Task[None] | None = None
 
     def _get_lock(self, char_id: int) -> asyncio.Lock:
         """Get or create lock for a characteristic.
@@ -447,26 +640,31 @@ class RollingWindowManager:
         Returns:
             RollingWindow populated with samples from database
         """
-        window = RollingWindow(max_size=self._window_size)
-
-        # Load sample data with measurement values pre-extracted
+        # Load persisted sample statistics as plain dicts
         # (avoids lazy loading issues in async contexts)
         sample_data = await self._repo.get_rolling_window_data(
             char_id=char_id,
             window_size=self._window_size,
             exclude_excluded=True
         )
+        return self._build_window(sample_data)
+
+    def _build_window(self, sample_data: list[dict]) -> RollingWindow:
+        """Build an unclassified window from rolling window sample data.
+
+        Args:
+            sample_data: Dicts with sample_id, timestamp, mean and range_value
+                (chronological order)
+
+        Returns:
+            RollingWindow with placeholder zones (set boundaries to classify)
+        """
+        window = RollingWindow(max_size=self._window_size)
 
         # Convert to WindowSample objects
         # Note: Boundaries will need to be set separately by the caller
         for data in sample_data:
-            values = data["values"]
-            value = sum(values) / len(values) if values else 0.0
-
-            # Calculate range for subgroups (n > 1)
-            range_value = None
-            if len(values) > 1:
-                range_value = max(values) - min(values)
+            value = data["mean"] if data["mean"] is not None else 0.0
 
             # Create WindowSample with placeholder zone info
             # (will be reclassified when boundaries are set)
@@ -474,7 +672,7 @@ class RollingWindowManager:
                 sample_id=data["sample_id"],
                 timestamp=data["timestamp"],
                 value=value,
-                range_value=range_value,
+                range_value=data["range_value"],
                 zone=Zone.ZONE_C_UPPER,  # Placeholder
                 is_above_center=True,     # Placeholder
                 sigma_distance=0.0        # Placeholder
@@ -484,6 +682,113 @@ class RollingWindowManager:
 
         return window
 
+    async def _load_window(self, char_id: int) -> RollingWindow:
+        """Load a window, sharing one query with concurrent cold loads.
+
+        The first miss schedules a batch load that runs after the current
+        event loop iteration; misses for other characteristics arriving
+        before then join the same batch and are loaded with a single
+        get_rolling_window_data_many() query.
+
+        Args:
+            char_id: Characteristic ID
+
+        Returns:
+            RollingWindow populated with samples from database
+        """
+        future = self._pending_loads.get(char_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending_loads[char_id] = future
+        if self._batch_loader is None:
+            self._batch_loader = asyncio.create_task(self._run_batch_load())
+        return await future
+
+    async def _run_batch_load(self) -> None:
+        """Resolve all pending cold loads with one query."""
+        # Let other coroutines that are about to miss join this batch
+        await asyncio.sleep(0)
+        pending, self._pending_loads = self._pending_loads, {}
+        self._batch_loader = None
+
+        try:
+            if len(pending) == 1:
+                (char_id,) = pending
+                windows = {char_id: await self._load_window_from_db(char_id)}
+            else:
+                data = await self._repo.get_rolling_window_data_many(
+                    list(pending), window_size=self._window_size, exclude_excluded=True
+                )
+                windows = {
+                    char_id: self._build_window(data.get(char_id, []))
+                    for char_id in pending
+                }
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for char_id, future in pending.items():
+            if not future.done():
+                future.set_result(windows[char_id])
+
+    def _cache_loaded(self, char_id: int, window: RollingWindow) -> RollingWindow:
+        """Cache a freshly loaded window and return the cached window.
+
+        If warm_up() cached a window for the characteristic while the load
+        was in flight, that window is kept.
+        """
+        if char_id in self._cache:
+            self._touch_window(char_id)
+            return self._cache[char_id]
+        self._evict_lru()
+        self._cache[char_id] = window
+        return window
+
+    async def warm_up(
+        self,
+        char_ids: Iterable[int],
+        boundaries: Mapping[int, ZoneBoundaries] | None = None,
+    ) -> int:
+        """Bulk-load windows for characteristics that are not cached yet.
+
+        Loads the latest samples of all requested characteristics with one
+        query per IN-clause chunk and classifies each window's zones in one
+        vectorized pass when boundaries are given. Use it at startup, before
+        data providers begin submitting samples, and ahead of batches that
+        touch many characteristics.
+
+        Args:
+            char_ids: Characteristics to load (at most max_cached_windows are kept)
+            boundaries: Optional zone boundaries per characteristic; windows
+                without boundaries are classified on their first add_sample()
+
+        Returns:
+            Number of windows loaded
+        """
+        missing = [
+            char_id for char_id in dict.fromkeys(char_ids) if char_id not in self._cache
+        ][:self._max_cached]
+        if not missing:
+            return 0
+
+        data = await self._repo.get_rolling_window_data_many(
+            missing, window_size=self._window_size, exclude_excluded=True
+        )
+
+        loaded = 0
+        for char_id in missing:
+            if char_id in self._cache:
+                continue  # loaded concurrently while the query ran
+            window = self._build_window(data.get(char_id, []))
+            if boundaries is not None and char_id in boundaries:
+                window.set_boundaries(boundaries[char_id])
+            self._evict_lru()
+            self._cache[char_id] = window
+            loaded += 1
+        return loaded
+
     async def get_window(self, char_id: int) -> RollingWindow:
         """Get or load rolling window for characteristic.
 
@@ -503,15 +808,8 @@ class RollingWindowManager:
                 return self._cache[char_id]
 
             # Load from database
-            window = await self._load_window_from_db(char_id)
-
-            # Evict LRU if necessary
-            self._evict_lru()
-
-            # Add to cache
-            self._cache[char_id] = window
-
-            return window
+            window = await self._load_window(char_id)
+            return self._cache_loaded(char_id, window)
 
     async def add_sample(
         self,
@@ -551,9 +849,7 @@ class RollingWindowManager:
         async with self._get_lock(char_id):
             # Get or create window
             if char_id not in self._cache:
-                window = await self._load_window_from_db(char_id)
-                self._evict_lru()
-                self._cache[char_id] = window
+                window = self._cache_loaded(char_id, await self._load_window(char_id))
             else:
                 window = self._cache[char_id]
                 self._touch_window(char_id)
@@ -630,6 +926,11 @@ class RollingWindowManager:
             if char_id in self._cache:
                 del self._cache[char_id]
 
+    async def invalidate_all(self) -> None:
+        """Invalidate every cached window (e.g. after the database was reseeded)."""
+        for char_id in list(self._cache):
+            await self.invalidate(char_id)
+
     async def update_boundaries(
         self,
         char_id: int,
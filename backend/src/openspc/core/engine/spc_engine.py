@@ -7,19 +7,36 @@ rule evaluation, violation creation, and statistics calculation.
 import structlog
 import math
 import time
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from openspc.core.engine.rolling_window import WindowSample, ZoneBoundaries
-from openspc.core.events import EventBus, SampleProcessedEvent, ViolationCreatedEvent
-from openspc.core.providers.protocol import SampleContext
+import numpy as np
+
+from openspc.core.engine.char_cache import CharacteristicSnapshot
+from openspc.core.engine.nelson_incremental import IncrementalNelsonEvaluator
+from openspc.core.engine.nelson_vectorized import (
+    MAX_RULE_LENGTH,
+    VectorizedNelsonEvaluator,
+    window_to_arrays,
+)
+from openspc.core.engine.rolling_window import ZONE_CODES, WindowSample, ZoneBoundaries
+from openspc.core.events import (
+    Event,
+    EventBus,
+    SampleProcessedEvent,
+    ViolationCreatedEvent,
+)
+from openspc.core.providers.protocol import SampleContext, SampleEvent
 from openspc.db.models.characteristic import SubgroupMode
 from openspc.utils.statistics import calculate_zones
 
 if TYPE_CHECKING:
+    from openspc.core.engine.char_cache import CharacteristicCache
     from openspc.core.engine.nelson_rules import NelsonRuleLibrary, RuleResult
-    from openspc.core.engine.rolling_window import RollingWindowManager
+    from openspc.core.engine.rolling_window import RollingWindow, RollingWindowManager
+    from openspc.db.models.sample import Sample
     from openspc.db.repositories import (
         CharacteristicRepository,
         SampleRepository,
@@ -34,6 +51,31 @@ logger = structlog.get_logger(__name__)
 # characteristic_config model (e.g. limit_window_size) with this as default.
 DEFAULT_LIMIT_WINDOW_SIZE = 100
 
+# Number of samples persisted per flush in process_batch(). Bounds the size of
+# each multi-row INSERT and the number of ORM objects held at once.
+BATCH_CHUNK_SIZE = 500
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+    """Return an aware UTC datetime (naive values are taken as UTC)."""
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=UTC)
+    return timestamp.astimezone(UTC)
+
+
+def _order_key(timestamp: datetime | None) -> tuple[bool, datetime]:
+    """Sort key for batch samples; samples without a timestamp sort last."""
+    if timestamp is None:
+        return (True, datetime.min.replace(tzinfo=UTC))
+    return (False, _as_utc(timestamp))
+
+
+def _precedes_window(window: "RollingWindow", timestamp: datetime | None) -> bool:
+    """Whether a sample timestamp is older than the newest window sample."""
+    if timestamp is None or window.size == 0:
+        return False
+    return _as_utc(timestamp) < _as_utc(window.get_recent(1)[0].timestamp)
+
 
 @dataclass
 class ViolationInfo:
@@ -93,6 +135,34 @@ class ProcessingResult:
     processing_time_ms: float = 0.0
 
 
+@dataclass
+class BatchProcessingResult:
+    """Result of processing a batch of samples through the SPC engine.
+
+    Both mappings are keyed by the position of the sample in the input list,
+    so callers can correlate results and errors with their own request items.
+
+    Attributes:
+        results: Input index -> ProcessingResult for successfully processed samples
+        errors: Input index -> error message for samples that failed validation
+        processing_time_ms: Total time taken to process the batch in milliseconds
+    """
+
+    results: dict[int, ProcessingResult] = field(default_factory=dict)
+    errors: dict[int, str] = field(default_factory=dict)
+    processing_time_ms: float = 0.0
+
+    @property
+    def successful(self) -> int:
+        """Number of samples processed successfully."""
+        return len(self.results)
+
+    @property
+    def failed(self) -> int:
+        """Number of samples that failed."""
+        return len(self.errors)
+
+
 class SPCEngine:
     """Main SPC processing engine.
 
@@ -111,6 +181,7 @@ class SPCEngine:
         violation_repo: Repository for violation persistence
         window_manager: Manager for rolling windows
         rule_library: Library of Nelson Rules
+        char_cache: Optional characteristic cache (loads per sample if None)
     """
 
     def __init__(
@@ -121,6 +192,7 @@ class SPCEngine:
         window_manager: "RollingWindowManager",
         rule_library: "NelsonRuleLibrary",
         event_bus: EventBus | None = None,
+        char_cache: "CharacteristicCache | None" = None,
     ):
         """Initialize SPC engine with required dependencies.
 
@@ -131,12 +203,17 @@ class SPCEngine:
             window_manager: Rolling window manager
             rule_library: Nelson Rules library
             event_bus: Optional event bus for publishing events (uses global if None)
+            char_cache: Optional cache of characteristic snapshots. Without a
+                cache the characteristic and its rules are loaded per call.
         """
         self._sample_repo = sample_repo
         self._char_repo = char_repo
         self._violation_repo = violation_repo
         self._window_manager = window_manager
         self._rule_library = rule_library
+        self._char_cache = char_cache
+        self._incremental_rules = IncrementalNelsonEvaluator()
+        self._vectorized_rules = VectorizedNelsonEvaluator()
 
         # Use provided event bus or import global instance
         if event_bus is None:
@@ -146,6 +223,24 @@ class SPCEngine:
         else:
             self._event_bus = event_bus
 
+    async def _get_characteristic(
+        self, characteristic_id: int
+    ) -> CharacteristicSnapshot | None:
+        """Load the characteristic definition, from the cache when configured.
+
+        Args:
+            characteristic_id: ID of the characteristic
+
+        Returns:
+            Immutable snapshot of the characteristic, or None if not found
+        """
+        if self._char_cache is not None:
+            return await self._char_cache.get(self._char_repo, characteristic_id)
+        char = await self._char_repo.get_with_rules(characteristic_id)
+        if char is None:
+            return None
+        return CharacteristicSnapshot.from_model(char)
+
     def _validate_measurements(
         self,
         char,
@@ -350,18 +445,12 @@ class SPCEngine:
             context = SampleContext()
 
         # Step 1: Validate characteristic exists and measurements
-        char = await self._char_repo.get_with_rules(characteristic_id)
+        char = await self._get_characteristic(characteristic_id)
         if char is None:
             raise ValueError(f"Characteristic {characteristic_id} not found")
 
-        # Extract ALL needed values immediately after loading to avoid lazy loading issues
-        # (session operations below may expire the ORM object)
-        enabled_rules = {rule.rule_id for rule in char.rules if rule.is_enabled}
-        # Also extract require_acknowledgement settings per rule
-        rule_require_ack = {
-            rule.rule_id: rule.require_acknowledgement
-            for rule in char.rules
-        }
+        enabled_rules = char.enabled_rules
+        rule_require_ack = char.rule_require_ack
         char_subgroup_mode = char.subgroup_mode
         char_subgroup_size = char.subgroup_size
         char_min_measurements = char.min_measurements
@@ -434,8 +523,12 @@ class SPCEngine:
         # Step 5: Evaluate enabled Nelson Rules
         window = await self._window_manager.get_window(characteristic_id)
 
-        # Check all enabled rules (enabled_rules was extracted earlier to avoid lazy loading)
-        rule_results = self._rule_library.check_all(window, enabled_rules)
+        # Check all enabled rules (enabled_rules was extracted earlier to avoid lazy loading).
+        # Windows long enough for every rule use the O(1) incremental counters.
+        if window.max_size >= MAX_RULE_LENGTH:
+            rule_results = self._incremental_rules.check_latest(window, enabled_rules)
+        else:
+            rule_results = self._rule_library.check_all(window, enabled_rules)
 
         # Step 6: Create violations for triggered rules
         violations = await self._create_violations(
@@ -482,6 +575,604 @@ class SPCEngine:
         return result
 
 
+    async def warm_up(self, characteristic_ids: Iterable[int]) -> int:
+        """Preload characteristic definitions and rolling windows in bulk.
+
+        Loads the definitions of all characteristics with one query (through
+        the characteristic cache when configured) and their rolling windows
+        with one windowed query, classifying zones for characteristics that
+        have stored control limits. Characteristics without limits get their
+        boundaries computed on their first sample as usual.
+
+        Args:
+            characteristic_ids: Characteristics expected to receive samples
+
+        Returns:
+            Number of rolling windows loaded
+        """
+        ids = list(dict.fromkeys(characteristic_ids))
+        if self._char_cache is not None:
+            snapshots = await self._char_cache.get_many(self._char_repo, ids)
+        else:
+            snapshots = {
+                char_id: CharacteristicSnapshot.from_model(char, plant_id)
+                for char_id, (char, plant_id) in (
+                    await self._char_repo.get_definitions(ids)
+                ).items()
+            }
+
+        boundaries = {
+            char_id: self._boundaries_from_limits(snapshot.ucl, snapshot.lcl)
+            for char_id, snapshot in snapshots.items()
+            if snapshot.ucl is not None and snapshot.lcl is not None
+        }
+        return await self._window_manager.warm_up(snapshots, boundaries)
+
+    async def process_batch(
+        self,
+        samples: list[SampleEvent],
+        evaluate_rules: bool = True,
+        isolate_failures: bool = False,
+    ) -> BatchProcessingResult:
+        """Process many samples through the SPC pipeline with batched I/O.
+
+        Samples are grouped by characteristic. Each characteristic and its
+        rules are loaded once, samples are validated individually, persisted
+        with multi-row INSERTs (in chunks of BATCH_CHUNK_SIZE), and Nelson
+        Rules are evaluated over the group in timestamp order, exactly as if
+        the samples had been submitted one at a time in that order. Samples
+        older than the newest sample of the rolling window are evaluated on
+        a window reloaded from the database instead. Violations are written
+        in one flush per chunk, and events are published once the whole
+        batch is persisted.
+
+        Validation failures (unknown characteristic, wrong measurement count,
+        missing stored sigma) are reported per sample and do not abort the
+        batch. Database errors propagate unless isolate_failures is set; the
+        caller owns the transaction either way.
+
+        Args:
+            samples: Samples to process; each event's timestamp is stored as
+                the sample timestamp
+            evaluate_rules: If False, samples are validated and persisted but
+                rolling windows and Nelson Rules are skipped (zone is reported
+                as "unevaluated")
+            isolate_failures: If True, the batch runs in a savepoint. If it
+                fails, it is retried one sample at a time, each in its own
+                savepoint, and samples that still fail are reported as
+                "Unexpected error" instead of failing the batch.
+
+        Returns:
+            BatchProcessingResult keyed by input index
+
+        Example:
+            >>> batch = await engine.process_batch([
+            ...     SampleEvent(1, [10.1, 10.2], ts1, SampleContext(source="API")),
+            ...     SampleEvent(1, [10.0, 10.3], ts2, SampleContext(source="API")),
+            ... ])
+            >>> print(f"{batch.successful} ok, {batch.failed} failed")
+        """
+        start_time = time.perf_counter()
+
+        if isolate_failures:
+            batch_result, events = await self._run_batch_isolated(samples, evaluate_rules)
+        else:
+            batch_result, events = await self._run_batch(samples, evaluate_rules)
+
+        for event in events:
+            await self._event_bus.publish(event)
+
+        end_time = time.perf_counter()
+        batch_result.processing_time_ms = (end_time - start_time) * 1000
+
+        # Amortize the batch time over the processed samples
+        if batch_result.results:
+            per_sample_ms = batch_result.processing_time_ms / len(batch_result.results)
+            for result in batch_result.results.values():
+                result.processing_time_ms = per_sample_ms
+
+        return batch_result
+
+    async def _run_batch(
+        self,
+        samples: list[SampleEvent],
+        evaluate_rules: bool,
+    ) -> tuple[BatchProcessingResult, list[Event]]:
+        """Process a batch and collect the events to publish.
+
+        Args:
+            samples: Samples to process
+            evaluate_rules: Whether to update windows and evaluate Nelson Rules
+
+        Returns:
+            Tuple of (results keyed by input index, events in publish order)
+        """
+        batch_result = BatchProcessingResult()
+        events: list[Event] = []
+
+        # Group input indices by characteristic, preserving input order
+        groups: dict[int, list[int]] = {}
+        for idx, event in enumerate(samples):
+            groups.setdefault(event.characteristic_id, []).append(idx)
+
+        # Load the windows of all characteristics in the batch with one query
+        # instead of one cold load per characteristic
+        if evaluate_rules and len(groups) > 1:
+            await self._window_manager.warm_up(groups)
+
+        for characteristic_id, indices in groups.items():
+            await self._process_characteristic_batch(
+                characteristic_id, indices, samples, evaluate_rules, batch_result, events
+            )
+        return batch_result, events
+
+    async def _run_batch_isolated(
+        self,
+        samples: list[SampleEvent],
+        evaluate_rules: bool,
+    ) -> tuple[BatchProcessingResult, list[Event]]:
+        """Process a batch in a savepoint, falling back to one sample at a time.
+
+        A database error rolls back the savepoint of the whole batch; the
+        samples are then retried individually so one bad sample does not
+        fail the others. Windows that may hold rolled-back samples are
+        invalidated after every failed attempt.
+
+        Args:
+            samples: Samples to process
+            evaluate_rules: Whether to update windows and evaluate Nelson Rules
+
+        Returns:
+            Tuple of (results keyed by input index, events in publish order)
+        """
+        session = self._sample_repo.session
+        try:
+            async with session.begin_nested():
+                return await self._run_batch(samples, evaluate_rules)
+        except Exception as e:
+            logger.warning("batch_failed", size=len(samples), error=str(e))
+            await self._invalidate_windows(samples)
+            if len(samples) == 1:
+                logger.exception("batch_sample_failed", index=0)
+                return BatchProcessingResult(errors={0: "Unexpected error"}), []
+
+        batch_result = BatchProcessingResult()
+        events: list[Event] = []
+        for idx, sample in enumerate(samples):
+            try:
+                async with session.begin_nested():
+                    single, single_events = await self._run_batch([sample], evaluate_rules)
+            except Exception:
+                logger.exception("batch_sample_failed", index=idx)
+                await self._invalidate_windows([sample])
+                batch_result.errors[idx] = "Unexpected error"
+                continue
+
+            if 0 in single.results:
+                batch_result.results[idx] = single.results[0]
+            else:
+                batch_result.errors[idx] = single.errors[0]
+            events.extend(single_events)
+        return batch_result, events
+
+    async def _invalidate_windows(self, samples: list[SampleEvent]) -> None:
+        """Drop cached windows that may contain rolled-back samples."""
+        for char_id in {event.characteristic_id for event in samples}:
+            await self._window_manager.invalidate(char_id)
+
+    async def _process_characteristic_batch(
+        self,
+        characteristic_id: int,
+        indices: list[int],
+        samples: list[SampleEvent],
+        evaluate_rules: bool,
+        batch_result: BatchProcessingResult,
+        events: list[Event],
+    ) -> None:
+        """Process all batch samples belonging to one characteristic.
+
+        Samples are evaluated in timestamp order. If the oldest one precedes
+        the newest sample of the rolling window (backfilled or out-of-order
+        data), all are stored first and evaluated on a reloaded window.
+
+        Args:
+            characteristic_id: ID of the characteristic
+            indices: Input indices of the samples for this characteristic
+            samples: Full input sample list
+            evaluate_rules: Whether to update windows and evaluate Nelson Rules
+            batch_result: Result accumulator (updated in place)
+            events: Event accumulator (updated in place)
+        """
+        char = await self._get_characteristic(characteristic_id)
+        if char is None:
+            for idx in indices:
+                batch_result.errors[idx] = f"Characteristic {characteristic_id} not found"
+            return
+
+        char_subgroup_mode = char.subgroup_mode
+        char_subgroup_size = char.subgroup_size
+        char_min_measurements = char.min_measurements
+        char_warn_below_count = char.warn_below_count
+        char_stored_sigma = char.stored_sigma
+        char_stored_center_line = char.stored_center_line
+
+        # Validate and compute statistics per sample
+        valid: list[tuple[int, dict]] = []
+        for idx in indices:
+            event = samples[idx]
+            measurements = event.measurements
+            try:
+                _, is_undersized = self._validate_measurements_with_values(
+                    subgroup_mode=char_subgroup_mode,
+                    subgroup_size=char_subgroup_size,
+                    min_measurements=char_min_measurements,
+                    warn_below_count=char_warn_below_count,
+                    measurements=measurements,
+                )
+                stats = self._compute_sample_statistics_with_values(
+                    subgroup_mode=char_subgroup_mode,
+                    stored_sigma=char_stored_sigma,
+                    stored_center_line=char_stored_center_line,
+                    measurements=measurements,
+                    actual_n=len(measurements),
+                )
+            except ValueError as e:
+                batch_result.errors[idx] = str(e)
+                continue
+            stats["is_undersized"] = is_undersized
+            valid.append((idx, stats))
+
+        if not valid:
+            return
+
+        # Rules see the samples in timestamp order, the order the database
+        # and charts use (samples without a timestamp are stored at server time)
+        valid.sort(key=lambda item: _order_key(samples[item[0]].timestamp))
+
+        # Load the rolling window before inserting, so the cold load does not
+        # pick up the batch samples that are about to be appended.
+        backfill = False
+        if evaluate_rules:
+            window = await self._window_manager.get_window(characteristic_id)
+            backfill = _precedes_window(window, samples[valid[0][0]].timestamp)
+
+        boundaries: ZoneBoundaries | None = None
+        backfilled: list[tuple[list[tuple[int, dict]], list[Sample]]] = []
+
+        for chunk_start in range(0, len(valid), BATCH_CHUNK_SIZE):
+            chunk = valid[chunk_start:chunk_start + BATCH_CHUNK_SIZE]
+            created = await self._persist_chunk(characteristic_id, chunk, samples)
+
+            if evaluate_rules and boundaries is None:
+                boundaries = await self._get_zone_boundaries_with_values(
+                    characteristic_id=characteristic_id,
+                    ucl=char.ucl,
+                    lcl=char.lcl,
+                )
+
+            if backfill:
+                # Evaluated once every sample is stored
+                backfilled.append((chunk, created))
+                continue
+
+            window_samples: list[WindowSample | None] = [None] * len(chunk)
+            chunk_results: list[list[RuleResult]] = [[] for _ in chunk]
+            if evaluate_rules:
+                assert boundaries is not None
+                window_samples, chunk_results = await self._evaluate_chunk_in_order(
+                    characteristic_id, char, chunk, created, samples, boundaries
+                )
+            await self._finish_chunk(
+                characteristic_id, char, chunk, created, window_samples, chunk_results,
+                batch_result, events,
+            )
+
+        if backfilled:
+            assert boundaries is not None
+            evaluated = await self._evaluate_backfill(
+                characteristic_id,
+                char.enabled_rules,
+                [
+                    item
+                    for chunk, created in backfilled
+                    for item in zip(chunk, created, strict=True)
+                ],
+                boundaries,
+            )
+            offset = 0
+            for chunk, created in backfilled:
+                window_samples = evaluated[0][offset:offset + len(chunk)]
+                chunk_results = evaluated[1][offset:offset + len(chunk)]
+                offset += len(chunk)
+                await self._finish_chunk(
+                    characteristic_id, char, chunk, created, window_samples, chunk_results,
+                    batch_result, events,
+                )
+
+    async def _persist_chunk(
+        self,
+        characteristic_id: int,
+        chunk: list[tuple[int, dict]],
+        samples: list[SampleEvent],
+    ) -> list["Sample"]:
+        """Persist one chunk of validated batch samples with batched INSERTs.
+
+        Args:
+            characteristic_id: ID of the characteristic
+            chunk: (input index, statistics) of each sample, in timestamp order
+            samples: Full input sample list
+
+        Returns:
+            Created samples, in chunk order
+        """
+        rows = []
+        for idx, stats in chunk:
+            event = samples[idx]
+            context = event.context or SampleContext()
+            row = {
+                "char_id": characteristic_id,
+                "values": event.measurements,
+                "batch_number": context.batch_number,
+                "operator_id": context.operator_id,
+                "actual_n": len(event.measurements),
+                "is_undersized": stats["is_undersized"],
+                "effective_ucl": stats["effective_ucl"],
+                "effective_lcl": stats["effective_lcl"],
+                "z_score": stats["z_score"],
+            }
+            if event.timestamp is not None:
+                row["timestamp"] = event.timestamp
+            rows.append(row)
+        return await self._sample_repo.create_many_with_measurements(rows)
+
+    async def _evaluate_chunk_in_order(
+        self,
+        characteristic_id: int,
+        char: CharacteristicSnapshot,
+        chunk: list[tuple[int, dict]],
+        created: list["Sample"],
+        samples: list[SampleEvent],
+        boundaries: ZoneBoundaries,
+    ) -> tuple[list[WindowSample | None], list[list["RuleResult"]]]:
+        """Append a chunk that follows the window tail and evaluate its rules.
+
+        Args:
+            characteristic_id: ID of the characteristic
+            char: Characteristic snapshot
+            chunk: (input index, statistics) of each sample, in timestamp order
+            created: Persisted samples, in chunk order
+            samples: Full input sample list
+            boundaries: Zone boundaries for classification
+
+        Returns:
+            Tuple of (window samples, triggered RuleResults) per chunk position
+        """
+        window_samples: list[WindowSample | None] = [None] * len(chunk)
+        chunk_results: list[list[RuleResult]] = [[] for _ in chunk]
+        context = None
+        for pos, ((idx, stats), sample) in enumerate(zip(chunk, created, strict=True)):
+            window_samples[pos] = await self._window_manager.add_sample(
+                char_id=characteristic_id,
+                sample=sample,
+                boundaries=boundaries,
+                measurement_values=samples[idx].measurements,
+                subgroup_mode=char.subgroup_mode,
+                actual_n=len(samples[idx].measurements),
+                is_undersized=stats["is_undersized"],
+                z_score=stats["z_score"],
+                effective_ucl=stats["effective_ucl"],
+                effective_lcl=stats["effective_lcl"],
+                stored_sigma=char.stored_sigma,
+                stored_center_line=char.stored_center_line,
+            )
+            window = await self._window_manager.get_window(characteristic_id)
+            if window.max_size < MAX_RULE_LENGTH:
+                # Short windows truncate rule context; evaluate per point
+                chunk_results[pos] = [
+                    r for r in self._rule_library.check_all(window, char.enabled_rules)
+                    if r.triggered
+                ]
+            elif pos == 0:
+                # Classified points preceding this chunk (boundaries are set now)
+                values, zones, ids = window_to_arrays(window)
+                keep = slice(-MAX_RULE_LENGTH, -1)
+                context = (values[keep], zones[keep], ids[keep])
+
+        if context is not None:
+            chunk_results = self._evaluate_chunk_vectorized(
+                context, window_samples, char.enabled_rules
+            )
+        return window_samples, chunk_results
+
+    async def _evaluate_backfill(
+        self,
+        characteristic_id: int,
+        enabled_rules: frozenset[int],
+        persisted: list[tuple[tuple[int, dict], "Sample"]],
+        boundaries: ZoneBoundaries,
+    ) -> tuple[list[WindowSample | None], list[list["RuleResult"]]]:
+        """Evaluate samples stored before the window tail on a reloaded window.
+
+        The cached window no longer matches the stored sample order, so it is
+        dropped and reloaded from the database, where it picks up the
+        inserted samples that are among the latest by timestamp. Rules are
+        evaluated over the reloaded window with check_history(). Inserted
+        samples older than the reloaded window are classified but not
+        rule-checked, as the window holds none of their neighbours.
+
+        Args:
+            characteristic_id: ID of the characteristic
+            enabled_rules: Rule IDs to evaluate
+            persisted: ((input index, statistics), created sample) pairs
+            boundaries: Zone boundaries for classification
+
+        Returns:
+            Tuple of (window samples, triggered RuleResults) per sample
+        """
+        await self._window_manager.invalidate(characteristic_id)
+        window = await self._window_manager.get_window(characteristic_id)
+        await self._window_manager.update_boundaries(characteristic_id, boundaries)
+
+        values, zones, ids = window_to_arrays(window)
+        triggered = self._vectorized_rules.check_history(values, zones, ids, enabled_rules)
+        positions = {
+            window_sample.sample_id: (pos, window_sample)
+            for pos, window_sample in enumerate(window.get_samples())
+        }
+
+        window_samples: list[WindowSample | None] = []
+        results: list[list[RuleResult]] = []
+        for (_, stats), sample in persisted:
+            if sample.id in positions:
+                pos, window_sample = positions[sample.id]
+                results.append(triggered.get(pos, []))
+            else:
+                zone, is_above, sigma_distance = window.classify_value(stats["mean"])
+                window_sample = WindowSample(
+                    sample_id=sample.id,
+                    timestamp=sample.timestamp,
+                    value=stats["mean"],
+                    range_value=stats["range_value"],
+                    zone=zone,
+                    is_above_center=is_above,
+                    sigma_distance=sigma_distance,
+                )
+                results.append([])
+            window_samples.append(window_sample)
+        return window_samples, results
+
+    async def _finish_chunk(
+        self,
+        characteristic_id: int,
+        char: CharacteristicSnapshot,
+        chunk: list[tuple[int, dict]],
+        created: list["Sample"],
+        window_samples: list[WindowSample | None],
+        chunk_results: list[list["RuleResult"]],
+        batch_result: BatchProcessingResult,
+        events: list[Event],
+    ) -> None:
+        """Persist a chunk's violations and record its results and events.
+
+        Args:
+            characteristic_id: ID of the characteristic
+            char: Characteristic snapshot
+            chunk: (input index, statistics) of each sample
+            created: Persisted samples, in chunk order
+            window_samples: Classified window samples (None if not evaluated)
+            chunk_results: Triggered RuleResults per chunk position
+            batch_result: Result accumulator (updated in place)
+            events: Event accumulator (updated in place)
+        """
+        pending = [
+            (idx, sample, window_samples[pos], chunk_results[pos])
+            for pos, ((idx, _), sample) in enumerate(zip(chunk, created, strict=True))
+        ]
+
+        violation_rows = [
+            {
+                "sample_id": sample.id,
+                "char_id": characteristic_id,
+                "rule_id": r.rule_id,
+                "rule_name": r.rule_name,
+                "severity": r.severity.value,
+                "acknowledged": False,
+                "requires_acknowledgement": char.rule_require_ack.get(r.rule_id, True),
+            }
+            for _, sample, _, rule_results in pending
+            for r in rule_results
+        ]
+        violation_records = iter(await self._violation_repo.create_many(violation_rows))
+
+        # Build results and events now that everything is persisted
+        stats_by_idx = dict(chunk)
+        for idx, sample, window_sample, rule_results in pending:
+            stats = stats_by_idx[idx]
+            violations = []
+            for r in rule_results:
+                violation_record = next(violation_records)
+                events.append(ViolationCreatedEvent(
+                    violation_id=violation_record.id,
+                    sample_id=sample.id,
+                    characteristic_id=characteristic_id,
+                    rule_id=r.rule_id,
+                    rule_name=r.rule_name,
+                    severity=r.severity.value,
+                ))
+                violations.append(
+                    ViolationInfo(
+                        rule_id=r.rule_id,
+                        rule_name=r.rule_name,
+                        severity=r.severity.value,
+                        message=r.message,
+                        involved_sample_ids=r.involved_sample_ids,
+                    )
+                )
+
+            zone = window_sample.zone.value if window_sample else "unevaluated"
+            batch_result.results[idx] = ProcessingResult(
+                sample_id=sample.id,
+                characteristic_id=characteristic_id,
+                timestamp=sample.timestamp,
+                mean=stats["mean"],
+                range_value=stats["range_value"],
+                zone=zone,
+                sigma_distance=window_sample.sigma_distance if window_sample else 0.0,
+                is_above_center=window_sample.is_above_center if window_sample else False,
+                in_control=len(violations) == 0,
+                violations=violations,
+            )
+
+            events.append(SampleProcessedEvent(
+                sample_id=sample.id,
+                characteristic_id=characteristic_id,
+                mean=stats["mean"],
+                range_value=stats["range_value"],
+                zone=zone,
+                in_control=len(violations) == 0,
+                timestamp=sample.timestamp,
+            ))
+
+        logger.debug(
+            "batch_chunk_processed",
+            characteristic_id=characteristic_id,
+            sample_count=len(chunk),
+            violation_count=len(violation_rows),
+        )
+
+    def _evaluate_chunk_vectorized(
+        self,
+        context: tuple[np.ndarray, np.ndarray, np.ndarray],
+        window_samples: list[WindowSample | None],
+        enabled_rules: frozenset[int],
+    ) -> list[list["RuleResult"]]:
+        """Evaluate Nelson Rules at every point of a batch chunk in one pass.
+
+        Args:
+            context: (values, zone codes, sample IDs) of the window points
+                preceding the chunk
+            window_samples: Classified window samples for the chunk, in order
+            enabled_rules: Rule IDs to evaluate
+
+        Returns:
+            Triggered RuleResults for each chunk position
+        """
+        ctx_values, ctx_zones, ctx_ids = context
+        offset = ctx_values.shape[0]
+        values = np.concatenate((ctx_values, [ws.value for ws in window_samples]))
+        zones = np.concatenate(
+            (ctx_zones, np.array([ZONE_CODES[ws.zone] for ws in window_samples], dtype=np.int8))
+        )
+        ids = np.concatenate((ctx_ids, [ws.sample_id for ws in window_samples]))
+
+        triggered = self._vectorized_rules.check_history(
+            values, zones, ids, enabled_rules, start=offset
+        )
+        chunk_results: list[list[RuleResult]] = [[] for _ in window_samples]
+        for index, results in triggered.items():
+            chunk_results[index - offset] = results
+        return chunk_results
+
     async def _get_zone_boundaries_with_values(
         self,
         characteristic_id: int,
@@ -506,21 +1197,7 @@ class SPCEngine:
         """
         # If control limits are provided, use them
         if ucl is not None and lcl is not None:
-            # Calculate center line and sigma from stored limits
-            center_line = (ucl + lcl) / 2
-            sigma = (ucl - lcl) / 6  # UCL/LCL are typically +/- 3 sigma
-
-            zones = calculate_zones(center_line, sigma)
-            return ZoneBoundaries(
-                center_line=zones.center_line,
-                plus_1_sigma=zones.plus_1_sigma,
-                plus_2_sigma=zones.plus_2_sigma,
-                plus_3_sigma=zones.plus_3_sigma,
-                minus_1_sigma=zones.minus_1_sigma,
-                minus_2_sigma=zones.minus_2_sigma,
-                minus_3_sigma=zones.minus_3_sigma,
-                sigma=sigma,
-            )
+            return self._boundaries_from_limits(ucl, lcl)
 
         # Otherwise, calculate from historical data
         center_line, ucl, lcl = await self.recalculate_limits(
@@ -541,11 +1218,38 @@ class SPCEngine:
             sigma=sigma,
         )
 
+    @staticmethod
+    def _boundaries_from_limits(ucl: float, lcl: float) -> ZoneBoundaries:
+        """Build zone boundaries from stored UCL/LCL.
+
+        Args:
+            ucl: Upper Control Limit
+            lcl: Lower Control Limit
+
+        Returns:
+            ZoneBoundaries centered between the limits (limits at +/- 3 sigma)
+        """
+        # Calculate center line and sigma from stored limits
+        center_line = (ucl + lcl) / 2
+        sigma = (ucl - lcl) / 6  # UCL/LCL are typically +/- 3 sigma
+
+        zones = calculate_zones(center_line, sigma)
+        return ZoneBoundaries(
+            center_line=zones.center_line,
+            plus_1_sigma=zones.plus_1_sigma,
+            plus_2_sigma=zones.plus_2_sigma,
+            plus_3_sigma=zones.plus_3_sigma,
+            minus_1_sigma=zones.minus_1_sigma,
+            minus_2_sigma=zones.minus_2_sigma,
+            minus_3_sigma=zones.minus_3_sigma,
+            sigma=sigma,
+        )
+
     async def _create_violations(
         self,
         sample_id: int,
         rule_results: list["RuleResult"],
-        rule_require_ack: dict[int, bool] | None = None,
+        rule_require_ack: Mapping[int, bool] | None = None,
         characteristic_id: int | None = None,
     ) -> list[ViolationInfo]:
         """Create violation records for triggered rules.
@@ -630,7 +1334,10 @@ class SPCEngine:
             calculate_xbar_r_limits,
         )
 
-        char = await self._char_repo.get_by_id(characteristic_id)
+        if self._char_cache is not None:
+            char = await self._char_cache.get(self._char_repo, characteristic_id)
+        else:
+            char = await self._char_repo.get_by_id(characteristic_id)
         if char is None:
             raise ValueError(f"Characteristic {characteristic_id} not found")
 
@@ -649,10 +1356,7 @@ class SPCEngine:
         # Calculate based on subgroup size
         if char.subgroup_size == 1:
             # Individuals chart (I-MR)
-            values = []
-            for data in sample_data:
-                if data["values"]:
-                    values.append(data["values"][0])
+            values = [data["mean"] for data in sample_data if data["mean"] is not None]
 
             if len(values) < 2:
                 raise ValueError("Need at least 2 samples for I-MR chart")
@@ -668,11 +1372,10 @@ class SPCEngine:
             means = []
             ranges = []
             for data in sample_data:
-                sample_values = data["values"]
-                if len(sample_values) != char.subgroup_size:
+                if data["actual_n"] != char.subgroup_size or data["range_value"] is None:
                     continue
-                means.append(sum(sample_values) / len(sample_values))
-                ranges.append(max(sample_values) - min(sample_values))
+                means.append(data["mean"])
+                ranges.append(data["range_value"])
 
             if len(means) < 2:
                 raise ValueError("Need at least 2 subgroups for X-bar R chart")
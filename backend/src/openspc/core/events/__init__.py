@@ -28,7 +28,13 @@ Usage:
     ... ))
 """
 
-from openspc.core.events.bus import EventBus, EventHandler, event_bus
+from openspc.core.events.bus import (
+    BackpressurePolicy,
+    EventBus,
+    EventHandler,
+    HandlerQueue,
+    event_bus,
+)
 from openspc.core.events.events import (
     AlertThresholdExceededEvent,
     CharacteristicCreatedEvent,
@@ -43,8 +49,10 @@ from openspc.core.events.events import (
 
 __all__ = [
     # Event bus
+    "BackpressurePolicy",
     "EventBus",
     "EventHandler",
+    "HandlerQueue",
     "event_bus",
     # Base event
     "Event",
@@ -9,21 +9,255 @@ Key features:
 - Async handlers that don't block publishers
 - Error isolation - one handler failure doesn't affect others
 - Optional synchronous waiting for all handlers to complete
+- Optional queued dispatch: a bounded queue and a fixed number of worker
+  coroutines per subscription, with a per-handler overflow policy
 """
 
 import asyncio
 import structlog
-from collections.abc import Awaitable, Callable
-from typing import Type
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from enum import Enum
+from typing import Any, Type
 
 from openspc.core.events.events import Event
 
 # Type alias for event handler functions
 EventHandler = Callable[[Event], Awaitable[None]]
 
+# Type alias for coalescing key functions
+EventKey = Callable[[Event], Hashable]
+
 logger = structlog.get_logger(__name__)
 
 
+class BackpressurePolicy(str, Enum):
+    """What a queued subscription does when its queue is full.
+
+    - BLOCK: the publisher waits until a worker frees a slot
+    - DROP_OLDEST: discard the oldest queued event
+    - COALESCE: replace the queued event with the same key; otherwise drop
+      the oldest
+    - LATEST_PER_KEY: replace the queued event with the same key; otherwise
+      queue it anyway, so no key loses its latest event and the queue holds
+      at most ``maxsize`` events plus one per key
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    LATEST_PER_KEY = "latest_per_key"
+
+
+# Policies that coalesce queued events by key
+_KEYED_POLICIES = frozenset({BackpressurePolicy.COALESCE, BackpressurePolicy.LATEST_PER_KEY})
+
+
+class HandlerQueue:
+    """Bounded event queue served by a fixed pool of worker coroutines.
+
+    A queue is attached to one or more subscriptions via
+    ``EventBus.subscribe(..., queue=...)``. Subscriptions sharing a queue
+    share its bound and workers; with a single worker their events are
+    handled in publish order, across event types. Workers are started lazily
+    on the first queued event.
+
+    Args:
+        name: Queue name used in metrics and logs
+        maxsize: Maximum number of queued (not yet started) events
+        workers: Number of worker coroutines
+        policy: What to do when the queue is full
+        key: Coalescing key function (required for COALESCE and
+            LATEST_PER_KEY). Events only coalesce with queued events for the
+            same handler.
+
+    Raises:
+        ValueError: If the options are invalid
+
+    Example:
+        >>> queue = HandlerQueue("broadcast", maxsize=1000)
+        >>> bus.subscribe(SampleProcessedEvent, on_sample, queue=queue)
+        >>> bus.subscribe(ControlLimitsUpdatedEvent, on_limits, queue=queue)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        workers: int = 1,
+        policy: BackpressurePolicy | str = BackpressurePolicy.BLOCK,
+        key: EventKey | None = None,
+    ) -> None:
+        policy = BackpressurePolicy(policy)
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if policy in _KEYED_POLICIES and key is None:
+            raise ValueError(f"{policy.name} overflow policy requires a key function")
+
+        self.name = name
+        self.maxsize = maxsize
+        self.workers = workers
+        self.policy = policy
+        self.key = key
+
+        self._pending: deque[tuple[Hashable | None, EventHandler, Event]] = deque()
+        self._active = 0
+        self._changed: asyncio.Condition | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Metrics
+        self.max_depth = 0
+        self.processed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.blocked = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting for a worker."""
+        return len(self._pending)
+
+    async def put(self, handler: EventHandler, event: Event) -> None:
+        """Queue an event for a handler, applying the overflow policy if full.
+
+        Args:
+            handler: Handler the event is delivered to
+            event: Event to deliver
+        """
+        changed = self._ensure_started()
+        key = (handler, self.key(event)) if self.key is not None else None
+
+        async with changed:
+            if len(self._pending) >= self.maxsize:
+                if self.policy is BackpressurePolicy.BLOCK:
+                    self.blocked += 1
+                    await changed.wait_for(lambda: len(self._pending) < self.maxsize)
+                elif self._coalesce(key, handler, event):
+                    return
+                elif self.policy is BackpressurePolicy.LATEST_PER_KEY:
+                    pass  # first event for this key: queue it beyond maxsize
+                else:
+                    self._pending.popleft()
+                    self._record_drop()
+
+            self._pending.append((key, handler, event))
+            self.max_depth = max(self.max_depth, len(self._pending))
+            changed.notify_all()
+
+    def _coalesce(
+        self, key: Hashable | None, handler: EventHandler, event: Event
+    ) -> bool:
+        """Replace a queued event with the same key, keeping its position."""
+        if self.policy not in _KEYED_POLICIES:
+            return False
+        for index, (queued_key, _, _) in enumerate(self._pending):
+            if queued_key == key:
+                self._pending[index] = (key, handler, event)
+                self.coalesced += 1
+                return True
+        return False
+
+    def _record_drop(self) -> None:
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 1000 == 0:
+            logger.warning("event_queue_overflow", queue=self.name, dropped=self.dropped)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._changed is None or self._loop is not asyncio.get_running_loop():
+            return
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: not self._pending and self._active == 0
+            )
+
+    def close(self) -> None:
+        """Cancel the worker coroutines (queued events are discarded)."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        self._pending.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth, latency and overflow metrics."""
+        return {
+            "name": self.name,
+            "policy": self.policy.value,
+            "workers": self.workers,
+            "maxsize": self.maxsize,
+            "depth": len(self._pending),
+            "max_depth": self.max_depth,
+            "active": self._active,
+            "processed": self.processed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "blocked": self.blocked,
+            "avg_latency_ms": (
+                round(self.total_latency / self.processed * 1000, 3)
+                if self.processed else 0.0
+            ),
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+        }
+
+    def _ensure_started(self) -> asyncio.Condition:
+        """Start the workers on the running loop (restarting after a loop change)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.close()
+            self._active = 0
+            self._loop = loop
+            self._changed = asyncio.Condition()
+        assert self._changed is not None
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+        return self._changed
+
+    async def _worker(self) -> None:
+        """Deliver queued events to their handlers one at a time."""
+        changed = self._changed
+        assert changed is not None
+        while True:
+            async with changed:
+                await changed.wait_for(lambda: bool(self._pending))
+                _, handler, event = self._pending.popleft()
+                self._active += 1
+                changed.notify_all()
+
+            start = time.perf_counter()
+            try:
+                await handler(event)
+            except Exception as e:
+                self.failed += 1
+                logger.error(
+                    "event_handler_failed",
+                    handler=handler.__name__,
+                    event_type=type(event).__name__,
+                    queue=self.name,
+                    error=str(e),
+                    exc_info=True,
+                )
+            finally:
+                self._active -= 1
+
+            elapsed = time.perf_counter() - start
+            self.processed += 1
+            self.total_latency += elapsed
+            self.max_latency = max(self.max_latency, elapsed)
+
+            async with changed:
+                changed.notify_all()
+
+
 class EventBus:
     """Asynchronous event bus for internal communication.
 
@@ -59,23 +293,48 @@ class EventBus:
         """Initialize the event bus."""
         self._handlers: dict[Type[Event], list[EventHandler]] = {}
         self._running_tasks: set[asyncio.Task[None]] = set()
-
-    def subscribe(self, event_type: Type[Event], handler: EventHandler) -> None:
+        self._queues: dict[tuple[Type[Event], EventHandler], HandlerQueue] = {}
+
+    def subscribe(
+        self,
+        event_type: Type[Event],
+        handler: EventHandler,
+        *,
+        queue: HandlerQueue | None = None,
+    ) -> None:
         """Subscribe a handler to an event type.
 
         The handler will be invoked whenever an event of the specified type
         is published. Multiple handlers can subscribe to the same event type.
 
+        By default every published event is handled in its own task. Passing
+        a ``queue`` switches the subscription to queued dispatch: events are
+        buffered in the bounded queue and handled by its workers, and the
+        queue's policy decides what happens when it is full. A handler must
+        not publish events into its own BLOCK queue, as it would wait on
+        itself.
+
         Args:
             event_type: The event class to subscribe to
             handler: Async function to handle the event
+            queue: Bounded queue to dispatch through (None = one task per event)
 
         Example:
             >>> async def log_violation(event: ViolationCreatedEvent):
             ...     logger.info(f"Violation {event.violation_id} created")
             >>>
             >>> bus.subscribe(ViolationCreatedEvent, log_violation)
+            >>>
+            >>> limits_queue = HandlerQueue(
+            ...     "limits",
+            ...     maxsize=100,
+            ...     policy=BackpressurePolicy.COALESCE,
+            ...     key=lambda e: e.characteristic_id,
+            ... )
+            >>> bus.subscribe(ControlLimitsUpdatedEvent, on_limits, queue=limits_queue)
         """
+        if queue is not None:
+            self._queues[(event_type, handler)] = queue
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
@@ -83,6 +342,7 @@ class EventBus:
             "handler_subscribed",
             handler=handler.__name__,
             event_type=event_type.__name__,
+            queue=queue.name if queue is not None else None,
         )
 
     def unsubscribe(self, event_type: Type[Event], handler: EventHandler) -> None:
@@ -102,6 +362,9 @@ class EventBus:
             self._handlers[event_type] = [
                 h for h in self._handlers[event_type] if h != handler
             ]
+            queue = self._queues.pop((event_type, handler), None)
+            if queue is not None and queue not in self._queues.values():
+                queue.close()
             logger.debug(
                 "handler_unsubscribed",
                 handler=handler.__name__,
@@ -111,8 +374,9 @@ class EventBus:
     async def publish(self, event: Event) -> None:
         """Publish an event to all subscribed handlers.
 
-        Handlers are invoked asynchronously and do not block the publisher.
-        Errors in handlers are caught and logged but do not propagate.
+        Handlers are invoked asynchronously and do not block the publisher,
+        except for queued subscriptions with the BLOCK policy whose queue is
+        full. Errors in handlers are caught and logged but do not propagate.
 
         Args:
             event: The event to publish
@@ -142,6 +406,10 @@ class EventBus:
             )
 
         for handler in handlers:
+            queue = self._queues.get((event_type, handler))
+            if queue is not None:
+                await queue.put(handler, event)
+                continue
             task = asyncio.create_task(self._safe_invoke(handler, event))
             self._running_tasks.add(task)
             task.add_done_callback(self._running_tasks.discard)
@@ -151,7 +419,8 @@ class EventBus:
 
         Unlike publish(), this method waits for all handlers to finish
         before returning. This is useful when you need to ensure event
-        processing is complete before proceeding.
+        processing is complete before proceeding. Queued subscriptions are
+        bypassed: handlers are invoked directly.
 
         Args:
             event: The event to publish
@@ -248,10 +517,12 @@ class EventBus:
             return e
 
     async def shutdown(self) -> None:
-        """Wait for all pending tasks to complete.
+        """Wait for all pending tasks and queued events to complete.
 
         Should be called during application shutdown to ensure
-        all event handlers have completed processing.
+        all event handlers have completed processing. Queue workers are
+        stopped once their queue is drained (and restarted by the next
+        publish).
 
         Example:
             >>> # During application shutdown
@@ -262,6 +533,30 @@ class EventBus:
             await asyncio.gather(*self._running_tasks, return_exceptions=True)
             logger.info("All event handlers completed")
 
+        for queue in self._unique_queues():
+            await queue.join()
+            queue.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return dispatch metrics.
+
+        Returns:
+            Dict with the number of in-flight per-event tasks and, for each
+            queued subscription, its queue depth, handler latency and
+            drop/coalesce/block counters
+        """
+        return {
+            "running_tasks": len(self._running_tasks),
+            "queues": [queue.get_stats() for queue in self._unique_queues()],
+        }
+
+    def _unique_queues(self) -> list[HandlerQueue]:
+        """Return the distinct queues attached to subscriptions."""
+        queues: dict[int, HandlerQueue] = {}
+        for queue in self._queues.values():
+            queues.setdefault(id(queue), queue)
+        return list(queues.values())
+
     def get_handler_count(self, event_type: Type[Event]) -> int:
         """Get the number of handlers subscribed to an event type.
 
@@ -294,6 +589,11 @@ class EventBus:
             >>> # Clear handlers for specific event
             >>> bus.clear_handlers(SampleProcessedEvent)
         """
+        for sub_key in [k for k in self._queues if event_type in (None, k[0])]:
+            queue = self._queues.pop(sub_key)
+            if queue not in self._queues.values():
+                queue.close()
+
         if event_type is None:
             self._handlers.clear()
             logger.debug("Cleared all event handlers")
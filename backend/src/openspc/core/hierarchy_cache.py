@@ -0,0 +1,202 @@
+"""In-process cache of hierarchy paths such as "Plant A > Line 1 > Cell 3".
+
+Violation lists show the hierarchy path of every characteristic on the
+page. Walking the parent chain costs one query per ancestor level, so
+HierarchyPathCache instead loads all nodes of a plant with a single query
+and resolves every path of that plant from the in-memory node map.
+
+Hierarchy endpoints call invalidate() for the affected plant when nodes are
+created, renamed, moved or deleted. A TTL bounds staleness for changes made
+outside this process.
+
+Example:
+    >>> paths = await hierarchy_path_cache.get_paths(HierarchyRepository(session), [3, 7])
+    >>> paths[3]
+    'Plant A > Line 1 > Cell 3'
+"""
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from openspc.core.cache_stats import hit_stats
+
+if TYPE_CHECKING:
+    from openspc.db.repositories import HierarchyRepository
+
+logger = structlog.get_logger(__name__)
+
+PATH_SEPARATOR = " > "
+
+# Marks node IDs whose plant is not known (None is a valid plant key)
+_UNKNOWN = object()
+
+
+@dataclass
+class _PlantNodes:
+    """Node map of one plant with memoized paths."""
+
+    nodes: dict[int, tuple[str, int | None]]
+    loaded_at: float
+    paths: dict[int, str] = field(default_factory=dict)
+
+    def path(self, node_id: int) -> str:
+        """Resolve the path of a node, memoizing it and its ancestors."""
+        cached = self.paths.get(node_id)
+        if cached is not None:
+            return cached
+
+        # Walk up to the root or the first ancestor with a known path
+        chain: list[int] = []
+        current: int | None = node_id
+        while (
+            current is not None
+            and current in self.nodes
+            and current not in self.paths
+            and current not in chain
+        ):
+            chain.append(current)
+            current = self.nodes[current][1]
+
+        prefix = self.paths.get(current, "") if current is not None else ""
+        for ancestor_id in reversed(chain):
+            name = self.nodes[ancestor_id][0]
+            prefix = f"{prefix}{PATH_SEPARATOR}{name}" if prefix else name
+            self.paths[ancestor_id] = prefix
+        return self.paths.get(node_id, "")
+
+
+class HierarchyPathCache:
+    """Plant-wide hierarchy node maps for resolving hierarchy paths.
+
+    Args:
+        ttl_seconds: Maximum age of a plant's node map (None = no expiry)
+    """
+
+    def __init__(self, ttl_seconds: float | None = 300.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._plants: dict[int | None, _PlantNodes] = {}
+        self._node_plant: dict[int, int | None] = {}
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def configure(self, ttl_seconds: float | None = None) -> None:
+        """Update the TTL and drop all node maps.
+
+        Args:
+            ttl_seconds: Maximum age of a node map (0 disables expiry)
+        """
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds or None
+        self.clear()
+
+    async def get_path(self, hierarchy_repo: "HierarchyRepository", hierarchy_id: int) -> str:
+        """Return the path of one hierarchy node.
+
+        Args:
+            hierarchy_repo: Repository used to load missing node maps
+            hierarchy_id: Hierarchy node ID
+
+        Returns:
+            Path from the root, or "" if the node does not exist
+        """
+        return (await self.get_paths(hierarchy_repo, [hierarchy_id])).get(hierarchy_id, "")
+
+    async def get_paths(
+        self, hierarchy_repo: "HierarchyRepository", hierarchy_ids: Iterable[int]
+    ) -> dict[int, str]:
+        """Return the paths of many hierarchy nodes.
+
+        Node maps of plants not yet cached are loaded with one query per
+        plant, plus one query to find the plants of unknown nodes.
+
+        Args:
+            hierarchy_repo: Repository used to load missing node maps
+            hierarchy_ids: Hierarchy node IDs
+
+        Returns:
+            Dict mapping node ID to path; nodes that do not exist are omitted
+        """
+        ids = list(dict.fromkeys(hierarchy_ids))
+        now = time.monotonic()
+
+        unknown = [
+            node_id for node_id in ids
+            if not self._is_fresh(self._node_plant.get(node_id, _UNKNOWN), now)
+        ]
+        if unknown:
+            self.misses += len(unknown)
+            plant_ids = await hierarchy_repo.get_plant_ids(unknown)
+            for plant_id in set(plant_ids.values()):
+                await self._load_plant(hierarchy_repo, plant_id)
+        self.hits += len(ids) - len(unknown)
+
+        paths: dict[int, str] = {}
+        for node_id in ids:
+            plant_id = self._node_plant.get(node_id, _UNKNOWN)
+            if plant_id is _UNKNOWN:
+                continue
+            paths[node_id] = self._plants[plant_id].path(node_id)
+        return paths
+
+    def _is_fresh(self, plant_id: Any, now: float) -> bool:
+        """Whether the node map of a plant is cached and not expired."""
+        if plant_id is _UNKNOWN:
+            return False
+        entry = self._plants.get(plant_id)
+        if entry is None:
+            return False
+        return self.ttl_seconds is None or now - entry.loaded_at < self.ttl_seconds
+
+    async def _load_plant(
+        self, hierarchy_repo: "HierarchyRepository", plant_id: int | None
+    ) -> None:
+        """Load all hierarchy nodes of a plant into a fresh node map."""
+        nodes = await hierarchy_repo.get_node_map(plant_id)
+        self._drop_plant(plant_id)
+        self._plants[plant_id] = _PlantNodes(nodes=nodes, loaded_at=time.monotonic())
+        for node_id in nodes:
+            self._node_plant[node_id] = plant_id
+        logger.debug("hierarchy_nodes_loaded", plant_id=plant_id, nodes=len(nodes))
+
+    def _drop_plant(self, plant_id: int | None) -> None:
+        """Remove a plant's node map and its node index entries."""
+        entry = self._plants.pop(plant_id, None)
+        if entry is not None:
+            for node_id in entry.nodes:
+                if self._node_plant.get(node_id, _UNKNOWN) == plant_id:
+                    del self._node_plant[node_id]
+
+    def invalidate(self, plant_id: int | None) -> None:
+        """Drop the node map of one plant.
+
+        Args:
+            plant_id: Plant whose hierarchy changed (None for nodes without
+                a plant)
+        """
+        self.invalidations += 1
+        self._drop_plant(plant_id)
+
+    def clear(self) -> None:
+        """Drop all node maps."""
+        self._plants.clear()
+        self._node_plant.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        return {
+            "plants": len(self._plants),
+            "nodes": len(self._node_plant),
+            **hit_stats(self.hits, self.misses),
+            "invalidations": self.invalidations,
+        }
+
+
+# Global cache shared by request handlers
+hierarchy_path_cache = HierarchyPathCache()
@@ -5,6 +5,7 @@ from openspc.core.providers.manager import TagProviderManager, TagProviderState,
 from openspc.core.providers.manual import ManualProvider
 from openspc.core.providers.opcua_manager import OPCUAProviderManager, OPCUAProviderState, opcua_provider_manager
 from openspc.core.providers.opcua_provider import OPCUANodeConfig, OPCUAProvider
+from openspc.core.providers.pipeline import KeyedWorkerPool
 from openspc.core.providers.protocol import (
     DataProvider,
     SampleCallback,
@@ -16,6 +17,7 @@ from openspc.db.models.data_source import TriggerStrategy
 
 __all__ = [
     "DataProvider",
+    "KeyedWorkerPool",
     "SampleCallback",
     "SampleContext",
     "SampleEvent",
@@ -43,17 +43,20 @@ class SubgroupBuffer:
         config: Configuration for this buffer
         values: Accumulated measurement values
         first_reading_time: Timestamp of first reading in current buffer
+        last_timestamp: Source timestamp of the latest reading that had one
     """
 
     config: TagConfig
     values: list[float] = field(default_factory=list)
     first_reading_time: datetime | None = None
+    last_timestamp: datetime | None = None
 
-    def add(self, value: float) -> bool:
+    def add(self, value: float, timestamp: datetime | None = None) -> bool:
         """Add a value to the buffer.
 
         Args:
             value: Measurement value to add
+            timestamp: Source timestamp of the reading (None if unknown)
 
         Returns:
             True if buffer is now full (reached subgroup_size)
@@ -61,6 +64,8 @@ class SubgroupBuffer:
         if not self.values:
             self.first_reading_time = datetime.now(timezone.utc)
         self.values.append(value)
+        if timestamp is not None:
+            self.last_timestamp = timestamp
         return len(self.values) >= self.config.subgroup_size
 
     def is_ready(self) -> bool:
@@ -91,10 +96,13 @@ class SubgroupBuffer:
     def flush(self) -> list[float]:
         """Get all values and clear the buffer.
 
+        Clears ``last_timestamp`` too, so read it before flushing.
+
         Returns:
             List of buffered values (may be less than subgroup_size)
         """
         values = self.values.copy()
         self.values.clear()
         self.first_reading_time = None
+        self.last_timestamp = None
         return values
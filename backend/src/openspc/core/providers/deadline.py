@@ -0,0 +1,173 @@
+"""Deadline scheduler for flushing partial subgroups on timeout.
+
+Providers used to wake every few seconds and check every buffer for a
+timeout, which costs a scan of all buffers per tick and flushes up to one
+tick late. Instead, a provider registers a deadline with a DeadlineScheduler
+when a buffer receives its first reading and cancels it when the buffer is
+flushed. The scheduler keeps deadlines in a heap on the monotonic clock and
+sleeps until the earliest one, so partial subgroups are flushed at their
+deadline and idle buffers cost nothing.
+
+Cancelled and rescheduled deadlines are removed lazily: their heap entries
+are skipped when they reach the top, and the heap is rebuilt when stale
+entries outnumber live ones.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+
+
+class DeadlineScheduler(Generic[K]):
+    """Invokes a callback for each key whose deadline has passed.
+
+    Each key has at most one deadline; scheduling a key again replaces it.
+    Callbacks run one at a time on the scheduler's task.
+
+    Args:
+        name: Scheduler name used in logs and metrics
+        callback: Async function invoked with the key at its deadline
+
+    Example:
+        >>> deadlines = DeadlineScheduler("tag", flush_on_timeout)
+        >>> deadlines.start()
+        >>> deadlines.schedule(char_id, config.buffer_timeout_seconds)
+        >>> deadlines.cancel(char_id)  # buffer flushed before its deadline
+        >>> await deadlines.stop()
+    """
+
+    def __init__(self, name: str, callback: Callable[[K], Awaitable[None]]) -> None:
+        self.name = name
+        self._callback = callback
+        self._heap: list[tuple[float, int, K]] = []
+        self._entries: dict[K, int] = {}  # key -> sequence of its live heap entry
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+        # Metrics
+        self.fired = 0
+        self.failed = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the scheduler task is running."""
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start the scheduler task (no-op if already running)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the scheduler task and drop all deadlines."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.clear()
+
+    def schedule(self, key: K, delay: float) -> None:
+        """Set the deadline of a key, replacing any earlier one.
+
+        Args:
+            key: Key passed to the callback (e.g. characteristic ID)
+            delay: Seconds from now until the deadline
+        """
+        sequence = next(self._sequence)
+        deadline = time.monotonic() + delay
+        self._entries[key] = sequence
+        heapq.heappush(self._heap, (deadline, sequence, key))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+        if self._heap[0][1] == sequence:
+            # New earliest deadline: wake the task to shorten its sleep
+            self._wakeup.set()
+
+    def cancel(self, key: K) -> None:
+        """Remove the deadline of a key (no-op if it has none).
+
+        Args:
+            key: Key whose deadline to remove
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all deadlines."""
+        self._heap.clear()
+        self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return pending deadline count and callback counters."""
+        return {
+            "name": self.name,
+            "pending": len(self._entries),
+            "heap_size": len(self._heap),
+            "fired": self.fired,
+            "failed": self.failed,
+        }
+
+    def _compact(self) -> None:
+        """Rebuild the heap from live entries only."""
+        self._heap = [
+            entry for entry in self._heap if self._entries.get(entry[2]) == entry[1]
+        ]
+        heapq.heapify(self._heap)
+
+    def _pop_due(self) -> tuple[K | None, float | None]:
+        """Pop the next due key, or return the delay until the next deadline."""
+        while self._heap:
+            deadline, sequence, key = self._heap[0]
+            if self._entries.get(key) != sequence:
+                heapq.heappop(self._heap)
+                continue
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                return None, delay
+            heapq.heappop(self._heap)
+            del self._entries[key]
+            return key, None
+        return None, None
+
+    async def _run(self) -> None:
+        """Sleep until the earliest deadline and invoke its callback."""
+        while True:
+            self._wakeup.clear()
+            key, delay = self._pop_due()
+            if key is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._callback(key)
+                self.fired += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(
+                    "deadline_callback_failed",
+                    scheduler=self.name,
+                    key=key,
+                    error=str(e),
+                    exc_info=True,
+                )
@@ -6,19 +6,17 @@ within the FastAPI application, connecting it to the MQTT manager and SPC engine
 
 from __future__ import annotations
 
+import asyncio
 import structlog
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from openspc.core.providers.protocol import SampleEvent
 from openspc.core.providers.tag import TagProvider
 
-if TYPE_CHECKING:
-    from openspc.core.engine.spc_engine import SPCEngine
-
 logger = structlog.get_logger(__name__)
 
 
@@ -33,6 +31,8 @@ class TagProviderState:
         samples_processed: Total samples processed since startup
         last_sample_time: Timestamp of last processed sample
         error_message: Current error message if not running
+        pending_messages: Received MQTT messages waiting to be decoded
+        pending_samples: Completed subgroups waiting for SPC processing
     """
 
     is_running: bool = False
@@ -41,6 +41,8 @@ class TagProviderState:
     samples_processed: int = 0
     last_sample_time: datetime | None = None
     error_message: str | None = None
+    pending_messages: int = 0
+    pending_samples: int = 0
 
     def __post_init__(self):
         if self.subscribed_topics is None:
@@ -51,8 +53,8 @@ class TagProviderManager:
     """Manages TAG provider lifecycle for the application.
 
     Provides a singleton-like manager for the TagProvider that:
-    - Initializes the provider with MQTT client and SPC engine
-    - Handles sample processing callbacks
+    - Initializes the provider with the MQTT client
+    - Hands completed samples to the group-commit writer
     - Tracks provider state
     - Supports restart on configuration changes
 
@@ -67,7 +69,6 @@ class TagProviderManager:
     def __init__(self):
         """Initialize the TAG provider manager."""
         self._provider: TagProvider | None = None
-        self._spc_engine: SPCEngine | None = None
         self._state = TagProviderState()
         self._session: AsyncSession | None = None
 
@@ -81,6 +82,8 @@ class TagProviderManager:
         if self._provider:
             self._state.subscribed_topics = list(self._provider._topic_to_chars.keys())
             self._state.characteristics_count = len(self._provider._configs)
+            self._state.pending_messages = self._provider.pending_messages
+            self._state.pending_samples = self._provider.pending_samples
         return self._state
 
     @property
@@ -92,11 +95,25 @@ class TagProviderManager:
         """
         return self._provider is not None and self._provider._running
 
+    def get_stats(self) -> dict[str, Any]:
+        """Return ingestion pipeline and buffer timeout metrics.
+
+        Returns:
+            Dict with ``pipeline`` and ``deadlines`` stats (empty if stopped)
+        """
+        if self._provider is None:
+            return {}
+        return {
+            "pipeline": self._provider._pool.get_stats(),
+            "deadlines": self._provider._deadlines.get_stats(),
+        }
+
     async def initialize(self, session: AsyncSession) -> bool:
         """Initialize TAG provider with database session.
 
-        Sets up the TAG provider with the MQTT client from mqtt_manager
-        and creates an SPC engine for processing samples.
+        Sets up the TAG provider with the MQTT client from mqtt_manager.
+        Samples are processed and committed by the shared group-commit
+        writer (``openspc.core.engine.sample_writer``), which must be started.
 
         Args:
             session: SQLAlchemy async session for database access
@@ -105,17 +122,11 @@ class TagProviderManager:
             True if initialization was successful, False otherwise
         """
         # Lazy imports to avoid circular dependencies
-        from openspc.core.engine.nelson_rules import NelsonRuleLibrary
-        from openspc.core.engine.rolling_window import RollingWindowManager
-        from openspc.core.engine.spc_engine import SPCEngine
-        from openspc.core.events import event_bus
-        from openspc.db.repositories import (
-            CharacteristicRepository,
-            SampleRepository,
-            ViolationRepository,
-        )
+        from openspc.core.config import get_settings
         from openspc.mqtt import mqtt_manager
 
+        settings = get_settings()
+
         logger.info("Initializing TAG provider manager")
         self._session = session
 
@@ -131,31 +142,15 @@ class TagProviderManager:
             self._state.error_message = "No MQTT client available"
             return False
 
-        # Create repositories
-        char_repo = CharacteristicRepository(session)
-        sample_repo = SampleRepository(session)
-        violation_repo = ViolationRepository(session)
-
-        # Create rolling window manager
-        window_manager = RollingWindowManager(sample_repo)
-
-        # Create Nelson rule library
-        rule_library = NelsonRuleLibrary()
-
-        # Create SPC engine
-        self._spc_engine = SPCEngine(
-            char_repo=char_repo,
-            sample_repo=sample_repo,
-            violation_repo=violation_repo,
-            window_manager=window_manager,
-            rule_library=rule_library,
-            event_bus=event_bus,
-        )
-
         # Create TAG provider with DataSourceRepository
         from openspc.db.repositories import DataSourceRepository
         ds_repo = DataSourceRepository(session)
-        self._provider = TagProvider(mqtt_client, ds_repo)
+        self._provider = TagProvider(
+            mqtt_client,
+            ds_repo,
+            workers=settings.tag_pipeline_workers,
+            queue_size=settings.tag_pipeline_queue_size,
+        )
         self._provider.set_callback(self._on_sample)
 
         # Start the provider
@@ -173,14 +168,15 @@ class TagProviderManager:
     async def _on_sample(self, event: SampleEvent) -> None:
         """Callback when TAG provider has a sample ready.
 
-        Processes the sample through the SPC engine.
+        Hands the sample to the group-commit writer. Runs on the provider's
+        processing worker for the characteristic and only waits while the
+        writer's queue is full; the result is logged once the sample's group
+        has been committed.
 
         Args:
             event: Sample event from TAG provider
         """
-        if self._spc_engine is None:
-            logger.warning("Cannot process sample: SPC engine not initialized")
-            return
+        from openspc.core.engine.group_commit import sample_writer
 
         logger.info(
             "processing_tag_sample",
@@ -189,31 +185,43 @@ class TagProviderManager:
         )
 
         try:
-            result = await self._spc_engine.process_sample(
-                characteristic_id=event.characteristic_id,
-                measurements=event.measurements,
-                context=event.context,
+            future = await sample_writer.submit(event)
+        except RuntimeError:
+            logger.warning(
+                "sample_writer_not_running", characteristic_id=event.characteristic_id
             )
+            return
+        future.add_done_callback(lambda f: self._on_committed(event, f))
 
-            self._state.samples_processed += 1
-            self._state.last_sample_time = datetime.now()
-
-            logger.info(
-                "tag_sample_processed",
-                sample_id=result.sample_id,
-                mean=round(result.mean, 3),
-                zone=result.zone,
-                in_control=result.in_control,
-                violation_count=len(result.violations),
-            )
+    def _on_committed(self, event: SampleEvent, future: asyncio.Future) -> None:
+        """Record the outcome of a submitted sample after its group commit.
 
-        except Exception as e:
+        Args:
+            event: The submitted sample event
+            future: Writer future holding the ProcessingResult or error
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
             logger.error(
                 "tag_sample_processing_error",
                 characteristic_id=event.characteristic_id,
-                error=str(e),
-                exc_info=True,
+                error=str(error),
             )
+            return
+
+        result = future.result()
+        self._state.samples_processed += 1
+        self._state.last_sample_time = datetime.now()
+        logger.info(
+            "tag_sample_processed",
+            sample_id=result.sample_id,
+            mean=round(result.mean, 3),
+            zone=result.zone,
+            in_control=result.in_control,
+            violation_count=len(result.violations),
+        )
 
     async def restart(self, session: AsyncSession) -> bool:
         """Restart the TAG provider.
@@ -245,7 +253,6 @@ class TagProviderManager:
             await self._provider.stop()
             self._provider = None
 
-        self._spc_engine = None
         self._state.is_running = False
         self._state.error_message = "Manager shutdown"
 
@@ -10,19 +10,17 @@ distinct from the CONNECTION-side manager (opcua/manager.py).
 
 from __future__ import annotations
 
+import asyncio
 import structlog
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from openspc.core.providers.opcua_provider import OPCUAProvider
 from openspc.core.providers.protocol import SampleEvent
 
-if TYPE_CHECKING:
-    from openspc.core.engine.spc_engine import SPCEngine
-
 logger = structlog.get_logger(__name__)
 
 
@@ -55,8 +53,8 @@ class OPCUAProviderManager:
     """Manages OPC-UA provider lifecycle for the application.
 
     Provides a singleton-like manager for the OPCUAProvider that:
-    - Initializes the provider with OPC-UA manager and SPC engine
-    - Handles sample processing callbacks
+    - Initializes the provider with the OPC-UA manager
+    - Hands completed samples to the group-commit writer
     - Tracks provider state
     - Supports restart on configuration changes
     """
@@ -64,7 +62,6 @@ class OPCUAProviderManager:
     def __init__(self):
         """Initialize the OPC-UA provider manager."""
         self._provider: OPCUAProvider | None = None
-        self._spc_engine: SPCEngine | None = None
         self._state = OPCUAProviderState()
         self._session: AsyncSession | None = None
 
@@ -81,11 +78,18 @@ class OPCUAProviderManager:
         """Check if provider is currently running."""
         return self._provider is not None and self._provider._running
 
+    def get_stats(self) -> dict[str, Any]:
+        """Return buffer timeout metrics (empty if stopped)."""
+        if self._provider is None:
+            return {}
+        return {"deadlines": self._provider._deadlines.get_stats()}
+
     async def initialize(self, session: AsyncSession) -> bool:
         """Initialize OPC-UA provider with database session.
 
-        Sets up the OPC-UA provider with the OPC-UA manager from opcua_manager
-        and creates an SPC engine for processing samples.
+        Sets up the OPC-UA provider with the OPC-UA manager from opcua_manager.
+        Samples are processed and committed by the shared group-commit
+        writer (``openspc.core.engine.sample_writer``), which must be started.
 
         Args:
             session: SQLAlchemy async session for database access
@@ -94,15 +98,6 @@ class OPCUAProviderManager:
             True if initialization was successful, False otherwise
         """
         # Lazy imports to avoid circular dependencies
-        from openspc.core.engine.nelson_rules import NelsonRuleLibrary
-        from openspc.core.engine.rolling_window import RollingWindowManager
-        from openspc.core.engine.spc_engine import SPCEngine
-        from openspc.core.events import event_bus
-        from openspc.db.repositories import (
-            CharacteristicRepository,
-            SampleRepository,
-            ViolationRepository,
-        )
         from openspc.db.repositories import DataSourceRepository
         from openspc.opcua.manager import opcua_manager
 
@@ -115,27 +110,6 @@ class OPCUAProviderManager:
             self._state.error_message = "No OPC-UA servers connected"
             return False
 
-        # Create repositories
-        char_repo = CharacteristicRepository(session)
-        sample_repo = SampleRepository(session)
-        violation_repo = ViolationRepository(session)
-
-        # Create rolling window manager
-        window_manager = RollingWindowManager(sample_repo)
-
-        # Create Nelson rule library
-        rule_library = NelsonRuleLibrary()
-
-        # Create SPC engine
-        self._spc_engine = SPCEngine(
-            char_repo=char_repo,
-            sample_repo=sample_repo,
-            violation_repo=violation_repo,
-            window_manager=window_manager,
-            rule_library=rule_library,
-            event_bus=event_bus,
-        )
-
         # Create OPC-UA provider with DataSourceRepository
         ds_repo = DataSourceRepository(session)
         self._provider = OPCUAProvider(opcua_manager, ds_repo)
@@ -156,14 +130,13 @@ class OPCUAProviderManager:
     async def _on_sample(self, event: SampleEvent) -> None:
         """Callback when OPC-UA provider has a sample ready.
 
-        Processes the sample through the SPC engine.
+        Hands the sample to the group-commit writer; the result is logged
+        once the sample's group has been committed.
 
         Args:
             event: Sample event from OPC-UA provider
         """
-        if self._spc_engine is None:
-            logger.warning("Cannot process sample: SPC engine not initialized")
-            return
+        from openspc.core.engine.group_commit import sample_writer
 
         logger.info(
             "processing_opcua_sample",
@@ -172,31 +145,43 @@ class OPCUAProviderManager:
         )
 
         try:
-            result = await self._spc_engine.process_sample(
-                characteristic_id=event.characteristic_id,
-                measurements=event.measurements,
-                context=event.context,
+            future = await sample_writer.submit(event)
+        except RuntimeError:
+            logger.warning(
+                "sample_writer_not_running", characteristic_id=event.characteristic_id
             )
+            return
+        future.add_done_callback(lambda f: self._on_committed(event, f))
 
-            self._state.samples_processed += 1
-            self._state.last_sample_time = datetime.now()
-
-            logger.info(
-                "opcua_sample_processed",
-                sample_id=result.sample_id,
-                mean=round(result.mean, 3),
-                zone=result.zone,
-                in_control=result.in_control,
-                violation_count=len(result.violations),
-            )
+    def _on_committed(self, event: SampleEvent, future: asyncio.Future) -> None:
+        """Record the outcome of a submitted sample after its group commit.
 
-        except Exception as e:
+        Args:
+            event: The submitted sample event
+            future: Writer future holding the ProcessingResult or error
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
             logger.error(
                 "opcua_sample_processing_error",
                 characteristic_id=event.characteristic_id,
-                error=str(e),
-                exc_info=True,
+                error=str(error),
             )
+            return
+
+        result = future.result()
+        self._state.samples_processed += 1
+        self._state.last_sample_time = datetime.now()
+        logger.info(
+            "opcua_sample_processed",
+            sample_id=result.sample_id,
+            mean=round(result.mean, 3),
+            zone=result.zone,
+            in_control=result.in_control,
+            violation_count=len(result.violations),
+        )
 
     async def restart(self, session: AsyncSession) -> bool:
         """Restart the OPC-UA provider.
@@ -228,7 +213,6 @@ class OPCUAProviderManager:
             await self._provider.stop()
             self._provider = None
 
-        self._spc_engine = None
         self._state.is_running = False
         self._state.error_message = "Manager shutdown"
 
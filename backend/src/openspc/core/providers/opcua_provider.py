@@ -5,7 +5,6 @@ node data changes and automatically collects measurements, buffering them
 into subgroups and triggering sample processing based on configured strategies.
 """
 
-import asyncio
 import structlog
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -14,6 +13,7 @@ from typing import TYPE_CHECKING
 from asyncua import ua
 
 from openspc.core.providers.buffer import SubgroupBuffer, TagConfig
+from openspc.core.providers.deadline import DeadlineScheduler
 from openspc.core.providers.protocol import DataProvider, SampleCallback, SampleContext, SampleEvent
 from openspc.db.models.data_source import TriggerStrategy
 
@@ -80,7 +80,9 @@ class OPCUAProvider(DataProvider):
         self._configs: dict[int, OPCUANodeConfig] = {}  # char_id -> config
         self._buffers: dict[int, SubgroupBuffer] = {}  # char_id -> buffer
         self._node_to_char: dict[str, int] = {}  # node_id -> char_id
-        self._timeout_task: asyncio.Task | None = None
+        self._deadlines: DeadlineScheduler[int] = DeadlineScheduler(
+            "opcua_provider", self._on_buffer_deadline
+        )
         self._running = False
 
     async def start(self) -> None:
@@ -90,12 +92,12 @@ class OPCUAProvider(DataProvider):
         1. Loads all active OPC-UA data sources from the database
         2. Creates configurations and buffers for each
         3. Subscribes to their OPC-UA node data changes
-        4. Starts the buffer timeout monitoring loop
+        4. Starts the buffer timeout scheduler
         """
         logger.info("Starting OPCUAProvider")
         self._running = True
         await self._load_opcua_sources()
-        self._timeout_task = asyncio.create_task(self._timeout_loop())
+        self._deadlines.start()
         logger.info(
             "opcua_provider_started",
             characteristics_count=len(self._configs),
@@ -105,20 +107,14 @@ class OPCUAProvider(DataProvider):
         """Stop the provider and clean up resources.
 
         This method:
-        1. Stops the timeout monitoring loop
+        1. Stops the buffer timeout scheduler
         2. Unsubscribes from all OPC-UA nodes
         3. Clears all buffers and configurations
         """
         logger.info("Stopping OPCUAProvider")
         self._running = False
 
-        # Cancel timeout task
-        if self._timeout_task and not self._timeout_task.done():
-            self._timeout_task.cancel()
-            try:
-                await self._timeout_task
-            except asyncio.CancelledError:
-                pass
+        await self._deadlines.stop()
 
         # Unsubscribe from all nodes
         for char_id, config in list(self._configs.items()):
@@ -330,8 +326,10 @@ class OPCUAProvider(DataProvider):
     ) -> None:
         """Add a value to a buffer and flush if needed based on trigger strategy.
 
-        Only on_change and on_timer are supported for OPC-UA.
+        Only on_change and on_timer are supported for OPC-UA. The first value
+        of a new subgroup starts its buffer timeout.
         """
+        was_empty = not buffer.values
         if config.trigger_strategy == TriggerStrategy.ON_CHANGE.value:
             is_full = buffer.add(value)
             if is_full:
@@ -345,6 +343,8 @@ class OPCUAProvider(DataProvider):
                 buffer_count=len(buffer.values),
                 subgroup_size=config.subgroup_size,
             )
+        if was_empty and buffer.values:
+            self._deadlines.schedule(char_id, config.buffer_timeout_seconds)
 
     async def _flush_buffer(self, char_id: int) -> None:
         """Flush buffer and create sample event.
@@ -359,6 +359,7 @@ class OPCUAProvider(DataProvider):
             logger.warning("no_buffer_found", characteristic_id=char_id)
             return
 
+        self._deadlines.cancel(char_id)
         buffer = self._buffers[char_id]
         values = buffer.flush()
 
@@ -399,40 +400,24 @@ class OPCUAProvider(DataProvider):
                 exc_info=True,
             )
 
-    async def _timeout_loop(self) -> None:
-        """Monitor buffers for timeouts and flush partial subgroups.
+    async def _on_buffer_deadline(self, char_id: int) -> None:
+        """Flush a partial subgroup whose buffer timeout has passed.
 
-        This background task runs periodically to check if any buffers
-        have timed out. If a buffer has pending values and has exceeded
-        the timeout threshold, it is flushed even if not full.
+        Args:
+            char_id: ID of the characteristic whose deadline passed
         """
-        logger.info("Starting OPC-UA buffer timeout monitoring loop")
-
-        while self._running:
-            try:
-                await asyncio.sleep(5)  # Check every 5 seconds
-
-                for char_id, buffer in self._buffers.items():
-                    config = self._configs.get(char_id)
-                    if not config:
-                        continue
-
-                    if buffer.values and buffer.is_timed_out(config.buffer_timeout_seconds):
-                        logger.warning(
-                            "opcua_buffer_timeout",
-                            characteristic_id=char_id,
-                            buffer_count=len(buffer.values),
-                            expected=config.subgroup_size,
-                        )
-                        await self._flush_buffer(char_id)
-
-            except asyncio.CancelledError:
-                logger.info("OPC-UA buffer timeout loop cancelled")
-                break
-            except Exception as e:
-                logger.error("opcua_timeout_loop_error", error=str(e), exc_info=True)
+        buffer = self._buffers.get(char_id)
+        config = self._configs.get(char_id)
+        if not buffer or not config or not buffer.values:
+            return
 
-        logger.info("OPC-UA buffer timeout monitoring loop stopped")
+        logger.warning(
+            "opcua_buffer_timeout",
+            characteristic_id=char_id,
+            buffer_count=len(buffer.values),
+            expected=config.subgroup_size,
+        )
+        await self._flush_buffer(char_id)
 
     async def refresh_subscriptions(self, ds_repo: "DataSourceRepository") -> int:
         """Refresh OPC-UA subscriptions based on current data sources.
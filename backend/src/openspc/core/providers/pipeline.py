@@ -0,0 +1,169 @@
+"""Ordered worker pool for the provider ingestion pipeline.
+
+Providers receive readings on the transport's receive loop (MQTT message
+loop, OPC-UA subscription callbacks), which must never wait on database
+work. Completed subgroups are therefore handed to a KeyedWorkerPool: a fixed
+number of worker coroutines, each with its own bounded queue. Items are
+sharded by key (the characteristic ID), so samples of one characteristic are
+processed strictly in order by a single worker while different
+characteristics are processed in parallel.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Sentinel used to stop a worker once its queue has been drained
+_STOP = object()
+
+
+class KeyedWorkerPool(Generic[T]):
+    """Bounded, per-key ordered worker pool.
+
+    Args:
+        name: Pool name used in logs and metrics
+        handler: Async function invoked for each submitted item
+        workers: Number of worker coroutines (shards)
+        queue_size: Bound of each worker's queue; submit() waits when full
+
+    Example:
+        >>> pool = KeyedWorkerPool("tag", process_event, workers=4)
+        >>> pool.start()
+        >>> await pool.submit(event.characteristic_id, event)
+        >>> await pool.stop()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[T], Awaitable[None]],
+        workers: int = 1,
+        queue_size: int = 1000,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self._handler = handler
+        self._queues: list[asyncio.Queue] = []
+        self._tasks: list[asyncio.Task[None]] = []
+
+        # Metrics
+        self.submitted = 0
+        self.processed = 0
+        self.failed = 0
+        self.max_latency = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker coroutines are running."""
+        return bool(self._tasks)
+
+    @property
+    def pending(self) -> int:
+        """Number of items queued across all workers."""
+        return sum(queue.qsize() for queue in self._queues)
+
+    def shard(self, key: Hashable) -> int:
+        """Return the index of the worker that handles a key.
+
+        Args:
+            key: Ordering key (e.g. characteristic ID)
+
+        Returns:
+            Worker index in range(workers)
+        """
+        return hash(key) % self.workers
+
+    def start(self) -> None:
+        """Start the worker coroutines (no-op if already running)."""
+        if self._tasks:
+            return
+        self._queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(self.workers)]
+        self._tasks = [
+            asyncio.create_task(self._worker(index, queue))
+            for index, queue in enumerate(self._queues)
+        ]
+        logger.debug("worker_pool_started", pool=self.name, workers=self.workers)
+
+    async def submit(self, key: Hashable, item: T) -> None:
+        """Queue an item on the worker that owns its key.
+
+        Waits while that worker's queue is full (backpressure).
+
+        Args:
+            key: Ordering key
+            item: Item passed to the handler
+
+        Raises:
+            RuntimeError: If the pool is not running
+        """
+        if not self._tasks:
+            raise RuntimeError(f"Worker pool {self.name!r} is not running")
+        self.submitted += 1
+        await self._queues[self.shard(key)].put(item)
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the workers.
+
+        Args:
+            drain: Process queued items before stopping (otherwise discard them)
+        """
+        if not self._tasks:
+            return
+        if drain:
+            for queue in self._queues:
+                await queue.put(_STOP)
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        else:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = []
+        logger.debug("worker_pool_stopped", pool=self.name, processed=self.processed)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depths and processing counters."""
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "depths": [queue.qsize() for queue in self._queues],
+            "submitted": self.submitted,
+            "processed": self.processed,
+            "failed": self.failed,
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+        }
+
+    async def _worker(self, index: int, queue: asyncio.Queue) -> None:
+        """Process one shard's items in submission order."""
+        while True:
+            item = await queue.get()
+            if item is _STOP:
+                return
+
+            start = time.perf_counter()
+            try:
+                await self._handler(item)
+            except Exception as e:
+                self.failed += 1
+                logger.error(
+                    "worker_pool_handler_failed",
+                    pool=self.name,
+                    worker=index,
+                    error=str(e),
+                    exc_info=True,
+                )
+            self.processed += 1
+            self.max_latency = max(self.max_latency, time.perf_counter() - start)
@@ -0,0 +1,128 @@
+"""Conversion of TAG payloads into timestamped readings.
+
+Gateways batch many readings into one MQTT message to keep broker message
+rates down. A plain TAG payload may be:
+
+- a single number: ``12.5``
+- a JSON array of numbers: ``[12.5, 12.7, 12.4]``
+- a JSON array of objects with a source timestamp:
+  ``[{"value": 12.5, "ts": 1706890000000}, ...]``
+- a single such object
+
+Timestamps are either milliseconds since the epoch (the SparkplugB
+convention) or ISO 8601 strings. SparkplugB array and DataSet metric values
+are converted the same way: array elements take the metric timestamp,
+DataSet rows are read like the objects above (a ``value`` column, or the
+only non-timestamp column, and an optional ``ts``/``timestamp`` column).
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# A measurement value and its source timestamp (None if the source has none)
+Reading = tuple[float, datetime | None]
+
+_TIMESTAMP_KEYS = ("ts", "timestamp", "time")
+
+
+def parse_timestamp(raw: Any) -> datetime | None:
+    """Convert a source timestamp to an aware UTC datetime.
+
+    Args:
+        raw: Milliseconds since the epoch, ISO 8601 string, datetime or None
+
+    Returns:
+        Aware datetime, or None if ``raw`` is None
+
+    Raises:
+        ValueError: If ``raw`` is not a valid timestamp
+    """
+    if raw is None:
+        return None
+    if isinstance(raw, datetime):
+        return raw if raw.tzinfo else raw.replace(tzinfo=timezone.utc)
+    if isinstance(raw, bool):
+        raise ValueError(f"Invalid timestamp: {raw!r}")
+    if isinstance(raw, (int, float)):
+        return datetime.fromtimestamp(raw / 1000.0, tz=timezone.utc)
+    if isinstance(raw, str):
+        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    raise ValueError(f"Invalid timestamp: {raw!r}")
+
+
+def _reading_from_item(item: Any, default_timestamp: datetime | None) -> Reading:
+    """Convert one batch element (number or value/timestamp object) to a reading."""
+    if isinstance(item, dict):
+        fields = {str(key).lower(): value for key, value in item.items()}
+        ts_key = next((key for key in _TIMESTAMP_KEYS if key in fields), None)
+        if "value" in fields:
+            value = fields["value"]
+        else:
+            others = [v for key, v in fields.items() if key != ts_key]
+            if len(others) != 1:
+                raise ValueError(f"No value in {item!r}")
+            value = others[0]
+        timestamp = parse_timestamp(fields[ts_key]) if ts_key else None
+        return float(value), timestamp or default_timestamp
+    if isinstance(item, (bool, str)) or item is None:
+        raise ValueError(f"Invalid reading: {item!r}")
+    return float(item), default_timestamp
+
+
+def readings_from_value(value: Any, timestamp: datetime | None = None) -> list[Reading]:
+    """Convert a decoded value (number, list or object) to readings.
+
+    Elements of a list that are not valid readings are skipped.
+
+    Args:
+        value: Scalar, list of numbers/objects, or value/timestamp object
+        timestamp: Source timestamp for readings without their own
+
+    Returns:
+        Readings in payload order
+
+    Raises:
+        ValueError: If a non-list value is not a valid reading
+    """
+    timestamp = parse_timestamp(timestamp)
+    if not isinstance(value, list):
+        return [_reading_from_item(value, timestamp)]
+
+    readings: list[Reading] = []
+    for item in value:
+        try:
+            readings.append(_reading_from_item(item, timestamp))
+        except (TypeError, ValueError) as e:
+            logger.warning("skipping_invalid_reading", item=repr(item), error=str(e))
+    return readings
+
+
+def parse_plain_payload(payload: bytes) -> list[Reading]:
+    """Parse a plain (non-SparkplugB) TAG payload into readings.
+
+    Args:
+        payload: Message payload as bytes
+
+    Returns:
+        Readings in payload order
+
+    Raises:
+        ValueError: If the payload is neither a number nor a JSON batch
+    """
+    text = payload.decode().strip()
+    try:
+        return [(float(text), None)]
+    except ValueError:
+        if not text.startswith(("[", "{")):
+            raise
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON payload: {e}") from e
+    return readings_from_value(data)
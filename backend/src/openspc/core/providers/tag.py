@@ -3,6 +3,15 @@
 This module provides the TagProvider class, which subscribes to MQTT topics
 and automatically collects measurements from machine tags, buffering them
 into subgroups and triggering sample processing based on configured strategies.
+
+Messages flow through a three-stage pipeline so that slow SPC processing
+(database writes) never blocks reading from the broker socket:
+
+1. Receive: the MQTT message loop only enqueues raw messages
+2. Decode/buffer: a single task decodes payloads and fills subgroup buffers
+   in arrival order (data and trigger messages share one queue)
+3. Process: completed subgroups go to a KeyedWorkerPool, ordered per
+   characteristic and parallel across characteristics
 """
 
 import asyncio
@@ -11,9 +20,13 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from openspc.core.providers.buffer import SubgroupBuffer, TagConfig
+from openspc.core.providers.deadline import DeadlineScheduler
+from openspc.core.providers.pipeline import KeyedWorkerPool
 from openspc.core.providers.protocol import DataProvider, SampleCallback, SampleContext, SampleEvent
+from openspc.core.providers.readings import Reading, parse_plain_payload, readings_from_value
 from openspc.db.models.data_source import TriggerStrategy
 from openspc.mqtt.client import MQTTClient
+from openspc.mqtt.sparkplug import SparkplugAliasTable, SparkplugDecoder
 
 if TYPE_CHECKING:
     from openspc.db.repositories.data_source import DataSourceRepository
@@ -35,10 +48,14 @@ class TagProvider(DataProvider):
     - Buffer timeout to flush partial subgroups
     - Multiple trigger strategies (ON_CHANGE, ON_TRIGGER, ON_TIMER)
     - Topic-to-characteristic mapping
+    - Batched payloads: many readings with source timestamps per message
+    - SparkplugB metric aliases learned from birth certificates
 
     Args:
         mqtt_client: MQTT client for topic subscriptions
-        char_repo: Repository for characteristic queries
+        ds_repo: Repository for data source queries
+        workers: Number of sample processing workers
+        queue_size: Bound of the receive queue and of each worker queue
 
     Example:
         >>> config = MQTTConfig(host="mqtt.example.com", port=1883)
@@ -59,6 +76,8 @@ class TagProvider(DataProvider):
         self,
         mqtt_client: MQTTClient,
         ds_repo: "DataSourceRepository",
+        workers: int = 1,
+        queue_size: int = 1000,
     ):
         self._mqtt = mqtt_client
         self._ds_repo = ds_repo
@@ -66,8 +85,44 @@ class TagProvider(DataProvider):
         self._configs: dict[int, TagConfig] = {}  # char_id -> config
         self._buffers: dict[int, SubgroupBuffer] = {}  # char_id -> buffer
         self._topic_to_chars: dict[str, list[int]] = {}  # topic -> [char_id, ...]
-        self._timeout_task: asyncio.Task | None = None
+        # SparkplugB: metric names needed per data topic, birth/death topics
+        self._topic_metrics: dict[str, frozenset[str]] = {}
+        self._session_topics: set[str] = set()
+        self._trigger_tags: set[str] = set()
+        self._sparkplug_aliases = SparkplugAliasTable()
+        self._deadlines: DeadlineScheduler[int] = DeadlineScheduler(
+            "tag_provider", self._on_buffer_deadline
+        )
         self._running = False
+        # (is_trigger, topic, payload) awaiting the decode stage
+        self._messages: asyncio.Queue[tuple[bool, str, bytes]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self._decode_task: asyncio.Task | None = None
+        self._pool: KeyedWorkerPool[SampleEvent] = KeyedWorkerPool(
+            "tag_provider", self._process_event, workers=workers, queue_size=queue_size
+        )
+
+    @property
+    def pending_messages(self) -> int:
+        """Number of received messages waiting to be decoded."""
+        return self._messages.qsize()
+
+    @property
+    def pending_samples(self) -> int:
+        """Number of completed subgroups waiting for processing."""
+        return self._pool.pending
+
+    def shard(self, characteristic_id: int) -> int:
+        """Return the processing worker index for a characteristic.
+
+        Args:
+            characteristic_id: Characteristic ID
+
+        Returns:
+            Worker index, stable for the lifetime of the provider
+        """
+        return self._pool.shard(characteristic_id)
 
     async def start(self) -> None:
         """Start the provider: load configs and subscribe to topics.
@@ -75,16 +130,19 @@ class TagProvider(DataProvider):
         This method:
         1. Loads all TAG-type characteristics from the database
         2. Creates configurations and buffers for each
-        3. Subscribes to their MQTT topics
-        4. Starts the buffer timeout monitoring loop
+        3. Starts the decode and processing stages
+        4. Subscribes to their MQTT topics
+        5. Starts the buffer timeout scheduler
 
         Raises:
             RuntimeError: If provider fails to start
         """
         logger.info("Starting TagProvider")
         self._running = True
+        self._pool.start()
+        self._decode_task = asyncio.create_task(self._decode_loop())
         await self._load_tag_characteristics()
-        self._timeout_task = asyncio.create_task(self._timeout_loop())
+        self._deadlines.start()
         logger.info(
             "tag_provider_started",
             characteristics_count=len(self._configs),
@@ -94,33 +152,53 @@ class TagProvider(DataProvider):
         """Stop the provider and clean up resources.
 
         This method:
-        1. Stops the timeout monitoring loop
+        1. Stops the buffer timeout scheduler
         2. Unsubscribes from all MQTT topics
-        3. Clears all buffers and configurations
+        3. Drains received messages and queued samples
+        4. Clears all buffers and configurations
         """
         logger.info("Stopping TagProvider")
         self._running = False
 
-        # Cancel timeout task
-        if self._timeout_task and not self._timeout_task.done():
-            self._timeout_task.cancel()
-            try:
-                await self._timeout_task
-            except asyncio.CancelledError:
-                pass
+        await self._deadlines.stop()
 
         # Unsubscribe from all topics
         for topic in list(self._topic_to_chars.keys()):
             try:
-                await self._mqtt.unsubscribe(topic)
+                await self._mqtt.unsubscribe(topic, self._on_message)
                 logger.debug("unsubscribed_from_topic", topic=topic)
             except Exception as e:
                 logger.error("error_unsubscribing", topic=topic, error=str(e))
+        for topic in list(self._session_topics):
+            try:
+                await self._mqtt.unsubscribe(topic, self._on_message)
+            except Exception as e:
+                logger.error("error_unsubscribing", topic=topic, error=str(e))
+        for trigger_tag in list(self._trigger_tags):
+            try:
+                await self._mqtt.unsubscribe(trigger_tag, self._on_trigger_message)
+            except Exception as e:
+                logger.error("error_unsubscribing", topic=trigger_tag, error=str(e))
+
+        # Drain the pipeline: decode what was received, then process it
+        if self._decode_task and not self._decode_task.done():
+            await self._messages.join()
+            self._decode_task.cancel()
+            try:
+                await self._decode_task
+            except asyncio.CancelledError:
+                pass
+        self._decode_task = None
+        await self._pool.stop()
 
         # Clear state
         self._configs.clear()
         self._buffers.clear()
         self._topic_to_chars.clear()
+        self._topic_metrics.clear()
+        self._session_topics.clear()
+        self._trigger_tags.clear()
+        self._sparkplug_aliases.clear()
 
         logger.info("TagProvider stopped")
 
@@ -128,7 +206,9 @@ class TagProvider(DataProvider):
         """Set the callback for sample processing.
 
         The callback will be invoked asynchronously when a buffer is flushed
-        and a sample is ready for processing.
+        and a sample is ready for processing. It runs on a processing worker:
+        calls for one characteristic never overlap, calls for different
+        characteristics may run concurrently.
 
         Args:
             callback: Async function to invoke with SampleEvent
@@ -141,7 +221,6 @@ class TagProvider(DataProvider):
         mqtt_sources = await self._ds_repo.get_active_mqtt_sources()
 
         subscribed_topics: set[str] = set()
-        subscribed_triggers: set[str] = set()
 
         for src in mqtt_sources:
             char = src.characteristic
@@ -188,30 +267,109 @@ class TagProvider(DataProvider):
                     if not self._topic_to_chars[src.topic]:
                         del self._topic_to_chars[src.topic]
                     continue
+                if src.topic.startswith("spBv1.0/"):
+                    await self._subscribe_session_topics(src.topic)
 
-            if src.trigger_tag and src.trigger_tag not in subscribed_triggers:
+            if src.trigger_tag and src.trigger_tag not in self._trigger_tags:
                 try:
                     await self._mqtt.subscribe(src.trigger_tag, self._on_trigger_message)
-                    subscribed_triggers.add(src.trigger_tag)
+                    self._trigger_tags.add(src.trigger_tag)
                     logger.info("subscribed_to_trigger_tag", trigger_tag=src.trigger_tag)
                 except Exception as e:
                     logger.error("trigger_tag_subscribe_failed", trigger_tag=src.trigger_tag, error=str(e))
 
+        for topic, char_ids in self._topic_to_chars.items():
+            if topic.startswith("spBv1.0/"):
+                self._topic_metrics[topic] = frozenset(
+                    self._configs[char_id].metric_name
+                    for char_id in char_ids
+                    if self._configs[char_id].metric_name
+                )
+
         logger.info("loaded_mqtt_data_sources", count=len(self._configs))
 
+    async def _subscribe_session_topics(self, topic: str) -> None:
+        """Subscribe to the birth and death certificates of a SparkplugB topic.
+
+        Edge nodes with aliasing enabled send data metrics by alias only;
+        the names are announced in NBIRTH/DBIRTH.
+
+        Args:
+            topic: SparkplugB NDATA or DDATA topic
+        """
+        try:
+            session_topics = SparkplugDecoder.session_topics(topic)
+        except ValueError:
+            return
+        for session_topic in session_topics:
+            if session_topic in self._session_topics:
+                continue
+            try:
+                await self._mqtt.subscribe(session_topic, self._on_message)
+                self._session_topics.add(session_topic)
+            except Exception as e:
+                logger.error("subscribe_failed", topic=session_topic, error=str(e))
+
     async def _on_message(self, topic: str, payload: bytes) -> None:
-        """Handle incoming MQTT message for a data tag.
+        """Receive an MQTT message for a data tag.
+
+        Runs on the MQTT message loop, so it only enqueues the message for
+        the decode stage (waiting only if that queue is full). Messages
+        arriving after stop() are ignored, as nothing drains the queue.
+
+        Args:
+            topic: MQTT topic the message was received on
+            payload: Message payload as bytes
+        """
+        if not self._running:
+            return
+        await self._messages.put((False, topic, payload))
+
+    async def _on_trigger_message(self, topic: str, payload: bytes) -> None:
+        """Receive an MQTT message for a trigger tag.
+
+        Trigger messages share the decode queue with data messages so a
+        trigger always flushes the readings received before it.
 
-        This callback is invoked when a message arrives on a subscribed
-        data topic. For SparkplugB topics (spBv1.0/ prefix), decodes the
+        Args:
+            topic: MQTT topic the message was received on
+            payload: Message payload as bytes (not used)
+        """
+        if not self._running:
+            return
+        await self._messages.put((True, topic, payload))
+
+    async def _decode_loop(self) -> None:
+        """Decode stage: apply received messages to buffers in arrival order."""
+        while True:
+            is_trigger, topic, payload = await self._messages.get()
+            try:
+                if is_trigger:
+                    await self._handle_trigger(topic)
+                else:
+                    await self._handle_message(topic, payload)
+            except Exception as e:
+                logger.error("message_decode_error", topic=topic, error=str(e), exc_info=True)
+            finally:
+                self._messages.task_done()
+
+    async def _handle_message(self, topic: str, payload: bytes) -> None:
+        """Decode a data tag message and buffer its values.
+
+        For SparkplugB topics (spBv1.0/ prefix), decodes the
         protobuf payload and dispatches individual metrics to characteristics
         by metric_name. For plain topics, parses as float and dispatches
-        to all characteristics on that topic.
+        to all characteristics on that topic. SparkplugB birth and death
+        certificates only update the alias table.
 
         Args:
             topic: MQTT topic the message was received on
             payload: Message payload as bytes
         """
+        if topic in self._session_topics:
+            self._handle_sparkplug_session(topic, payload)
+            return
+
         if topic not in self._topic_to_chars:
             logger.warning("unmapped_topic", topic=topic)
             return
@@ -223,29 +381,48 @@ class TagProvider(DataProvider):
         else:
             await self._handle_plain_message(topic, payload, char_ids)
 
+    def _handle_sparkplug_session(self, topic: str, payload: bytes) -> None:
+        """Update the alias table from a SparkplugB birth or death certificate."""
+        try:
+            _ts, metrics, _seq = SparkplugDecoder.decode_payload(payload)
+            self._sparkplug_aliases.update(topic, metrics)
+        except Exception as e:
+            logger.error("sparkplug_decode_failed", topic=topic, error=str(e))
+
     async def _handle_sparkplug_message(
         self, topic: str, payload: bytes, char_ids: list[int]
     ) -> None:
-        """Handle a SparkplugB message by decoding metrics and dispatching by name."""
-        from openspc.mqtt.sparkplug import SparkplugDecoder
+        """Handle a SparkplugB message by decoding metrics and dispatching by name.
 
+        Only the metrics configured for the topic are decoded. Metrics sent
+        by alias only are matched through the aliases of the configured
+        metrics, precomputed from the birth certificate. A metric may
+        repeat within a payload, and array or DataSet values carry a batch
+        of readings; all of them are buffered in payload order.
+        """
+        names = self._topic_metrics.get(topic, frozenset())
+        aliases = self._sparkplug_aliases.wanted(topic, names)
         try:
-            _ts, metrics, _seq = SparkplugDecoder.decode_payload(payload)
+            _ts, metrics, _seq = SparkplugDecoder.decode_payload(
+                payload, aliases=aliases, names=names
+            )
         except Exception as e:
             logger.error("sparkplug_decode_failed", topic=topic, error=str(e))
             return
 
-        # Build name -> value map from decoded metrics
-        metric_values: dict[str, float] = {}
+        # Build name -> readings map from decoded metrics
+        metric_readings: dict[str, list[Reading]] = {}
         for metric in metrics:
             try:
-                metric_values[metric.name] = float(metric.value)
+                readings = readings_from_value(metric.value, metric.timestamp)
             except (TypeError, ValueError):
                 logger.debug(
                     "skipping_non_numeric_metric",
                     metric_name=metric.name,
                     metric_value=repr(metric.value),
                 )
+                continue
+            metric_readings.setdefault(metric.name, []).extend(readings)
 
         # Dispatch to each characteristic by its configured metric_name
         for char_id in char_ids:
@@ -262,25 +439,26 @@ class TagProvider(DataProvider):
                 )
                 continue
 
-            value = metric_values.get(config.metric_name)
-            if value is None:
+            readings = metric_readings.get(config.metric_name)
+            if not readings:
                 continue
 
             logger.debug(
                 "received_sparkplug_metric",
                 metric_name=config.metric_name,
-                value=value,
+                reading_count=len(readings),
                 topic=topic,
                 characteristic_id=char_id,
             )
-            await self._dispatch_value(char_id, config, buffer, value)
+            for value, timestamp in readings:
+                await self._dispatch_value(char_id, config, buffer, value, timestamp)
 
     async def _handle_plain_message(
         self, topic: str, payload: bytes, char_ids: list[int]
     ) -> None:
-        """Handle a plain (non-SparkplugB) message by parsing as float."""
+        """Handle a plain (non-SparkplugB) message: a number or a JSON batch."""
         try:
-            value = float(payload.decode().strip())
+            readings = parse_plain_payload(payload)
         except (ValueError, UnicodeDecodeError) as e:
             logger.error(
                 "payload_parse_failed",
@@ -296,20 +474,35 @@ class TagProvider(DataProvider):
             if not config or not buffer:
                 continue
 
-            logger.debug("received_value", value=value, topic=topic, characteristic_id=char_id)
-            await self._dispatch_value(char_id, config, buffer, value)
+            logger.debug(
+                "received_values",
+                reading_count=len(readings),
+                topic=topic,
+                characteristic_id=char_id,
+            )
+            for value, timestamp in readings:
+                await self._dispatch_value(char_id, config, buffer, value, timestamp)
 
     async def _dispatch_value(
-        self, char_id: int, config: TagConfig, buffer: SubgroupBuffer, value: float
+        self,
+        char_id: int,
+        config: TagConfig,
+        buffer: SubgroupBuffer,
+        value: float,
+        timestamp: datetime | None = None,
     ) -> None:
-        """Add a value to a buffer and flush if needed based on trigger strategy."""
+        """Add a value to a buffer and flush if needed based on trigger strategy.
+
+        The first value of a new subgroup starts its buffer timeout.
+        """
+        was_empty = not buffer.values
         if config.trigger_strategy == TriggerStrategy.ON_CHANGE.value:
-            is_full = buffer.add(value)
+            is_full = buffer.add(value, timestamp)
             if is_full:
                 logger.debug("buffer_full", characteristic_id=char_id)
                 await self._flush_buffer(char_id)
         elif config.trigger_strategy == TriggerStrategy.ON_TRIGGER.value:
-            buffer.add(value)
+            buffer.add(value, timestamp)
             logger.debug(
                 "value_buffered_waiting_trigger",
                 characteristic_id=char_id,
@@ -317,23 +510,21 @@ class TagProvider(DataProvider):
                 subgroup_size=config.subgroup_size,
             )
         elif config.trigger_strategy == TriggerStrategy.ON_TIMER.value:
-            buffer.add(value)
+            buffer.add(value, timestamp)
             logger.debug(
                 "value_buffered_timer_flush",
                 characteristic_id=char_id,
                 buffer_count=len(buffer.values),
                 subgroup_size=config.subgroup_size,
             )
+        if was_empty and buffer.values:
+            self._deadlines.schedule(char_id, config.buffer_timeout_seconds)
 
-    async def _on_trigger_message(self, topic: str, payload: bytes) -> None:
-        """Handle incoming MQTT message for a trigger tag.
-
-        This callback is invoked when a message arrives on a trigger topic.
-        It flushes all buffers that are configured to use this trigger tag.
+    async def _handle_trigger(self, topic: str) -> None:
+        """Flush all buffers that are configured to use this trigger tag.
 
         Args:
-            topic: MQTT topic the message was received on
-            payload: Message payload as bytes (not used)
+            topic: Trigger topic the message was received on
         """
         logger.debug("trigger_received", topic=topic)
 
@@ -354,7 +545,9 @@ class TagProvider(DataProvider):
         """Flush buffer and create sample event.
 
         This method retrieves all values from the buffer, creates a
-        SampleEvent, and invokes the registered callback for processing.
+        SampleEvent, and queues it on the characteristic's processing worker.
+        The sample is timestamped with the latest source timestamp of its
+        readings, or the flush time if they had none.
 
         Args:
             char_id: ID of the characteristic whose buffer to flush
@@ -363,7 +556,9 @@ class TagProvider(DataProvider):
             logger.warning("no_buffer_found", characteristic_id=char_id)
             return
 
+        self._deadlines.cancel(char_id)
         buffer = self._buffers[char_id]
+        timestamp = buffer.last_timestamp or datetime.now(timezone.utc)
         values = buffer.flush()
 
         if not values:
@@ -380,11 +575,22 @@ class TagProvider(DataProvider):
         event = SampleEvent(
             characteristic_id=char_id,
             measurements=values,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp,
             context=SampleContext(source="TAG"),
         )
 
-        # Invoke callback
+        if not self._pool.is_running:
+            logger.warning("pipeline_not_running", characteristic_id=char_id)
+            return
+        await self._pool.submit(char_id, event)
+
+    async def _process_event(self, event: SampleEvent) -> None:
+        """Process stage: invoke the callback for a completed subgroup.
+
+        Args:
+            event: Sample event created by _flush_buffer()
+        """
+        char_id = event.characteristic_id
         if self._callback is None:
             logger.warning(
                 "no_callback_set",
@@ -403,37 +609,21 @@ class TagProvider(DataProvider):
                 exc_info=True,
             )
 
-    async def _timeout_loop(self) -> None:
-        """Monitor buffers for timeouts and flush partial subgroups.
+    async def _on_buffer_deadline(self, char_id: int) -> None:
+        """Flush a partial subgroup whose buffer timeout has passed.
 
-        This background task runs periodically to check if any buffers
-        have timed out. If a buffer has pending values and has exceeded
-        the timeout threshold, it is flushed even if not full.
+        Args:
+            char_id: ID of the characteristic whose deadline passed
         """
-        logger.info("Starting buffer timeout monitoring loop")
-
-        while self._running:
-            try:
-                await asyncio.sleep(5)  # Check every 5 seconds
-
-                for char_id, buffer in self._buffers.items():
-                    config = self._configs.get(char_id)
-                    if not config:
-                        continue
-
-                    if buffer.values and buffer.is_timed_out(config.buffer_timeout_seconds):
-                        logger.warning(
-                            "buffer_timeout",
-                            characteristic_id=char_id,
-                            buffer_count=len(buffer.values),
-                            expected=config.subgroup_size,
-                        )
-                        await self._flush_buffer(char_id)
-
-            except asyncio.CancelledError:
-                logger.info("Buffer timeout loop cancelled")
-                break
-            except Exception as e:
-                logger.error("timeout_loop_error", error=str(e), exc_info=True)
+        buffer = self._buffers.get(char_id)
+        config = self._configs.get(char_id)
+        if not buffer or not config or not buffer.values:
+            return
 
-        logger.info("Buffer timeout monitoring loop stopped")
+        logger.warning(
+            "buffer_timeout",
+            characteristic_id=char_id,
+            buffer_count=len(buffer.values),
+            expected=config.subgroup_size,
+        )
+        await self._flush_buffer(char_id)
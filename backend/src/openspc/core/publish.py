@@ -4,8 +4,17 @@ This module provides MQTTPublisher that bridges the Event Bus and MQTT
 infrastructure. It subscribes to domain events and publishes them to
 outbound-enabled MQTT brokers using UNS-compatible topic structures.
 
-The publisher supports both JSON and SparkplugB payload formats, with
-per-characteristic rate limiting to prevent publish storms.
+The publisher supports both JSON and SparkplugB payload formats. Sample and
+control limit updates are rate limited per broker and characteristic by
+coalescing: an update arriving within a broker's ``outbound_rate_limit`` of
+the last publish replaces the pending one, and the latest is published as
+soon as the interval has passed, so consumers always end up with the most
+recent state. Violation and acknowledgement events are discrete and are
+published immediately.
+
+Outbound broker settings, hierarchy paths and characteristic names are kept
+in memory, so publishing an event normally needs no database query. The
+path and name of a characteristic are dropped when it is updated or deleted.
 """
 
 import json
@@ -17,13 +26,19 @@ from typing import TYPE_CHECKING, Any
 import structlog
 from sqlalchemy import select
 
+from openspc.core.cache_stats import hit_stats
 from openspc.core.events import (
+    BackpressurePolicy,
+    CharacteristicDeletedEvent,
+    CharacteristicUpdatedEvent,
     ControlLimitsUpdatedEvent,
     EventBus,
+    HandlerQueue,
     SampleProcessedEvent,
     ViolationAcknowledgedEvent,
     ViolationCreatedEvent,
 )
+from openspc.core.providers.deadline import DeadlineScheduler
 from openspc.db.models.broker import MQTTBroker
 from openspc.db.models.characteristic import Characteristic
 from openspc.db.models.hierarchy import Hierarchy
@@ -34,6 +49,12 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+
+def _characteristic_key(event: SampleProcessedEvent | ControlLimitsUpdatedEvent) -> int:
+    """Coalescing key for per-characteristic events."""
+    return event.characteristic_id
+
+
 # Characters invalid in MQTT topic segments
 _INVALID_TOPIC_CHARS = re.compile(r"[#+/\x00]")
 
@@ -146,6 +167,115 @@ async def build_hierarchy_path(
     return (plant_name, segments)
 
 
+class OutboundBrokerCache:
+    """In-memory list of outbound-enabled brokers and their settings.
+
+    The broker endpoints call invalidate() after every change; the TTL
+    bounds staleness for changes made elsewhere (other processes, reseeds).
+
+    Args:
+        ttl_seconds: Maximum age of the cached list (0 reloads every time)
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._brokers: list[dict[str, Any]] | None = None
+        self._loaded_at = 0.0
+        self._version = 0
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def configure(self, ttl_seconds: float | None = None) -> None:
+        """Update the TTL and drop the cached list.
+
+        Args:
+            ttl_seconds: Maximum age of the cached list (0 reloads every time)
+        """
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds
+        self.clear()
+
+    async def get(self, session_factory: Any) -> list[dict[str, Any]]:
+        """Return the outbound-enabled brokers, loading them if stale.
+
+        Args:
+            session_factory: Async context manager factory for DB sessions
+
+        Returns:
+            List of broker config dicts with id, outbound_topic_prefix,
+            outbound_format, and outbound_rate_limit
+        """
+        if (
+            self._brokers is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        ):
+            self.hits += 1
+            return self._brokers
+        self.misses += 1
+
+        version = self._version
+        async with session_factory() as session:
+            brokers = await self._load(session)
+        # Do not keep a list loaded while the brokers were being changed
+        if version == self._version:
+            self._brokers = brokers
+            self._loaded_at = time.monotonic()
+        return brokers
+
+    @staticmethod
+    async def _load(session: Any) -> list[dict[str, Any]]:
+        """Query all active brokers with outbound publishing enabled."""
+        stmt = select(
+            MQTTBroker.id,
+            MQTTBroker.outbound_topic_prefix,
+            MQTTBroker.outbound_format,
+            MQTTBroker.outbound_rate_limit,
+        ).where(
+            MQTTBroker.is_active == True,  # noqa: E712
+            MQTTBroker.outbound_enabled == True,  # noqa: E712
+        )
+        result = await session.execute(stmt)
+        rows = result.all()
+        return [
+            {
+                "id": row[0],
+                "outbound_topic_prefix": row[1],
+                "outbound_format": row[2],
+                "outbound_rate_limit": row[3],
+            }
+            for row in rows
+        ]
+
+    def invalidate(self) -> None:
+        """Drop the cached list after a broker was created, changed or deleted."""
+        self._version += 1
+        self._brokers = None
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop the cached list."""
+        self._brokers = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache state and hit/miss counters."""
+        return {
+            "cached": self._brokers is not None,
+            "brokers": len(self._brokers) if self._brokers is not None else 0,
+            **hit_stats(self.hits, self.misses),
+            "invalidations": self.invalidations,
+        }
+
+
+# Global cache shared by the publisher and the broker endpoints
+outbound_broker_cache = OutboundBrokerCache()
+
+# (broker_id, characteristic_id, topic event type)
+_SlotKey = tuple[int, int, str]
+
+
 class MQTTPublisher:
     """Publishes SPC events to outbound-enabled MQTT brokers.
 
@@ -153,8 +283,9 @@ class MQTTPublisher:
     MQTT brokers. It subscribes to SPC domain events and publishes them
     using UNS-compatible topic structures.
 
-    Supports JSON and SparkplugB payload formats. Implements per-characteristic
-    rate limiting to prevent publish storms.
+    Supports JSON and SparkplugB payload formats. Sample and limit updates
+    are coalesced per broker and characteristic: at most one publish per
+    ``outbound_rate_limit`` seconds, always with the latest payload.
 
     Args:
         mqtt_manager: MQTT connection manager for publishing
@@ -172,6 +303,7 @@ class MQTTPublisher:
         mqtt_manager: "MQTTManager",
         event_bus: EventBus,
         session_factory: Any,
+        queue_size: int = 1000,
     ) -> None:
         """Initialize the MQTT outbound publisher.
 
@@ -179,108 +311,176 @@ class MQTTPublisher:
             mqtt_manager: MQTT connection manager instance
             event_bus: Event bus instance for event subscriptions
             session_factory: Async context manager factory for DB sessions
+            queue_size: Bound of each event dispatch queue
         """
         self._mqtt_manager = mqtt_manager
         self._event_bus = event_bus
         self._session_factory = session_factory
-        self._path_cache: dict[int, tuple[str, list[str]]] = {}
-        self._last_publish: dict[tuple[int, int], float] = {}
+        # Sample/limit updates coalesce per characteristic when brokers fall
+        # behind (outbound publishing is coalesced per characteristic
+        # anyway) but are never dropped, so every characteristic's latest
+        # state is published; violation events block the publisher rather
+        # than being lost.
+        self._updates_queue = HandlerQueue(
+            "mqtt_updates",
+            maxsize=queue_size,
+            policy=BackpressurePolicy.LATEST_PER_KEY,
+            key=_characteristic_key,
+        )
+        self._violations_queue = HandlerQueue(
+            "mqtt_violations", maxsize=queue_size, policy=BackpressurePolicy.BLOCK
+        )
+        # characteristic_id -> (plant_name, hierarchy_segments, char_name)
+        self._targets: dict[int, tuple[str, list[str], str]] = {}
+        self._last_publish: dict[_SlotKey, float] = {}
+        # Latest throttled update per slot: (broker, topic, payload_builder)
+        self._pending: dict[_SlotKey, tuple[dict[str, Any], str, Any]] = {}
+        self._flusher: DeadlineScheduler[_SlotKey] = DeadlineScheduler(
+            "mqtt_publisher", self._flush_slot
+        )
         self._publish_count: int = 0
+        self.coalesced = 0
         self._setup_subscriptions()
         logger.info("MQTTPublisher initialized")
 
     def _setup_subscriptions(self) -> None:
         """Subscribe to Event Bus events for outbound publishing."""
-        self._event_bus.subscribe(SampleProcessedEvent, self._on_sample_processed)
-        self._event_bus.subscribe(ViolationCreatedEvent, self._on_violation_created)
-        self._event_bus.subscribe(
-            ViolationAcknowledgedEvent, self._on_violation_acknowledged
+        bus = self._event_bus
+        bus.subscribe(
+            SampleProcessedEvent, self._on_sample_processed, queue=self._updates_queue
         )
-        self._event_bus.subscribe(
-            ControlLimitsUpdatedEvent, self._on_limits_updated
+        bus.subscribe(
+            ControlLimitsUpdatedEvent, self._on_limits_updated, queue=self._updates_queue
         )
-        logger.debug("MQTTPublisher subscribed to 4 event types")
+        bus.subscribe(
+            ViolationCreatedEvent,
+            self._on_violation_created,
+            queue=self._violations_queue,
+        )
+        bus.subscribe(
+            ViolationAcknowledgedEvent,
+            self._on_violation_acknowledged,
+            queue=self._violations_queue,
+        )
+        bus.subscribe(CharacteristicUpdatedEvent, self._on_characteristic_changed)
+        bus.subscribe(CharacteristicDeletedEvent, self._on_characteristic_changed)
+        logger.debug("MQTTPublisher subscribed to 6 event types")
+
+    async def stop(self) -> None:
+        """Publish pending coalesced updates and stop the flush scheduler."""
+        await self._flusher.stop()
+        for key in list(self._pending):
+            await self._flush_slot(key)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return coalescing metrics (event queues are in the EventBus stats)."""
+        return {
+            "handled_events": self._publish_count,
+            "coalesced": self.coalesced,
+            "pending": len(self._pending),
+            "cached_targets": len(self._targets),
+            "flusher": self._flusher.get_stats(),
+        }
 
-    async def _resolve_path(
-        self, session: Any, characteristic_id: int
-    ) -> tuple[str, list[str]]:
-        """Resolve hierarchy path for a characteristic, using cache.
+    async def _resolve_target(
+        self, characteristic_id: int
+    ) -> tuple[str, list[str], str]:
+        """Resolve plant, hierarchy path and name of a characteristic, using cache.
 
         Args:
-            session: SQLAlchemy async session
             characteristic_id: ID of the characteristic
 
         Returns:
-            Tuple of (plant_name, hierarchy_segments)
+            Tuple of (plant_name, hierarchy_segments, char_name)
         """
-        if characteristic_id in self._path_cache:
-            return self._path_cache[characteristic_id]
+        target = self._targets.get(characteristic_id)
+        if target is not None:
+            return target
 
-        result = await build_hierarchy_path(session, characteristic_id)
-        self._path_cache[characteristic_id] = result
-        return result
+        async with self._session_factory() as session:
+            plant_name, segments = await build_hierarchy_path(
+                session, characteristic_id
+            )
+            char_stmt = select(Characteristic.name).where(
+                Characteristic.id == characteristic_id
+            )
+            char_row = (await session.execute(char_stmt)).one_or_none()
+        char_name = char_row[0] if char_row else f"char_{characteristic_id}"
 
-    async def _get_outbound_brokers(
-        self, session: Any
-    ) -> list[dict[str, Any]]:
-        """Get all active brokers with outbound publishing enabled.
+        target = (plant_name, segments, char_name)
+        self._targets[characteristic_id] = target
+        return target
+
+    async def _on_characteristic_changed(
+        self, event: CharacteristicUpdatedEvent | CharacteristicDeletedEvent
+    ) -> None:
+        """Drop the cached topic target of a renamed, moved or deleted characteristic.
 
         Args:
-            session: SQLAlchemy async session
+            event: Characteristic updated or deleted event
+        """
+        self._targets.pop(event.characteristic_id, None)
+
+    async def _get_outbound_brokers(self) -> list[dict[str, Any]]:
+        """Get all active brokers with outbound publishing enabled.
 
         Returns:
             List of broker config dicts with id, outbound_topic_prefix,
-            outbound_format, and outbound_rate_limit
+            outbound_format, and outbound_rate_limit (cached in memory)
         """
-        stmt = select(
-            MQTTBroker.id,
-            MQTTBroker.outbound_topic_prefix,
-            MQTTBroker.outbound_format,
-            MQTTBroker.outbound_rate_limit,
-        ).where(
-            MQTTBroker.is_active == True,  # noqa: E712
-            MQTTBroker.outbound_enabled == True,  # noqa: E712
-        )
-        result = await session.execute(stmt)
-        rows = result.all()
-        return [
-            {
-                "id": row[0],
-                "outbound_topic_prefix": row[1],
-                "outbound_format": row[2],
-                "outbound_rate_limit": row[3],
-            }
-            for row in rows
-        ]
+        return await outbound_broker_cache.get(self._session_factory)
 
-    def _check_rate_limit(
-        self, broker_id: int, char_id: int, rate_limit: float
+    def _coalesce(
+        self,
+        key: _SlotKey,
+        broker: dict[str, Any],
+        topic: str,
+        payload_builder: Any,
     ) -> bool:
-        """Check whether publishing is allowed under rate limiting.
+        """Hold an update in its slot if the slot published too recently.
 
         Args:
-            broker_id: ID of the broker
-            char_id: ID of the characteristic
-            rate_limit: Minimum seconds between publishes
+            key: Slot key (broker, characteristic, event type)
+            broker: Broker config dict
+            topic: Outbound topic
+            payload_builder: Callable(format_str) -> bytes for the update
 
         Returns:
-            True if publishing is allowed, False if throttled
+            True if the update was held (replacing any held before), False
+            if it may be published now
         """
-        key = (broker_id, char_id)
+        rate_limit = broker["outbound_rate_limit"] or 0
         now = time.monotonic()
         last = self._last_publish.get(key)
 
-        if last is not None and (now - last) < rate_limit:
+        if key not in self._pending and (last is None or now - last >= rate_limit):
+            self._last_publish[key] = now
             return False
 
-        self._last_publish[key] = now
+        if key not in self._pending:
+            self._flusher.start()
+            self._flusher.schedule(key, last + rate_limit - now)
+        else:
+            self.coalesced += 1
+        self._pending[key] = (broker, topic, payload_builder)
         return True
 
+    async def _flush_slot(self, key: _SlotKey) -> None:
+        """Publish the latest update held in a slot."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        broker, topic, payload_builder = pending
+        self._last_publish[key] = time.monotonic()
+        await self._send(broker, topic, payload_builder, key[1], key[2])
+
     def _cleanup_stale_entries(self) -> None:
         """Remove stale rate limit entries older than 5 minutes."""
         now = time.monotonic()
         stale_keys = [
-            k for k, v in self._last_publish.items() if (now - v) > 300
+            k
+            for k, v in self._last_publish.items()
+            if (now - v) > 300 and k not in self._pending
         ]
         for k in stale_keys:
             del self._last_publish[k]
@@ -303,60 +503,80 @@ class MQTTPublisher:
         }
         return json.dumps(payload).encode("utf-8")
 
+    async def _send(
+        self,
+        broker: dict[str, Any],
+        topic: str,
+        payload_builder: Any,
+        characteristic_id: int,
+        topic_event_type: str,
+    ) -> None:
+        """Build the payload for a broker's format and publish it."""
+        broker_id = broker["id"]
+        try:
+            payload = payload_builder(broker["outbound_format"])
+        except Exception:
+            logger.warning(
+                "mqtt_pub_payload_error",
+                broker_id=broker_id,
+                format=broker["outbound_format"],
+                exc_info=True,
+            )
+            return
+
+        try:
+            await self._mqtt_manager.publish(
+                topic=topic,
+                payload=payload,
+                qos=1,
+                broker_id=broker_id,
+            )
+            logger.debug(
+                "mqtt_pub_sent",
+                topic=topic,
+                broker_id=broker_id,
+                characteristic_id=characteristic_id,
+                event_type=topic_event_type,
+            )
+        except Exception:
+            logger.warning(
+                "mqtt_pub_send_error",
+                topic=topic,
+                broker_id=broker_id,
+                exc_info=True,
+            )
+
     async def _publish_to_outbound_brokers(
         self,
         topic_event_type: str,
         characteristic_id: int,
         payload_builder: Any,
+        coalesce: bool = False,
     ) -> None:
         """Shared publishing logic for all event handlers.
 
-        Opens a DB session, resolves the hierarchy path, gets the
-        characteristic name, iterates outbound-enabled brokers, and
-        publishes to each with rate limiting.
+        Resolves the hierarchy path and characteristic name, iterates
+        outbound-enabled brokers, and publishes to each. Coalesced updates
+        published too recently for a broker are held and published later.
 
         Args:
             topic_event_type: Event type for topic assembly ("sample", "violation", etc.)
             characteristic_id: ID of the characteristic
             payload_builder: Callable(format_str) -> bytes that builds the payload
+            coalesce: Rate limit by coalescing (sample and limit updates)
         """
         try:
-            async with self._session_factory() as session:
-                # Resolve hierarchy path
-                plant_name, segments = await self._resolve_path(
-                    session, characteristic_id
-                )
-
-                # Get characteristic name
-                char_stmt = select(Characteristic.name).where(
-                    Characteristic.id == characteristic_id
-                )
-                char_result = await session.execute(char_stmt)
-                char_row = char_result.one_or_none()
-                char_name = char_row[0] if char_row else f"char_{characteristic_id}"
-
-                # Get outbound-enabled brokers
-                brokers = await self._get_outbound_brokers(session)
-
+            brokers = await self._get_outbound_brokers()
             if not brokers:
                 return
 
+            plant_name, segments, char_name = await self._resolve_target(
+                characteristic_id
+            )
+
             for broker in brokers:
                 broker_id = broker["id"]
 
-                # Rate limit check
-                if not self._check_rate_limit(
-                    broker_id,
-                    characteristic_id,
-                    broker["outbound_rate_limit"],
-                ):
-                    logger.debug(
-                        "mqtt_pub_throttled",
-                        broker_id=broker_id,
-                        characteristic_id=characteristic_id,
-                    )
-                    continue
-
                 # Build topic
                 topic = build_outbound_topic(
                     prefix=broker["outbound_topic_prefix"],
@@ -366,40 +586,22 @@ class MQTTPublisher:
                     event_type=topic_event_type,
                 )
 
-                # Build payload based on format
-                try:
-                    payload = payload_builder(broker["outbound_format"])
-                except Exception:
-                    logger.warning(
-                        "mqtt_pub_payload_error",
-                        broker_id=broker_id,
-                        format=broker["outbound_format"],
-                        exc_info=True,
-                    )
-                    continue
-
-                # Publish
-                try:
-                    await self._mqtt_manager.publish(
-                        topic=topic,
-                        payload=payload,
-                        qos=1,
-                        broker_id=broker_id,
-                    )
+                if coalesce and self._coalesce(
+                    (broker_id, characteristic_id, topic_event_type),
+                    broker,
+                    topic,
+                    payload_builder,
+                ):
                     logger.debug(
-                        "mqtt_pub_sent",
-                        topic=topic,
+                        "mqtt_pub_coalesced",
                         broker_id=broker_id,
                         characteristic_id=characteristic_id,
-                        event_type=topic_event_type,
-                    )
-                except Exception:
-                    logger.warning(
-                        "mqtt_pub_send_error",
-                        topic=topic,
-                        broker_id=broker_id,
-                        exc_info=True,
                     )
+                    continue
+
+                await self._send(
+                    broker, topic, payload_builder, characteristic_id, topic_event_type
+                )
 
             # Periodic cleanup
             self._publish_count += 1
@@ -449,7 +651,7 @@ class MQTTPublisher:
             return self._build_json_payload("sample_processed", data)
 
         await self._publish_to_outbound_brokers(
-            "sample", event.characteristic_id, payload_builder
+            "sample", event.characteristic_id, payload_builder, coalesce=True
         )
 
     async def _on_violation_created(self, event: ViolationCreatedEvent) -> None:
@@ -596,12 +798,14 @@ class MQTTPublisher:
             return self._build_json_payload("limits_updated", data)
 
         await self._publish_to_outbound_brokers(
-            "limits", event.characteristic_id, payload_builder
+            "limits", event.characteristic_id, payload_builder, coalesce=True
         )
 
 
 __all__ = [
     "MQTTPublisher",
+    "OutboundBrokerCache",
+    "outbound_broker_cache",
     "build_hierarchy_path",
     "build_outbound_topic",
     "sanitize_topic_segment",
@@ -13,6 +13,8 @@ from datetime import datetime, timedelta, timezone
 import structlog
 from sqlalchemy import delete, func, select
 
+from openspc.core.engine.chart_cache import chart_data_cache
+from openspc.core.engine.group_commit import sample_writer
 from openspc.db.database import get_database
 from openspc.db.models.characteristic import Characteristic
 from openspc.db.models.plant import Plant
@@ -20,6 +22,7 @@ from openspc.db.models.sample import Sample
 from openspc.db.models.violation import Violation
 from openspc.db.repositories.purge_history import PurgeHistoryRepository
 from openspc.db.repositories.retention import RetentionRepository
+from openspc.db.repositories.violation import ViolationRepository
 
 logger = structlog.get_logger(__name__)
 
@@ -145,6 +148,10 @@ class PurgeEngine:
                 )
                 total_samples_deleted += samples_del
                 total_violations_deleted += violations_del
+                if samples_del:
+                    # Cached charts and live windows may still hold the purged samples
+                    chart_data_cache.invalidate(char_id)
+                    await sample_writer.invalidate(char_id)
 
             # Mark run as completed
             async with db.session() as session:
@@ -225,12 +232,13 @@ class PurgeEngine:
             async with db.session() as session:
                 # Find the IDs of the oldest samples to delete
                 oldest_ids_result = await session.execute(
-                    select(Sample.id)
+                    select(Sample.id, Sample.timestamp)
                     .where(Sample.char_id == char_id)
                     .order_by(Sample.timestamp.asc())
                     .limit(batch)
                 )
-                sample_ids = [row[0] for row in oldest_ids_result.all()]
+                rows = oldest_ids_result.all()
+                sample_ids = [row[0] for row in rows]
                 if not sample_ids:
                     break
 
@@ -246,6 +254,11 @@ class PurgeEngine:
                 await session.execute(
                     delete(Sample).where(Sample.id.in_(sample_ids))
                 )
+                if violations_in_batch:
+                    # Cascaded deletes bypass the violation rollup
+                    await ViolationRepository(session).refresh_rollup(
+                        char_id, rows[0][1], rows[-1][1]
+                    )
 
                 total_samples += len(sample_ids)
                 total_violations += violations_in_batch
@@ -272,12 +285,13 @@ class PurgeEngine:
             async with db.session() as session:
                 # Find batch of sample IDs to delete
                 sample_ids_result = await session.execute(
-                    select(Sample.id)
+                    select(Sample.id, Sample.timestamp)
                     .where(Sample.char_id == char_id, Sample.timestamp < cutoff)
                     .order_by(Sample.timestamp.asc())
                     .limit(BATCH_SIZE)
                 )
-                sample_ids = [row[0] for row in sample_ids_result.all()]
+                rows = sample_ids_result.all()
+                sample_ids = [row[0] for row in rows]
                 if not sample_ids:
                     break
 
@@ -293,6 +307,11 @@ class PurgeEngine:
                 await session.execute(
                     delete(Sample).where(Sample.id.in_(sample_ids))
                 )
+                if violations_in_batch:
+                    # Cascaded deletes bypass the violation rollup
+                    await ViolationRepository(session).refresh_rollup(
+                        char_id, rows[0][1], rows[-1][1]
+                    )
 
                 total_samples += len(sample_ids)
                 total_violations += violations_in_batch
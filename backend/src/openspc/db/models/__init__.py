@@ -19,7 +19,7 @@ from openspc.db.models.purge_history import PurgeHistory
 from openspc.db.models.retention_policy import RetentionPolicy
 from openspc.db.models.sample import Measurement, Sample
 from openspc.db.models.user import User, UserPlantRole, UserRole
-from openspc.db.models.violation import Severity, Violation
+from openspc.db.models.violation import Severity, Violation, ViolationDailyRollup
 
 __all__ = [
     # Base
@@ -44,6 +44,7 @@ __all__ = [
     "Sample",
     "Measurement",
     "Violation",
+    "ViolationDailyRollup",
     # Enums
     "DataSourceType",
     "HierarchyType",
@@ -49,6 +49,11 @@ class Sample(Base):
     effective_lcl: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     z_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
+    # Statistics of the measurements (set on insert/edit so reads skip measurement rows)
+    mean: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    range_value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    std_dev: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
     # Edit tracking - indicates sample has been modified from original
     is_modified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from openspc.db.models.hierarchy import Base
@@ -31,6 +41,17 @@ class Violation(Base):
     """
 
     __tablename__ = "violation"
+    __table_args__ = (
+        # Covering index for GROUP BY statistics joined through sample_id
+        Index(
+            "ix_violation_stats",
+            "sample_id",
+            "rule_id",
+            "severity",
+            "acknowledged",
+            "requires_acknowledgement",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     sample_id: Mapped[int] = mapped_column(ForeignKey("sample.id", ondelete="CASCADE"), nullable=False)
@@ -61,3 +82,36 @@ class Violation(Base):
             f"rule_id={self.rule_id}, severity='{self.severity}', "
             f"acknowledged={self.acknowledged})>"
         )
+
+
+class ViolationDailyRollup(Base):
+    """Violation counts per characteristic, day, rule and severity.
+
+    Maintained alongside the violation table so dashboard statistics over
+    long ranges read one row per day and rule instead of every violation.
+    Days are UTC days of the sample timestamp. Acknowledgement state is not
+    rolled up; it changes after the fact and is counted from the (small)
+    set of unacknowledged violations instead.
+    """
+
+    __tablename__ = "violation_daily_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "char_id", "day", "rule_id", "severity", name="uq_violation_daily_rollup_key"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    char_id: Mapped[int] = mapped_column(
+        ForeignKey("characteristic.id", ondelete="CASCADE"), nullable=False
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    rule_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    severity: Mapped[str] = mapped_column(String(20), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ViolationDailyRollup(char_id={self.char_id}, day={self.day}, "
+            f"rule_id={self.rule_id}, severity='{self.severity}', count={self.count})>"
+        )
@@ -10,6 +10,10 @@ from openspc.db.models.hierarchy import Base
 
 ModelT = TypeVar("ModelT", bound=Base)
 
+# Maximum number of IDs bound into one IN clause (SQLite's default variable
+# limit is 999 on older builds)
+IN_CLAUSE_CHUNK_SIZE = 500
+
 
 class BaseRepository(Generic[ModelT]):
     """Generic base repository providing standard CRUD operations.
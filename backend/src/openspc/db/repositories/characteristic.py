@@ -1,11 +1,14 @@
 """Repository for Characteristic model with hierarchy filtering."""
 
+from collections.abc import Iterable
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from openspc.db.models.characteristic import Characteristic
-from openspc.db.repositories.base import BaseRepository
+from openspc.db.models.hierarchy import Hierarchy
+from openspc.db.repositories.base import IN_CLAUSE_CHUNK_SIZE, BaseRepository
 
 
 class CharacteristicRepository(BaseRepository[Characteristic]):
@@ -134,3 +137,54 @@ class CharacteristicRepository(BaseRepository[Characteristic]):
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def get_definition(
+        self, char_id: int
+    ) -> tuple[Characteristic, int | None] | None:
+        """Get a characteristic with rules loaded and its plant ID.
+
+        Loads everything the SPC engine and plant-scoped authorization need
+        for one characteristic (used to fill the characteristic cache).
+
+        Args:
+            char_id: ID of the characteristic to retrieve
+
+        Returns:
+            Tuple of (characteristic with rules loaded, plant_id of its
+            hierarchy node), or None if not found
+        """
+        stmt = (
+            select(Characteristic, Hierarchy.plant_id)
+            .join(Hierarchy, Characteristic.hierarchy_id == Hierarchy.id)
+            .where(Characteristic.id == char_id)
+            .options(selectinload(Characteristic.rules))
+        )
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    async def get_definitions(
+        self, char_ids: Iterable[int]
+    ) -> dict[int, tuple[Characteristic, int | None]]:
+        """Bulk version of get_definition().
+
+        Args:
+            char_ids: IDs of the characteristics to retrieve
+
+        Returns:
+            Dict mapping char_id to (characteristic with rules loaded,
+            plant_id); IDs that do not exist are omitted
+        """
+        ids = list(dict.fromkeys(char_ids))
+        definitions: dict[int, tuple[Characteristic, int | None]] = {}
+        for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+            stmt = (
+                select(Characteristic, Hierarchy.plant_id)
+                .join(Hierarchy, Characteristic.hierarchy_id == Hierarchy.id)
+                .where(Characteristic.id.in_(ids[start:start + IN_CLAUSE_CHUNK_SIZE]))
+                .options(selectinload(Characteristic.rules))
+            )
+            for char, plant_id in (await self.session.execute(stmt)).all():
+                definitions[char.id] = (char, plant_id)
+        return definitions
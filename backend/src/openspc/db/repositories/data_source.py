@@ -25,6 +25,12 @@ class DataSourceRepository(BaseRepository[DataSource]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_active_characteristic_ids(self) -> list[int]:
+        """Get IDs of characteristics fed by an active data source (any protocol)."""
+        stmt = select(DataSource.characteristic_id).where(DataSource.is_active == True)  # noqa: E712
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_mqtt_sources(self, broker_id: int | None = None) -> list[MQTTDataSource]:
         stmt = select(MQTTDataSource)
         if broker_id is not None:
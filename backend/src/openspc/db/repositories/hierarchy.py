@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from openspc.db.models.hierarchy import Hierarchy
-from openspc.db.repositories.base import BaseRepository
+from openspc.db.repositories.base import IN_CLAUSE_CHUNK_SIZE, BaseRepository
 
 
 class HierarchyNode(BaseModel):
@@ -212,6 +212,43 @@ class HierarchyRepository(BaseRepository[Hierarchy]):
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def get_plant_ids(self, node_ids: Sequence[int]) -> dict[int, Optional[int]]:
+        """Get the plant of each of many hierarchy nodes.
+
+        Args:
+            node_ids: IDs of the hierarchy nodes
+
+        Returns:
+            Dict mapping node ID to plant ID; nodes that do not exist are omitted
+        """
+        plant_ids: dict[int, Optional[int]] = {}
+        for start in range(0, len(node_ids), IN_CLAUSE_CHUNK_SIZE):
+            stmt = select(Hierarchy.id, Hierarchy.plant_id).where(
+                Hierarchy.id.in_(node_ids[start:start + IN_CLAUSE_CHUNK_SIZE])
+            )
+            result = await self.session.execute(stmt)
+            plant_ids.update(result.all())
+        return plant_ids
+
+    async def get_node_map(
+        self, plant_id: Optional[int]
+    ) -> dict[int, tuple[str, Optional[int]]]:
+        """Get the name and parent of every node of a plant in one query.
+
+        Args:
+            plant_id: ID of the plant, or None for nodes without a plant
+
+        Returns:
+            Dict mapping node ID to (name, parent_id)
+        """
+        stmt = select(Hierarchy.id, Hierarchy.name, Hierarchy.parent_id)
+        if plant_id is None:
+            stmt = stmt.where(Hierarchy.plant_id.is_(None))
+        else:
+            stmt = stmt.where(Hierarchy.plant_id == plant_id)
+        result = await self.session.execute(stmt)
+        return {node_id: (name, parent_id) for node_id, name, parent_id in result.all()}
+
     async def create_in_plant(
         self,
         plant_id: int,
@@ -1,13 +1,123 @@
 """Repository for Sample model with rolling window queries."""
 
-from datetime import datetime, timezone
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta, timezone
+from typing import NamedTuple
 
-from sqlalchemy import select
+from sqlalchemy import Date, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.expression import FunctionElement, Subquery
 
 from openspc.db.models.sample import Measurement, Sample
-from openspc.db.repositories.base import BaseRepository
+from openspc.db.repositories.base import IN_CLAUSE_CHUNK_SIZE, BaseRepository
+from openspc.utils.statistics import calculate_sample_statistics
+
+
+class ChartPoint(NamedTuple):
+    """Sample columns needed to draw one control chart point."""
+
+    id: int
+    char_id: int
+    timestamp: datetime
+    mean: float | None
+    range_value: float | None
+    std_dev: float | None
+    is_excluded: bool
+    actual_n: int
+    is_undersized: bool
+    effective_ucl: float | None
+    effective_lcl: float | None
+    z_score: float | None
+
+
+class sample_day(FunctionElement):
+    """UTC calendar day of a timestamp column, portable across dialects."""
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(sample_day)
+def _compile_sample_day(element, compiler, **kw):
+    return "CAST(%s AS DATE)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(sample_day, "postgresql")
+def _compile_sample_day_postgresql(element, compiler, **kw):
+    # Casting timestamptz to DATE uses the session TimeZone, not UTC
+    return "CAST(timezone('UTC', %s) AS DATE)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(sample_day, "sqlite")
+def _compile_sample_day_sqlite(element, compiler, **kw):
+    # SQLite has no DATE type; CAST would yield the year as an integer
+    return "date(%s)" % compiler.process(element.clauses, **kw)
+
+
+def _utc_date(timestamp: datetime) -> date:
+    """UTC calendar day of a timestamp (naive values are taken as UTC)."""
+    if timestamp.tzinfo is None:
+        return timestamp.date()
+    return timestamp.astimezone(timezone.utc).date()
+
+
+def display_sequence_subquery(
+    char_ids: list[int] | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> Subquery:
+    """Build a subquery numbering samples within each characteristic and day.
+
+    The sequence is ROW_NUMBER() over (char_id, day) ordered by timestamp
+    then id, counting excluded samples too, so it matches the NNN part of
+    the YYMMDD-NNN display key. Filters are widened to whole UTC days, plus
+    one day on each side, so the numbering is never affected by the
+    requested range and callers joining on the subquery keep every sample
+    in that range whatever offset the bounds were given in.
+
+    Args:
+        char_ids: Restrict to these characteristics (None = all)
+        start_date: Only number days on or after this date
+        end_date: Only number days on or before this date
+
+    Returns:
+        Subquery with columns ``id`` and ``day_seq``
+    """
+    stmt = select(
+        Sample.id,
+        func.row_number().over(
+            partition_by=(Sample.char_id, sample_day(Sample.timestamp)),
+            order_by=(Sample.timestamp, Sample.id),
+        ).label("day_seq"),
+    )
+    if char_ids is not None:
+        stmt = stmt.where(Sample.char_id.in_(char_ids))
+    if start_date is not None:
+        first_day = _utc_date(start_date) - timedelta(days=1)
+        stmt = stmt.where(
+            Sample.timestamp >= datetime.combine(first_day, time.min, tzinfo=timezone.utc)
+        )
+    if end_date is not None:
+        last_day = _utc_date(end_date) + timedelta(days=1)
+        stmt = stmt.where(
+            Sample.timestamp <= datetime.combine(last_day, time.max, tzinfo=timezone.utc)
+        )
+    return stmt.subquery("display_seq")
+
+
+def format_display_key(timestamp: datetime, day_seq: int) -> str:
+    """Format a sample display key (YYMMDD-NNN).
+
+    Args:
+        timestamp: Sample timestamp
+        day_seq: 1-based position of the sample within its day
+
+    Returns:
+        Display key string
+    """
+    return f"{timestamp.strftime('%y%m%d')}-{day_seq:03d}"
 
 
 class SampleRepository(BaseRepository[Sample]):
@@ -43,6 +153,34 @@ class SampleRepository(BaseRepository[Sample]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_display_keys(self, samples: list[Sample]) -> dict[int, str]:
+        """Compute YYMMDD-NNN display keys for samples in a single query.
+
+        Args:
+            samples: Samples to compute keys for
+
+        Returns:
+            Dictionary mapping sample ID to display key
+        """
+        if not samples:
+            return {}
+
+        seq = display_sequence_subquery(
+            char_ids=sorted({s.char_id for s in samples}),
+            start_date=min(s.timestamp for s in samples),
+            end_date=max(s.timestamp for s in samples),
+        )
+        wanted = [s.id for s in samples]
+        result = await self.session.execute(
+            select(seq.c.id, seq.c.day_seq).where(seq.c.id.in_(wanted))
+        )
+        day_seqs = dict(result.all())
+        return {
+            s.id: format_display_key(s.timestamp, day_seqs[s.id])
+            for s in samples
+            if s.id in day_seqs
+        }
+
     async def get_rolling_window(
         self, char_id: int, window_size: int = 25, exclude_excluded: bool = True
     ) -> list[Sample]:
@@ -89,10 +227,11 @@ class SampleRepository(BaseRepository[Sample]):
     async def get_rolling_window_data(
         self, char_id: int, window_size: int = 25, exclude_excluded: bool = True
     ) -> list[dict]:
-        """Get rolling window sample data with measurement values pre-extracted.
+        """Get rolling window sample data from the persisted sample statistics.
 
-        This method avoids lazy loading issues by extracting measurement values
-        immediately after the query, returning plain dictionaries instead of ORM objects.
+        Only sample columns are read; measurement rows are not loaded.
+        Returns plain dictionaries instead of ORM objects to avoid lazy
+        loading issues.
 
         Args:
             char_id: ID of the characteristic to query
@@ -100,36 +239,344 @@ class SampleRepository(BaseRepository[Sample]):
             exclude_excluded: If True, filter out excluded samples (default: True)
 
         Returns:
-            List of dictionaries with sample_id, timestamp, and values (measurement list)
+            List of dictionaries with sample_id, timestamp, actual_n, mean and
+            range_value (chronological order)
         """
         stmt = (
-            select(Sample)
-            .options(selectinload(Sample.measurements))
+            select(
+                Sample.id, Sample.timestamp, Sample.actual_n, Sample.mean, Sample.range_value
+            )
             .where(Sample.char_id == char_id)
-            .order_by(Sample.timestamp.desc())
+            .order_by(Sample.timestamp.desc(), Sample.id.desc())
             .limit(window_size)
-            .execution_options(populate_existing=True)
         )
 
         if exclude_excluded:
             stmt = stmt.where(Sample.is_excluded == False)
 
         result = await self.session.execute(stmt)
-        samples = list(result.scalars().all())
+        data = [self._window_row(*row) for row in reversed(result.all())]
+        await self._fill_window_statistics(data)
+        return data
+
+    async def get_rolling_window_data_many(
+        self,
+        char_ids: Iterable[int],
+        window_size: int = 25,
+        exclude_excluded: bool = True,
+    ) -> dict[int, list[dict]]:
+        """Get rolling window data for many characteristics at once.
+
+        Ranks samples per characteristic with ROW_NUMBER() OVER (PARTITION BY
+        char_id ORDER BY timestamp DESC) and keeps the latest window_size
+        samples, so each chunk of characteristics costs a single query
+        instead of one query each.
+
+        Args:
+            char_ids: IDs of the characteristics to query
+            window_size: Number of most recent samples per characteristic
+            exclude_excluded: If True, filter out excluded samples (default: True)
+
+        Returns:
+            Dict mapping every requested char_id to the same list of
+            dictionaries get_rolling_window_data() returns (empty if the
+            characteristic has no samples)
+        """
+        ids = list(dict.fromkeys(char_ids))
+        data: dict[int, list[dict]] = {char_id: [] for char_id in ids}
+
+        for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            ranked = select(
+                Sample.id,
+                Sample.char_id,
+                Sample.timestamp,
+                Sample.actual_n,
+                Sample.mean,
+                Sample.range_value,
+                func.row_number()
+                .over(
+                    partition_by=Sample.char_id,
+                    order_by=(Sample.timestamp.desc(), Sample.id.desc()),
+                )
+                .label("position"),
+            ).where(Sample.char_id.in_(chunk))
+            if exclude_excluded:
+                ranked = ranked.where(Sample.is_excluded == False)  # noqa: E712
+            ranked = ranked.subquery()
+
+            stmt = (
+                select(
+                    ranked.c.char_id,
+                    ranked.c.id,
+                    ranked.c.timestamp,
+                    ranked.c.actual_n,
+                    ranked.c.mean,
+                    ranked.c.range_value,
+                )
+                .where(ranked.c.position <= window_size)
+                .order_by(ranked.c.char_id, ranked.c.position.desc())
+            )
+            result = await self.session.execute(stmt)
 
-        # Extract data immediately to avoid lazy loading issues
-        data = []
-        for sample in reversed(samples):  # Reverse for chronological order
-            measurements = sample.measurements
-            values = [m.value for m in measurements] if measurements else []
-            data.append({
-                "sample_id": sample.id,
-                "timestamp": sample.timestamp,
-                "values": values,
-            })
+            for char_id, *columns in result.all():
+                data[char_id].append(self._window_row(*columns))
 
+        await self._fill_window_statistics([row for rows in data.values() for row in rows])
         return data
 
+    @staticmethod
+    def _window_row(
+        sample_id: int,
+        timestamp: datetime,
+        actual_n: int,
+        mean: float | None,
+        range_value: float | None,
+    ) -> dict:
+        """Build one rolling window data dictionary."""
+        return {
+            "sample_id": sample_id,
+            "timestamp": timestamp,
+            "actual_n": actual_n,
+            "mean": mean,
+            "range_value": range_value,
+        }
+
+    async def _fill_window_statistics(self, rows: list[dict]) -> None:
+        """Fill mean/range_value of window rows whose columns are NULL."""
+        missing = [row for row in rows if row["mean"] is None]
+        if not missing:
+            return
+        statistics = await self._statistics_from_measurements(
+            [row["sample_id"] for row in missing]
+        )
+        for row in missing:
+            if row["sample_id"] in statistics:
+                row["mean"], row["range_value"], _ = statistics[row["sample_id"]]
+
+    async def get_samples_with_statistics(
+        self,
+        char_id: int,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int | None = None,
+        exclude_excluded: bool = False,
+    ) -> list[Sample]:
+        """Get samples with their persisted statistics, without measurements.
+
+        Read path for charts and control limit calculation: only the sample
+        table is queried, and callers use ``mean``, ``range_value`` and
+        ``std_dev`` instead of the measurements relationship (which is not
+        loaded).
+
+        Args:
+            char_id: ID of the characteristic to query
+            start_date: Optional start of date range (inclusive)
+            end_date: Optional end of date range (inclusive)
+            limit: Optional number of most recent samples to return
+            exclude_excluded: If True, filter out excluded samples
+
+        Returns:
+            List of samples ordered by timestamp (oldest to newest)
+        """
+        stmt = select(Sample).where(Sample.char_id == char_id)
+        if start_date is not None:
+            stmt = stmt.where(Sample.timestamp >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(Sample.timestamp <= end_date)
+        if exclude_excluded:
+            stmt = stmt.where(Sample.is_excluded == False)  # noqa: E712
+
+        if limit is not None:
+            stmt = stmt.order_by(Sample.timestamp.desc(), Sample.id.desc()).limit(limit)
+            result = await self.session.execute(stmt)
+            samples = list(reversed(result.scalars().all()))
+        else:
+            stmt = stmt.order_by(Sample.timestamp, Sample.id)
+            result = await self.session.execute(stmt)
+            samples = list(result.scalars().all())
+
+        missing = [s for s in samples if s.mean is None]
+        if missing:
+            from sqlalchemy.orm.attributes import set_committed_value
+
+            statistics = await self._statistics_from_measurements([s.id for s in missing])
+            for sample in missing:
+                if sample.id in statistics:
+                    for key, value in zip(
+                        ("mean", "range_value", "std_dev"), statistics[sample.id], strict=True
+                    ):
+                        set_committed_value(sample, key, value)
+
+        return samples
+
+    async def get_chart_points(
+        self,
+        char_id: int,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int | None = None,
+        exclude_excluded: bool = False,
+    ) -> list[ChartPoint]:
+        """Get chart points as plain tuples of the needed sample columns.
+
+        Fast path for chart rendering over long date ranges: selects only
+        the columns in ChartPoint, without building ORM objects or loading
+        measurements and edit history.
+
+        Args:
+            char_id: ID of the characteristic to query
+            start_date: Optional start of date range (inclusive)
+            end_date: Optional end of date range (inclusive)
+            limit: Optional number of most recent samples to return
+            exclude_excluded: If True, filter out excluded samples
+
+        Returns:
+            List of chart points ordered by timestamp (oldest to newest)
+        """
+        stmt = select(*(getattr(Sample, name) for name in ChartPoint._fields)).where(
+            Sample.char_id == char_id
+        )
+        if start_date is not None:
+            stmt = stmt.where(Sample.timestamp >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(Sample.timestamp <= end_date)
+        if exclude_excluded:
+            stmt = stmt.where(Sample.is_excluded == False)  # noqa: E712
+
+        if limit is not None:
+            stmt = stmt.order_by(Sample.timestamp.desc(), Sample.id.desc()).limit(limit)
+            result = await self.session.execute(stmt)
+            points = [ChartPoint(*row) for row in reversed(result.all())]
+        else:
+            stmt = stmt.order_by(Sample.timestamp, Sample.id)
+            result = await self.session.execute(stmt)
+            points = [ChartPoint(*row) for row in result.all()]
+
+        await self._fill_chart_statistics(points)
+        return points
+
+    async def get_chart_points_many(
+        self,
+        char_ids: Iterable[int],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int | None = None,
+        exclude_excluded: bool = False,
+    ) -> dict[int, list[ChartPoint]]:
+        """Get chart points for many characteristics at once.
+
+        With a limit, samples are ranked per characteristic with ROW_NUMBER()
+        OVER (PARTITION BY char_id ORDER BY timestamp DESC), so each chunk of
+        characteristics costs a single query.
+
+        Args:
+            char_ids: IDs of the characteristics to query
+            start_date: Optional start of date range (inclusive)
+            end_date: Optional end of date range (inclusive)
+            limit: Optional number of most recent samples per characteristic
+            exclude_excluded: If True, filter out excluded samples
+
+        Returns:
+            Dict mapping every requested char_id to the list get_chart_points()
+            returns (oldest to newest, empty if there are no samples)
+        """
+        ids = list(dict.fromkeys(char_ids))
+        points: dict[int, list[ChartPoint]] = {char_id: [] for char_id in ids}
+        columns = [getattr(Sample, name) for name in ChartPoint._fields]
+
+        for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            filters = [Sample.char_id.in_(chunk)]
+            if start_date is not None:
+                filters.append(Sample.timestamp >= start_date)
+            if end_date is not None:
+                filters.append(Sample.timestamp <= end_date)
+            if exclude_excluded:
+                filters.append(Sample.is_excluded == False)  # noqa: E712
+
+            if limit is not None:
+                ranked = (
+                    select(
+                        *columns,
+                        func.row_number()
+                        .over(
+                            partition_by=Sample.char_id,
+                            order_by=(Sample.timestamp.desc(), Sample.id.desc()),
+                        )
+                        .label("position"),
+                    )
+                    .where(*filters)
+                    .subquery()
+                )
+                stmt = (
+                    select(*(ranked.c[name] for name in ChartPoint._fields))
+                    .where(ranked.c.position <= limit)
+                    .order_by(ranked.c.char_id, ranked.c.position.desc())
+                )
+            else:
+                stmt = (
+                    select(*columns)
+                    .where(*filters)
+                    .order_by(Sample.char_id, Sample.timestamp, Sample.id)
+                )
+
+            result = await self.session.execute(stmt)
+            for row in result.all():
+                point = ChartPoint(*row)
+                points[point.char_id].append(point)
+
+        await self._fill_chart_statistics(*points.values())
+        return points
+
+    async def _fill_chart_statistics(self, *point_lists: list[ChartPoint]) -> None:
+        """Fill (in place) the statistics of chart points whose columns are NULL."""
+        missing = [
+            (points, i)
+            for points in point_lists
+            for i, point in enumerate(points)
+            if point.mean is None
+        ]
+        if not missing:
+            return
+        statistics = await self._statistics_from_measurements(
+            [points[i].id for points, i in missing]
+        )
+        for points, i in missing:
+            if points[i].id in statistics:
+                mean, range_value, std_dev = statistics[points[i].id]
+                points[i] = points[i]._replace(mean=mean, range_value=range_value, std_dev=std_dev)
+
+    async def _statistics_from_measurements(
+        self, sample_ids: list[int]
+    ) -> dict[int, tuple[float | None, float | None, float | None]]:
+        """Compute statistics for samples whose persisted columns are NULL.
+
+        Covers rows written without the statistics columns (e.g. inserted
+        directly rather than through this repository).
+
+        Args:
+            sample_ids: IDs of the samples to compute statistics for
+
+        Returns:
+            Dict mapping sample ID to (mean, range, std_dev); samples without
+            measurements are omitted
+        """
+        values: dict[int, list[float]] = {}
+        for start in range(0, len(sample_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = sample_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            result = await self.session.execute(
+                select(Measurement.sample_id, Measurement.value)
+                .where(Measurement.sample_id.in_(chunk))
+                .order_by(Measurement.sample_id, Measurement.id)
+            )
+            for sample_id, value in result.all():
+                values.setdefault(sample_id, []).append(value)
+        return {
+            sample_id: calculate_sample_statistics(sample_values)
+            for sample_id, sample_values in values.items()
+        }
+
     async def get_by_characteristic(
         self,
         char_id: int,
@@ -215,9 +662,10 @@ class SampleRepository(BaseRepository[Sample]):
                 batch_number="BATCH-002"
             )
         """
-        # Create the sample with context
+        # Create the sample with context and the statistics of its values
+        mean, range_value, std_dev = calculate_sample_statistics(values)
         sample_data = {"char_id": char_id, **context}
-        sample = Sample(**sample_data)
+        sample = Sample(**sample_data, mean=mean, range_value=range_value, std_dev=std_dev)
         self.session.add(sample)
         await self.session.flush()  # Get the sample ID
 
@@ -237,3 +685,60 @@ class SampleRepository(BaseRepository[Sample]):
         set_committed_value(sample, "measurements", measurements)
 
         return sample
+
+    async def create_many_with_measurements(self, rows: list[dict]) -> list[Sample]:
+        """Create many samples and their measurements with batched INSERTs.
+
+        All samples are added to the session and flushed together, followed by
+        a single flush for all measurements. SQLAlchemy groups the pending rows
+        into multi-row INSERT statements, so a batch of N samples costs two
+        round trips instead of 2N.
+
+        Args:
+            rows: One dict per sample with ``char_id``, ``values`` (measurement
+                list) and any additional Sample column values (timestamp,
+                batch_number, operator_id, actual_n, ...)
+
+        Returns:
+            Created samples, in the same order as ``rows``, with measurements
+            attached
+
+        Example:
+            samples = await repo.create_many_with_measurements([
+                {"char_id": 1, "values": [10.1, 10.2], "batch_number": "B1"},
+                {"char_id": 1, "values": [10.0, 10.3], "batch_number": "B1"},
+            ])
+        """
+        from sqlalchemy.orm.attributes import set_committed_value
+
+        if not rows:
+            return []
+
+        samples: list[Sample] = []
+        values_per_sample: list[list[float]] = []
+        for row in rows:
+            sample_data = dict(row)
+            values = list(sample_data.pop("values"))
+            values_per_sample.append(values)
+            mean, range_value, std_dev = calculate_sample_statistics(values)
+            samples.append(
+                Sample(**sample_data, mean=mean, range_value=range_value, std_dev=std_dev)
+            )
+
+        self.session.add_all(samples)
+        await self.session.flush()  # Assigns sample IDs in batched INSERTs
+
+        measurements_per_sample: list[list[Measurement]] = []
+        all_measurements: list[Measurement] = []
+        for sample, values in zip(samples, values_per_sample, strict=True):
+            measurements = [Measurement(sample_id=sample.id, value=v) for v in values]
+            measurements_per_sample.append(measurements)
+            all_measurements.extend(measurements)
+
+        self.session.add_all(all_measurements)
+        await self.session.flush()
+
+        for sample, measurements in zip(samples, measurements_per_sample, strict=True):
+            set_committed_value(sample, "measurements", measurements)
+
+        return samples
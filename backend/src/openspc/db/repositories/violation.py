@@ -1,13 +1,57 @@
 """Repository for Violation model with acknowledgment tracking."""
 
-from datetime import datetime, timezone
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, NamedTuple
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from openspc.db.models.violation import Violation
-from openspc.db.repositories.base import BaseRepository
+from openspc.db.models.violation import Violation, ViolationDailyRollup
+from openspc.db.repositories.base import IN_CLAUSE_CHUNK_SIZE, BaseRepository
+from openspc.db.repositories.sample import sample_day
+
+
+class ViolationCounts(NamedTuple):
+    """Aggregated violation counts for statistics.
+
+    Attributes:
+        by_rule_severity: Violation count per (rule_id, severity)
+        unacknowledged: Unacknowledged violations requiring acknowledgement
+        informational: Unacknowledged violations not requiring acknowledgement
+    """
+    by_rule_severity: Counter[tuple[int, str]]
+    unacknowledged: int
+    informational: int
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+    """Return an aware UTC datetime (naive values are taken as UTC)."""
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc)
+
+
+def _utc_day(timestamp: datetime) -> date:
+    """UTC calendar day of a timestamp (naive values are taken as UTC)."""
+    return _as_utc(timestamp).date()
+
+
+def _day_start(day: date) -> datetime:
+    """Start of a UTC day."""
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def _as_date(value: Any) -> date:
+    """Normalize a day returned by the database (SQLite returns strings)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
 
 
 class ViolationRepository(BaseRepository[Violation]):
@@ -89,19 +133,108 @@ class ViolationRepository(BaseRepository[Violation]):
         if not sample_ids:
             return {}
 
-        stmt = (
-            select(Violation)
-            .where(Violation.sample_id.in_(sample_ids))
-            .execution_options(populate_existing=True)
-        )
-        result = await self.session.execute(stmt)
-        violations = list(result.scalars().all())
-
         grouped: dict[int, list[Violation]] = {}
-        for v in violations:
-            grouped.setdefault(v.sample_id, []).append(v)
+        for start in range(0, len(sample_ids), IN_CLAUSE_CHUNK_SIZE):
+            stmt = (
+                select(Violation)
+                .where(Violation.sample_id.in_(sample_ids[start:start + IN_CLAUSE_CHUNK_SIZE]))
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            for v in result.scalars().all():
+                grouped.setdefault(v.sample_id, []).append(v)
         return grouped
 
+    async def get_sample_ids_with_violations(
+        self,
+        char_id: int,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> set[int]:
+        """Get the IDs of a characteristic's samples that have violations.
+
+        Args:
+            char_id: ID of the characteristic to query
+            start_date: Optional start of the sample date range (inclusive)
+            end_date: Optional end of the sample date range (inclusive)
+
+        Returns:
+            Set of sample IDs with at least one violation
+        """
+        return await self.get_sample_ids_with_violations_many(
+            [char_id], start_date=start_date, end_date=end_date
+        )
+
+    async def get_sample_ids_with_violations_many(
+        self,
+        char_ids: Iterable[int],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> set[int]:
+        """Get the IDs of samples with violations across many characteristics.
+
+        Args:
+            char_ids: IDs of the characteristics to query
+            start_date: Optional start of the sample date range (inclusive)
+            end_date: Optional end of the sample date range (inclusive)
+
+        Returns:
+            Set of sample IDs with at least one violation
+        """
+        from openspc.db.models.sample import Sample
+
+        ids = list(dict.fromkeys(char_ids))
+        sample_ids: set[int] = set()
+        for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+            stmt = (
+                select(Violation.sample_id)
+                .join(Sample, Sample.id == Violation.sample_id)
+                .where(Sample.char_id.in_(ids[start:start + IN_CLAUSE_CHUNK_SIZE]))
+                .distinct()
+            )
+            if start_date is not None:
+                stmt = stmt.where(Sample.timestamp >= start_date)
+            if end_date is not None:
+                stmt = stmt.where(Sample.timestamp <= end_date)
+
+            result = await self.session.execute(stmt)
+            sample_ids.update(result.scalars().all())
+        return sample_ids
+
+    async def create_many(self, rows: list[dict]) -> list[Violation]:
+        """Create many violations in a single flush.
+
+        Unlike ``create()``, instances are not refreshed one by one; all
+        pending rows are written with batched INSERTs.
+
+        Args:
+            rows: One dict of Violation column values per violation
+
+        Returns:
+            Created violations in the same order as ``rows``
+        """
+        if not rows:
+            return []
+
+        violations = [Violation(**row) for row in rows]
+        self.session.add_all(violations)
+        await self.session.flush()
+        await self.add_to_rollup(violations)
+        return violations
+
+    async def create(self, **kwargs: Any) -> Violation:
+        """Create a violation and count it in the daily rollup.
+
+        Args:
+            **kwargs: Violation column values
+
+        Returns:
+            The created violation
+        """
+        violation = await super().create(**kwargs)
+        await self.add_to_rollup([violation])
+        return violation
+
     async def acknowledge(
         self, violation_id: int, user: str, reason: str
     ) -> Violation | None:
@@ -140,6 +273,105 @@ class ViolationRepository(BaseRepository[Violation]):
 
         return violation
 
+    async def get_acknowledgement_context(
+        self, violation_ids: Iterable[int]
+    ) -> dict[int, tuple[bool, int, int | None]]:
+        """Load what batch acknowledgement needs to authorize many violations.
+
+        One query per chunk of IDs joins each violation to its sample,
+        characteristic and hierarchy node.
+
+        Args:
+            violation_ids: IDs of the violations
+
+        Returns:
+            Dict mapping violation ID to (acknowledged, char_id, plant_id);
+            violations that do not exist are omitted
+        """
+        from openspc.db.models.characteristic import Characteristic
+        from openspc.db.models.hierarchy import Hierarchy
+        from openspc.db.models.sample import Sample
+
+        ids = list(dict.fromkeys(violation_ids))
+        context: dict[int, tuple[bool, int, int | None]] = {}
+        for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+            stmt = (
+                select(
+                    Violation.id,
+                    Violation.acknowledged,
+                    Sample.char_id,
+                    Hierarchy.plant_id,
+                )
+                .join(Sample, Violation.sample_id == Sample.id)
+                .join(Characteristic, Sample.char_id == Characteristic.id)
+                .outerjoin(Hierarchy, Characteristic.hierarchy_id == Hierarchy.id)
+                .where(Violation.id.in_(ids[start:start + IN_CLAUSE_CHUNK_SIZE]))
+            )
+            result = await self.session.execute(stmt)
+            for violation_id, acknowledged, char_id, plant_id in result.all():
+                context[violation_id] = (acknowledged, char_id, plant_id)
+        return context
+
+    async def acknowledge_many(
+        self,
+        violation_ids: list[int],
+        user: str,
+        reason: str,
+        ack_timestamp: datetime | None = None,
+    ) -> int:
+        """Acknowledge many violations with set-based UPDATEs.
+
+        Violations that are already acknowledged are left unchanged.
+
+        Args:
+            violation_ids: IDs of the violations to acknowledge
+            user: Username of the person acknowledging
+            reason: Reason for acknowledging
+            ack_timestamp: Acknowledgement time (defaults to now)
+
+        Returns:
+            Number of violations acknowledged
+        """
+        if ack_timestamp is None:
+            ack_timestamp = datetime.now(timezone.utc)
+        acknowledged = 0
+        for start in range(0, len(violation_ids), IN_CLAUSE_CHUNK_SIZE):
+            result = await self.session.execute(
+                update(Violation)
+                .where(
+                    Violation.id.in_(violation_ids[start:start + IN_CLAUSE_CHUNK_SIZE]),
+                    Violation.acknowledged == False,
+                )
+                .values(
+                    acknowledged=True,
+                    ack_user=user,
+                    ack_reason=reason,
+                    ack_timestamp=ack_timestamp,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            acknowledged += result.rowcount
+        return acknowledged
+
+    async def exclude_samples(self, violation_ids: list[int]) -> None:
+        """Exclude the samples of many violations from calculations.
+
+        Args:
+            violation_ids: IDs of the violations whose samples to exclude
+        """
+        from openspc.db.models.sample import Sample
+
+        for start in range(0, len(violation_ids), IN_CLAUSE_CHUNK_SIZE):
+            sample_ids = select(Violation.sample_id).where(
+                Violation.id.in_(violation_ids[start:start + IN_CLAUSE_CHUNK_SIZE])
+            )
+            await self.session.execute(
+                update(Sample)
+                .where(Sample.id.in_(sample_ids))
+                .values(is_excluded=True)
+                .execution_options(synchronize_session=False)
+            )
+
     async def list_violations(
         self,
         characteristic_id: int | None = None,
@@ -233,3 +465,265 @@ class ViolationRepository(BaseRepository[Violation]):
         violations = list(result.scalars().all())
 
         return violations, total
+
+    async def count_violations(
+        self,
+        characteristic_id: int | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        before: datetime | None = None,
+        acknowledged: bool | None = None,
+    ) -> list[tuple[int, str, bool, bool, int]]:
+        """Count violations grouped by rule, severity and acknowledgement.
+
+        Aggregates in the database with one GROUP BY query (covered by the
+        ix_violation_stats index) instead of loading violation rows.
+
+        Args:
+            characteristic_id: Optional characteristic filter
+            start_date: Optional sample timestamp lower bound (inclusive)
+            end_date: Optional sample timestamp upper bound (inclusive)
+            before: Optional sample timestamp upper bound (exclusive)
+            acknowledged: Optional acknowledgement status filter
+
+        Returns:
+            Rows of (rule_id, severity, acknowledged, requires_acknowledgement,
+            count)
+        """
+        from openspc.db.models.sample import Sample
+
+        stmt = (
+            select(
+                Violation.rule_id,
+                Violation.severity,
+                Violation.acknowledged,
+                Violation.requires_acknowledgement,
+                func.count(),
+            )
+            .join(Sample, Violation.sample_id == Sample.id)
+            .group_by(
+                Violation.rule_id,
+                Violation.severity,
+                Violation.acknowledged,
+                Violation.requires_acknowledgement,
+            )
+        )
+        if characteristic_id is not None:
+            stmt = stmt.where(Sample.char_id == characteristic_id)
+        if start_date is not None:
+            stmt = stmt.where(Sample.timestamp >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(Sample.timestamp <= end_date)
+        if before is not None:
+            stmt = stmt.where(Sample.timestamp < before)
+        if acknowledged is not None:
+            stmt = stmt.where(Violation.acknowledged == acknowledged)
+
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def get_violation_counts(
+        self,
+        characteristic_id: int | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        use_rollup: bool = False,
+    ) -> ViolationCounts:
+        """Aggregate violation counts for a characteristic and date range.
+
+        With ``use_rollup``, whole UTC days inside the range are read from
+        the daily rollup and only the partial days at the range edges are
+        counted from violations, so the cost grows with the number of days
+        rather than the number of violations. Unacknowledged counts are
+        always taken from the unacknowledged violations.
+
+        Args:
+            characteristic_id: Optional characteristic filter
+            start_date: Optional sample timestamp lower bound (inclusive)
+            end_date: Optional sample timestamp upper bound (inclusive)
+            use_rollup: Read whole days from the daily rollup
+
+        Returns:
+            ViolationCounts for the range
+        """
+        by_rule_severity: Counter[tuple[int, str]] = Counter()
+        unacknowledged = 0
+        informational = 0
+
+        first_day = last_day = None
+        if use_rollup:
+            if start_date is not None:
+                start_date = _as_utc(start_date)
+                first_day = _utc_day(start_date)
+                if start_date > _day_start(first_day):
+                    first_day += timedelta(days=1)
+            if end_date is not None:
+                end_date = _as_utc(end_date)
+                last_day = _utc_day(end_date) - timedelta(days=1)
+            if first_day is not None and last_day is not None and first_day > last_day:
+                use_rollup = False
+
+        if not use_rollup:
+            rows = await self.count_violations(characteristic_id, start_date, end_date)
+            for rule_id, severity, acked, requires_ack, count in rows:
+                by_rule_severity[(rule_id, severity)] += count
+                if not acked:
+                    if requires_ack:
+                        unacknowledged += count
+                    else:
+                        informational += count
+            return ViolationCounts(by_rule_severity, unacknowledged, informational)
+
+        # Whole days from the rollup
+        stmt = select(
+            ViolationDailyRollup.rule_id,
+            ViolationDailyRollup.severity,
+            func.sum(ViolationDailyRollup.count),
+        ).group_by(ViolationDailyRollup.rule_id, ViolationDailyRollup.severity)
+        if characteristic_id is not None:
+            stmt = stmt.where(ViolationDailyRollup.char_id == characteristic_id)
+        if first_day is not None:
+            stmt = stmt.where(ViolationDailyRollup.day >= first_day)
+        if last_day is not None:
+            stmt = stmt.where(ViolationDailyRollup.day <= last_day)
+        for rule_id, severity, count in (await self.session.execute(stmt)).all():
+            by_rule_severity[(rule_id, severity)] += int(count)
+
+        # Partial days at the edges from violations
+        edges = []
+        if first_day is not None and start_date < _day_start(first_day):
+            edges.append({"start_date": start_date, "before": _day_start(first_day)})
+        if last_day is not None:
+            edges.append({
+                "start_date": _day_start(last_day + timedelta(days=1)),
+                "end_date": end_date,
+            })
+        for edge in edges:
+            for rule_id, severity, _, _, count in await self.count_violations(
+                characteristic_id, **edge
+            ):
+                by_rule_severity[(rule_id, severity)] += count
+
+        # Acknowledgement changes after the fact, so it is not rolled up
+        for _, _, _, requires_ack, count in await self.count_violations(
+            characteristic_id, start_date, end_date, acknowledged=False
+        ):
+            if requires_ack:
+                unacknowledged += count
+            else:
+                informational += count
+        return ViolationCounts(by_rule_severity, unacknowledged, informational)
+
+    async def add_to_rollup(self, violations: Iterable[Violation]) -> None:
+        """Count newly created violations in the daily rollup.
+
+        Rows are incremented with UPDATE and created with INSERT when
+        missing. API submissions and the group-commit writer can add
+        violations for the same characteristic and day concurrently, so the
+        INSERT runs in a savepoint and falls back to the UPDATE when another
+        transaction created the row first.
+
+        Args:
+            violations: Flushed violations (their samples must exist)
+        """
+        from openspc.db.models.sample import Sample
+
+        violations = list(violations)
+        if not violations:
+            return
+
+        sample_ids = list({v.sample_id for v in violations})
+        samples: dict[int, tuple[int, datetime]] = {}
+        for start in range(0, len(sample_ids), IN_CLAUSE_CHUNK_SIZE):
+            result = await self.session.execute(
+                select(Sample.id, Sample.char_id, Sample.timestamp).where(
+                    Sample.id.in_(sample_ids[start:start + IN_CLAUSE_CHUNK_SIZE])
+                )
+            )
+            for sample_id, char_id, timestamp in result.all():
+                samples[sample_id] = (char_id, timestamp)
+
+        counts: Counter[tuple[int, date, int, str]] = Counter()
+        for v in violations:
+            char_id, timestamp = samples[v.sample_id]
+            counts[(char_id, _utc_day(timestamp), v.rule_id, v.severity)] += 1
+
+        for (char_id, day, rule_id, severity), count in counts.items():
+            increment = (
+                update(ViolationDailyRollup)
+                .where(
+                    ViolationDailyRollup.char_id == char_id,
+                    ViolationDailyRollup.day == day,
+                    ViolationDailyRollup.rule_id == rule_id,
+                    ViolationDailyRollup.severity == severity,
+                )
+                .values(count=ViolationDailyRollup.count + count)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.session.execute(increment)
+            if result.rowcount > 0:
+                continue
+            try:
+                async with self.session.begin_nested():
+                    await self.session.execute(
+                        insert(ViolationDailyRollup).values(
+                            char_id=char_id,
+                            day=day,
+                            rule_id=rule_id,
+                            severity=severity,
+                            count=count,
+                        )
+                    )
+            except IntegrityError:
+                # A concurrent transaction created the row after our UPDATE
+                await self.session.execute(increment)
+
+    async def refresh_rollup(
+        self, char_id: int, start_date: datetime, end_date: datetime
+    ) -> None:
+        """Recompute a characteristic's rollup rows for a range of days.
+
+        Used after violations are removed, e.g. when samples are deleted,
+        edited or purged (cascaded deletes bypass add_to_rollup()).
+
+        Args:
+            char_id: Characteristic ID
+            start_date: Any time on the first day to recompute
+            end_date: Any time on the last day to recompute
+        """
+        from openspc.db.models.sample import Sample
+
+        first_day, last_day = _utc_day(start_date), _utc_day(end_date)
+        await self.session.execute(
+            delete(ViolationDailyRollup)
+            .where(
+                ViolationDailyRollup.char_id == char_id,
+                ViolationDailyRollup.day >= first_day,
+                ViolationDailyRollup.day <= last_day,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        day = sample_day(Sample.timestamp)
+        result = await self.session.execute(
+            select(day, Violation.rule_id, Violation.severity, func.count())
+            .join(Sample, Violation.sample_id == Sample.id)
+            .where(
+                Sample.char_id == char_id,
+                Sample.timestamp >= _day_start(first_day),
+                Sample.timestamp < _day_start(last_day + timedelta(days=1)),
+            )
+            .group_by(day, Violation.rule_id, Violation.severity)
+        )
+        rows = [
+            {
+                "char_id": char_id,
+                "day": _as_date(row_day),
+                "rule_id": rule_id,
+                "severity": severity,
+                "count": count,
+            }
+            for row_day, rule_id, severity, count in result.all()
+        ]
+        if rows:
+            await self.session.execute(insert(ViolationDailyRollup), rows)
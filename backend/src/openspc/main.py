@@ -23,20 +23,26 @@ from openspc.api.v1.plants import router as plants_router
 from openspc.api.v1.providers import router as providers_router
 from openspc.api.v1.retention import router as retention_router
 from openspc.api.v1.samples import router as samples_router
+from openspc.api.v1.stats import router as stats_router
 from openspc.api.v1.users import router as users_router
 from openspc.api.v1.tags import router as tags_router
 from openspc.api.v1.violations import router as violations_router
 from openspc.api.v1.websocket import manager as ws_manager
 from openspc.api.v1.websocket import router as websocket_router
+from openspc.core.auth.api_key import verified_key_cache
 from openspc.core.auth.bootstrap import bootstrap_admin_user
+from openspc.core.auth.principal import principal_cache
 from openspc.core.broadcast import WebSocketBroadcaster
-from openspc.core.publish import MQTTPublisher
+from openspc.core.publish import MQTTPublisher, outbound_broker_cache
 from openspc.core.config import get_settings
+from openspc.core.engine import characteristic_cache, chart_data_cache, sample_writer
 from openspc.core.events import event_bus
+from openspc.core.hierarchy_cache import hierarchy_path_cache
 from openspc.core.rate_limit import limiter
 from openspc.core.providers import tag_provider_manager, opcua_provider_manager
 from openspc.core.purge_engine import PurgeEngine
 from openspc.db.database import get_database
+from openspc.db.repositories.data_source import DataSourceRepository
 from openspc.mqtt import mqtt_manager
 from openspc.opcua.manager import opcua_manager
 
@@ -95,11 +101,59 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await ws_manager.start()
 
     # Initialize WebSocket broadcaster and wire it to event bus
-    broadcaster = WebSocketBroadcaster(ws_manager, event_bus)
+    broadcaster = WebSocketBroadcaster(
+        ws_manager, event_bus, queue_size=settings.event_queue_size
+    )
 
     # Store broadcaster in app state for access by other components
     app.state.broadcaster = broadcaster
 
+    # Cache characteristic definitions, invalidated by characteristic events
+    characteristic_cache.configure(
+        max_size=settings.characteristic_cache_size,
+        ttl_seconds=settings.characteristic_cache_ttl_seconds,
+    )
+    characteristic_cache.subscribe(event_bus)
+
+    # Cache chart-data responses, versioned by sample and limit events
+    chart_data_cache.configure(
+        max_size=settings.chart_cache_size,
+        ttl_seconds=settings.chart_cache_ttl_seconds,
+    )
+    chart_data_cache.subscribe(event_bus)
+
+    # Cache plant-wide hierarchy node maps used to build hierarchy paths
+    hierarchy_path_cache.configure(ttl_seconds=settings.hierarchy_path_cache_ttl_seconds)
+
+    # Remember successful API key verifications to skip repeated bcrypt
+    verified_key_cache.configure(
+        max_size=settings.api_key_cache_size,
+        ttl_seconds=settings.api_key_cache_ttl_seconds,
+    )
+
+    # Cache authenticated user snapshots to skip the per-request user query
+    principal_cache.configure(
+        max_size=settings.principal_cache_size,
+        ttl_seconds=settings.principal_cache_ttl_seconds,
+    )
+
+    # Start the group-commit writer used by TAG and OPC-UA providers
+    sample_writer.configure(
+        max_rows=settings.sample_commit_max_rows,
+        max_delay_ms=settings.sample_commit_interval_ms,
+        queue_size=settings.sample_commit_queue_size,
+    )
+    await sample_writer.start(db.session_factory)
+
+    # Preload rolling windows so the first live samples skip cold loads
+    if settings.window_warmup_on_startup:
+        try:
+            async with db.session() as session:
+                char_ids = await DataSourceRepository(session).get_active_characteristic_ids()
+            await sample_writer.warm_up(char_ids)
+        except Exception as e:
+            logger.warning("window_warmup_failed", error=str(e))
+
     # Initialize MQTT manager with database session
     try:
         async with db.session() as session:
@@ -143,7 +197,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.warning("opcua_init_failed", error=str(e))
 
     # Initialize MQTT outbound publisher (after MQTT manager so brokers are connected)
-    mqtt_publisher = MQTTPublisher(mqtt_manager, event_bus, db.session)
+    outbound_broker_cache.configure(ttl_seconds=settings.outbound_broker_cache_ttl_seconds)
+    mqtt_publisher = MQTTPublisher(
+        mqtt_manager, event_bus, db.session, queue_size=settings.event_queue_size
+    )
     app.state.mqtt_publisher = mqtt_publisher
     logger.info("MQTT outbound publisher initialized")
 
@@ -177,9 +234,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown TAG provider first (before MQTT)
     await tag_provider_manager.shutdown()
 
+    # Publish coalesced outbound updates while brokers are still connected
+    await app.state.mqtt_publisher.stop()
+
     # Shutdown MQTT manager
     await mqtt_manager.shutdown()
 
+    # Commit samples still pending from the providers
+    await sample_writer.stop()
+
     # Wait for pending event handlers to complete
     await event_bus.shutdown()
 
@@ -232,6 +295,7 @@ app.include_router(data_entry_router)
 app.include_router(providers_router)
 app.include_router(retention_router)
 app.include_router(samples_router)
+app.include_router(stats_router)
 app.include_router(tags_router)
 app.include_router(violations_router)
 app.include_router(websocket_router)
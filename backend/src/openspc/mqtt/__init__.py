@@ -5,11 +5,13 @@ from openspc.mqtt.discovery import DiscoveredTopic, TopicDiscoveryService, Topic
 from openspc.mqtt.manager import ConnectionState, MQTTManager, mqtt_manager
 from openspc.mqtt.sparkplug import (
     SparkplugAdapter,
+    SparkplugAliasTable,
     SparkplugDecoder,
     SparkplugEncoder,
     SparkplugMessage,
     SparkplugMetric,
 )
+from openspc.mqtt.topic_trie import TopicTrie
 
 __all__ = [
     "MQTTClient",
@@ -19,6 +21,7 @@ __all__ = [
     "ConnectionState",
     "mqtt_manager",
     "SparkplugAdapter",
+    "SparkplugAliasTable",
     "SparkplugDecoder",
     "SparkplugEncoder",
     "SparkplugMessage",
@@ -26,4 +29,5 @@ __all__ = [
     "TopicDiscoveryService",
     "DiscoveredTopic",
     "TopicTreeNode",
+    "TopicTrie",
 ]
@@ -7,14 +7,13 @@ automatic reconnection, topic subscription management, and graceful shutdown.
 import asyncio
 import contextlib
 import structlog
-from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 from aiomqtt import Client, MqttError
 
-logger = structlog.get_logger(__name__)
+from openspc.mqtt.topic_trie import MessageCallback, TopicTrie
 
-MessageCallback = Callable[[str, bytes], Awaitable[None]]
+logger = structlog.get_logger(__name__)
 
 
 @dataclass
@@ -49,8 +48,9 @@ class MQTTClient:
     The client automatically:
     - Reconnects with exponential backoff on connection loss
     - Restores subscriptions after reconnection
-    - Routes incoming messages to registered callbacks
+    - Routes incoming messages to registered callbacks via a topic trie
     - Handles topic wildcard matching (# and +)
+    - Supports several callbacks per topic pattern
 
     Example:
         >>> config = MQTTConfig(host="mqtt.example.com", port=1883)
@@ -74,7 +74,7 @@ class MQTTClient:
         self._config = config
         self._client: Client | None = None
         self._connected = False
-        self._subscriptions: dict[str, MessageCallback] = {}
+        self._subscriptions = TopicTrie()
         self._reconnect_task: asyncio.Task[None] | None = None
         self._message_task: asyncio.Task[None] | None = None
         self._shutdown_event = asyncio.Event()
@@ -88,6 +88,15 @@ class MQTTClient:
         """
         return self._connected
 
+    @property
+    def subscribed_topics(self) -> list[str]:
+        """Topic patterns with at least one registered callback.
+
+        Returns:
+            Patterns in subscription order
+        """
+        return list(self._subscriptions)
+
     async def connect(self) -> None:
         """Connect to MQTT broker with auto-reconnection.
 
@@ -157,9 +166,11 @@ class MQTTClient:
     async def subscribe(self, topic: str, callback: MessageCallback) -> None:
         """Subscribe to a topic with callback.
 
-        Registers a callback for messages on the specified topic. If already
-        connected, immediately subscribes to the broker. If not connected,
-        the subscription will be established when connection is made.
+        Registers a callback for messages on the specified topic. A topic
+        can have several callbacks (e.g. a tag provider and a tag preview);
+        the broker subscription is made when the first one is registered.
+        If not connected, the subscription will be established when
+        connection is made.
 
         Supports MQTT wildcards:
         - Single level: sensors/+/temperature
@@ -177,9 +188,9 @@ class MQTTClient:
             >>> await client.subscribe("sensors/+/temp", handle_temp)
         """
         logger.info("subscribing_to_topic", topic=topic)
-        self._subscriptions[topic] = callback
+        is_new = self._subscriptions.insert(topic, callback)
 
-        if self._connected and self._client:
+        if is_new and self._connected and self._client:
             try:
                 await self._client.subscribe(topic)
                 logger.info("subscribed", topic=topic)
@@ -187,23 +198,25 @@ class MQTTClient:
                 logger.error("subscribe_failed", topic=topic, error=str(e))
                 raise
 
-    async def unsubscribe(self, topic: str) -> None:
+    async def unsubscribe(
+        self, topic: str, callback: MessageCallback | None = None
+    ) -> None:
         """Unsubscribe from a topic.
 
-        Removes the topic subscription and callback. If connected, immediately
+        Removes one callback, or all callbacks, of the topic. Once no
+        callback is left and the client is connected, immediately
         unsubscribes from the broker.
 
         Args:
             topic: Topic pattern to unsubscribe from
+            callback: Callback to remove (None removes all callbacks)
 
         Example:
-            >>> await client.unsubscribe("sensors/+/temp")
+            >>> await client.unsubscribe("sensors/+/temp", handle_temp)
         """
         logger.info("unsubscribing_from_topic", topic=topic)
 
-        if topic in self._subscriptions:
-            del self._subscriptions[topic]
-
+        if self._subscriptions.remove(topic, callback):
             if self._connected and self._client:
                 try:
                     await self._client.unsubscribe(topic)
@@ -390,18 +403,17 @@ class MQTTClient:
                         payload_size=len(payload),
                     )
 
-                    # Match topic to callbacks (handle wildcards)
-                    for sub_topic, callback in self._subscriptions.items():
-                        if self._topic_matches(sub_topic, topic):
-                            try:
-                                await callback(topic, payload)
-                            except Exception as e:
-                                logger.error(
-                                    "callback_error",
-                                    topic=topic,
-                                    error=str(e),
-                                    exc_info=True,
-                                )
+                    # Resolve callbacks from the topic trie (handles wildcards)
+                    for callback in self._subscriptions.match(topic):
+                        try:
+                            await callback(topic, payload)
+                        except Exception as e:
+                            logger.error(
+                                "callback_error",
+                                topic=topic,
+                                error=str(e),
+                                exc_info=True,
+                            )
 
             except MqttError as e:
                 self._connected = False
@@ -426,6 +438,9 @@ class MQTTClient:
     def _topic_matches(pattern: str, topic: str) -> bool:
         """Check if topic matches subscription pattern.
 
+        Message dispatch uses TopicTrie; this pairwise check is kept for
+        one-off comparisons.
+
         Implements MQTT wildcard matching:
         - # matches zero or more levels (must be last)
         - + matches exactly one level
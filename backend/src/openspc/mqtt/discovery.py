@@ -154,7 +154,9 @@ class TopicDiscoveryService:
         self._is_active = False
         if self._subscribe_pattern:
             try:
-                await client.unsubscribe(self._subscribe_pattern)
+                await client.unsubscribe(
+                    self._subscribe_pattern, self._on_discovery_message
+                )
             except Exception as e:
                 logger.warning("discovery_unsubscribe_error", error=str(e))
             self._subscribe_pattern = None
@@ -315,7 +317,8 @@ class TopicDiscoveryService:
             seen: set[str] = set()
             result: list[SparkplugMetricInfo] = []
             for m in metrics:
-                if m.name not in seen:
+                # Alias-only metrics carry no name outside their birth certificate
+                if m.name and m.name not in seen:
                     seen.add(m.name)
                     result.append(SparkplugMetricInfo(name=m.name, data_type=m.data_type))
             return result
@@ -9,6 +9,7 @@ import asyncio
 import structlog
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -107,7 +108,7 @@ class MQTTManager:
             state = self._states.get(broker_id)
             if state and client.is_connected:
                 state.is_connected = True
-                state.subscribed_topics = list(client._subscriptions.keys())
+                state.subscribed_topics = client.subscribed_topics
                 return state
 
         # Return first state or default
@@ -117,7 +118,7 @@ class MQTTManager:
             client = self._clients.get(first_id)
             if client:
                 state.is_connected = client.is_connected
-                state.subscribed_topics = list(client._subscriptions.keys())
+                state.subscribed_topics = client.subscribed_topics
             return state
 
         return ConnectionState(error_message="No broker configured")
@@ -131,6 +132,17 @@ class MQTTManager:
         """
         return any(client.is_connected for client in self._clients.values())
 
+    def get_stats(self) -> dict[int, dict[str, Any]]:
+        """Return subscription dispatch metrics per broker.
+
+        Returns:
+            Dict mapping broker ID to its topic trie stats
+        """
+        return {
+            broker_id: client._subscriptions.get_stats()
+            for broker_id, client in self._clients.items()
+        }
+
     # -----------------------------------------------------------------------
     # Multi-broker API
     # -----------------------------------------------------------------------
@@ -160,7 +172,7 @@ class MQTTManager:
             client = self._clients.get(broker_id)
             if client:
                 state.is_connected = client.is_connected
-                state.subscribed_topics = list(client._subscriptions.keys())
+                state.subscribed_topics = client.subscribed_topics
         return state
 
     def get_all_states(self) -> dict[int, ConnectionState]:
@@ -174,7 +186,7 @@ class MQTTManager:
             client = self._clients.get(broker_id)
             if client:
                 state.is_connected = client.is_connected
-                state.subscribed_topics = list(client._subscriptions.keys())
+                state.subscribed_topics = client.subscribed_topics
             result[broker_id] = state
         return result
 
@@ -488,12 +500,14 @@ class MQTTManager:
         self,
         topic: str,
         broker_id: int | None = None,
+        callback=None,
     ) -> None:
         """Unsubscribe from an MQTT topic.
 
         Args:
             topic: Topic pattern to unsubscribe from
             broker_id: Optional broker ID (None = first available client)
+            callback: Callback to remove (None removes all callbacks)
         """
         if broker_id is not None:
             client = self._clients.get(broker_id)
@@ -501,7 +515,7 @@ class MQTTManager:
             client = self.client
 
         if client:
-            await client.unsubscribe(topic)
+            await client.unsubscribe(topic, callback)
             logger.info("unsubscribed_from_topic", topic=topic)
 
     async def publish(
@@ -5,6 +5,7 @@ MQTT specification for Industrial IoT. It handles:
 - Topic namespace parsing (spBv1.0/{group_id}/{message_type}/{edge_node_id}/{device_id})
 - Metric extraction and encoding
 - Session awareness (NBIRTH/NDEATH)
+- Metric aliases announced in birth certificates (NBIRTH/DBIRTH)
 - Integration with OpenSPC violation events
 - Both protobuf (real SparkplugB) and JSON (fallback) payload formats
 
@@ -13,7 +14,9 @@ References:
 """
 
 import json
+import struct
 import structlog
+from collections.abc import Container, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -45,6 +48,19 @@ DATA_TYPE_MAP: dict[int, str] = {
     17: "Bytes",
     18: "File",
     19: "Template",
+    22: "Int8Array",
+    23: "Int16Array",
+    24: "Int32Array",
+    25: "Int64Array",
+    26: "UInt8Array",
+    27: "UInt16Array",
+    28: "UInt32Array",
+    29: "UInt64Array",
+    30: "FloatArray",
+    31: "DoubleArray",
+    32: "BooleanArray",
+    33: "StringArray",
+    34: "DateTimeArray",
 }
 
 # Reverse map: string name -> protobuf integer
@@ -69,6 +85,26 @@ _VALUE_FIELD_MAP: dict[str, str] = {
     "UUID": "string_value",
     "Bytes": "bytes_value",
     "File": "bytes_value",
+    **{
+        array_type: "bytes_value"
+        for array_type in DATA_TYPE_MAP.values()
+        if array_type.endswith("Array")
+    },
+}
+
+# Numeric array types: packed little-endian elements in bytes_value
+_ARRAY_FORMAT_MAP: dict[str, str] = {
+    "Int8Array": "b",
+    "Int16Array": "h",
+    "Int32Array": "i",
+    "Int64Array": "q",
+    "UInt8Array": "B",
+    "UInt16Array": "H",
+    "UInt32Array": "I",
+    "UInt64Array": "Q",
+    "FloatArray": "f",
+    "DoubleArray": "d",
+    "DateTimeArray": "Q",  # ms since epoch
 }
 
 
@@ -86,6 +122,7 @@ class SparkplugMetric:
         timestamp: When the metric was sampled (None uses message timestamp)
         data_type: Sparkplug data type (Int32, Float, Boolean, String, etc.)
         properties: Optional metadata key-value pairs
+        alias: Metric alias from the payload (None if the payload has none)
     """
 
     name: str
@@ -93,6 +130,7 @@ class SparkplugMetric:
     timestamp: datetime | None = None
     data_type: str = "Float"
     properties: dict[str, Any] | None = None
+    alias: int | None = None
 
 
 @dataclass
@@ -134,16 +172,39 @@ class SparkplugMessage:
 def _extract_protobuf_value(metric) -> Any:
     """Extract value from a protobuf Metric based on its oneof field.
 
+    Numeric arrays are unpacked to lists and DataSets to a list of rows,
+    each a dict of column name to value.
+
     Args:
         metric: Protobuf Payload.Metric instance
 
     Returns:
-        The extracted value (int, float, bool, str, bytes, or None)
+        The extracted value (int, float, bool, str, bytes, list, or None)
     """
     value_field = metric.WhichOneof("value")
     if value_field is None:
         return None
-    return getattr(metric, value_field)
+    if value_field == "dataset_value":
+        dataset = metric.dataset_value
+        columns = list(dataset.columns)
+        return [
+            dict(zip(columns, (_extract_dataset_value(e) for e in row.elements), strict=True))
+            for row in dataset.rows
+        ]
+    value = getattr(metric, value_field)
+    array_format = _ARRAY_FORMAT_MAP.get(DATA_TYPE_MAP.get(metric.datatype, ""))
+    if array_format is not None and value_field == "bytes_value":
+        count = len(value) // struct.calcsize(array_format)
+        return list(struct.unpack(f"<{count}{array_format}", value))
+    return value
+
+
+def _extract_dataset_value(element) -> Any:
+    """Extract the value of a protobuf DataSet cell."""
+    value_field = element.WhichOneof("value_")
+    if value_field is None:
+        return None
+    return getattr(element, value_field)
 
 
 class SparkplugDecoder:
@@ -203,10 +264,46 @@ class SparkplugDecoder:
             "device_id": parts[4] if len(parts) > 4 else None,
         }
 
+    @staticmethod
+    def session_topics(topic: str) -> list[str]:
+        """Return the birth and death certificate topics of a data topic.
+
+        Subscribing to these alongside an NDATA/DDATA topic keeps an alias
+        table for the topic current.
+
+        Args:
+            topic: Sparkplug NDATA or DDATA topic
+
+        Returns:
+            NBIRTH/NDEATH topics of the edge node, plus DBIRTH/DDEATH of the
+            device for DDATA topics; empty for other message types
+
+        Raises:
+            ValueError: If topic doesn't match Sparkplug format
+
+        Example:
+            >>> SparkplugDecoder.session_topics("spBv1.0/spc/NDATA/node1")
+            ['spBv1.0/spc/NBIRTH/node1', 'spBv1.0/spc/NDEATH/node1']
+        """
+        parts = SparkplugDecoder.parse_topic(topic)
+        if parts["message_type"] not in ("NDATA", "DDATA"):
+            return []
+
+        node = f"{parts['namespace']}/{parts['group_id']}/{{}}/{parts['edge_node_id']}"
+        topics = [node.format("NBIRTH"), node.format("NDEATH")]
+        if parts["message_type"] == "DDATA" and parts["device_id"] is not None:
+            topics += [
+                f"{node.format(message_type)}/{parts['device_id']}"
+                for message_type in ("DBIRTH", "DDEATH")
+            ]
+        return topics
+
     @staticmethod
     def decode_payload(
         payload: bytes,
         format: str = "protobuf",
+        aliases: Mapping[int, str] | None = None,
+        names: Container[str] | None = None,
     ) -> tuple[datetime, list[SparkplugMetric], int | None]:
         """Decode Sparkplug B payload to metrics.
 
@@ -214,9 +311,16 @@ class SparkplugDecoder:
         "protobuf", uses the real SparkplugB protobuf decoder. Falls back
         to JSON if protobuf parsing fails.
 
+        Metrics sent by alias only (no name) get their name from
+        ``aliases``; without a matching alias their name is empty. With
+        ``names``, all other metrics are skipped before their value is
+        extracted.
+
         Args:
             payload: Payload bytes (protobuf or JSON encoded)
             format: Payload format - "protobuf" or "json" (default: "protobuf")
+            aliases: Alias to metric name map from the birth certificate
+            names: Metric names to decode (None decodes all metrics)
 
         Returns:
             Tuple of (timestamp, metrics_list, sequence_number)
@@ -231,29 +335,33 @@ class SparkplugDecoder:
         """
         if format == "protobuf":
             try:
-                return SparkplugDecoder._decode_protobuf(payload)
+                return SparkplugDecoder._decode_protobuf(payload, aliases, names)
             except Exception as e:
                 logger.warning(
                     "protobuf_decode_failed_json_fallback",
                     error=str(e),
                 )
                 try:
-                    return SparkplugDecoder._decode_json(payload)
+                    return SparkplugDecoder._decode_json(payload, aliases, names)
                 except Exception:
                     raise ValueError(
                         f"Payload could not be decoded as protobuf or JSON: {e}"
                     ) from e
         else:
-            return SparkplugDecoder._decode_json(payload)
+            return SparkplugDecoder._decode_json(payload, aliases, names)
 
     @staticmethod
     def _decode_protobuf(
         payload: bytes,
+        aliases: Mapping[int, str] | None = None,
+        names: Container[str] | None = None,
     ) -> tuple[datetime, list[SparkplugMetric], int | None]:
         """Decode a protobuf SparkplugB payload.
 
         Args:
             payload: Protobuf-encoded payload bytes
+            aliases: Alias to metric name map for alias-only metrics
+            names: Metric names to decode (None decodes all metrics)
 
         Returns:
             Tuple of (timestamp, metrics_list, sequence_number)
@@ -272,6 +380,13 @@ class SparkplugDecoder:
         # Extract metrics
         metrics = []
         for m in pb.metrics:
+            name = m.name
+            if not name and aliases:
+                # Alias-only metric (edge node sends aliases after its birth)
+                name = aliases.get(m.alias, "")
+            if names is not None and name not in names:
+                continue
+
             # Determine data type name
             dt_name = DATA_TYPE_MAP.get(m.datatype, "Float")
 
@@ -284,10 +399,11 @@ class SparkplugDecoder:
                 metric_ts = datetime.utcfromtimestamp(m.timestamp / 1000.0)
 
             metric = SparkplugMetric(
-                name=m.name,
+                name=name,
                 value=value,
                 data_type=dt_name,
                 timestamp=metric_ts or timestamp,
+                alias=m.alias,
             )
             metrics.append(metric)
 
@@ -296,6 +412,8 @@ class SparkplugDecoder:
     @staticmethod
     def _decode_json(
         payload: bytes,
+        aliases: Mapping[int, str] | None = None,
+        names: Container[str] | None = None,
     ) -> tuple[datetime, list[SparkplugMetric], int | None]:
         """Decode a JSON SparkplugB payload (backward compatible).
 
@@ -309,8 +427,12 @@ class SparkplugDecoder:
             ]
         }
 
+        Metrics may carry an "alias" instead of, or in addition to, a name.
+
         Args:
             payload: JSON-encoded payload bytes
+            aliases: Alias to metric name map for alias-only metrics
+            names: Metric names to decode (None decodes all metrics)
 
         Returns:
             Tuple of (timestamp, metrics_list, sequence_number)
@@ -336,16 +458,24 @@ class SparkplugDecoder:
         # Parse metrics
         metrics = []
         for metric_data in data["metrics"]:
-            if "name" not in metric_data or "value" not in metric_data:
+            alias = metric_data.get("alias")
+            if ("name" not in metric_data and alias is None) or "value" not in metric_data:
                 logger.warning("skipping_invalid_metric", metric_data=metric_data)
                 continue
 
+            name = metric_data.get("name")
+            if name is None:
+                name = aliases.get(alias, "") if aliases else ""
+            if names is not None and name not in names:
+                continue
+
             metric = SparkplugMetric(
-                name=metric_data["name"],
+                name=name,
                 value=metric_data["value"],
                 data_type=metric_data.get("type", "Float"),
                 timestamp=timestamp,
                 properties=metric_data.get("properties"),
+                alias=alias,
             )
             metrics.append(metric)
 
@@ -358,15 +488,19 @@ class SparkplugDecoder:
         topic: str,
         payload: bytes,
         format: str = "protobuf",
+        aliases: "SparkplugAliasTable | None" = None,
     ) -> SparkplugMessage:
         """Decode a complete Sparkplug message.
 
         Combines topic parsing and payload decoding into a single message object.
+        With an alias table, birth and death certificates update it and
+        alias-only metrics of data messages are resolved to their names.
 
         Args:
             topic: MQTT topic string
             payload: Message payload bytes
             format: Payload format - "protobuf" or "json" (default: "protobuf")
+            aliases: Alias table of the sending edge nodes
 
         Returns:
             Parsed SparkplugMessage object
@@ -381,7 +515,12 @@ class SparkplugDecoder:
             'NDATA: 5 metrics'
         """
         topic_parts = self.parse_topic(topic)
-        timestamp, metrics, seq = self.decode_payload(payload, format=format)
+        alias_map = aliases.get(topic) if aliases is not None else None
+        timestamp, metrics, seq = self.decode_payload(
+            payload, format=format, aliases=alias_map
+        )
+        if aliases is not None:
+            aliases.update(topic, metrics)
 
         return SparkplugMessage(
             topic=topic,
@@ -395,6 +534,114 @@ class SparkplugDecoder:
         )
 
 
+class SparkplugAliasTable:
+    """Metric aliases announced in birth certificates, per edge node and device.
+
+    Edge nodes with aliasing enabled name each metric once, in NBIRTH (node
+    metrics) or DBIRTH (device metrics), and send only its integer alias in
+    later NDATA/DDATA messages. The table records these aliases per
+    (group, edge node, device) and forgets them when the session ends: an
+    NBIRTH or NDEATH drops the node and all its devices, a DDEATH drops one
+    device.
+
+    For consumers interested in a few metrics per topic, ``wanted`` returns
+    the precomputed alias map of just those metrics, so decoding can skip
+    all other metrics with one integer lookup each.
+
+    Example:
+        >>> table = SparkplugAliasTable()
+        >>> table.update("spBv1.0/spc/DBIRTH/node1/dev1", birth_metrics)
+        >>> names = frozenset({"Temp"})
+        >>> aliases = table.wanted("spBv1.0/spc/DDATA/node1/dev1", names)
+        >>> SparkplugDecoder.decode_payload(payload, aliases=aliases, names=names)
+    """
+
+    def __init__(self) -> None:
+        self._aliases: dict[tuple[str, str, str | None], dict[int, str]] = {}
+        self._wanted: dict[str, tuple[frozenset[str], dict[int, str]]] = {}
+
+    @staticmethod
+    def _key(parts: dict[str, str | None]) -> tuple[str, str, str | None]:
+        return (parts["group_id"], parts["edge_node_id"], parts["device_id"])
+
+    def update(self, topic: str, metrics: list[SparkplugMetric]) -> bool:
+        """Apply a birth or death certificate to the table.
+
+        Args:
+            topic: Topic the message was received on
+            metrics: Decoded metrics of the message
+
+        Returns:
+            True if the message was a birth or death certificate
+        """
+        parts = SparkplugDecoder.parse_topic(topic)
+        message_type = parts["message_type"]
+        key = self._key(parts)
+
+        if message_type in ("NBIRTH", "NDEATH"):
+            self._drop_node(key[0], key[1])
+        elif message_type == "DDEATH":
+            self._aliases.pop(key, None)
+        elif message_type != "DBIRTH":
+            return False
+        self._wanted.clear()
+
+        if message_type in ("NBIRTH", "DBIRTH"):
+            named = [m for m in metrics if m.name and m.alias is not None]
+            # Protobuf has no "unset" alias, so a birth without any nonzero
+            # alias means the edge node does not use aliases
+            if any(m.alias for m in named):
+                self._aliases[key] = {m.alias: m.name for m in named}
+                logger.debug(
+                    "sparkplug_aliases_learned",
+                    topic=topic,
+                    alias_count=len(self._aliases[key]),
+                )
+        return True
+
+    def _drop_node(self, group_id: str, edge_node_id: str) -> None:
+        for key in [k for k in self._aliases if k[0] == group_id and k[1] == edge_node_id]:
+            del self._aliases[key]
+
+    def get(self, topic: str) -> dict[int, str]:
+        """Return the alias to metric name map for a data topic.
+
+        Args:
+            topic: NDATA or DDATA topic
+
+        Returns:
+            Aliases from the current birth certificate (empty if unknown)
+        """
+        return self._aliases.get(self._key(SparkplugDecoder.parse_topic(topic)), {})
+
+    def wanted(self, topic: str, names: frozenset[str]) -> dict[int, str]:
+        """Return the aliases of selected metrics of a data topic.
+
+        The result is cached per topic until the next birth or death
+        certificate.
+
+        Args:
+            topic: NDATA or DDATA topic
+            names: Metric names the caller needs
+
+        Returns:
+            Alias to metric name map restricted to ``names``
+        """
+        cached = self._wanted.get(topic)
+        if cached is not None and cached[0] == names:
+            return cached[1]
+        wanted = {
+            alias: name for alias, name in self.get(topic).items() if name in names
+        }
+        self._wanted[topic] = (names, wanted)
+        return wanted
+
+    def clear(self) -> None:
+        """Forget all aliases."""
+        self._aliases.clear()
+        self._wanted.clear()
+
+
 class SparkplugEncoder:
     """Encodes Sparkplug B messages for publishing.
 
@@ -525,11 +772,16 @@ class SparkplugEncoder:
                 elif value_field == "string_value":
                     m.string_value = str(metric.value)
                 elif value_field == "bytes_value":
-                    if isinstance(metric.value, bytes):
+                    array_format = _ARRAY_FORMAT_MAP.get(metric.data_type)
+                    if array_format is not None and isinstance(metric.value, list):
+                        m.bytes_value = struct.pack(
+                            f"<{len(metric.value)}{array_format}", *metric.value
+                        )
+                    elif isinstance(metric.value, bytes):
                         m.bytes_value = metric.value
                     else:
                         m.bytes_value = str(metric.value).encode("utf-8")
-            except (TypeError, ValueError) as e:
+            except (TypeError, ValueError, struct.error) as e:
                 logger.warning(
                     "metric_value_encode_fallback",
                     metric_name=metric.name,
@@ -686,6 +938,27 @@ class SparkplugAdapter:
         self._decoder = SparkplugDecoder()
         self._encoder = SparkplugEncoder()
         self._seq = 0  # Sequence counter for ordering
+        self.aliases = SparkplugAliasTable()
+
+    def decode_message(self, topic: str, payload: bytes) -> SparkplugMessage:
+        """Decode an incoming Sparkplug message, tracking metric aliases.
+
+        Birth and death certificates update the adapter's alias table, so
+        alias-only metrics of later data messages carry their names.
+
+        Args:
+            topic: MQTT topic string
+            payload: Message payload bytes
+
+        Returns:
+            Parsed SparkplugMessage object
+
+        Raises:
+            ValueError: If topic or payload is invalid
+        """
+        return self._decoder.decode_message(
+            topic, payload, format=self._payload_format, aliases=self.aliases
+        )
 
     def extract_value_from_message(
         self,
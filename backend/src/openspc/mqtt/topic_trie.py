@@ -0,0 +1,209 @@
+"""Topic trie for dispatching MQTT messages to subscription callbacks.
+
+MQTTClient used to test every subscription pattern against every incoming
+message. With thousands of mapped topics that linear scan dominated the
+message loop. TopicTrie stores patterns level by level, with ``+`` and
+``#`` as ordinary child keys, so resolving a topic visits at most the
+literal, ``+`` and ``#`` children of each level: O(topic depth) for the
+usual mix of literal patterns and a few wildcards.
+
+Resolved callbacks for concrete topics are cached, since devices publish
+to the same topics over and over; the cache is cleared whenever a
+subscription changes.
+
+Example:
+    >>> trie = TopicTrie()
+    >>> trie.insert("sensors/+/temp", on_temp)
+    True
+    >>> trie.insert("sensors/#", on_any)
+    True
+    >>> trie.match("sensors/line1/temp")
+    (on_temp, on_any)
+"""
+
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+from openspc.core.cache_stats import hit_stats
+
+MessageCallback = Callable[[str, bytes], Awaitable[None]]
+
+
+class _TrieNode:
+    """One topic level of the trie."""
+
+    __slots__ = ("children", "callbacks")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.callbacks: list[MessageCallback] = []
+
+
+class TopicTrie:
+    """Subscription patterns and their callbacks, indexed by topic level.
+
+    Implements MQTT wildcard matching:
+    - ``+`` matches exactly one level
+    - ``#`` matches zero or more levels (only as the last level)
+
+    Several callbacks can be registered per pattern. Iterating the trie
+    yields the subscribed patterns in subscription order.
+
+    Args:
+        cache_size: Maximum number of concrete topics with cached matches
+    """
+
+    def __init__(self, cache_size: int = 10000) -> None:
+        self._root = _TrieNode()
+        self._patterns: dict[str, _TrieNode] = {}
+        self._cache: dict[str, tuple[MessageCallback, ...]] = {}
+        self.cache_size = cache_size
+
+        # Metrics
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def insert(self, pattern: str, callback: MessageCallback) -> bool:
+        """Register a callback for a pattern.
+
+        Registering the same callback twice for a pattern has no effect.
+
+        Args:
+            pattern: Subscription pattern (may contain + and #)
+            callback: Async function to call for matching messages
+
+        Returns:
+            True if the pattern had no callbacks before
+        """
+        node = self._patterns.get(pattern)
+        if node is None:
+            node = self._root
+            for level in pattern.split("/"):
+                child = node.children.get(level)
+                if child is None:
+                    child = node.children[level] = _TrieNode()
+                node = child
+            self._patterns[pattern] = node
+
+        is_new = not node.callbacks
+        if callback not in node.callbacks:
+            node.callbacks.append(callback)
+            self._cache.clear()
+        return is_new
+
+    def remove(self, pattern: str, callback: MessageCallback | None = None) -> bool:
+        """Unregister one or all callbacks of a pattern.
+
+        Args:
+            pattern: Subscription pattern
+            callback: Callback to remove (None removes all callbacks)
+
+        Returns:
+            True if the pattern has no callbacks left and was removed
+        """
+        node = self._patterns.get(pattern)
+        if node is None:
+            return False
+
+        if callback is None:
+            node.callbacks.clear()
+        elif callback in node.callbacks:
+            node.callbacks.remove(callback)
+        else:
+            return False
+        self._cache.clear()
+
+        if node.callbacks:
+            return False
+        del self._patterns[pattern]
+        self._prune(pattern.split("/"))
+        return True
+
+    def _prune(self, levels: list[str]) -> None:
+        """Delete nodes of a removed pattern that no longer lead anywhere."""
+        path = [self._root]
+        for level in levels:
+            path.append(path[-1].children[level])
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.callbacks or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+
+    def match(self, topic: str) -> tuple[MessageCallback, ...]:
+        """Resolve the callbacks of all patterns matching a concrete topic.
+
+        A callback registered under several matching patterns is returned
+        once per pattern.
+
+        Args:
+            topic: Topic of an incoming message
+
+        Returns:
+            Matching callbacks
+        """
+        cached = self._cache.get(topic)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        self.cache_misses += 1
+
+        callbacks: list[MessageCallback] = []
+        nodes = [self._root]
+        for level in topic.split("/"):
+            next_nodes: list[_TrieNode] = []
+            for node in nodes:
+                multi = node.children.get("#")
+                if multi is not None:
+                    callbacks.extend(multi.callbacks)
+                child = node.children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+                single = node.children.get("+")
+                if single is not None:
+                    next_nodes.append(single)
+            nodes = next_nodes
+            if not nodes:
+                break
+        for node in nodes:
+            callbacks.extend(node.callbacks)
+            # "a/#" also matches the parent level "a"
+            multi = node.children.get("#")
+            if multi is not None:
+                callbacks.extend(multi.callbacks)
+
+        result = tuple(callbacks)
+        if len(self._cache) >= self.cache_size:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._cache[next(iter(self._cache))]
+        self._cache[topic] = result
+        return result
+
+    def callbacks(self, pattern: str) -> list[MessageCallback]:
+        """Return the callbacks registered for a pattern.
+
+        Args:
+            pattern: Subscription pattern
+
+        Returns:
+            Copy of the pattern's callbacks (empty if not subscribed)
+        """
+        node = self._patterns.get(pattern)
+        return list(node.callbacks) if node is not None else []
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return pattern count and match cache counters."""
+        return {
+            "patterns": len(self._patterns),
+            "cached_topics": len(self._cache),
+            **hit_stats(self.cache_hits, self.cache_misses),
+        }
+
+    def __contains__(self, pattern: object) -> bool:
+        return pattern in self._patterns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._patterns))
+
+    def __len__(self) -> int:
+        return len(self._patterns)
@@ -21,6 +21,12 @@ from .statistics import (
     calculate_imr_limits,
     calculate_zones,
     calculate_control_limits_from_sigma,
+    calculate_sample_statistics,
+)
+
+from .downsampling import (
+    downsample_indices,
+    lttb_indices,
 )
 
 __all__ = [
@@ -45,4 +51,9 @@ __all__ = [
     "calculate_imr_limits",
     "calculate_zones",
     "calculate_control_limits_from_sigma",
+    # Per-sample statistics
+    "calculate_sample_statistics",
+    # Chart downsampling
+    "downsample_indices",
+    "lttb_indices",
 ]
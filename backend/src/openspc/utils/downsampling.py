@@ -0,0 +1,89 @@
+"""Downsampling of control chart series for display.
+
+Long date ranges contain far more samples than a chart can show. These
+functions pick a representative subset with the Largest-Triangle-Three-
+Buckets (LTTB) algorithm, which preserves the visual shape of the series
+(peaks, troughs, shifts), and always add the points that must never be
+hidden, such as out-of-control samples and samples with violations.
+"""
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Select point indices with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are
+    split into ``threshold - 2`` buckets and, per bucket, the point forming
+    the largest triangle with the previously selected point and the average
+    of the next bucket is kept.
+
+    Args:
+        x: X coordinates (ascending), e.g. sample positions or timestamps
+        y: Y coordinates (plotted values)
+        threshold: Number of points to keep
+
+    Returns:
+        Ascending array of selected indices (all indices if the series has
+        no more than ``threshold`` points or threshold < 3)
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (threshold - 2)
+
+    indices = np.empty(threshold, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+
+    return indices
+
+
+def downsample_indices(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_points: int,
+    keep: np.ndarray | None = None,
+) -> np.ndarray:
+    """Select about ``max_points`` representative points plus required points.
+
+    Points flagged in ``keep`` are always returned, even when that exceeds
+    ``max_points``; the remaining budget is filled with LTTB.
+
+    Args:
+        x: X coordinates (ascending)
+        y: Y coordinates (plotted values)
+        max_points: Target number of points
+        keep: Optional boolean mask of points that must be kept
+
+    Returns:
+        Ascending array of selected indices
+
+    Example:
+        >>> y = np.sin(np.linspace(0, 20, 100_000))
+        >>> idx = downsample_indices(np.arange(len(y)), y, 2000, keep=y > 0.999)
+    """
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    required = np.flatnonzero(keep) if keep is not None else np.empty(0, dtype=np.intp)
+    budget = max(max_points - len(required), 3)
+    return np.union1d(lttb_indices(x, y, budget), required)
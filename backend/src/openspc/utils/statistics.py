@@ -471,3 +471,25 @@ def calculate_mean_range(values: List[float]) -> tuple[float, float | None]:
     mean = sum(values) / len(values)
     range_val = (max(values) - min(values)) if len(values) > 1 else None
     return mean, range_val
+
+
+def calculate_sample_statistics(
+    values: List[float],
+) -> tuple[float | None, float | None, float | None]:
+    """Calculate the per-sample statistics persisted on the sample row.
+
+    Args:
+        values: Measurement values of one sample.
+
+    Returns:
+        Tuple of (mean, range, std_dev). Range and standard deviation
+        (sample, ddof=1) are None for single values; all three are None
+        for an empty list.
+    """
+    if not values:
+        return None, None, None
+    arr = np.asarray(values, dtype=np.float64)
+    mean = float(np.mean(arr))
+    if len(arr) < 2:
+        return mean, None, None
+    return mean, float(np.ptp(arr)), float(np.std(arr, ddof=1))
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractContextManager, contextmanager
 from typing import TYPE_CHECKING
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -15,6 +17,12 @@ from sqlalchemy.pool import StaticPool
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine
 
+from openspc.core.auth.api_key import verified_key_cache
+from openspc.core.auth.principal import principal_cache
+from openspc.core.engine.char_cache import characteristic_cache
+from openspc.core.engine.chart_cache import chart_data_cache
+from openspc.core.hierarchy_cache import hierarchy_path_cache
+from openspc.core.publish import outbound_broker_cache
 from openspc.db.models import Base
 
 
@@ -26,6 +34,24 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_process_caches() -> Generator[None, None, None]:
+    """Clear the process-wide caches (IDs are reused across test databases)."""
+    characteristic_cache.clear()
+    chart_data_cache.clear()
+    hierarchy_path_cache.clear()
+    verified_key_cache.clear()
+    principal_cache.clear()
+    outbound_broker_cache.clear()
+    yield
+    characteristic_cache.clear()
+    chart_data_cache.clear()
+    hierarchy_path_cache.clear()
+    verified_key_cache.clear()
+    principal_cache.clear()
+    outbound_broker_cache.clear()
+
+
 @pytest_asyncio.fixture
 async def async_engine() -> AsyncGenerator[AsyncEngine, None]:
     """Create async engine with in-memory SQLite for testing."""
@@ -55,3 +81,31 @@ async def async_session(async_engine: AsyncEngine) -> AsyncGenerator[AsyncSessio
     async with async_session_factory() as session:
         yield session
         await session.rollback()
+
+
+@pytest.fixture
+def count_statements(
+    async_engine: AsyncEngine,
+) -> Callable[[], AbstractContextManager[list[str]]]:
+    """Context manager collecting the SQL statements executed on the test engine.
+
+    Example:
+        >>> with count_statements() as statements:
+        ...     await repo.get_by_id(1)
+        >>> assert len(statements) == 1
+    """
+
+    @contextmanager
+    def counter() -> Generator[list[str], None, None]:
+        statements: list[str] = []
+
+        def before_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", before_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", before_execute)
+
+    return counter
@@ -51,6 +51,7 @@ def mock_violation_repo():
     repo.session.flush = AsyncMock()
     repo.session.refresh = AsyncMock()
     repo.get_by_id = AsyncMock()
+    repo.add_to_rollup = AsyncMock()
     return repo
 
 
@@ -0,0 +1,123 @@
+"""Tests for the verified API key cache."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.api.v1.api_keys import revoke_api_key
+from openspc.core.auth.api_key import (
+    APIKeyAuth,
+    VerifiedKeyCache,
+    verified_key_cache,
+    verify_api_key,
+)
+from openspc.db.models.api_key import APIKey
+
+
+@pytest.fixture
+async def plain_key(async_session: AsyncSession) -> str:
+    """An active API key; returns the plain key."""
+    key = APIKeyAuth.generate_key()
+    async_session.add(APIKey(
+        name="PLC",
+        key_hash=APIKeyAuth.hash_key(key),
+        key_prefix=APIKeyAuth.extract_prefix(key),
+    ))
+    await async_session.commit()
+    return key
+
+
+def _count_bcrypt():
+    return patch.object(APIKeyAuth, "verify_key", wraps=APIKeyAuth.verify_key)
+
+
+class TestVerifiedKeyCache:
+
+    def test_does_not_store_plain_key(self):
+        cache = VerifiedKeyCache()
+        cache.put("openspc_secret", "id-1", "hash")
+
+        assert cache.get("openspc_secret") == ("id-1", "hash")
+        assert cache.get("openspc_other") is None
+        assert all(b"openspc_secret" not in digest for digest in cache._entries)
+
+    def test_ttl_and_size_bounds(self):
+        cache = VerifiedKeyCache(max_size=2, ttl_seconds=0.01)
+        for i in range(3):
+            cache.put(f"key-{i}", f"id-{i}", "hash")
+        assert cache.get("key-0") is None
+        assert cache.get_stats()["size"] == 2
+
+        time.sleep(0.02)
+        assert cache.get("key-2") is None
+
+    def test_invalidate_by_key_id(self):
+        cache = VerifiedKeyCache()
+        cache.put("key-a", "id-1", "hash")
+        cache.put("key-b", "id-2", "hash")
+
+        cache.invalidate("id-1")
+
+        assert cache.get("key-a") is None
+        assert cache.get("key-b") == ("id-2", "hash")
+
+    def test_zero_ttl_disables(self):
+        cache = VerifiedKeyCache(ttl_seconds=0)
+        cache.put("key", "id-1", "hash")
+
+        assert cache.get("key") is None
+
+
+@pytest.mark.asyncio
+class TestVerifyApiKey:
+
+    async def test_repeated_requests_skip_bcrypt(self, async_session, plain_key):
+        with _count_bcrypt() as verify:
+            first = await verify_api_key(x_api_key=plain_key, session=async_session)
+            second = await verify_api_key(x_api_key=plain_key, session=async_session)
+
+        assert first.id == second.id
+        assert verify.call_count == 1
+        assert verified_key_cache.hits == 1
+
+    async def test_wrong_key_not_cached(self, async_session, plain_key):
+        wrong = plain_key[:-4] + "xxxx"
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc:
+                await verify_api_key(x_api_key=wrong, session=async_session)
+            assert exc.value.status_code == 401
+        assert verified_key_cache.get_stats()["size"] == 0
+
+    async def test_revocation_takes_effect_immediately(self, async_session, plain_key):
+        api_key = await verify_api_key(x_api_key=plain_key, session=async_session)
+
+        await revoke_api_key(key_id=api_key.id, session=async_session, _user=None)
+
+        assert verified_key_cache.get_stats()["size"] == 0
+        with pytest.raises(HTTPException):
+            await verify_api_key(x_api_key=plain_key, session=async_session)
+
+    async def test_deactivation_elsewhere_rejected(self, async_session, plain_key):
+        api_key = await verify_api_key(x_api_key=plain_key, session=async_session)
+
+        # Deactivated without going through the endpoint (e.g. another worker)
+        api_key.is_active = False
+        await async_session.commit()
+
+        with pytest.raises(HTTPException):
+            await verify_api_key(x_api_key=plain_key, session=async_session)
+
+    async def test_expiry_rejected(self, async_session, plain_key):
+        api_key = await verify_api_key(x_api_key=plain_key, session=async_session)
+
+        api_key.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await async_session.commit()
+
+        with pytest.raises(HTTPException) as exc:
+            await verify_api_key(x_api_key=plain_key, session=async_session)
+        assert exc.value.detail == "API key has expired"
+        assert verified_key_cache.get_stats()["size"] == 0
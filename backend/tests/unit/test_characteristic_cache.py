@@ -0,0 +1,203 @@
+"""Unit tests for the characteristic definition cache.
+
+Covers snapshot contents, hit/miss behaviour, invalidation through the event
+bus, TTL expiry and LRU eviction, and the queries saved on the sample path.
+"""
+
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.api.deps import resolve_plant_id_for_characteristic
+from openspc.core.engine.char_cache import (
+    CharacteristicCache,
+    characteristic_cache,
+)
+from openspc.core.engine.nelson_rules import NelsonRuleLibrary
+from openspc.core.engine.rolling_window import RollingWindowManager
+from openspc.core.engine.spc_engine import SPCEngine
+from openspc.core.events import (
+    CharacteristicDeletedEvent,
+    CharacteristicUpdatedEvent,
+    ControlLimitsUpdatedEvent,
+    EventBus,
+)
+from openspc.db.models.characteristic import CharacteristicRule
+from openspc.db.models.plant import Plant
+from openspc.db.repositories import (
+    CharacteristicRepository,
+    HierarchyRepository,
+    SampleRepository,
+    ViolationRepository,
+)
+
+
+@pytest.fixture
+async def char_id(async_session: AsyncSession) -> int:
+    plant = Plant(name="Plant A", code="PA")
+    async_session.add(plant)
+    await async_session.flush()
+    site = await HierarchyRepository(async_session).create(
+        name="Site A", type="Site", parent_id=None, plant_id=plant.id
+    )
+    char = await CharacteristicRepository(async_session).create(
+        hierarchy_id=site.id, name="Bore", subgroup_size=1, ucl=13.0, lcl=7.0
+    )
+    async_session.add_all([
+        CharacteristicRule(char_id=char.id, rule_id=1, is_enabled=True),
+        CharacteristicRule(
+            char_id=char.id, rule_id=2, is_enabled=False, require_acknowledgement=False
+        ),
+    ])
+    await async_session.commit()
+    return char.id
+
+
+@pytest.mark.asyncio
+class TestCharacteristicCache:
+
+    async def test_snapshot_contents(self, async_session, char_id):
+        cache = CharacteristicCache()
+
+        snapshot = await cache.get(CharacteristicRepository(async_session), char_id)
+
+        assert snapshot.name == "Bore"
+        assert snapshot.plant_id is not None
+        assert (snapshot.ucl, snapshot.lcl) == (13.0, 7.0)
+        assert snapshot.enabled_rules == frozenset({1})
+        assert dict(snapshot.rule_require_ack) == {1: True, 2: False}
+
+    async def test_hit_runs_no_queries(self, count_statements, async_session, char_id):
+        cache = CharacteristicCache()
+        repo = CharacteristicRepository(async_session)
+        first = await cache.get(repo, char_id)
+
+        with count_statements() as statements:
+            second = await cache.get(repo, char_id)
+
+        assert second is first
+        assert statements == []
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    async def test_missing_characteristic_not_cached(self, async_session):
+        cache = CharacteristicCache()
+
+        assert await cache.get(CharacteristicRepository(async_session), 999) is None
+        assert cache.get_stats()["size"] == 0
+
+    @pytest.mark.parametrize("make_event", [
+        lambda cid: CharacteristicUpdatedEvent(characteristic_id=cid, changes={"ucl": 14.0}),
+        lambda cid: ControlLimitsUpdatedEvent(
+            characteristic_id=cid, center_line=10.0, ucl=14.0, lcl=6.0
+        ),
+        lambda cid: CharacteristicDeletedEvent(characteristic_id=cid, name="Bore"),
+    ])
+    async def test_events_invalidate(self, async_session, char_id, make_event):
+        bus = EventBus()
+        cache = CharacteristicCache()
+        cache.subscribe(bus)
+        repo = CharacteristicRepository(async_session)
+        await cache.get(repo, char_id)
+
+        await bus.publish_and_wait(make_event(char_id))
+
+        assert cache.get_stats()["size"] == 0
+        await cache.get(repo, char_id)
+        assert cache.misses == 2
+
+    async def test_load_racing_invalidation_is_not_cached(self, async_session, char_id):
+        cache = CharacteristicCache()
+        repo = CharacteristicRepository(async_session)
+        load = repo.get_definition
+
+        async def load_then_update(cid):
+            row = await load(cid)
+            cache.invalidate(cid)  # update committed while loading
+            return row
+
+        repo.get_definition = load_then_update
+        assert await cache.get(repo, char_id) is not None
+        assert cache.get_stats()["size"] == 0
+
+    async def test_ttl_expiry(self, async_session, char_id, monkeypatch):
+        cache = CharacteristicCache(ttl_seconds=10.0)
+        repo = CharacteristicRepository(async_session)
+        now = [1000.0]
+        monkeypatch.setattr(
+            "openspc.core.engine.char_cache.time.monotonic", lambda: now[0]
+        )
+        await cache.get(repo, char_id)
+
+        now[0] += 11.0
+        await cache.get(repo, char_id)
+
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    async def test_lru_eviction(self, async_session, char_id):
+        repo = CharacteristicRepository(async_session)
+        site_id = (await repo.get_by_id(char_id)).hierarchy_id
+        other = await repo.create(hierarchy_id=site_id, name="Depth", subgroup_size=1)
+        await async_session.commit()
+        cache = CharacteristicCache(max_size=1)
+
+        await cache.get(repo, char_id)
+        await cache.get(repo, other.id)
+
+        assert cache.get_stats()["size"] == 1
+        await cache.get(repo, char_id)
+        assert cache.misses == 3
+
+
+@pytest.mark.asyncio
+class TestSamplePathQueries:
+
+    def _engine(self, session, char_cache=None) -> SPCEngine:
+        sample_repo = SampleRepository(session)
+        return SPCEngine(
+            sample_repo=sample_repo,
+            char_repo=CharacteristicRepository(session),
+            violation_repo=ViolationRepository(session),
+            window_manager=RollingWindowManager(sample_repo),
+            rule_library=NelsonRuleLibrary(),
+            event_bus=EventBus(),
+            char_cache=char_cache,
+        )
+
+    async def test_plant_resolution_is_cached(self, count_statements, async_session, char_id):
+        plant_id = await resolve_plant_id_for_characteristic(char_id, async_session)
+
+        with count_statements() as statements:
+            assert await resolve_plant_id_for_characteristic(char_id, async_session) == plant_id
+
+        assert statements == []
+
+    async def test_plant_resolution_without_plant_is_404(self, async_session):
+        site = await HierarchyRepository(async_session).create(
+            name="Orphan", type="Site", parent_id=None
+        )
+        char = await CharacteristicRepository(async_session).create(
+            hierarchy_id=site.id, name="Bore", subgroup_size=1
+        )
+        await async_session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await resolve_plant_id_for_characteristic(char.id, async_session)
+
+        assert exc_info.value.status_code == 404
+
+    async def test_cached_engine_skips_characteristic_queries(
+        self, count_statements, async_session, char_id
+    ):
+        uncached = self._engine(async_session)
+        cached = self._engine(async_session, characteristic_cache)
+        await uncached.process_sample(char_id, [10.0])
+        await cached.process_sample(char_id, [10.0])
+
+        with count_statements() as uncached_statements:
+            await uncached.process_sample(char_id, [10.1])
+        with count_statements() as cached_statements:
+            await cached.process_sample(char_id, [10.2])
+
+        # Characteristic row and its rules are no longer loaded per sample
+        assert len(uncached_statements) - len(cached_statements) == 2
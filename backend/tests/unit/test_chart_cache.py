@@ -0,0 +1,216 @@
+"""Tests for the versioned chart-data response cache and ETag handling."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.api.schemas.data_entry import BatchEntryRequest, DataEntryRequest
+from openspc.api.v1.characteristics import get_chart_data
+from openspc.api.v1.data_entry import submit_batch
+from openspc.core.engine.chart_cache import ChartDataCache, chart_data_cache, etag_matches
+from openspc.core.events import ControlLimitsUpdatedEvent, EventBus, SampleProcessedEvent
+from openspc.db.repositories import (
+    CharacteristicRepository,
+    HierarchyRepository,
+    SampleRepository,
+)
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+
+class TestEtagMatches:
+
+    def test_matching(self):
+        assert etag_matches('"a-1"', '"a-1"')
+        assert etag_matches('W/"a-1"', '"a-1"')
+        assert etag_matches('"x", "a-1"', '"a-1"')
+        assert etag_matches("*", '"a-1"')
+
+    def test_not_matching(self):
+        assert not etag_matches(None, '"a-1"')
+        assert not etag_matches('"a-2"', '"a-1"')
+
+
+class TestChartDataCache:
+
+    def test_put_get_and_invalidate(self):
+        cache = ChartDataCache()
+        version = cache.version(1)
+        cache.put(1, ("p",), version, "response")
+
+        assert cache.get(1, ("p",)) == "response"
+        cache.invalidate(1)
+        assert cache.get(1, ("p",)) is None
+        assert cache.get_stats()["size"] == 0
+        assert (cache.hits, cache.misses, cache.invalidations) == (1, 1, 1)
+
+    def test_racing_invalidation_not_stored(self):
+        cache = ChartDataCache()
+        version = cache.version(1)
+        cache.invalidate(1)
+
+        cache.put(1, ("p",), version, "stale")
+
+        assert cache.get(1, ("p",)) is None
+
+    def test_etag_changes_with_version_and_params(self):
+        cache = ChartDataCache()
+
+        first = cache.etag(1, ("p",), 0)
+
+        assert cache.etag(1, ("p",), 0) == first
+        assert cache.etag(1, ("p",), 1) != first
+        assert cache.etag(1, ("q",), 0) != first
+        assert cache.etag(2, ("p",), 0) != first
+        assert ChartDataCache().etag(1, ("p",), 0) != first
+
+    def test_ttl_expires_entries_and_etags(self):
+        cache = ChartDataCache(ttl_seconds=0.01)
+        version = cache.version(1)
+        etag = cache.etag(1, ("p",), version)
+        cache.put(1, ("p",), version, "response")
+
+        time.sleep(0.02)
+
+        assert cache.get(1, ("p",)) is None
+        assert cache.etag(1, ("p",), cache.version(1)) != etag
+
+    def test_invalidate_all_rotates_etags(self):
+        cache = ChartDataCache()
+        etag = cache.etag(1, ("p",), cache.version(1))
+        cache.put(1, ("p",), 0, "response")
+
+        cache.invalidate_all()
+
+        assert cache.get(1, ("p",)) is None
+        assert cache.etag(1, ("p",), cache.version(1)) != etag
+
+    def test_lru_eviction(self):
+        cache = ChartDataCache(max_size=2)
+        for char_id in (1, 2):
+            cache.put(char_id, (), 0, char_id)
+        cache.get(1, ())
+
+        cache.put(3, (), 0, 3)
+
+        assert cache.get(2, ()) is None
+        assert cache.get(1, ()) == 1
+        assert cache.get_stats()["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_events_bump_version(self):
+        cache = ChartDataCache()
+        bus = EventBus()
+        cache.subscribe(bus)
+        cache.subscribe(bus)
+
+        await bus.publish(SampleProcessedEvent(
+            sample_id=1, characteristic_id=5, mean=1.0, range_value=None,
+            zone="zone_c_upper", in_control=True,
+        ))
+        await bus.publish(ControlLimitsUpdatedEvent(
+            characteristic_id=5, center_line=1.0, ucl=2.0, lcl=0.0,
+            method="moving_range", sample_count=25,
+        ))
+        await asyncio.sleep(0)
+
+        assert cache.version(5) == 2
+
+
+@pytest.fixture
+async def char_id(async_session: AsyncSession) -> int:
+    """Individuals characteristic with 30 samples."""
+    site = await HierarchyRepository(async_session).create(
+        name="Site", type="Site", parent_id=None
+    )
+    char = await CharacteristicRepository(async_session).create(
+        hierarchy_id=site.id, name="Temp", subgroup_size=1, ucl=13.0, lcl=7.0
+    )
+    await SampleRepository(async_session).create_many_with_measurements([
+        {"char_id": char.id, "values": [10.0 + (i % 5) * 0.1],
+         "timestamp": START + timedelta(minutes=i)}
+        for i in range(30)
+    ])
+    await async_session.commit()
+    return char.id
+
+
+@pytest.mark.asyncio
+class TestChartDataEndpoint:
+
+    async def _chart(self, session, char_id, if_none_match=None, **kwargs):
+        response = Response()
+        params = {"limit": 100, "start_date": None, "end_date": None, "max_points": None}
+        params.update(kwargs)
+        result = await get_chart_data(
+            char_id=char_id,
+            response=response,
+            if_none_match=if_none_match,
+            repo=CharacteristicRepository(session),
+            sample_repo=SampleRepository(session),
+            session=session,
+            _user=MagicMock(),
+            **params,
+        )
+        return result, response
+
+    async def test_cached_until_invalidated(self, count_statements, async_session, char_id):
+        first, response = await self._chart(async_session, char_id)
+
+        with count_statements() as statements:
+            second, second_response = await self._chart(async_session, char_id)
+        assert statements == []
+        assert second is first
+        assert second_response.headers["ETag"] == response.headers["ETag"]
+
+        await SampleRepository(async_session).create_with_measurements(
+            char_id=char_id, values=[11.0], timestamp=START + timedelta(hours=1)
+        )
+        await async_session.commit()
+        chart_data_cache.invalidate(char_id)
+
+        third, third_response = await self._chart(async_session, char_id)
+        assert len(third.data_points) == 31
+        assert third_response.headers["ETag"] != response.headers["ETag"]
+
+    async def test_if_none_match_returns_304(self, count_statements, async_session, char_id):
+        _, response = await self._chart(async_session, char_id, limit=10)
+        etag = response.headers["ETag"]
+
+        with count_statements() as statements:
+            result, _ = await self._chart(
+                async_session, char_id, if_none_match=f"W/{etag}", limit=10
+            )
+        assert statements == []
+        assert result.status_code == 304
+        assert result.headers["ETag"] == etag
+
+        # Different options or a newer version need a full response
+        other, _ = await self._chart(async_session, char_id, if_none_match=etag, limit=20)
+        assert len(other.data_points) == 20
+        chart_data_cache.invalidate(char_id)
+        fresh, _ = await self._chart(async_session, char_id, if_none_match=etag, limit=10)
+        assert len(fresh.data_points) == 10
+
+    async def test_data_entry_batch_invalidates_after_commit(self, async_session, char_id):
+        first, _ = await self._chart(async_session, char_id)
+        version = chart_data_cache.version(char_id)
+
+        await submit_batch(
+            data=BatchEntryRequest(samples=[
+                DataEntryRequest(characteristic_id=char_id, measurements=[10.2]),
+                DataEntryRequest(characteristic_id=char_id, measurements=[10.3]),
+            ]),
+            auth=MagicMock(),
+            session=async_session,
+        )
+
+        assert chart_data_cache.version(char_id) == version + 1
+        second, _ = await self._chart(async_session, char_id)
+        assert len(second.data_points) == len(first.data_points) + 2
@@ -0,0 +1,115 @@
+"""Tests for the multi-characteristic chart-data endpoint."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.api.schemas.characteristic import ChartDataBatchRequest
+from openspc.api.v1.characteristics import get_chart_data, get_chart_data_batch
+from openspc.db.models.violation import Violation
+from openspc.db.repositories import (
+    CharacteristicRepository,
+    HierarchyRepository,
+    SampleRepository,
+)
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+
+@pytest.fixture
+async def char_ids(async_session: AsyncSession) -> list[int]:
+    """Eight charted characteristics (n=1 and n=3) plus one without limits."""
+    site = await HierarchyRepository(async_session).create(
+        name="Site", type="Site", parent_id=None
+    )
+    chars = CharacteristicRepository(async_session)
+    samples = SampleRepository(async_session)
+    ids = []
+    for c in range(8):
+        size = 1 if c % 2 == 0 else 3
+        char = await chars.create(
+            hierarchy_id=site.id, name=f"C{c}", subgroup_size=size, ucl=12.0, lcl=8.0
+        )
+        rows = [
+            {
+                "char_id": char.id,
+                "values": [10.0 + ((i * (c + 1)) % 7) * 0.3] * size,
+                "timestamp": START + timedelta(minutes=i),
+            }
+            for i in range(40)
+        ]
+        created = await samples.create_many_with_measurements(rows)
+        async_session.add(Violation(
+            sample_id=created[35].id, char_id=char.id, rule_id=1,
+            rule_name="Beyond Limits", severity="CRITICAL",
+        ))
+        ids.append(char.id)
+    idle = await chars.create(hierarchy_id=site.id, name="Idle", subgroup_size=1)
+    ids.append(idle.id)
+    await async_session.commit()
+    return ids
+
+
+async def _batch(session, **kwargs):
+    return await get_chart_data_batch(
+        request=ChartDataBatchRequest(**kwargs),
+        repo=CharacteristicRepository(session),
+        sample_repo=SampleRepository(session),
+        session=session,
+        _user=MagicMock(),
+    )
+
+
+@pytest.mark.asyncio
+class TestChartDataBatch:
+
+    async def test_matches_single_endpoint(self, async_session, char_ids):
+        batch = await _batch(async_session, characteristic_ids=char_ids + [999], limit=10)
+
+        assert [c.characteristic_id for c in batch.charts] == char_ids
+        assert batch.missing_ids == [999]
+        for chart in batch.charts:
+            single = await get_chart_data(
+                char_id=chart.characteristic_id,
+                limit=10,
+                start_date=None,
+                end_date=None,
+                max_points=None,
+                if_none_match=None,
+                response=Response(),
+                repo=CharacteristicRepository(async_session),
+                sample_repo=SampleRepository(async_session),
+                session=async_session,
+                _user=MagicMock(),
+            )
+            assert chart == single
+        assert batch.charts[0].data_points[5].violation_rules == [1]
+        assert batch.charts[-1].data_points == []
+
+    async def test_query_count_does_not_grow(self, count_statements, async_session, char_ids):
+        with count_statements() as two:
+            await _batch(async_session, characteristic_ids=char_ids[:2], limit=20)
+        async_session.expunge_all()
+        with count_statements() as all_charts:
+            await _batch(async_session, characteristic_ids=char_ids, limit=20)
+
+        assert len(all_charts) == len(two)
+        assert len(all_charts) <= 6
+
+    async def test_shared_date_range_with_downsampling(self, async_session, char_ids):
+        batch = await _batch(
+            async_session,
+            characteristic_ids=char_ids[:4],
+            start_date=START,
+            end_date=START + timedelta(hours=1),
+            max_points=10,
+        )
+
+        for chart in batch.charts:
+            assert chart.total_points == 40
+            assert chart.downsampled
+            assert any(p.violation_rules == [1] for p in chart.data_points)
@@ -0,0 +1,158 @@
+"""Tests for chart downsampling and the chart-data fast path."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.api.v1.characteristics import get_chart_data
+from openspc.db.models.violation import Violation
+from openspc.db.repositories import (
+    CharacteristicRepository,
+    HierarchyRepository,
+    SampleRepository,
+    ViolationRepository,
+)
+from openspc.utils.downsampling import downsample_indices, lttb_indices
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TestLttb:
+
+    def test_keeps_endpoints_and_size(self):
+        y = np.sin(np.linspace(0, 20, 5000))
+
+        idx = lttb_indices(np.arange(5000), y, 200)
+
+        assert len(idx) == 200
+        assert idx[0] == 0 and idx[-1] == 4999
+        assert np.all(np.diff(idx) > 0)
+
+    def test_keeps_spike(self):
+        y = np.zeros(1000)
+        y[537] = 50.0
+
+        idx = lttb_indices(np.arange(1000), y, 50)
+
+        assert 537 in idx
+
+    def test_short_series_unchanged(self):
+        assert lttb_indices(np.arange(5), np.ones(5), 10).tolist() == [0, 1, 2, 3, 4]
+
+
+class TestDownsampleIndices:
+
+    def test_required_points_always_kept(self):
+        rng = np.random.default_rng(3)
+        y = rng.normal(0.0, 1.0, 10000)
+        keep = np.zeros(10000, dtype=bool)
+        keep[[5, 4321, 9998]] = True
+
+        idx = downsample_indices(np.arange(10000), y, 100, keep=keep)
+
+        assert {5, 4321, 9998} <= set(idx.tolist())
+        assert len(idx) <= 100 + 3
+
+    def test_no_downsampling_below_max_points(self):
+        assert len(downsample_indices(np.arange(50), np.ones(50), 100)) == 50
+
+
+@pytest.fixture
+async def char_id(async_session: AsyncSession) -> int:
+    """Individuals characteristic with 2000 in-control samples and two signals."""
+    site = await HierarchyRepository(async_session).create(
+        name="Site", type="Site", parent_id=None
+    )
+    char = await CharacteristicRepository(async_session).create(
+        hierarchy_id=site.id, name="Temp", subgroup_size=1, ucl=13.0, lcl=7.0
+    )
+    rng = np.random.default_rng(11)
+    values = np.round(rng.normal(10.0, 0.5, 2000), 3)
+    values[1234] = 15.0  # beyond UCL
+    rows = [
+        {"char_id": char.id, "values": [float(v)], "timestamp": START + timedelta(minutes=i)}
+        for i, v in enumerate(values)
+    ]
+    samples = await SampleRepository(async_session).create_many_with_measurements(rows)
+    # In-control point with a (non-limit) rule violation
+    async_session.add(Violation(
+        sample_id=samples[777].id, char_id=char.id, rule_id=2,
+        rule_name="Shift", severity="WARNING",
+    ))
+    await async_session.commit()
+    return char.id
+
+
+@pytest.mark.asyncio
+class TestChartData:
+
+    async def _chart(self, session, char_id, **kwargs):
+        params = {
+            "limit": 100,
+            "start_date": None,
+            "end_date": None,
+            "max_points": None,
+            "if_none_match": None,
+        }
+        params.update(kwargs)
+        return await get_chart_data(
+            char_id=char_id,
+            response=Response(),
+            repo=CharacteristicRepository(session),
+            sample_repo=SampleRepository(session),
+            session=session,
+            _user=MagicMock(),
+            **params,
+        )
+
+    async def test_chart_points_match_samples(self, async_session, char_id):
+        repo = SampleRepository(async_session)
+
+        points = await repo.get_chart_points(char_id, limit=5)
+        samples = await repo.get_samples_with_statistics(char_id, limit=5)
+
+        assert [(p.id, p.mean, p.actual_n) for p in points] == [
+            (s.id, s.mean, s.actual_n) for s in samples
+        ]
+
+    async def test_sample_ids_with_violations(self, async_session, char_id):
+        repo = ViolationRepository(async_session)
+
+        ids = await repo.get_sample_ids_with_violations(char_id)
+        early = await repo.get_sample_ids_with_violations(
+            char_id, end_date=START + timedelta(minutes=100)
+        )
+
+        assert len(ids) == 1
+        assert early == set()
+
+    async def test_date_range_downsampled(self, async_session, char_id):
+        response = await self._chart(
+            async_session,
+            char_id,
+            start_date=START,
+            end_date=START + timedelta(days=7),
+            max_points=200,
+        )
+
+        assert response.total_points == 2000
+        assert response.downsampled
+        assert 190 <= len(response.data_points) <= 200
+        means = [p.mean for p in response.data_points]
+        assert 15.0 in means
+        assert any(p.violation_rules == [2] for p in response.data_points)
+        timestamps = [p.timestamp for p in response.data_points]
+        assert timestamps == sorted(timestamps)
+
+    async def test_without_max_points_keeps_limit(self, async_session, char_id):
+        response = await self._chart(
+            async_session, char_id, start_date=START, end_date=START + timedelta(days=7)
+        )
+
+        assert len(response.data_points) == 100
+        assert response.total_points == 100
+        assert not response.downsampled
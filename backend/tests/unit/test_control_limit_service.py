@@ -14,7 +14,8 @@ import numpy as np
 import pytest
 
 from openspc.core.engine.control_limits import ControlLimitService
-from openspc.db.models.sample import Measurement, Sample
+from openspc.db.models.sample import Sample
+from openspc.utils.statistics import calculate_sample_statistics
 
 
 def _make_service() -> ControlLimitService:
@@ -27,27 +28,15 @@ def _make_service() -> ControlLimitService:
 
 def _make_samples_n1(values: list[float]) -> list:
     """Create mock samples with 1 measurement each."""
-    samples = []
-    for v in values:
-        sample = MagicMock(spec=Sample)
-        m = MagicMock(spec=Measurement)
-        m.value = v
-        sample.measurements = [m]
-        samples.append(sample)
-    return samples
+    return _make_samples_subgroup([[v] for v in values])
 
 
 def _make_samples_subgroup(subgroups: list[list[float]]) -> list:
-    """Create mock samples with multiple measurements each."""
+    """Create mock samples with the persisted statistics of each subgroup."""
     samples = []
     for sg in subgroups:
         sample = MagicMock(spec=Sample)
-        measurements = []
-        for v in sg:
-            m = MagicMock(spec=Measurement)
-            m.value = v
-            measurements.append(m)
-        sample.measurements = measurements
+        sample.mean, sample.range_value, sample.std_dev = calculate_sample_statistics(sg)
         samples.append(sample)
     return samples
 
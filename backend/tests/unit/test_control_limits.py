@@ -19,7 +19,13 @@ import pytest
 
 from openspc.core.engine.control_limits import CalculationResult, ControlLimitService
 from openspc.db.models.characteristic import Characteristic
-from openspc.db.models.sample import Measurement, Sample
+from openspc.db.models.sample import Sample
+from openspc.utils.statistics import calculate_sample_statistics
+
+
+def _set_statistics(sample, values: list[float]) -> None:
+    """Give a mock sample the statistics persisted for its measurement values."""
+    sample.mean, sample.range_value, sample.std_dev = calculate_sample_statistics(values)
 
 
 class TestMethodSelection:
@@ -85,9 +91,7 @@ class TestMovingRangeCalculation:
         samples = []
         for value in values:
             sample = MagicMock(spec=Sample)
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            sample.measurements = [measurement]
+            _set_statistics(sample, [value])
             samples.append(sample)
 
         # Calculate
@@ -144,9 +148,7 @@ class TestMovingRangeCalculation:
         samples = []
         for value in values:
             sample = MagicMock(spec=Sample)
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            sample.measurements = [measurement]
+            _set_statistics(sample, [value])
             samples.append(sample)
 
         # Calculate
@@ -200,12 +202,7 @@ class TestRBarCalculation:
         samples = []
         for subgroup_values in subgroups:
             sample = MagicMock(spec=Sample)
-            measurements = []
-            for value in subgroup_values:
-                measurement = MagicMock(spec=Measurement)
-                measurement.value = value
-                measurements.append(measurement)
-            sample.measurements = measurements
+            _set_statistics(sample, [value for value in subgroup_values])
             samples.append(sample)
 
         # Calculate
@@ -240,12 +237,7 @@ class TestRBarCalculation:
         samples = []
         for subgroup_values in subgroups:
             sample = MagicMock(spec=Sample)
-            measurements = []
-            for value in subgroup_values:
-                measurement = MagicMock(spec=Measurement)
-                measurement.value = value
-                measurements.append(measurement)
-            sample.measurements = measurements
+            _set_statistics(sample, [value for value in subgroup_values])
             samples.append(sample)
 
         # Calculate
@@ -291,12 +283,7 @@ class TestSBarCalculation:
             subgroup_values = [random.gauss(100, 2) for _ in range(15)]
 
             sample = MagicMock(spec=Sample)
-            measurements = []
-            for value in subgroup_values:
-                measurement = MagicMock(spec=Measurement)
-                measurement.value = value
-                measurements.append(measurement)
-            sample.measurements = measurements
+            _set_statistics(sample, [value for value in subgroup_values])
             samples.append(sample)
 
         # Calculate
@@ -333,12 +320,7 @@ class TestSBarCalculation:
         samples = []
         for subgroup_values in subgroups:
             sample = MagicMock(spec=Sample)
-            measurements = []
-            for value in subgroup_values:
-                measurement = MagicMock(spec=Measurement)
-                measurement.value = value
-                measurements.append(measurement)
-            sample.measurements = measurements
+            _set_statistics(sample, [value for value in subgroup_values])
             samples.append(sample)
 
         # Calculate
@@ -378,12 +360,10 @@ class TestCalculateLimits:
             sample.id = i
             sample.is_excluded = False
             sample.violations = []
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            sample.measurements = [measurement]
+            _set_statistics(sample, [value])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
 
         # Create service and calculate
         service = ControlLimitService(sample_repo, char_repo, window_manager)
@@ -419,15 +399,10 @@ class TestCalculateLimits:
             sample.id = i
             sample.is_excluded = False
             sample.violations = []
-            measurements = []
-            for j in range(5):
-                measurement = MagicMock(spec=Measurement)
-                measurement.value = 10.0 + (i % 3) + (j * 0.1)
-                measurements.append(measurement)
-            sample.measurements = measurements
+            _set_statistics(sample, [10.0 + (i % 3) + (j * 0.1) for j in range(5)])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
 
         # Create service and calculate
         service = ControlLimitService(sample_repo, char_repo, window_manager)
@@ -466,15 +441,10 @@ class TestCalculateLimits:
             sample.id = i
             sample.is_excluded = False
             sample.violations = []
-            measurements = []
-            for j in range(15):
-                measurement = MagicMock(spec=Measurement)
-                measurement.value = random.gauss(100, 2)
-                measurements.append(measurement)
-            sample.measurements = measurements
+            _set_statistics(sample, [random.gauss(100, 2) for j in range(15)])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
 
         # Create service and calculate
         service = ControlLimitService(sample_repo, char_repo, window_manager)
@@ -511,12 +481,10 @@ class TestCalculateLimits:
             sample.id = i
             # Mark every 5th sample as excluded
             sample.is_excluded = (i % 5 == 0)
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            sample.measurements = [measurement]
+            _set_statistics(sample, [value])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
 
         # Create service and calculate with exclusion
         service = ControlLimitService(sample_repo, char_repo, window_manager)
@@ -548,12 +516,10 @@ class TestCalculateLimits:
             sample = MagicMock(spec=Sample)
             sample.id = i
             sample.is_excluded = False
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = 10.0
-            sample.measurements = [measurement]
+            _set_statistics(sample, [10.0])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
 
         # Create service and try to calculate
         service = ControlLimitService(sample_repo, char_repo, window_manager)
@@ -607,12 +573,10 @@ class TestRecalculateAndPersist:
             sample = MagicMock(spec=Sample)
             sample.id = i
             sample.is_excluded = False
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            sample.measurements = [measurement]
+            _set_statistics(sample, [value])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
         window_manager.invalidate = AsyncMock()
 
         # Create service and recalculate
@@ -659,12 +623,10 @@ class TestRecalculateAndPersist:
             sample = MagicMock(spec=Sample)
             sample.id = i
             sample.is_excluded = False
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            sample.measurements = [measurement]
+            _set_statistics(sample, [value])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
         window_manager.invalidate = AsyncMock()
 
         # Create service and recalculate
@@ -710,12 +672,10 @@ class TestStoredParametersPersistence:
             sample = MagicMock(spec=Sample)
             sample.id = i
             sample.is_excluded = False
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            sample.measurements = [measurement]
+            _set_statistics(sample, [value])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
         window_manager.invalidate = AsyncMock()
 
         # Create service and recalculate
@@ -755,12 +715,10 @@ class TestStoredParametersPersistence:
             sample = MagicMock(spec=Sample)
             sample.id = i
             sample.is_excluded = False
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            sample.measurements = [measurement]
+            _set_statistics(sample, [value])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
         window_manager.invalidate = AsyncMock()
 
         # Create service and recalculate
@@ -807,15 +765,10 @@ class TestModeSpecificLimitCalculation:
             sample = MagicMock(spec=Sample)
             sample.id = i
             sample.is_excluded = False
-            measurements = []
-            for j in range(5):
-                measurement = MagicMock(spec=Measurement)
-                measurement.value = 100.0 + (i % 3) + (j * 0.1)
-                measurements.append(measurement)
-            sample.measurements = measurements
+            _set_statistics(sample, [100.0 + (i % 3) + (j * 0.1) for j in range(5)])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
         window_manager.invalidate = AsyncMock()
 
         # Create service and recalculate
@@ -862,15 +815,10 @@ class TestModeSpecificLimitCalculation:
             sample = MagicMock(spec=Sample)
             sample.id = i
             sample.is_excluded = False
-            measurements = []
-            for j in range(5):
-                measurement = MagicMock(spec=Measurement)
-                measurement.value = 100.0 + (i % 3) + (j * 0.1)
-                measurements.append(measurement)
-            sample.measurements = measurements
+            _set_statistics(sample, [100.0 + (i % 3) + (j * 0.1) for j in range(5)])
             samples.append(sample)
 
-        sample_repo.get_by_characteristic = AsyncMock(return_value=samples)
+        sample_repo.get_samples_with_statistics = AsyncMock(return_value=samples)
         window_manager.invalidate = AsyncMock()
 
         # Create service and recalculate
@@ -900,9 +848,7 @@ class TestEdgeCases:
         samples = []
         for value in values:
             sample = MagicMock(spec=Sample)
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            sample.measurements = [measurement]
+            _set_statistics(sample, [value])
             samples.append(sample)
 
         # Should not raise error
@@ -927,12 +873,7 @@ class TestEdgeCases:
         samples = []
         for subgroup_values in subgroups:
             sample = MagicMock(spec=Sample)
-            measurements = []
-            for value in subgroup_values:
-                measurement = MagicMock(spec=Measurement)
-                measurement.value = value
-                measurements.append(measurement)
-            sample.measurements = measurements
+            _set_statistics(sample, [value for value in subgroup_values])
             samples.append(sample)
 
         # Calculate
@@ -954,12 +895,7 @@ class TestEdgeCases:
 
         # Create sample with 5 measurements
         sample = MagicMock(spec=Sample)
-        measurements = []
-        for value in [10.0, 10.5, 11.0, 10.2, 10.8]:
-            measurement = MagicMock(spec=Measurement)
-            measurement.value = value
-            measurements.append(measurement)
-        sample.measurements = measurements
+        _set_statistics(sample, [value for value in [10.0, 10.5, 11.0, 10.2, 10.8]])
 
         samples = [sample] * 4  # 4 identical subgroups
 
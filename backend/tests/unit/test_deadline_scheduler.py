@@ -0,0 +1,143 @@
+"""Tests for the buffer timeout deadline scheduler."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from openspc.core.providers.deadline import DeadlineScheduler
+from openspc.core.providers.tag import TagProvider
+
+
+class _Recorder:
+    """Callback that records keys with their firing time."""
+
+    def __init__(self) -> None:
+        self.fired: list[tuple[int, float]] = []
+        self.event = asyncio.Event()
+
+    async def __call__(self, key: int) -> None:
+        self.fired.append((key, time.monotonic()))
+        self.event.set()
+
+
+@pytest.mark.asyncio
+class TestDeadlineScheduler:
+
+    async def test_fires_at_deadline_in_order(self):
+        recorder = _Recorder()
+        scheduler = DeadlineScheduler("test", recorder)
+        scheduler.start()
+        started = time.monotonic()
+
+        scheduler.schedule(2, 0.10)
+        scheduler.schedule(1, 0.05)
+        while len(recorder.fired) < 2:
+            await asyncio.wait_for(recorder.event.wait(), 2.0)
+            recorder.event.clear()
+
+        assert [key for key, _ in recorder.fired] == [1, 2]
+        # Fired at the deadline, not at a polling interval
+        assert 0.05 <= recorder.fired[0][1] - started < 1.0
+        assert len(scheduler) == 0
+        await scheduler.stop()
+
+    async def test_cancel_and_reschedule(self):
+        recorder = _Recorder()
+        scheduler = DeadlineScheduler("test", recorder)
+        scheduler.start()
+
+        scheduler.schedule(1, 0.05)
+        scheduler.cancel(1)
+        scheduler.schedule(2, 0.05)
+        scheduler.schedule(2, 0.15)
+        await asyncio.sleep(0.1)
+        assert recorder.fired == []
+
+        await asyncio.sleep(0.1)
+        assert [key for key, _ in recorder.fired] == [2]
+        await scheduler.stop()
+
+    async def test_earlier_deadline_wakes_sleeping_task(self):
+        recorder = _Recorder()
+        scheduler = DeadlineScheduler("test", recorder)
+        scheduler.start()
+        scheduler.schedule(1, 10.0)
+        await asyncio.sleep(0.01)
+
+        scheduler.schedule(2, 0.02)
+        await asyncio.wait_for(recorder.event.wait(), 0.5)
+
+        assert [key for key, _ in recorder.fired] == [2]
+        assert 1 in scheduler
+        await scheduler.stop()
+        assert len(scheduler) == 0
+
+    async def test_failing_callback_keeps_running(self):
+        calls: list[int] = []
+
+        async def callback(key: int) -> None:
+            calls.append(key)
+            if key == 1:
+                raise RuntimeError("flush failed")
+
+        scheduler = DeadlineScheduler("test", callback)
+        scheduler.start()
+        scheduler.schedule(1, 0.01)
+        scheduler.schedule(2, 0.02)
+        await asyncio.sleep(0.1)
+
+        assert calls == [1, 2]
+        assert scheduler.get_stats()["failed"] == 1
+        await scheduler.stop()
+
+    async def test_stale_entries_compacted(self):
+        scheduler = DeadlineScheduler("test", AsyncMock())
+        for _ in range(1000):
+            scheduler.schedule(1, 60.0)
+            scheduler.cancel(1)
+            scheduler.schedule(2, 60.0)
+
+        assert len(scheduler) == 1
+        assert scheduler.get_stats()["heap_size"] <= 2 * len(scheduler) + 65
+
+
+@pytest.mark.asyncio
+class TestTagProviderTimeouts:
+
+    async def test_partial_subgroup_flushed_at_deadline(self):
+        sources = [
+            SimpleNamespace(
+                id=i,
+                topic=f"plant/tag{i}",
+                trigger_strategy="on_change",
+                trigger_tag=None,
+                metric_name=None,
+                characteristic=SimpleNamespace(id=i, name=f"Tag {i}", subgroup_size=5),
+            )
+            for i in range(1000)
+        ]
+        ds_repo = Mock()
+        ds_repo.get_active_mqtt_sources = AsyncMock(return_value=sources)
+        mqtt = Mock()
+        mqtt.subscribe = AsyncMock()
+        mqtt.unsubscribe = AsyncMock()
+        provider = TagProvider(mqtt, ds_repo)
+        callback = AsyncMock()
+        provider.set_callback(callback)
+        await provider.start()
+        provider._configs[3].buffer_timeout_seconds = 0.05
+        provider._configs[4].buffer_timeout_seconds = 0.05
+
+        await provider._handle_message("plant/tag3", b"1.0")
+        await provider._handle_message("plant/tag3", b"2.0")
+        await provider._handle_message("plant/tag4", b"[1, 2, 3, 4, 5]")
+        # Only the partial subgroup has a deadline; idle buffers have none
+        assert len(provider._deadlines) == 1
+        await asyncio.sleep(0.15)
+        await provider.stop()
+
+        measurements = sorted(call.args[0].measurements for call in callback.await_args_list)
+        assert measurements == [[1.0, 2.0], [1.0, 2.0, 3.0, 4.0, 5.0]]
@@ -7,6 +7,7 @@ Tests cover:
 - Error isolation between handlers
 - Multiple subscribers per event type
 - Handler cleanup and shutdown
+- Queued dispatch with bounded queues and overflow policies
 """
 
 import asyncio
@@ -16,10 +17,12 @@ from typing import Any
 import pytest
 
 from openspc.core.events import (
+    BackpressurePolicy,
     CharacteristicUpdatedEvent,
     ControlLimitsUpdatedEvent,
     Event,
     EventBus,
+    HandlerQueue,
     SampleProcessedEvent,
     ViolationAcknowledgedEvent,
     ViolationCreatedEvent,
@@ -837,3 +840,261 @@ class TestEventBusIntegration:
 
         assert "sample" in events
         assert "violation" in events
+
+
+def _sample(sample_id: int, characteristic_id: int = 1) -> SampleProcessedEvent:
+    return SampleProcessedEvent(
+        sample_id=sample_id,
+        characteristic_id=characteristic_id,
+        mean=10.5,
+        range_value=None,
+        zone="zone_c_upper",
+        in_control=True,
+    )
+
+
+class TestEventBusQueuedDispatch:
+    """Tests for bounded per-subscription queues and worker pools."""
+
+    @pytest.mark.asyncio
+    async def test_single_worker_preserves_order(self) -> None:
+        bus = EventBus()
+        received: list[int] = []
+
+        async def handler(event: SampleProcessedEvent) -> None:
+            received.append(event.sample_id)
+
+        bus.subscribe(
+            SampleProcessedEvent, handler, queue=HandlerQueue("q", maxsize=10)
+        )
+        for i in range(25):
+            await bus.publish(_sample(i))
+        await bus.shutdown()
+
+        assert received == list(range(25))
+        stats = bus.get_stats()["queues"][0]
+        assert stats["processed"] == 25
+        assert stats["dropped"] == 0
+        assert stats["depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_is_bounded(self) -> None:
+        bus = EventBus()
+        active = 0
+        peak = 0
+
+        async def handler(event: SampleProcessedEvent) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+
+        bus.subscribe(
+            SampleProcessedEvent,
+            handler,
+            queue=HandlerQueue("q", maxsize=100, workers=3),
+        )
+        for i in range(50):
+            await bus.publish(_sample(i))
+        await bus.shutdown()
+
+        assert peak == 3
+        assert bus.get_stats()["running_tasks"] == 0
+
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_space(self) -> None:
+        bus = EventBus()
+        release = asyncio.Event()
+        received: list[int] = []
+
+        async def handler(event: SampleProcessedEvent) -> None:
+            await release.wait()
+            received.append(event.sample_id)
+
+        bus.subscribe(
+            SampleProcessedEvent, handler, queue=HandlerQueue("q", maxsize=2)
+        )
+        await bus.publish(_sample(0))
+        await asyncio.sleep(0)  # worker takes event 0
+        await bus.publish(_sample(1))
+        await bus.publish(_sample(2))
+
+        publisher = asyncio.create_task(bus.publish(_sample(3)))
+        await asyncio.sleep(0.01)
+        assert not publisher.done()
+
+        release.set()
+        await publisher
+        await bus.shutdown()
+
+        assert received == [0, 1, 2, 3]
+        assert bus.get_stats()["queues"][0]["blocked"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self) -> None:
+        bus = EventBus()
+        release = asyncio.Event()
+        received: list[int] = []
+
+        async def handler(event: SampleProcessedEvent) -> None:
+            await release.wait()
+            received.append(event.sample_id)
+
+        bus.subscribe(
+            SampleProcessedEvent,
+            handler,
+            queue=HandlerQueue(
+                "q", maxsize=2, policy=BackpressurePolicy.DROP_OLDEST
+            ),
+        )
+        await bus.publish(_sample(0))
+        await asyncio.sleep(0)  # worker takes event 0
+        for i in range(1, 5):
+            await bus.publish(_sample(i))
+
+        release.set()
+        await bus.shutdown()
+
+        assert received == [0, 3, 4]
+        stats = bus.get_stats()["queues"][0]
+        assert stats["dropped"] == 2
+        assert stats["max_depth"] == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy_keeps_latest_per_key(self) -> None:
+        bus = EventBus()
+        release = asyncio.Event()
+        received: list[tuple[int, int]] = []
+
+        async def handler(event: SampleProcessedEvent) -> None:
+            await release.wait()
+            received.append((event.characteristic_id, event.sample_id))
+
+        bus.subscribe(
+            SampleProcessedEvent,
+            handler,
+            queue=HandlerQueue(
+                "q", maxsize=2, policy="coalesce", key=lambda e: e.characteristic_id
+            ),
+        )
+        await bus.publish(_sample(0, characteristic_id=1))
+        await asyncio.sleep(0)
+        await bus.publish(_sample(1, characteristic_id=1))
+        await bus.publish(_sample(2, characteristic_id=2))
+        await bus.publish(_sample(3, characteristic_id=1))  # replaces 1
+        await bus.publish(_sample(4, characteristic_id=3))  # drops oldest (3)
+
+        release.set()
+        await bus.shutdown()
+
+        assert received == [(1, 0), (2, 2), (3, 4)]
+        stats = bus.get_stats()["queues"][0]
+        assert stats["coalesced"] == 1
+        assert stats["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_latest_per_key_policy_never_drops_a_key(self) -> None:
+        bus = EventBus()
+        release = asyncio.Event()
+        received: list[tuple[int, int]] = []
+
+        async def handler(event: SampleProcessedEvent) -> None:
+            await release.wait()
+            received.append((event.characteristic_id, event.sample_id))
+
+        bus.subscribe(
+            SampleProcessedEvent,
+            handler,
+            queue=HandlerQueue(
+                "q", maxsize=2, policy="latest_per_key",
+                key=lambda e: e.characteristic_id,
+            ),
+        )
+        await bus.publish(_sample(0, characteristic_id=1))
+        await asyncio.sleep(0)
+        await bus.publish(_sample(1, characteristic_id=1))
+        await bus.publish(_sample(2, characteristic_id=2))
+        await bus.publish(_sample(3, characteristic_id=3))  # queued beyond maxsize
+        await bus.publish(_sample(4, characteristic_id=2))  # replaces 2
+
+        release.set()
+        await bus.shutdown()
+
+        assert received == [(1, 0), (1, 1), (2, 4), (3, 3)]
+        stats = bus.get_stats()["queues"][0]
+        assert stats["coalesced"] == 1
+        assert stats["dropped"] == 0
+        assert stats["max_depth"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_and_latency_are_recorded(self) -> None:
+        bus = EventBus()
+
+        async def failing(event: SampleProcessedEvent) -> None:
+            raise ValueError("boom")
+
+        bus.subscribe(
+            SampleProcessedEvent, failing, queue=HandlerQueue("failing", maxsize=5)
+        )
+        await bus.publish(_sample(1))
+        await bus.shutdown()
+
+        stats = bus.get_stats()["queues"][0]
+        assert stats["name"] == "failing"
+        assert stats["failed"] == 1
+        assert stats["processed"] == 1
+        assert stats["max_latency_ms"] >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_removes_queue(self) -> None:
+        bus = EventBus()
+
+        async def handler(event: SampleProcessedEvent) -> None:
+            pass
+
+        bus.subscribe(
+            SampleProcessedEvent, handler, queue=HandlerQueue("q", maxsize=5)
+        )
+        await bus.publish(_sample(1))
+        bus.unsubscribe(SampleProcessedEvent, handler)
+
+        assert bus.get_stats()["queues"] == []
+        assert bus.get_handler_count(SampleProcessedEvent) == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_queue_preserves_order_across_types(self) -> None:
+        bus = EventBus()
+        received: list[str] = []
+        queue = HandlerQueue("shared", maxsize=10)
+
+        async def on_sample(event: SampleProcessedEvent) -> None:
+            await asyncio.sleep(0.001)
+            received.append(f"sample-{event.sample_id}")
+
+        async def on_limits(event: ControlLimitsUpdatedEvent) -> None:
+            received.append("limits")
+
+        bus.subscribe(SampleProcessedEvent, on_sample, queue=queue)
+        bus.subscribe(ControlLimitsUpdatedEvent, on_limits, queue=queue)
+        await bus.publish(_sample(1))
+        await bus.publish(
+            ControlLimitsUpdatedEvent(
+                characteristic_id=1, center_line=100.0, ucl=103.0, lcl=97.0
+            )
+        )
+        await bus.publish(_sample(2))
+        await bus.shutdown()
+
+        assert received == ["sample-1", "limits", "sample-2"]
+        assert len(bus.get_stats()["queues"]) == 1
+
+    def test_invalid_options(self) -> None:
+        with pytest.raises(ValueError):
+            HandlerQueue("q", maxsize=0)
+        with pytest.raises(ValueError):
+            HandlerQueue("q", maxsize=5, workers=0)
+        with pytest.raises(ValueError):
+            HandlerQueue("q", maxsize=5, policy="coalesce")
+        with pytest.raises(ValueError):
+            HandlerQueue("q", maxsize=5, policy="latest_per_key")
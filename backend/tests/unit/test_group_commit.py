@@ -0,0 +1,179 @@
+"""Unit tests for the group-commit sample writer.
+
+Runs the writer against an in-memory SQLite database and checks that
+samples are committed in groups, results and events are released only
+after the commit, and a bad sample does not fail the rest of its group.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from openspc.core.engine.char_cache import characteristic_cache
+from openspc.core.engine.group_commit import GroupCommitWriter
+from openspc.core.events import ControlLimitsUpdatedEvent, EventBus, SampleProcessedEvent
+from openspc.core.providers.protocol import SampleContext, SampleEvent
+from openspc.db.models.sample import Sample
+from openspc.db.repositories import CharacteristicRepository, HierarchyRepository
+
+
+def _event(char_id: int, value: float) -> SampleEvent:
+    return SampleEvent(
+        characteristic_id=char_id,
+        measurements=[value],
+        timestamp=datetime.now(timezone.utc),
+        context=SampleContext(source="TAG"),
+    )
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def char_ids(session_factory) -> tuple[int, int]:
+    """One characteristic with limits and one without (limits cannot be computed)."""
+    async with session_factory() as session:
+        site = await HierarchyRepository(session).create(
+            name="Site", type="Site", parent_id=None
+        )
+        chars = CharacteristicRepository(session)
+        with_limits = await chars.create(
+            hierarchy_id=site.id, name="Temp", subgroup_size=1, ucl=130.0, lcl=70.0
+        )
+        without_limits = await chars.create(
+            hierarchy_id=site.id, name="Width", subgroup_size=1
+        )
+        await session.commit()
+        return with_limits.id, without_limits.id
+
+
+async def _sample_count(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(Sample))
+
+
+@pytest.mark.asyncio
+class TestGroupCommitWriter:
+
+    async def test_samples_committed_in_one_group(self, session_factory, char_ids):
+        bus = EventBus()
+        writer = GroupCommitWriter(max_rows=100, max_delay_ms=10)
+        await writer.start(session_factory, bus)
+
+        futures = [await writer.submit(_event(char_ids[0], 100.0 + i)) for i in range(20)]
+        results = await asyncio.gather(*futures)
+        await writer.stop()
+
+        assert [r.mean for r in results] == [100.0 + i for i in range(20)]
+        assert writer.commits == 1
+        assert writer.samples_committed == 20
+        assert await _sample_count(session_factory) == 20
+
+    async def test_max_rows_splits_groups(self, session_factory, char_ids):
+        writer = GroupCommitWriter(max_rows=8, max_delay_ms=10)
+        await writer.start(session_factory, EventBus())
+
+        futures = [await writer.submit(_event(char_ids[0], 100.0)) for _ in range(20)]
+        await asyncio.gather(*futures)
+        await writer.stop()
+
+        assert writer.commits == 3
+        assert await _sample_count(session_factory) == 20
+
+    async def test_events_released_after_commit(self, session_factory, char_ids):
+        bus = EventBus()
+        committed_counts: list[int] = []
+
+        async def on_sample(event: SampleProcessedEvent) -> None:
+            committed_counts.append(await _sample_count(session_factory))
+
+        bus.subscribe(SampleProcessedEvent, on_sample)
+        writer = GroupCommitWriter(max_rows=100, max_delay_ms=10)
+        await writer.start(session_factory, bus)
+
+        await writer.process(_event(char_ids[0], 101.0))
+        await writer.stop()
+        await bus.shutdown()
+
+        # The handler saw the sample already committed
+        assert committed_counts == [1]
+
+    async def test_bad_sample_does_not_fail_group(self, session_factory, char_ids):
+        with_limits, without_limits = char_ids
+        writer = GroupCommitWriter(max_rows=100, max_delay_ms=10)
+        await writer.start(session_factory, EventBus())
+
+        good = await writer.submit(_event(with_limits, 100.0))
+        bad = await writer.submit(_event(without_limits, 5.0))
+        unknown = await writer.submit(_event(9999, 5.0))
+        good_after = await writer.submit(_event(with_limits, 101.0))
+        await writer.stop()
+
+        assert (await good).mean == 100.0
+        assert (await good_after).mean == 101.0
+        with pytest.raises(ValueError):
+            await bad
+        with pytest.raises(ValueError, match="not found"):
+            await unknown
+        assert writer.failed_commits == 1
+        assert await _sample_count(session_factory) == 2
+
+    async def test_submit_requires_running_writer(self):
+        writer = GroupCommitWriter()
+        with pytest.raises(RuntimeError):
+            await writer.submit(_event(1, 1.0))
+
+    async def test_warm_up_preloads_windows(self, session_factory, char_ids):
+        writer = GroupCommitWriter(max_rows=100, max_delay_ms=10)
+        await writer.start(session_factory, EventBus())
+
+        loaded = await writer.warm_up(char_ids)
+        result = await writer.process(_event(char_ids[0], 100.0))
+        await writer.stop()
+
+        assert loaded == 2
+        assert result.mean == 100.0
+
+    async def test_limits_update_reclassifies_live_samples(self, session_factory, char_ids):
+        bus = EventBus()
+        characteristic_cache.subscribe(bus)
+        writer = GroupCommitWriter(max_rows=100, max_delay_ms=1)
+        await writer.start(session_factory, bus)
+        await writer.process(_event(char_ids[0], 100.0))
+
+        # Tighten the limits the way the limits endpoints do
+        async with session_factory() as session:
+            char = await CharacteristicRepository(session).get_by_id(char_ids[0])
+            char.ucl, char.lcl = 103.0, 97.0
+            await session.commit()
+        await bus.publish_and_wait(ControlLimitsUpdatedEvent(
+            characteristic_id=char_ids[0], center_line=100.0, ucl=103.0, lcl=97.0
+        ))
+
+        result = await writer.process(_event(char_ids[0], 104.0))
+        await writer.stop()
+
+        assert result.zone == "beyond_ucl"
+        assert writer.window_invalidations == 1
+
+    async def test_invalidate_drops_window_and_stop_unsubscribes(
+        self, session_factory, char_ids
+    ):
+        bus = EventBus()
+        writer = GroupCommitWriter(max_rows=100, max_delay_ms=1)
+        await writer.start(session_factory, bus)
+        await writer.warm_up([char_ids[0]])
+        assert writer._window_manager.cache_size == 1
+
+        await writer.invalidate(char_ids[0])
+        assert writer._window_manager.cache_size == 0
+        await writer.stop()
+
+        assert bus.get_handler_count(ControlLimitsUpdatedEvent) == 0
+        await writer.invalidate(char_ids[0])  # no-op while stopped
+        assert writer.window_invalidations == 1
@@ -0,0 +1,206 @@
+"""Unit tests for the provider ingestion pipeline.
+
+Tests the KeyedWorkerPool (per-key ordering, parallelism, backpressure)
+and the TagProvider receive/decode/process stages.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from openspc.core.providers.pipeline import KeyedWorkerPool
+from openspc.core.providers.protocol import SampleEvent
+from openspc.core.providers.tag import TagProvider
+from openspc.mqtt.client import MQTTClient, MQTTConfig
+
+
+def _source(char_id: int, topic: str, subgroup_size: int = 1, **kwargs):
+    """Build a stand-in for an MQTTDataSource row."""
+    return SimpleNamespace(
+        id=char_id,
+        topic=topic,
+        trigger_strategy=kwargs.get("trigger_strategy", "on_change"),
+        trigger_tag=kwargs.get("trigger_tag"),
+        metric_name=None,
+        characteristic=SimpleNamespace(
+            id=char_id, name=f"char-{char_id}", subgroup_size=subgroup_size
+        ),
+    )
+
+
+async def _started_provider(sources, callback, workers: int = 2) -> TagProvider:
+    mqtt = Mock()
+    mqtt.subscribe = AsyncMock()
+    mqtt.unsubscribe = AsyncMock()
+    ds_repo = Mock()
+    ds_repo.get_active_mqtt_sources = AsyncMock(return_value=sources)
+    provider = TagProvider(mqtt, ds_repo, workers=workers, queue_size=100)
+    provider.set_callback(callback)
+    await provider.start()
+    return provider
+
+
+@pytest.mark.asyncio
+class TestKeyedWorkerPool:
+
+    async def test_ordered_per_key(self):
+        seen: list[tuple[int, int]] = []
+
+        async def handler(item: tuple[int, int]) -> None:
+            await asyncio.sleep(0)
+            seen.append(item)
+
+        pool = KeyedWorkerPool("test", handler, workers=3, queue_size=5)
+        pool.start()
+        for seq in range(20):
+            for key in range(4):
+                await pool.submit(key, (key, seq))
+        await pool.stop()
+
+        for key in range(4):
+            assert [seq for k, seq in seen if k == key] == list(range(20))
+        assert pool.processed == 80
+
+    async def test_keys_on_different_workers_run_in_parallel(self):
+        release = asyncio.Event()
+        started: list[int] = []
+
+        async def handler(key: int) -> None:
+            started.append(key)
+            await release.wait()
+
+        pool = KeyedWorkerPool("test", handler, workers=2)
+        pool.start()
+        await pool.submit(0, 0)
+        await pool.submit(1, 1)
+        await asyncio.sleep(0.01)
+
+        assert sorted(started) == [0, 1]
+        release.set()
+        await pool.stop()
+
+    async def test_submit_blocks_when_worker_queue_full(self):
+        release = asyncio.Event()
+
+        async def handler(item: int) -> None:
+            await release.wait()
+
+        pool = KeyedWorkerPool("test", handler, workers=1, queue_size=1)
+        pool.start()
+        await pool.submit(1, 1)
+        await asyncio.sleep(0)  # worker picks up item 1
+        await pool.submit(1, 2)
+
+        blocked = asyncio.create_task(pool.submit(1, 3))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await pool.stop()
+        assert pool.processed == 3
+
+    async def test_handler_errors_are_isolated(self):
+        async def handler(item: int) -> None:
+            if item == 1:
+                raise ValueError("boom")
+
+        pool = KeyedWorkerPool("test", handler)
+        pool.start()
+        await pool.submit(1, 1)
+        await pool.submit(1, 2)
+        await pool.stop()
+
+        assert pool.failed == 1
+        assert pool.processed == 2
+
+    async def test_submit_requires_running_pool(self):
+        pool = KeyedWorkerPool("test", AsyncMock())
+        with pytest.raises(RuntimeError):
+            await pool.submit(1, 1)
+
+
+@pytest.mark.asyncio
+class TestTagProviderPipeline:
+
+    async def test_receive_does_not_wait_for_processing(self):
+        release = asyncio.Event()
+        processed: list[SampleEvent] = []
+
+        async def slow_callback(event: SampleEvent) -> None:
+            await release.wait()
+            processed.append(event)
+
+        provider = await _started_provider([_source(1, "line/temp")], slow_callback)
+
+        await asyncio.wait_for(provider._on_message("line/temp", b"1.0"), 0.1)
+        await asyncio.wait_for(provider._on_message("line/temp", b"2.0"), 0.1)
+        await asyncio.sleep(0.01)
+        assert processed == []
+        assert provider.pending_samples == 1  # one in flight, one queued
+
+        release.set()
+        await provider.stop()
+        assert [e.measurements for e in processed] == [[1.0], [2.0]]
+
+    async def test_characteristic_order_preserved_across_workers(self):
+        processed: list[tuple[int, float]] = []
+
+        async def callback(event: SampleEvent) -> None:
+            await asyncio.sleep(0.001 * (event.characteristic_id % 2))
+            processed.append((event.characteristic_id, event.measurements[0]))
+
+        sources = [_source(char_id, f"line/{char_id}") for char_id in range(1, 5)]
+        provider = await _started_provider(sources, callback, workers=3)
+
+        for i in range(10):
+            for char_id in range(1, 5):
+                await provider._on_message(f"line/{char_id}", str(float(i)).encode())
+        await provider.stop()
+
+        for char_id in range(1, 5):
+            values = [v for c, v in processed if c == char_id]
+            assert values == [float(i) for i in range(10)]
+
+    async def test_trigger_flushes_values_received_before_it(self):
+        callback = AsyncMock()
+        source = _source(
+            1,
+            "line/width",
+            subgroup_size=5,
+            trigger_strategy="on_trigger",
+            trigger_tag="line/trigger",
+        )
+        provider = await _started_provider([source], callback)
+
+        await provider._on_message("line/width", b"1.0")
+        await provider._on_message("line/width", b"2.0")
+        await provider._on_trigger_message("line/trigger", b"1")
+        await provider.stop()
+
+        callback.assert_awaited_once()
+        assert callback.call_args[0][0].measurements == [1.0, 2.0]
+
+    async def test_restart_releases_trigger_subscription(self):
+        mqtt = MQTTClient(MQTTConfig(host="localhost"))
+        ds_repo = Mock()
+        ds_repo.get_active_mqtt_sources = AsyncMock(return_value=[_source(
+            1, "line/width", trigger_strategy="on_trigger", trigger_tag="line/trigger"
+        )])
+        old = TagProvider(mqtt, ds_repo, queue_size=2)
+        await old.start()
+        await old.stop()
+        new = TagProvider(mqtt, ds_repo, queue_size=2)
+        await new.start()
+
+        callbacks = list(mqtt._subscriptions.match("line/trigger"))
+        assert [cb.__self__ for cb in callbacks] == [new]
+
+        # A late message for the stopped provider must not fill its queue
+        for _ in range(5):
+            await asyncio.wait_for(old._on_trigger_message("line/trigger", b"1"), 0.1)
+        assert old.pending_messages == 0
+        await new.stop()
+        assert list(mqtt._subscriptions.match("line/trigger")) == []
@@ -234,7 +234,7 @@ class TestMQTTClientSubscription:
             # Verify subscription was made
             mock_mqtt_client.subscribe.assert_called_once_with("test/topic")
             assert "test/topic" in client._subscriptions
-            assert client._subscriptions["test/topic"] == callback
+            assert client._subscriptions.callbacks("test/topic") == [callback]
 
         await client.disconnect()
 
@@ -249,7 +249,7 @@ class TestMQTTClientSubscription:
 
         # Subscription should be stored but not sent to broker
         assert "test/topic" in client._subscriptions
-        assert client._subscriptions["test/topic"] == callback
+        assert client._subscriptions.callbacks("test/topic") == [callback]
 
     @pytest.mark.asyncio
     async def test_subscriptions_restored_after_reconnection(self) -> None:
@@ -726,7 +726,7 @@ class TestMQTTClientEdgeCases:
             assert client.is_connected is False
 
     def test_multiple_callbacks_for_same_topic(self) -> None:
-        """Test that subscribing to same topic overwrites previous callback."""
+        """Test that subscribing to same topic keeps every callback."""
         config = MQTTConfig()
         client = MQTTClient(config)
 
@@ -737,5 +737,5 @@ class TestMQTTClientEdgeCases:
         asyncio.run(client.subscribe("test/topic", callback1))
         asyncio.run(client.subscribe("test/topic", callback2))
 
-        # Only the second callback should be registered
-        assert client._subscriptions["test/topic"] == callback2
+        # Both callbacks are registered, in subscription order
+        assert client._subscriptions.callbacks("test/topic") == [callback1, callback2]
@@ -0,0 +1,145 @@
+"""Tests for incremental Nelson Rules evaluation.
+
+The incremental evaluator must return exactly what
+NelsonRuleLibrary.check_all() returns for the same window after every
+appended point, while only updating counters for the newest sample.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from openspc.core.engine.nelson_incremental import IncrementalNelsonEvaluator
+from openspc.core.engine.nelson_rules import NelsonRuleLibrary
+from openspc.core.engine.rolling_window import (
+    RollingWindow,
+    WindowSample,
+    ZoneBoundaries,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _boundaries(center: float = 100.0, sigma: float = 10.0) -> ZoneBoundaries:
+    """Build standard zone boundaries."""
+    return ZoneBoundaries(
+        center_line=center,
+        sigma=sigma,
+        plus_1_sigma=center + sigma,
+        plus_2_sigma=center + 2 * sigma,
+        plus_3_sigma=center + 3 * sigma,
+        minus_1_sigma=center - sigma,
+        minus_2_sigma=center - 2 * sigma,
+        minus_3_sigma=center - 3 * sigma,
+    )
+
+
+def _append(window: RollingWindow, sample_id: int, value: float) -> None:
+    zone, is_above, sigma_dist = window.classify_value(value)
+    window.append(WindowSample(
+        sample_id=sample_id,
+        timestamp=datetime(2025, 1, 1) + timedelta(minutes=sample_id),
+        value=value,
+        range_value=None,
+        zone=zone,
+        is_above_center=is_above,
+        sigma_distance=sigma_dist,
+    ))
+
+
+def _as_tuples(results: list) -> list[tuple]:
+    return [
+        (r.rule_id, r.rule_name, r.severity, r.message, r.involved_sample_ids)
+        for r in results
+    ]
+
+
+def _series(seed: int, n: int = 400) -> list[float]:
+    """Generate a series that exercises every rule (drifts, trends, swings)."""
+    rng = np.random.default_rng(seed)
+    values = rng.normal(100.0, 10.0, n)
+    values[50:62] += 15.0                      # shift (Rule 2, 5, 6)
+    values[120:130] = 100.0 + np.arange(10)    # trend (Rule 3)
+    values[200:216] = 100.0 + np.where(np.arange(16) % 2, 3.0, -3.0)  # Rules 4, 7
+    values[300:310] = 100.0 + np.where(np.arange(10) % 2, 25.0, -25.0)  # Rule 8
+    return [float(v) for v in np.round(values, 1)]
+
+
+@pytest.fixture
+def evaluator() -> IncrementalNelsonEvaluator:
+    return IncrementalNelsonEvaluator()
+
+
+@pytest.fixture
+def window() -> RollingWindow:
+    window = RollingWindow(max_size=25)
+    window.set_boundaries(_boundaries())
+    return window
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestIncrementalEquivalence:
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_check_all_after_every_point(self, evaluator, window, seed):
+        library = NelsonRuleLibrary()
+        for i, value in enumerate(_series(seed)):
+            _append(window, i + 1, value)
+            expected = library.check_all(window)
+            assert _as_tuples(evaluator.check_latest(window)) == _as_tuples(expected)
+
+    def test_enabled_rules_filter(self, evaluator, window):
+        for i in range(9):
+            _append(window, i + 1, 135.0)
+
+        results = evaluator.check_latest(window, enabled_rules={2, 7})
+
+        assert [r.rule_id for r in results] == [2]
+
+    def test_empty_window(self, evaluator, window):
+        assert evaluator.check_latest(window) == []
+
+
+class TestStateSync:
+
+    def test_state_is_updated_incrementally(self, evaluator, window):
+        for i in range(5):
+            _append(window, i + 1, 105.0)
+        evaluator.check_latest(window)
+        state = window.rule_state
+
+        _append(window, 6, 95.0)
+        evaluator.check_latest(window)
+
+        assert window.rule_state is state
+        assert state.side_run == 1
+        assert state.appended_count == window.appended_count
+
+    def test_rescan_after_unevaluated_appends(self, evaluator, window):
+        library = NelsonRuleLibrary()
+        evaluator.check_latest(window)
+        for i in range(12):
+            _append(window, i + 1, 100.0 + i)
+
+        results = evaluator.check_latest(window)
+
+        assert _as_tuples(results) == _as_tuples(library.check_all(window))
+        assert window.rule_state.up_run == 11
+
+    def test_reclassification_resets_state(self, evaluator, window):
+        for i in range(9):
+            _append(window, i + 1, 105.0)
+        assert [r.rule_id for r in evaluator.check_latest(window)] == [2]
+
+        # Move the center line above the points: now all below center
+        window.set_boundaries(_boundaries(center=110.0))
+        assert window.rule_state is None
+
+        results = evaluator.check_latest(window)
+        assert results[0].message == "9 consecutive points below center line"
@@ -0,0 +1,193 @@
+"""Tests for the vectorized Nelson Rules evaluator.
+
+The vectorized evaluator must produce exactly the same RuleResults as
+NelsonRuleLibrary.check_all() applied to a rolling window ending at each
+point, so most tests compare the two over generated series.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from openspc.core.engine.nelson_rules import NelsonRuleLibrary
+from openspc.core.engine.nelson_vectorized import (
+    MAX_RULE_LENGTH,
+    VectorizedNelsonEvaluator,
+    window_to_arrays,
+)
+from openspc.core.engine.rolling_window import (
+    ZONE_CODES,
+    RollingWindow,
+    WindowSample,
+    ZoneBoundaries,
+    classify_zone_codes,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _boundaries(center: float = 100.0, sigma: float = 10.0) -> ZoneBoundaries:
+    """Build standard zone boundaries."""
+    return ZoneBoundaries(
+        center_line=center,
+        sigma=sigma,
+        plus_1_sigma=center + sigma,
+        plus_2_sigma=center + 2 * sigma,
+        plus_3_sigma=center + 3 * sigma,
+        minus_1_sigma=center - sigma,
+        minus_2_sigma=center - 2 * sigma,
+        minus_3_sigma=center - 3 * sigma,
+    )
+
+
+def _reference_results(values: list[float], window_size: int = 25) -> dict[int, list]:
+    """Run NelsonRuleLibrary.check_all() after appending each value."""
+    library = NelsonRuleLibrary()
+    window = RollingWindow(max_size=window_size)
+    window.set_boundaries(_boundaries())
+    t = datetime(2025, 1, 1)
+    results = {}
+    for i, v in enumerate(values):
+        zone, is_above, sigma_dist = window.classify_value(v)
+        window.append(WindowSample(
+            sample_id=i + 1,
+            timestamp=t + timedelta(minutes=i),
+            value=v,
+            range_value=None,
+            zone=zone,
+            is_above_center=is_above,
+            sigma_distance=sigma_dist,
+        ))
+        triggered = [r for r in library.check_all(window) if r.triggered]
+        if triggered:
+            results[i] = triggered
+    return results
+
+
+def _as_tuples(results: list) -> list[tuple]:
+    return [
+        (r.rule_id, r.rule_name, r.severity, r.message, r.involved_sample_ids)
+        for r in results
+    ]
+
+
+def _series(seed: int, n: int = 400) -> list[float]:
+    """Generate a series that exercises every rule (drifts, trends, swings)."""
+    rng = np.random.default_rng(seed)
+    values = rng.normal(100.0, 10.0, n)
+    values[50:62] += 15.0                      # shift (Rule 2, 5, 6)
+    values[120:130] = 100.0 + np.arange(10)    # trend (Rule 3)
+    values[200:216] = 100.0 + np.where(np.arange(16) % 2, 3.0, -3.0)  # Rules 4, 7
+    values[300:310] = 100.0 + np.where(np.arange(10) % 2, 25.0, -25.0)  # Rule 8
+    return [float(v) for v in np.round(values, 1)]
+
+
+@pytest.fixture
+def evaluator() -> VectorizedNelsonEvaluator:
+    return VectorizedNelsonEvaluator()
+
+
+# ---------------------------------------------------------------------------
+# Zone classification
+# ---------------------------------------------------------------------------
+
+class TestClassifyZoneCodes:
+
+    def test_matches_rolling_window_classification(self):
+        bounds = _boundaries()
+        window = RollingWindow(max_size=10)
+        window.set_boundaries(bounds)
+        values = np.array([65.0, 70.0, 79.9, 80.0, 95.0, 100.0, 110.0, 125.0, 130.0, 140.0])
+
+        codes = classify_zone_codes(values, bounds)
+
+        expected = [ZONE_CODES[window.classify_value(v)[0]] for v in values]
+        assert codes.tolist() == expected
+
+    def test_window_to_arrays(self):
+        window = RollingWindow(max_size=5)
+        window.set_boundaries(_boundaries())
+        t = datetime(2025, 1, 1)
+        for i, v in enumerate([95.0, 135.0]):
+            zone, is_above, dist = window.classify_value(v)
+            window.append(WindowSample(i + 10, t, v, None, zone, is_above, dist))
+
+        values, zones, ids = window_to_arrays(window)
+
+        assert values.tolist() == [95.0, 135.0]
+        assert zones.tolist() == [-1, 4]
+        assert ids.tolist() == [10, 11]
+
+
+# ---------------------------------------------------------------------------
+# Equivalence with the per-rule classes
+# ---------------------------------------------------------------------------
+
+class TestEquivalence:
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_check_history_matches_check_all(self, evaluator, seed):
+        values = _series(seed)
+        arr = np.array(values)
+        zones = classify_zone_codes(arr, _boundaries())
+        ids = np.arange(1, len(values) + 1)
+
+        history = evaluator.check_history(arr, zones, ids)
+        expected = _reference_results(values)
+
+        assert history.keys() == expected.keys()
+        for index, results in expected.items():
+            assert _as_tuples(history[index]) == _as_tuples(results)
+
+    def test_check_latest_matches_check_all(self, evaluator):
+        values = _series(7)[: MAX_RULE_LENGTH + 60]
+        expected = _reference_results(values)
+        arr = np.array(values)
+        zones = classify_zone_codes(arr, _boundaries())
+        ids = np.arange(1, len(values) + 1)
+
+        for end in range(1, len(values) + 1):
+            latest = evaluator.check_latest(arr[:end], zones[:end], ids[:end])
+            assert _as_tuples(latest) == _as_tuples(expected.get(end - 1, []))
+
+    def test_enabled_rules_filter(self, evaluator):
+        values = [135.0] + [100.0] * 5
+        arr = np.array(values)
+        zones = classify_zone_codes(arr, _boundaries())
+
+        masks = evaluator.check_series(arr, zones, enabled_rules={2, 3})
+
+        assert set(masks) == {2, 3}
+        assert not masks[2].any()
+
+    def test_history_start_skips_context(self, evaluator):
+        arr = np.array([135.0, 100.0, 136.0])
+        zones = classify_zone_codes(arr, _boundaries())
+
+        history = evaluator.check_history(arr, zones, np.array([1, 2, 3]), start=1)
+
+        assert list(history) == [2]
+        assert history[2][0].involved_sample_ids == [3]
+
+    def test_empty_series(self, evaluator):
+        empty = np.array([])
+        assert evaluator.check_latest(empty, empty.astype(np.int8), empty) == []
+        assert evaluator.check_history(empty, empty.astype(np.int8), empty) == {}
+
+
+class TestPerformance:
+
+    def test_large_series_single_pass(self, evaluator):
+        rng = np.random.default_rng(0)
+        values = rng.normal(100.0, 10.0, 100_000)
+        zones = classify_zone_codes(values, _boundaries())
+
+        masks = evaluator.check_series(values, zones)
+
+        assert set(masks) == set(range(1, 9))
+        assert all(mask.shape == values.shape for mask in masks.values())
+        # Rule 1 is a plain threshold check
+        assert masks[1].sum() == np.count_nonzero(np.abs(values - 100.0) > 30.0)
@@ -0,0 +1,181 @@
+"""Tests for coalesced outbound MQTT publishing and the broker cache."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.core.events import (
+    CharacteristicDeletedEvent,
+    CharacteristicUpdatedEvent,
+    EventBus,
+    SampleProcessedEvent,
+    ViolationCreatedEvent,
+)
+from openspc.core.publish import MQTTPublisher, OutboundBrokerCache, outbound_broker_cache
+from openspc.db.models.broker import MQTTBroker
+from openspc.db.models.characteristic import Characteristic
+from openspc.db.models.plant import Plant
+from openspc.db.repositories import CharacteristicRepository, HierarchyRepository
+
+
+def _sample(char_id: int, mean: float) -> SampleProcessedEvent:
+    return SampleProcessedEvent(
+        sample_id=int(mean), characteristic_id=char_id, mean=mean,
+        range_value=None, zone="zone_c_upper", in_control=True,
+    )
+
+
+@pytest.fixture
+async def outbound(async_session: AsyncSession) -> dict:
+    """A characteristic under Plant > Line and one outbound broker (0.1 s limit)."""
+    plant = Plant(name="Plant A", code="PA")
+    async_session.add(plant)
+    await async_session.flush()
+    line = await HierarchyRepository(async_session).create_in_plant(
+        plant.id, name="Line 1", type="Line"
+    )
+    char = await CharacteristicRepository(async_session).create(
+        hierarchy_id=line.id, name="Bore", subgroup_size=1
+    )
+    broker = MQTTBroker(
+        name="uns", host="localhost", outbound_enabled=True,
+        outbound_topic_prefix="openspc", outbound_format="json", outbound_rate_limit=0.1,
+    )
+    async_session.add(broker)
+    await async_session.commit()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield async_session
+
+    manager = Mock()
+    manager.publish = AsyncMock()
+    publisher = MQTTPublisher(manager, Mock(), session_factory)
+    yield {"publisher": publisher, "manager": manager, "char_id": char.id, "broker": broker}
+    await publisher.stop()
+
+
+def _published(manager) -> list[tuple[str, dict]]:
+    return [
+        (call.kwargs["topic"], json.loads(call.kwargs["payload"]))
+        for call in manager.publish.await_args_list
+    ]
+
+
+@pytest.mark.asyncio
+class TestCoalescedPublishing:
+
+    async def test_latest_update_published_after_interval(self, outbound):
+        publisher, manager = outbound["publisher"], outbound["manager"]
+        for mean in (1.0, 2.0, 3.0, 4.0):
+            await publisher._on_sample_processed(_sample(outbound["char_id"], mean))
+
+        assert [p["mean"] for _, p in _published(manager)] == [1.0]
+
+        await asyncio.sleep(0.2)
+
+        published = _published(manager)
+        assert [p["mean"] for _, p in published] == [1.0, 4.0]
+        assert published[0][0] == "openspc/plant_a/line_1/bore/sample"
+        assert publisher.coalesced == 2
+
+    async def test_violations_not_throttled(self, outbound):
+        publisher, manager = outbound["publisher"], outbound["manager"]
+        await publisher._on_sample_processed(_sample(outbound["char_id"], 1.0))
+        for violation_id in (1, 2):
+            await publisher._on_violation_created(ViolationCreatedEvent(
+                violation_id=violation_id, sample_id=1, characteristic_id=outbound["char_id"],
+                rule_id=1, rule_name="Outlier", severity="CRITICAL",
+            ))
+
+        assert [p["event"] for _, p in _published(manager)] == [
+            "sample_processed", "violation_created", "violation_created",
+        ]
+
+    async def test_stop_publishes_pending(self, outbound):
+        publisher, manager = outbound["publisher"], outbound["manager"]
+        await publisher._on_sample_processed(_sample(outbound["char_id"], 1.0))
+        await publisher._on_sample_processed(_sample(outbound["char_id"], 2.0))
+
+        await publisher.stop()
+
+        assert [p["mean"] for _, p in _published(manager)] == [1.0, 2.0]
+
+    async def test_no_queries_once_warm(self, count_statements, outbound):
+        publisher = outbound["publisher"]
+        await publisher._on_sample_processed(_sample(outbound["char_id"], 1.0))
+
+        with count_statements() as statements:
+            for mean in range(2, 50):
+                await publisher._on_sample_processed(_sample(outbound["char_id"], float(mean)))
+
+        assert statements == []
+
+    async def test_rename_and_delete_evict_target(self, async_session, outbound):
+        publisher, manager = outbound["publisher"], outbound["manager"]
+        bus = EventBus()
+        subscribed = MQTTPublisher(manager, bus, publisher._session_factory)
+        await subscribed._on_sample_processed(_sample(outbound["char_id"], 1.0))
+
+        char = await async_session.get(Characteristic, outbound["char_id"])
+        char.name = "Bore Diameter"
+        await async_session.commit()
+        await bus.publish(CharacteristicUpdatedEvent(
+            characteristic_id=char.id, changes={"name": char.name}
+        ))
+        await asyncio.sleep(0.15)
+        await subscribed._on_sample_processed(_sample(outbound["char_id"], 2.0))
+
+        assert [topic for topic, _ in _published(manager)] == [
+            "openspc/plant_a/line_1/bore/sample",
+            "openspc/plant_a/line_1/bore_diameter/sample",
+        ]
+
+        await bus.publish(CharacteristicDeletedEvent(characteristic_id=char.id, name=char.name))
+        await asyncio.sleep(0.01)
+        assert outbound["char_id"] not in subscribed._targets
+        await subscribed.stop()
+
+
+@pytest.mark.asyncio
+class TestOutboundBrokerCache:
+
+    async def test_invalidate_reloads(self, async_session, outbound):
+        publisher, manager = outbound["publisher"], outbound["manager"]
+        await publisher._on_sample_processed(_sample(outbound["char_id"], 1.0))
+
+        outbound["broker"].outbound_enabled = False
+        await async_session.commit()
+        outbound_broker_cache.invalidate()
+        await asyncio.sleep(0.15)
+        await publisher._on_sample_processed(_sample(outbound["char_id"], 2.0))
+
+        assert manager.publish.await_count == 1
+        assert outbound_broker_cache.get_stats()["brokers"] == 0
+
+    async def test_racing_invalidation_not_cached(self, async_session, outbound):
+        cache = OutboundBrokerCache()
+
+        @asynccontextmanager
+        async def invalidating_factory():
+            cache.invalidate()
+            yield async_session
+
+        assert len(await cache.get(invalidating_factory)) == 1
+        assert cache.get_stats()["cached"] is False
+
+    async def test_zero_ttl_reloads(self, async_session, outbound):
+        cache = OutboundBrokerCache(ttl_seconds=0)
+
+        @asynccontextmanager
+        async def session_factory():
+            yield async_session
+
+        await cache.get(session_factory)
+        await cache.get(session_factory)
+
+        assert cache.misses == 2
@@ -0,0 +1,149 @@
+"""Tests for the authenticated principal cache."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.api.deps import check_plant_role, get_current_user
+from openspc.api.schemas.user import ChangePasswordRequest, PlantRoleAssign
+from openspc.api.v1.auth import change_password, get_me
+from openspc.api.v1.users import assign_plant_role, deactivate_user
+from openspc.core.auth.passwords import hash_password, verify_password
+from openspc.core.auth.principal import Principal, PrincipalCache, principal_cache
+from openspc.db.models.plant import Plant
+from openspc.db.models.user import UserRole
+from openspc.db.repositories.user import UserRepository
+
+
+@pytest.fixture
+async def user_data(async_session: AsyncSession) -> dict:
+    """An admin and an operator at plant A; plant B without roles."""
+    plants = [Plant(name="Plant A", code="PA"), Plant(name="Plant B", code="PB")]
+    async_session.add_all(plants)
+    await async_session.flush()
+    repo = UserRepository(async_session)
+    admin = await repo.create(username="admin", hashed_password=hash_password("admin-pass"))
+    operator = await repo.create(
+        username="op", hashed_password=hash_password("old-password")
+    )
+    await repo.assign_plant_role(admin.id, plants[0].id, UserRole.admin)
+    await repo.assign_plant_role(operator.id, plants[0].id, UserRole.operator)
+    await async_session.commit()
+    return {
+        "plant_a": plants[0].id,
+        "plant_b": plants[1].id,
+        "admin_id": admin.id,
+        "operator_id": operator.id,
+    }
+
+
+async def _current_user(session, user_id):
+    with patch(
+        "openspc.core.auth.jwt.verify_access_token", return_value={"sub": str(user_id)}
+    ):
+        return await get_current_user(authorization="Bearer token", session=session)
+
+
+class TestPrincipalCache:
+
+    def _principal(self, user_id=1):
+        return Principal(
+            id=user_id, username="u", email=None, is_active=True,
+            must_change_password=False, created_at=None, updated_at=None, plant_roles=(),
+        )
+
+    def test_racing_invalidation_not_stored(self):
+        cache = PrincipalCache()
+        version = cache.version(1)
+        cache.invalidate(1)
+
+        cache.put(self._principal(), version)
+
+        assert cache.get(1) is None
+
+    def test_invalidate_all_bumps_every_user(self):
+        cache = PrincipalCache()
+        version = cache.version(7)
+        cache.put(self._principal(1), cache.version(1))
+
+        cache.invalidate_all()
+        cache.put(self._principal(7), version)
+
+        assert cache.get(1) is None
+        assert cache.get(7) is None
+
+    def test_size_bound_and_zero_ttl(self):
+        cache = PrincipalCache(max_size=1)
+        cache.put(self._principal(1), 0)
+        cache.put(self._principal(2), 0)
+        assert cache.get(1) is None
+        assert cache.get(2) is not None
+
+        disabled = PrincipalCache(ttl_seconds=0)
+        disabled.put(self._principal(1), 0)
+        assert disabled.get(1) is None
+
+
+@pytest.mark.asyncio
+class TestCachedAuthentication:
+
+    async def test_authorization_without_queries(self, count_statements, async_session, user_data):
+        first = await _current_user(async_session, user_data["operator_id"])
+
+        with count_statements() as statements:
+            user = await _current_user(async_session, user_data["operator_id"])
+            check_plant_role(user, user_data["plant_a"], "operator")
+            with pytest.raises(HTTPException):
+                check_plant_role(user, user_data["plant_b"], "operator")
+
+        assert statements == []
+        assert user is first
+        assert user.plant_roles[0].plant.name == "Plant A"
+
+    async def test_role_assignment_invalidates(self, async_session, user_data):
+        admin = await _current_user(async_session, user_data["admin_id"])
+        await _current_user(async_session, user_data["operator_id"])
+
+        await assign_plant_role(
+            user_id=user_data["operator_id"],
+            data=PlantRoleAssign(plant_id=user_data["plant_b"], role="supervisor"),
+            current_user=admin,
+            repo=UserRepository(async_session),
+        )
+
+        user = await _current_user(async_session, user_data["operator_id"])
+        check_plant_role(user, user_data["plant_b"], "supervisor")
+
+    async def test_deactivation_rejects_cached_user(self, async_session, user_data):
+        admin = await _current_user(async_session, user_data["admin_id"])
+        await _current_user(async_session, user_data["operator_id"])
+
+        await deactivate_user(
+            user_id=user_data["operator_id"],
+            current_user=admin,
+            repo=UserRepository(async_session),
+        )
+
+        with pytest.raises(HTTPException) as exc:
+            await _current_user(async_session, user_data["operator_id"])
+        assert exc.value.status_code == 401
+
+    async def test_me_and_change_password_with_snapshot(self, async_session, user_data):
+        user = await _current_user(async_session, user_data["operator_id"])
+
+        me = await get_me(current_user=user)
+        assert me.plant_roles[0].plant_code == "PA"
+
+        await change_password(
+            data=ChangePasswordRequest(
+                current_password="old-password", new_password="new-password"
+            ),
+            current_user=user,
+            session=async_session,
+        )
+
+        stored = await UserRepository(async_session).get_by_id(user_data["operator_id"])
+        assert verify_password("new-password", stored.hashed_password)
+        assert principal_cache.get(user_data["operator_id"]) is None
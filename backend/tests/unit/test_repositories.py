@@ -1,8 +1,9 @@
 """Unit tests for repository pattern implementation."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from openspc.db.models.characteristic import Characteristic, CharacteristicRule
@@ -15,6 +16,7 @@ from openspc.db.repositories import (
     SampleRepository,
     ViolationRepository,
 )
+from openspc.db.repositories.sample import display_sequence_subquery
 
 
 class TestBaseRepository:
@@ -568,6 +570,59 @@ class TestSampleRepository:
         measurement_values = [m.value for m in measurements_list]
         assert sorted(measurement_values) == sorted(values)
 
+    @pytest.mark.asyncio
+    async def test_get_display_keys(self, async_session: AsyncSession) -> None:
+        """Test display keys number samples per characteristic and day."""
+        h_repo = HierarchyRepository(async_session)
+        c_repo = CharacteristicRepository(async_session)
+        s_repo = SampleRepository(async_session)
+
+        site = await h_repo.create(name="Site A", type="Site", parent_id=None)
+        char = await c_repo.create(hierarchy_id=site.id, name="Char 1", subgroup_size=1)
+        other = await c_repo.create(hierarchy_id=site.id, name="Char 2", subgroup_size=1)
+
+        day1 = datetime(2025, 3, 4, 8, 0)
+        day2 = datetime(2025, 3, 5, 0, 30)
+        samples = [
+            Sample(char_id=char.id, timestamp=day1 + timedelta(hours=2)),
+            Sample(char_id=char.id, timestamp=day1, is_excluded=True),
+            Sample(char_id=other.id, timestamp=day1 + timedelta(hours=1)),
+            Sample(char_id=char.id, timestamp=day1 + timedelta(hours=2)),
+            Sample(char_id=char.id, timestamp=day2),
+        ]
+        async_session.add_all(samples)
+        await async_session.flush()
+
+        keys = await s_repo.get_display_keys(samples)
+
+        assert keys == {
+            samples[1].id: "250304-001",  # excluded samples still count
+            samples[0].id: "250304-002",
+            samples[3].id: "250304-003",  # timestamp tie broken by id
+            samples[2].id: "250304-001",  # numbered per characteristic
+            samples[4].id: "250305-001",
+        }
+        assert await s_repo.get_display_keys([samples[4]]) == {samples[4].id: "250305-001"}
+
+    @pytest.mark.asyncio
+    async def test_display_sequence_range_with_offset(self, async_session: AsyncSession) -> None:
+        """Test bounds with a UTC offset keep samples of the previous UTC day."""
+        h_repo = HierarchyRepository(async_session)
+        c_repo = CharacteristicRepository(async_session)
+
+        site = await h_repo.create(name="Site A", type="Site", parent_id=None)
+        char = await c_repo.create(hierarchy_id=site.id, name="Char 1", subgroup_size=1)
+        sample = Sample(char_id=char.id, timestamp=datetime(2026, 1, 15, 20, 0))
+        async_session.add(sample)
+        await async_session.flush()
+
+        # 2026-01-16T01:00+05:00 is 2026-01-15T20:00Z
+        start = datetime(2026, 1, 16, 1, 0, tzinfo=timezone(timedelta(hours=5)))
+        seq = display_sequence_subquery(char_ids=[char.id], start_date=start, end_date=start)
+        result = await async_session.execute(select(seq.c.id, seq.c.day_seq))
+
+        assert result.all() == [(sample.id, 1)]
+
 
 class TestViolationRepository:
     """Tests for ViolationRepository acknowledgment operations."""
@@ -1,12 +1,14 @@
 """Unit tests for rolling window manager."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 
 from openspc.core.engine.rolling_window import (
+    WINDOW_DTYPE,
     RollingWindow,
     RollingWindowManager,
     WindowSample,
@@ -385,6 +387,64 @@ class TestRollingWindow:
         assert len(window.get_samples()) == 0
 
 
+class TestRingBuffer:
+    """Tests for the array-backed storage of RollingWindow."""
+
+    def test_columns_stay_chronological_after_wraparound(self, sample_timestamp):
+        """Column views follow chronological order across many evictions."""
+        window = RollingWindow(max_size=4)
+        for i in range(11):
+            window.append(create_window_sample(
+                sample_id=i,
+                value=100.0 + i,
+                timestamp=sample_timestamp + timedelta(minutes=i)
+            ))
+
+        assert window.get_column("sample_id").tolist() == [7, 8, 9, 10]
+        assert window.get_column("value").tolist() == [107.0, 108.0, 109.0, 110.0]
+        assert [s.sample_id for s in window.get_samples()] == [7, 8, 9, 10]
+        assert [s.sample_id for s in window.get_recent(2)] == [10, 9]
+
+    def test_view_is_read_only_and_zero_copy(self, sample_timestamp):
+        """view() exposes the buffer without copying and rejects writes."""
+        window = RollingWindow(max_size=3)
+        window.append(create_window_sample(1, 101.0, sample_timestamp))
+
+        values = window.get_column("value")
+
+        assert np.shares_memory(values, window.view())
+        with pytest.raises(ValueError):
+            values[0] = 0.0
+
+    def test_round_trip_preserves_optional_fields(self):
+        """None fields and tz-aware timestamps survive storage in the buffer."""
+        window = RollingWindow(max_size=2)
+        ts = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        sample = WindowSample(
+            sample_id=5,
+            timestamp=ts,
+            value=101.5,
+            range_value=None,
+            zone=Zone.ZONE_C_UPPER,
+            is_above_center=True,
+            sigma_distance=0.75,
+            actual_n=3,
+            is_undersized=True,
+            effective_ucl=106.0,
+            effective_lcl=None,
+            z_score=0.75,
+        )
+        window.append(sample)
+
+        assert window.get_samples() == [sample]
+
+    def test_memory_per_window(self):
+        """A default window stays a few KB regardless of sample content."""
+        window = RollingWindow(max_size=25)
+        assert window.nbytes == 2 * 25 * WINDOW_DTYPE.itemsize
+        assert window.nbytes < 4096
+
+
 # RollingWindowManager Tests
 
 class TestRollingWindowManager:
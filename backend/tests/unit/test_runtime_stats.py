@@ -0,0 +1,38 @@
+"""Tests for the admin runtime metrics endpoint."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from openspc.api.v1.stats import get_runtime_stats
+from openspc.core.cache_stats import hit_stats
+from openspc.core.engine.char_cache import characteristic_cache
+from openspc.core.engine.chart_cache import chart_data_cache
+
+
+def test_hit_stats():
+    assert hit_stats(3, 1) == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+    assert hit_stats(0, 0)["hit_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_reports_caches():
+    misses = chart_data_cache.misses
+    chart_data_cache.get(1, ("p",))
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+
+    stats = await get_runtime_stats(request=request, _user=MagicMock())
+
+    assert stats["caches"]["characteristics"] == characteristic_cache.get_stats()
+    assert "hierarchy_paths" in stats["caches"]
+    assert "api_keys" in stats["caches"]
+    assert "principals" in stats["caches"]
+    assert "outbound_brokers" in stats["caches"]
+    assert stats["caches"]["chart_data"]["misses"] == misses + 1
+    assert "queues" in stats["event_bus"]
+    assert "commits" in stats["sample_writer"]
+    # Providers and the publisher report nothing until started
+    assert stats["tag_provider"] == {}
+    assert stats["opcua_provider"] == {}
+    assert stats["mqtt_publisher"] == {}
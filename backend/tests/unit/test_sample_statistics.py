@@ -0,0 +1,172 @@
+"""Tests for persisted per-sample statistics.
+
+Covers the statistics written with each sample, the read paths that use
+them instead of joining measurements, and the fallback for rows written
+without them.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.api.v1.samples import list_samples
+from openspc.core.engine.control_limits import ControlLimitService
+from openspc.db.models.sample import Measurement, Sample
+from openspc.db.repositories import (
+    CharacteristicRepository,
+    HierarchyRepository,
+    SampleRepository,
+)
+from openspc.utils.statistics import calculate_sample_statistics
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+
+@pytest.fixture
+async def char_id(async_session: AsyncSession) -> int:
+    """Characteristic (n=3) with 30 subgroups."""
+    site = await HierarchyRepository(async_session).create(
+        name="Site", type="Site", parent_id=None
+    )
+    char = await CharacteristicRepository(async_session).create(
+        hierarchy_id=site.id, name="Width", subgroup_size=3
+    )
+    rng = np.random.default_rng(7)
+    repo = SampleRepository(async_session)
+    for i in range(30):
+        await repo.create_with_measurements(
+            char_id=char.id,
+            values=[float(v) for v in np.round(rng.normal(10.0, 0.5, 3), 3)],
+            timestamp=START + timedelta(minutes=i),
+            actual_n=3,
+        )
+    await async_session.commit()
+    return char.id
+
+
+class TestCalculateSampleStatistics:
+
+    def test_subgroup(self):
+        values = [10.0, 12.0, 11.0, 15.0]
+
+        mean, range_value, std_dev = calculate_sample_statistics(values)
+
+        assert mean == pytest.approx(12.0)
+        assert range_value == 5.0
+        assert std_dev == pytest.approx(float(np.std(values, ddof=1)))
+
+    def test_single_and_empty(self):
+        assert calculate_sample_statistics([4.5]) == (4.5, None, None)
+        assert calculate_sample_statistics([]) == (None, None, None)
+
+
+@pytest.mark.asyncio
+class TestPersistedStatistics:
+
+    async def test_create_persists_statistics(self, async_session, char_id):
+        repo = SampleRepository(async_session)
+
+        sample = await repo.create_with_measurements(char_id=char_id, values=[1.0, 2.0, 4.0])
+        (many,) = await repo.create_many_with_measurements(
+            [{"char_id": char_id, "values": [7.0]}]
+        )
+
+        assert (sample.mean, sample.range_value) == (pytest.approx(7 / 3), 3.0)
+        assert sample.std_dev == pytest.approx(float(np.std([1.0, 2.0, 4.0], ddof=1)))
+        assert (many.mean, many.range_value, many.std_dev) == (7.0, None, None)
+
+    async def test_reads_skip_measurement_table(self, count_statements, async_session, char_id):
+        repo = SampleRepository(async_session)
+
+        with count_statements() as statements:
+            samples = await repo.get_samples_with_statistics(char_id, limit=10)
+            window = await repo.get_rolling_window_data(char_id, window_size=10)
+
+        assert len(statements) == 2
+        assert not any("measurement" in s for s in statements)
+        assert [s.id for s in samples] == [d["sample_id"] for d in window]
+        assert samples[-1].timestamp.replace(tzinfo=timezone.utc) == START + timedelta(minutes=29)
+
+    async def test_date_range_and_exclusion(self, async_session, char_id):
+        repo = SampleRepository(async_session)
+        samples = await repo.get_samples_with_statistics(char_id)
+        samples[0].is_excluded = True
+        await async_session.commit()
+
+        ranged = await repo.get_samples_with_statistics(
+            char_id, start_date=START, end_date=START + timedelta(minutes=4)
+        )
+        included = await repo.get_samples_with_statistics(char_id, exclude_excluded=True)
+
+        assert len(ranged) == 5
+        assert len(included) == 29
+
+    async def test_rows_without_statistics_fall_back_to_measurements(
+        self, async_session, char_id
+    ):
+        sample = Sample(char_id=char_id, timestamp=START + timedelta(hours=1), actual_n=3)
+        async_session.add(sample)
+        await async_session.flush()
+        async_session.add_all(
+            [Measurement(sample_id=sample.id, value=v) for v in (3.0, 5.0, 4.0)]
+        )
+        await async_session.commit()
+        repo = SampleRepository(async_session)
+
+        latest = (await repo.get_samples_with_statistics(char_id, limit=1))[0]
+        window = await repo.get_rolling_window_data(char_id, window_size=1)
+
+        assert (latest.mean, latest.range_value, latest.std_dev) == (4.0, 2.0, 1.0)
+        assert (window[0]["mean"], window[0]["range_value"]) == (4.0, 2.0)
+        assert sample not in async_session.dirty
+
+    async def test_control_limits_match_measurement_values(self, async_session, char_id):
+        sample_repo = SampleRepository(async_session)
+        service = ControlLimitService(
+            sample_repo=sample_repo,
+            char_repo=CharacteristicRepository(async_session),
+            window_manager=MagicMock(),
+        )
+
+        result = await service.calculate_limits(char_id, min_samples=25)
+
+        subgroups = [
+            [m.value for m in s.measurements]
+            for s in await sample_repo.get_by_characteristic(char_id)
+        ]
+        means = [float(np.mean(sg)) for sg in subgroups]
+        assert result.sample_count == 30
+        assert result.center_line == pytest.approx(float(np.mean(means)))
+        assert result.sigma == pytest.approx(
+            float(np.mean([np.ptp(sg) for sg in subgroups])) / 1.693, rel=1e-3
+        )
+
+
+@pytest.mark.asyncio
+class TestListSamplesDisplayKeys:
+
+    async def _list(self, session, characteristic_id):
+        return await list_samples(
+            characteristic_id=characteristic_id, start_date=None, end_date=None,
+            include_excluded=False, offset=0, limit=5, sort_dir="desc",
+            sample_repo=SampleRepository(session), _user=MagicMock(),
+        )
+
+    async def test_unfiltered_numbers_only_page(self, count_statements, async_session, char_id):
+        filtered = await self._list(async_session, char_id)
+
+        with count_statements() as statements:
+            unfiltered = await self._list(async_session, None)
+
+        assert [s.display_key for s in unfiltered.items] == [
+            s.display_key for s in filtered.items
+        ]
+        assert unfiltered.items[0].display_key == "260101-030"
+        # The window is restricted to the page's characteristics
+        numbering = [s for s in statements if "row_number" in s.lower()]
+        assert len(numbering) == 1
+        assert "char_id IN" in numbering[0]
@@ -0,0 +1,161 @@
+"""Tests for SparkplugB metric aliases from birth certificates."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from openspc.core.providers.tag import TagProvider
+from openspc.mqtt.sparkplug import (
+    SparkplugAdapter,
+    SparkplugAliasTable,
+    SparkplugDecoder,
+    SparkplugMetric,
+)
+from openspc.mqtt.sparkplug_b_pb2 import Payload
+
+NBIRTH = "spBv1.0/spc/NBIRTH/node1"
+NDEATH = "spBv1.0/spc/NDEATH/node1"
+DBIRTH = "spBv1.0/spc/DBIRTH/node1/press1"
+DDEATH = "spBv1.0/spc/DDEATH/node1/press1"
+DDATA = "spBv1.0/spc/DDATA/node1/press1"
+
+
+def _payload(*metrics: tuple[str, int, float]) -> bytes:
+    """Protobuf payload of (name, alias, value) metrics; empty names are alias-only."""
+    pb = Payload()
+    pb.timestamp = 1706890000000
+    for name, alias, value in metrics:
+        m = pb.metrics.add()
+        if name:
+            m.name = name
+        m.alias = alias
+        m.datatype = 10
+        m.double_value = value
+    return pb.SerializeToString()
+
+
+def _birth_metrics() -> list[SparkplugMetric]:
+    return [SparkplugMetric("Force", 0.0, alias=1), SparkplugMetric("Stroke", 0.0, alias=2)]
+
+
+class TestDecoderAliases:
+
+    def test_alias_only_metrics_resolved(self):
+        payload = _payload(("", 1, 12.5), ("", 2, 3.0), ("", 9, 1.0))
+
+        _ts, metrics, _seq = SparkplugDecoder.decode_payload(
+            payload, aliases={1: "Force", 2: "Stroke"}
+        )
+
+        assert [(m.name, m.alias, m.value) for m in metrics] == [
+            ("Force", 1, 12.5), ("Stroke", 2, 3.0), ("", 9, 1.0),
+        ]
+
+    def test_names_filter_skips_other_metrics(self):
+        payload = _payload(("", 1, 12.5), ("", 2, 3.0), ("Temp", 0, 20.0))
+
+        _ts, metrics, _seq = SparkplugDecoder.decode_payload(
+            payload, aliases={2: "Stroke"}, names=frozenset({"Stroke", "Temp"})
+        )
+
+        assert [m.name for m in metrics] == ["Stroke", "Temp"]
+
+    def test_json_alias(self):
+        payload = b'{"timestamp": 1706890000000, "metrics": [{"alias": 1, "value": 4.0}]}'
+
+        _ts, metrics, _seq = SparkplugDecoder.decode_payload(
+            payload, format="json", aliases={1: "Force"}
+        )
+
+        assert metrics[0].name == "Force"
+
+    def test_session_topics(self):
+        assert SparkplugDecoder.session_topics(DDATA) == [NBIRTH, NDEATH, DBIRTH, DDEATH]
+        assert SparkplugDecoder.session_topics("spBv1.0/spc/NDATA/node1") == [NBIRTH, NDEATH]
+        assert SparkplugDecoder.session_topics(NBIRTH) == []
+
+
+class TestAliasTable:
+
+    def test_birth_and_death(self):
+        table = SparkplugAliasTable()
+        assert table.update(DBIRTH, _birth_metrics()) is True
+        assert table.get(DDATA) == {1: "Force", 2: "Stroke"}
+
+        assert table.update(DDATA, []) is False
+        table.update(DDEATH, [])
+        assert table.get(DDATA) == {}
+
+    def test_nbirth_resets_devices(self):
+        table = SparkplugAliasTable()
+        table.update(DBIRTH, _birth_metrics())
+
+        table.update(NBIRTH, [SparkplugMetric("bdSeq", 0, alias=0)])
+
+        assert table.get(DDATA) == {}
+
+    def test_wanted_cached_until_birth(self):
+        table = SparkplugAliasTable()
+        names = frozenset({"Stroke"})
+        assert table.wanted(DDATA, names) == {}
+
+        table.update(DBIRTH, _birth_metrics())
+        wanted = table.wanted(DDATA, names)
+
+        assert wanted == {2: "Stroke"}
+        assert table.wanted(DDATA, names) is wanted
+
+    def test_adapter_tracks_aliases(self):
+        adapter = SparkplugAdapter(Mock())
+        adapter.decode_message(DBIRTH, _payload(("Force", 1, 0.0)))
+
+        message = adapter.decode_message(DDATA, _payload(("", 1, 7.5)))
+
+        assert adapter.extract_value_from_message(message, "Force") == 7.5
+
+
+@pytest.mark.asyncio
+class TestTagProviderAliases:
+
+    async def _provider(self) -> TagProvider:
+        source = SimpleNamespace(
+            id=1,
+            topic=DDATA,
+            trigger_strategy="on_change",
+            trigger_tag=None,
+            metric_name="Stroke",
+            characteristic=SimpleNamespace(id=7, name="Stroke", subgroup_size=5),
+        )
+        ds_repo = Mock()
+        ds_repo.get_active_mqtt_sources = AsyncMock(return_value=[source])
+        mqtt = Mock()
+        mqtt.subscribe = AsyncMock()
+        mqtt.unsubscribe = AsyncMock()
+        provider = TagProvider(mqtt, ds_repo)
+        await provider._load_tag_characteristics()
+        return provider
+
+    async def test_subscribes_to_session_topics(self):
+        provider = await self._provider()
+
+        subscribed = [call.args[0] for call in provider._mqtt.subscribe.await_args_list]
+        assert subscribed == [DDATA, NBIRTH, NDEATH, DBIRTH, DDEATH]
+
+    async def test_alias_only_ddata_dispatched(self):
+        provider = await self._provider()
+        await provider._handle_message(DBIRTH, _payload(("Force", 1, 0.0), ("Stroke", 2, 0.0)))
+
+        await provider._handle_message(DDATA, _payload(("", 1, 99.0), ("", 2, 3.5)))
+        await provider._handle_message(DDATA, _payload(("Stroke", 0, 4.0)))
+
+        assert provider._buffers[7].values == [3.5, 4.0]
+
+    async def test_death_forgets_aliases(self):
+        provider = await self._provider()
+        await provider._handle_message(DBIRTH, _payload(("Stroke", 2, 0.0)))
+        await provider._handle_message(NDEATH, _payload())
+
+        await provider._handle_message(DDATA, _payload(("", 2, 3.5)))
+
+        assert provider._buffers[7].values == []
@@ -906,3 +906,202 @@ class TestPerformance:
         # Verify processing time was recorded and is reasonable
         assert result.processing_time_ms > 0
         assert result.processing_time_ms < 10000  # Should be under 10 seconds
+
+
+class TestProcessBatch:
+    """Test bulk ingestion through SPCEngine.process_batch()."""
+
+    @pytest.fixture
+    async def batch_engine(self, async_session):
+        """SPC engine wired to real repositories on the in-memory database."""
+        from openspc.core.events import EventBus
+        from openspc.db.models.hierarchy import Hierarchy
+        from openspc.db.repositories import (
+            CharacteristicRepository,
+            SampleRepository,
+            ViolationRepository,
+        )
+
+        hierarchy = Hierarchy(name="Line 1", type="Line")
+        async_session.add(hierarchy)
+        await async_session.flush()
+
+        char = Characteristic(
+            hierarchy_id=hierarchy.id,
+            name="Diameter",
+            subgroup_size=1,
+            ucl=106.0,
+            lcl=94.0,
+        )
+        char.rules = [
+            CharacteristicRule(rule_id=i, is_enabled=True) for i in range(1, 9)
+        ]
+        async_session.add(char)
+        await async_session.flush()
+
+        sample_repo = SampleRepository(async_session)
+        engine = SPCEngine(
+            sample_repo=sample_repo,
+            char_repo=CharacteristicRepository(async_session),
+            violation_repo=ViolationRepository(async_session),
+            window_manager=RollingWindowManager(sample_repo),
+            rule_library=NelsonRuleLibrary(),
+            event_bus=EventBus(),
+        )
+        return engine, char.id
+
+    @pytest.mark.asyncio
+    async def test_batch_persists_samples_and_violations(self, batch_engine, async_session):
+        """Samples are persisted in order and rules see earlier batch samples."""
+        from openspc.core.providers.protocol import SampleEvent
+        from sqlalchemy import func, select
+
+        engine, char_id = batch_engine
+        base = datetime(2026, 1, 1)
+        values = [101.0] * 8 + [101.5, 110.0]
+        events = [
+            SampleEvent(
+                characteristic_id=char_id,
+                measurements=[v],
+                timestamp=base.replace(minute=i),
+                context=SampleContext(batch_number="B1"),
+            )
+            for i, v in enumerate(values)
+        ]
+
+        batch = await engine.process_batch(events)
+
+        assert batch.successful == 10
+        assert batch.failed == 0
+        assert [batch.results[i].mean for i in range(10)] == values
+        # Ninth point completes a shift (Rule 2); tenth is an outlier (Rule 1)
+        assert 2 in {v.rule_id for v in batch.results[8].violations}
+        assert 1 in {v.rule_id for v in batch.results[9].violations}
+        assert batch.results[0].in_control
+
+        sample_count = await async_session.scalar(
+            select(func.count()).select_from(Sample).where(Sample.char_id == char_id)
+        )
+        violation_count = await async_session.scalar(
+            select(func.count()).select_from(Violation)
+        )
+        assert sample_count == 10
+        assert violation_count == sum(len(r.violations) for r in batch.results.values())
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_errors_per_sample(self, batch_engine):
+        """Invalid samples and unknown characteristics don't abort the batch."""
+        from openspc.core.providers.protocol import SampleEvent
+
+        engine, char_id = batch_engine
+        now = datetime(2026, 1, 1)
+        events = [
+            SampleEvent(char_id, [100.0], now, SampleContext()),
+            SampleEvent(999, [100.0], now, SampleContext()),
+            SampleEvent(char_id, [], now, SampleContext()),
+        ]
+
+        batch = await engine.process_batch(events)
+
+        assert set(batch.results) == {0}
+        assert batch.errors[1] == "Characteristic 999 not found"
+        assert "Insufficient measurements" in batch.errors[2]
+
+    @pytest.mark.asyncio
+    async def test_batch_without_rule_evaluation(self, batch_engine):
+        """evaluate_rules=False persists samples without touching windows."""
+        from openspc.core.providers.protocol import SampleEvent
+
+        engine, char_id = batch_engine
+        now = datetime(2026, 1, 1)
+        events = [SampleEvent(char_id, [120.0], now, SampleContext())]
+
+        batch = await engine.process_batch(events, evaluate_rules=False)
+
+        assert batch.results[0].zone == "unevaluated"
+        assert batch.results[0].violations == []
+        assert engine._window_manager.cache_size == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluates_in_timestamp_order(self, batch_engine):
+        """Samples submitted out of order are evaluated in timestamp order."""
+        from openspc.core.providers.protocol import SampleEvent
+
+        engine, char_id = batch_engine
+        base = datetime(2026, 1, 1)
+        values = [101.0] * 8 + [101.5, 110.0]
+        events = [
+            SampleEvent(char_id, [v], base.replace(minute=i), SampleContext())
+            for i, v in enumerate(values)
+        ][::-1]
+
+        batch = await engine.process_batch(events)
+
+        # Input index 0 is the newest sample (the outlier), index 1 completes the shift
+        assert 1 in {v.rule_id for v in batch.results[0].violations}
+        assert 2 in {v.rule_id for v in batch.results[1].violations}
+        assert all(batch.results[i].in_control for i in range(2, 10))
+        window = await engine._window_manager.get_window(char_id)
+        assert [s.value for s in window.get_samples()] == values
+
+    @pytest.mark.asyncio
+    async def test_backfill_is_evaluated_on_reloaded_window(self, batch_engine):
+        """Samples older than the window tail are checked in stored order."""
+        from openspc.core.providers.protocol import SampleEvent
+
+        engine, char_id = batch_engine
+        base = datetime(2026, 1, 1)
+        await engine.process_batch([
+            SampleEvent(char_id, [101.0], base.replace(minute=20 + i), SampleContext())
+            for i in range(8)
+        ])
+
+        batch = await engine.process_batch(
+            [SampleEvent(char_id, [101.0], base, SampleContext())]
+        )
+
+        # Appended after the tail this would be the ninth point on one side
+        result = batch.results[0]
+        assert result.in_control
+        assert result.zone == "zone_c_upper"
+        window = await engine._window_manager.get_window(char_id)
+        assert window.get_samples()[0].sample_id == result.sample_id
+
+    @pytest.mark.asyncio
+    async def test_isolated_batch_reports_database_errors_per_sample(
+        self, batch_engine, async_session
+    ):
+        """A database error fails only the affected sample and its events."""
+        from openspc.core.events import SampleProcessedEvent
+        from openspc.core.providers.protocol import SampleEvent
+        from sqlalchemy import func, select
+
+        engine, char_id = batch_engine
+        published = []
+        engine._event_bus.publish = AsyncMock(side_effect=published.append)
+        create_many = engine._sample_repo.create_many_with_measurements
+
+        async def failing_create_many(rows):
+            created = await create_many(rows)
+            if any(row["values"] == [66.0] for row in rows):
+                raise RuntimeError("database is locked")
+            return created
+
+        engine._sample_repo.create_many_with_measurements = failing_create_many
+        base = datetime(2026, 1, 1)
+        events = [
+            SampleEvent(char_id, [v], base.replace(minute=i), SampleContext())
+            for i, v in enumerate([100.0, 66.0, 101.0])
+        ]
+
+        batch = await engine.process_batch(events, isolate_failures=True)
+
+        assert set(batch.results) == {0, 2}
+        assert batch.errors == {1: "Unexpected error"}
+        sample_count = await async_session.scalar(
+            select(func.count()).select_from(Sample).where(Sample.char_id == char_id)
+        )
+        assert sample_count == 2
+        assert [e.sample_id for e in published if isinstance(e, SampleProcessedEvent)] == [
+            batch.results[0].sample_id, batch.results[2].sample_id
+        ]
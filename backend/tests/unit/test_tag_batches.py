@@ -0,0 +1,150 @@
+"""Tests for batched TAG payloads with source timestamps."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from openspc.core.providers.readings import parse_plain_payload, readings_from_value
+from openspc.core.providers.tag import TagProvider
+from openspc.mqtt.sparkplug import SparkplugDecoder, SparkplugEncoder, SparkplugMetric
+from openspc.mqtt.sparkplug_b_pb2 import Payload
+
+TS = 1706890000000
+TS_DT = datetime.fromtimestamp(TS / 1000, tz=timezone.utc)
+DDATA = "spBv1.0/spc/DDATA/node1/press1"
+
+
+class TestParsePlainPayload:
+
+    def test_single_number(self):
+        assert parse_plain_payload(b" 12.5\n") == [(12.5, None)]
+
+    def test_array_of_numbers(self):
+        assert parse_plain_payload(b"[1, 2.5, 3]") == [(1.0, None), (2.5, None), (3.0, None)]
+
+    def test_objects_with_timestamps(self):
+        readings = parse_plain_payload(
+            b'[{"value": 1.5, "ts": 1706890000000},'
+            b' {"Value": 2.5, "timestamp": "2024-02-02T16:06:41Z"}]'
+        )
+
+        assert readings == [
+            (1.5, TS_DT),
+            (2.5, datetime(2024, 2, 2, 16, 6, 41, tzinfo=timezone.utc)),
+        ]
+
+    def test_invalid_items_skipped(self):
+        assert parse_plain_payload(b'[1, "x", null, {"ts": 1}, 2]') == [(1.0, None), (2.0, None)]
+
+    def test_invalid_payload_raises(self):
+        with pytest.raises(ValueError):
+            parse_plain_payload(b"not a number")
+        with pytest.raises(ValueError):
+            parse_plain_payload(b"[1, 2")
+
+    def test_dataset_rows_and_default_timestamp(self):
+        rows = [{"Force": 1.0, "ts": TS}, {"Force": 2.0}]
+
+        assert readings_from_value(rows, datetime(2024, 1, 1)) == [
+            (1.0, TS_DT),
+            (2.0, datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        ]
+
+
+class TestSparkplugBatchValues:
+
+    def test_array_round_trip(self):
+        payload = SparkplugEncoder.encode_metrics(
+            [SparkplugMetric("Force", [1.5, 2.5, 3.5], data_type="DoubleArray")]
+        )
+
+        _ts, metrics, _seq = SparkplugDecoder.decode_payload(payload)
+
+        assert metrics[0].value == [1.5, 2.5, 3.5]
+
+    def test_dataset_decoded_to_rows(self):
+        pb = Payload()
+        pb.timestamp = TS
+        m = pb.metrics.add()
+        m.name = "Force"
+        m.datatype = 16
+        m.dataset_value.num_of_cols = 2
+        m.dataset_value.columns.extend(["value", "ts"])
+        m.dataset_value.types.extend([10, 13])
+        for i in range(3):
+            row = m.dataset_value.rows.add()
+            row.elements.add().double_value = float(i)
+            row.elements.add().long_value = TS + i
+
+        _ts, metrics, _seq = SparkplugDecoder.decode_payload(pb.SerializeToString())
+
+        assert metrics[0].value == [{"value": float(i), "ts": TS + i} for i in range(3)]
+
+
+@pytest.mark.asyncio
+class TestTagProviderBatches:
+
+    async def _provider(self, topic: str, subgroup_size: int, metric_name=None) -> TagProvider:
+        source = SimpleNamespace(
+            id=1,
+            topic=topic,
+            trigger_strategy="on_change",
+            trigger_tag=None,
+            metric_name=metric_name,
+            characteristic=SimpleNamespace(id=7, name="Force", subgroup_size=subgroup_size),
+        )
+        ds_repo = Mock()
+        ds_repo.get_active_mqtt_sources = AsyncMock(return_value=[source])
+        mqtt = Mock()
+        mqtt.subscribe = AsyncMock()
+        provider = TagProvider(mqtt, ds_repo)
+        provider._pool.submit = AsyncMock()
+        provider._pool.start()
+        await provider._load_tag_characteristics()
+        return provider
+
+    def _events(self, provider):
+        return [call.args[1] for call in provider._pool.submit.await_args_list]
+
+    async def test_plain_batch_fills_subgroups(self):
+        provider = await self._provider("plant/force", subgroup_size=5)
+        batch = ",".join(f'{{"value": {i}, "ts": {TS + i * 1000}}}' for i in range(12))
+
+        await provider._handle_message("plant/force", f"[{batch}]".encode())
+
+        events = self._events(provider)
+        assert [e.measurements for e in events] == [
+            [0.0, 1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0, 9.0],
+        ]
+        assert events[0].timestamp == datetime.fromtimestamp((TS + 4000) / 1000, tz=timezone.utc)
+        assert provider._buffers[7].values == [10.0, 11.0]
+        await provider._pool.stop()
+
+    async def test_single_value_keeps_flush_time(self):
+        provider = await self._provider("plant/force", subgroup_size=1)
+        before = datetime.now(timezone.utc)
+
+        await provider._handle_message("plant/force", b"12.5")
+
+        assert self._events(provider)[0].timestamp >= before
+        await provider._pool.stop()
+
+    async def test_sparkplug_array_and_repeated_metrics(self):
+        provider = await self._provider(DDATA, subgroup_size=4, metric_name="Force")
+        payload = SparkplugEncoder.encode_metrics(
+            [
+                SparkplugMetric("Force", [1.0, 2.0, 3.0], data_type="DoubleArray"),
+                SparkplugMetric("Force", 4.0, data_type="Double"),
+                SparkplugMetric("Other", 9.0, data_type="Double"),
+            ],
+            timestamp=TS_DT,
+        )
+
+        await provider._handle_message(DDATA, payload)
+
+        events = self._events(provider)
+        assert [e.measurements for e in events] == [[1.0, 2.0, 3.0, 4.0]]
+        assert events[0].timestamp == TS_DT
+        await provider._pool.stop()
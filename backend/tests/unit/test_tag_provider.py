@@ -139,7 +139,9 @@ class TestTagProviderBasics:
         await tag_provider.stop()
 
         # Verify unsubscribe was called
-        mock_mqtt_client.unsubscribe.assert_called_once_with("test/topic")
+        mock_mqtt_client.unsubscribe.assert_called_once_with(
+            "test/topic", tag_provider._on_message
+        )
 
         # Verify state cleared
         assert len(tag_provider._configs) == 0
@@ -536,8 +538,8 @@ class TestBufferTimeout:
 
         await tag_provider.stop()
 
-    async def test_timeout_loop_runs(self, tag_provider, mock_char_repo):
-        """Test that timeout loop starts and stops correctly."""
+    async def test_timeout_scheduler_runs(self, tag_provider, mock_char_repo):
+        """Test that the timeout scheduler starts and stops correctly."""
         # Setup
         mock_char_repo.get_by_provider_type = AsyncMock(return_value=[])
 
@@ -545,15 +547,14 @@ class TestBufferTimeout:
         await tag_provider.start()
         await asyncio.sleep(0.1)
 
-        # Verify timeout task is running
-        assert tag_provider._timeout_task is not None
-        assert not tag_provider._timeout_task.done()
+        # Verify timeout scheduler is running
+        assert tag_provider._deadlines.is_running
 
         # Stop provider
         await tag_provider.stop()
 
-        # Verify timeout task is cancelled
-        assert tag_provider._timeout_task.done()
+        # Verify timeout scheduler is stopped
+        assert not tag_provider._deadlines.is_running
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,139 @@
+"""Tests for the MQTT subscription topic trie."""
+
+import random
+from unittest.mock import AsyncMock
+
+import pytest
+
+from openspc.mqtt.client import MQTTClient, MQTTConfig
+from openspc.mqtt.topic_trie import TopicTrie
+
+
+def _cb(name: str) -> AsyncMock:
+    """Named async callback stand-in."""
+    return AsyncMock(name=name)
+
+
+class TestTopicTrie:
+
+    def test_literal_and_wildcards(self):
+        trie = TopicTrie()
+        exact, plus, multi, root = _cb("exact"), _cb("plus"), _cb("multi"), _cb("root")
+        trie.insert("plant/line1/temp", exact)
+        trie.insert("plant/+/temp", plus)
+        trie.insert("plant/#", multi)
+        trie.insert("#", root)
+
+        assert set(trie.match("plant/line1/temp")) == {exact, plus, multi, root}
+        assert set(trie.match("plant/line2/temp")) == {plus, multi, root}
+        assert set(trie.match("plant")) == {multi, root}
+        assert set(trie.match("other/x")) == {root}
+
+    def test_matches_pairwise_check(self):
+        rng = random.Random(7)
+        levels = ["a", "b", "c"]
+        patterns = set()
+        for _ in range(200):
+            depth = rng.randint(1, 4)
+            parts = [rng.choice(levels + ["+"]) for _ in range(depth)]
+            if rng.random() < 0.3:
+                parts[-1] = "#"
+            patterns.add("/".join(parts))
+        trie = TopicTrie()
+        callbacks = {pattern: _cb(pattern) for pattern in patterns}
+        for pattern, callback in callbacks.items():
+            trie.insert(pattern, callback)
+
+        for _ in range(300):
+            topic = "/".join(rng.choice(levels) for _ in range(rng.randint(1, 5)))
+            expected = {
+                callbacks[p] for p in patterns if MQTTClient._topic_matches(p, topic)
+            }
+            assert set(trie.match(topic)) == expected, topic
+
+    def test_several_callbacks_per_pattern(self):
+        trie = TopicTrie()
+        first, second = _cb("first"), _cb("second")
+
+        assert trie.insert("a/b", first) is True
+        assert trie.insert("a/b", second) is False
+        assert trie.insert("a/b", second) is False
+
+        assert trie.match("a/b") == (first, second)
+        assert trie.remove("a/b", first) is False
+        assert trie.match("a/b") == (second,)
+        assert trie.remove("a/b", second) is True
+        assert "a/b" not in trie
+        assert trie.match("a/b") == ()
+
+    def test_remove_prunes_and_keeps_other_patterns(self):
+        trie = TopicTrie()
+        trie.insert("a/b/c", _cb("deep"))
+        shallow = _cb("shallow")
+        trie.insert("a/b", shallow)
+
+        assert trie.remove("a/b/c") is True
+        assert trie.match("a/b") == (shallow,)
+        assert trie.remove("a/b") is True
+        assert trie._root.children == {}
+        assert trie.remove("a/b") is False
+
+    def test_cache_invalidated_on_change(self):
+        trie = TopicTrie()
+        first, second = _cb("first"), _cb("second")
+        trie.insert("a/+", first)
+        trie.match("a/x")
+        trie.match("a/x")
+        assert trie.cache_hits == 1
+
+        trie.insert("a/x", second)
+
+        assert set(trie.match("a/x")) == {first, second}
+
+    def test_cache_bounded(self):
+        trie = TopicTrie(cache_size=2)
+        trie.insert("#", _cb("all"))
+        for topic in ("a", "b", "c"):
+            trie.match(topic)
+
+        assert trie.get_stats()["cached_topics"] == 2
+
+    def test_iterates_patterns_in_order(self):
+        trie = TopicTrie()
+        for pattern in ("z", "a/#", "m/+"):
+            trie.insert(pattern, _cb(pattern))
+
+        assert list(trie) == ["z", "a/#", "m/+"]
+        assert len(trie) == 3
+
+
+class TestClientDispatch:
+
+    @pytest.mark.asyncio
+    async def test_shared_topic_keeps_other_subscriber(self):
+        client = MQTTClient(MQTTConfig())
+        client._connected = True
+        client._client = AsyncMock()
+        provider, preview = _cb("provider"), _cb("preview")
+
+        await client.subscribe("plant/temp", provider)
+        await client.subscribe("plant/temp", preview)
+        await client.unsubscribe("plant/temp", preview)
+
+        client._client.subscribe.assert_awaited_once_with("plant/temp")
+        client._client.unsubscribe.assert_not_called()
+        assert client.subscribed_topics == ["plant/temp"]
+
+        await client.unsubscribe("plant/temp", provider)
+        client._client.unsubscribe.assert_awaited_once_with("plant/temp")
+        assert client.subscribed_topics == []
+
+    @pytest.mark.asyncio
+    async def test_many_topics(self):
+        client = MQTTClient(MQTTConfig())
+        callback = _cb("tag")
+        for i in range(10000):
+            await client.subscribe(f"plant/line{i % 100}/tag{i}", callback)
+
+        assert client._subscriptions.match("plant/line42/tag4242") == (callback,)
+        assert client._subscriptions.match("plant/line43/tag4242") == ()
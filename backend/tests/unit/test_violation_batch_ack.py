@@ -0,0 +1,278 @@
+"""Tests for cached hierarchy paths and set-based batch acknowledgement."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.api.schemas.hierarchy import HierarchyUpdate
+from openspc.api.schemas.violation import BatchAcknowledgeRequest
+from openspc.api.v1.hierarchy import delete_hierarchy_node, update_hierarchy_node
+from openspc.api.v1.violations import batch_acknowledge, list_violations
+from openspc.core.alerts.manager import AlertManager
+from openspc.core.engine.group_commit import sample_writer
+from openspc.core.hierarchy_cache import HierarchyPathCache, hierarchy_path_cache
+from openspc.db.models.plant import Plant
+from openspc.db.models.sample import Sample
+from openspc.db.models.violation import Violation
+from openspc.db.repositories import (
+    CharacteristicRepository,
+    HierarchyRepository,
+    SampleRepository,
+    ViolationRepository,
+)
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+
+def _user(role: str, plant_id: int) -> SimpleNamespace:
+    """User with one plant role."""
+    return SimpleNamespace(
+        plant_roles=[SimpleNamespace(plant_id=plant_id, role=SimpleNamespace(value=role))]
+    )
+
+
+@pytest.fixture
+async def plant_data(async_session: AsyncSession) -> dict:
+    """Two plants, each Site > Line > Cell with one characteristic and violations."""
+    hierarchy = HierarchyRepository(async_session)
+    chars = CharacteristicRepository(async_session)
+    samples = SampleRepository(async_session)
+    violations = ViolationRepository(async_session)
+    data: dict = {"plants": [], "chars": [], "violations": [], "cells": []}
+    for p in range(2):
+        plant = Plant(name=f"Plant {p}", code=f"P{p}")
+        async_session.add(plant)
+        await async_session.flush()
+        site = await hierarchy.create_in_plant(plant.id, name=f"Site {p}", type="Site")
+        line = await hierarchy.create_in_plant(
+            plant.id, name="Line", type="Line", parent_id=site.id
+        )
+        cell = await hierarchy.create_in_plant(
+            plant.id, name="Cell", type="Cell", parent_id=line.id
+        )
+        char = await chars.create(hierarchy_id=cell.id, name=f"C{p}", subgroup_size=1)
+        created = await samples.create_many_with_measurements([
+            {"char_id": char.id, "values": [10.0], "timestamp": START + timedelta(minutes=i)}
+            for i in range(5)
+        ])
+        rows = await violations.create_many([
+            {"sample_id": s.id, "char_id": char.id, "rule_id": 1, "severity": "CRITICAL"}
+            for s in created
+        ])
+        data["plants"].append(plant.id)
+        data["chars"].append(char.id)
+        data["cells"].append(cell.id)
+        data["violations"].append([v.id for v in rows])
+    await async_session.commit()
+    return data
+
+
+class TestHierarchyPathCache:
+
+    @pytest.mark.asyncio
+    async def test_paths_from_one_node_map_per_plant(
+        self, count_statements, async_session, plant_data
+    ):
+        cache = HierarchyPathCache()
+        repo = HierarchyRepository(async_session)
+
+        with count_statements() as statements:
+            paths = await cache.get_paths(repo, plant_data["cells"] + [999])
+        # Plant lookup plus one node map per plant
+        assert len(statements) == 3
+        assert paths == {
+            plant_data["cells"][0]: "Site 0 > Line > Cell",
+            plant_data["cells"][1]: "Site 1 > Line > Cell",
+        }
+
+        with count_statements() as statements:
+            assert await cache.get_path(repo, plant_data["cells"][0]) == "Site 0 > Line > Cell"
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads_plant(self, async_session, plant_data):
+        cache = HierarchyPathCache()
+        repo = HierarchyRepository(async_session)
+        cell_id = plant_data["cells"][0]
+        await cache.get_path(repo, cell_id)
+
+        node = await repo.get_by_id(cell_id)
+        line = await repo.get_by_id(node.parent_id)
+        await repo.update(line.id, name="Line A")
+        await async_session.commit()
+
+        assert await cache.get_path(repo, cell_id) == "Site 0 > Line > Cell"
+        cache.invalidate(plant_data["plants"][0])
+        assert await cache.get_path(repo, cell_id) == "Site 0 > Line A > Cell"
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, async_session, plant_data):
+        cache = HierarchyPathCache(ttl_seconds=0.01)
+        repo = HierarchyRepository(async_session)
+        await cache.get_path(repo, plant_data["cells"][0])
+
+        time.sleep(0.02)
+        await cache.get_path(repo, plant_data["cells"][0])
+
+        assert cache.misses == 2
+
+
+@pytest.mark.asyncio
+class TestHierarchyEndpointsInvalidate:
+
+    @pytest.mark.asyncio
+    async def test_rename_invalidates_after_commit(
+        self, monkeypatch, async_session, plant_data
+    ):
+        in_transaction: list[bool] = []
+        monkeypatch.setattr(
+            hierarchy_path_cache,
+            "invalidate",
+            lambda plant_id: in_transaction.append(async_session.in_transaction()),
+        )
+        repo = HierarchyRepository(async_session)
+
+        await update_hierarchy_node(
+            plant_data["cells"][0], HierarchyUpdate(name="Cell 1"), repo=repo, _user=None
+        )
+        await delete_hierarchy_node(plant_data["cells"][1], repo=repo, _user=None)
+
+        # A concurrent request cannot reload the pre-commit names
+        assert in_transaction == [False, False]
+
+
+class TestListViolationsHierarchy:
+
+    async def test_paths_resolved_without_ancestor_walks(
+        self, count_statements, async_session, plant_data
+    ):
+        params = dict(
+            characteristic_id=None, sample_id=None, acknowledged=None,
+            requires_acknowledgement=None, severity=None, rule_id=None,
+            start_date=None, end_date=None, offset=0, limit=100, page=None, per_page=None,
+        )
+        repo = ViolationRepository(async_session)
+
+        result = await list_violations(
+            repo=repo, session=async_session, _user=MagicMock(), **params
+        )
+        assert {item.hierarchy_path for item in result.items} == {
+            "Site 0 > Line > Cell", "Site 1 > Line > Cell",
+        }
+
+        with count_statements() as statements:
+            await list_violations(
+                repo=repo, session=async_session, _user=MagicMock(), **params
+            )
+        assert not any("FROM hierarchy" in s for s in statements)
+
+
+@pytest.mark.asyncio
+class TestBatchAcknowledge:
+
+    async def _ack(self, session, violation_ids, user, exclude_sample=False, notifier=None):
+        manager = AlertManager(ViolationRepository(session), SampleRepository(session))
+        if notifier is not None:
+            manager.add_notifier(notifier)
+        return await batch_acknowledge(
+            request=BatchAcknowledgeRequest(
+                violation_ids=violation_ids,
+                user="operator",
+                reason="Sensor glitch",
+                exclude_sample=exclude_sample,
+            ),
+            manager=manager,
+            repo=ViolationRepository(session),
+            session=session,
+            _user=user,
+        )
+
+    async def test_partial_success(self, async_session, plant_data):
+        own, other = plant_data["violations"]
+        await self._ack(async_session, own[:1], _user("supervisor", plant_data["plants"][0]))
+
+        result = await self._ack(
+            async_session,
+            [own[0], own[1], own[1], other[0], 999],
+            _user("supervisor", plant_data["plants"][0]),
+        )
+
+        assert result.successful == 1
+        assert result.acknowledged == [own[1]]
+        assert result.errors == {
+            own[0]: f"Violation {own[0]} is already acknowledged",
+            own[1]: f"Violation {own[1]} is already acknowledged",
+            other[0]: "supervisor or higher privileges required for this plant",
+            999: "Violation 999 not found",
+        }
+        # The repeated ID reports its second occurrence as already acknowledged
+        assert [r.success for r in result.results] == [False, True, False, False, False]
+
+        violation = await ViolationRepository(async_session).get_by_id(own[1])
+        await async_session.refresh(violation)
+        assert violation.acknowledged
+        assert violation.ack_user == "operator"
+        assert violation.ack_reason == "Sensor glitch"
+
+    async def test_operator_role_rejected(self, async_session, plant_data):
+        result = await self._ack(
+            async_session, plant_data["violations"][0], _user("operator", plant_data["plants"][0])
+        )
+
+        assert result.successful == 0
+        assert len(result.errors) == len(plant_data["violations"][0])
+
+    async def test_exclude_sample_and_bulk_notification(
+        self, monkeypatch, async_session, plant_data
+    ):
+        invalidate = AsyncMock()
+        monkeypatch.setattr(sample_writer, "invalidate", invalidate)
+        notifier = MagicMock()
+        notifier.notify_violations_acknowledged = AsyncMock()
+        ids = plant_data["violations"][0]
+
+        await self._ack(
+            async_session, ids, _user("admin", 0), exclude_sample=True, notifier=notifier
+        )
+
+        excluded = (await async_session.execute(
+            select(func.count()).select_from(Sample).where(Sample.is_excluded == True)
+        )).scalar_one()
+        assert excluded == len(ids)
+        notifier.notify_violations_acknowledged.assert_awaited_once()
+        events = notifier.notify_violations_acknowledged.await_args.args[0]
+        assert [e.violation_id for e in events] == ids
+        # The live writer must not keep evaluating rules on the excluded samples
+        invalidate.assert_awaited_once_with(plant_data["chars"][0])
+
+    async def test_large_batch_is_set_based(self, count_statements, async_session, plant_data):
+        sample_ids = (await async_session.execute(select(Sample.id))).scalars().all()
+        async_session.add_all([
+            Violation(sample_id=sample_ids[i % len(sample_ids)], rule_id=2, severity="WARNING")
+            for i in range(5000)
+        ])
+        await async_session.commit()
+        ids = (await async_session.execute(
+            select(Violation.id).where(Violation.rule_id == 2)
+        )).scalars().all()
+
+        started = time.perf_counter()
+        with count_statements() as statements:
+            result = await self._ack(async_session, list(ids), _user("admin", 0))
+        elapsed = time.perf_counter() - started
+
+        assert result.successful == 5000
+        # One SELECT and one UPDATE per chunk of 500 IDs, plus the commit
+        assert len(statements) <= 2 * 10 + 1
+        assert elapsed < 1.0
+        remaining = (await async_session.execute(
+            select(func.count()).select_from(Violation)
+            .where(Violation.rule_id == 2, Violation.acknowledged == False)
+        )).scalar_one()
+        assert remaining == 0
@@ -0,0 +1,212 @@
+"""Tests for SQL-side violation statistics and the daily violation rollup."""
+
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import Update, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.core.alerts.manager import AlertManager
+from openspc.core.engine.nelson_rules import RuleResult, Severity
+from openspc.db.models.sample import Sample
+from openspc.db.models.violation import ViolationDailyRollup
+from openspc.db.repositories import (
+    CharacteristicRepository,
+    HierarchyRepository,
+    SampleRepository,
+    ViolationRepository,
+)
+from openspc.db.repositories.sample import sample_day
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+
+@pytest.fixture
+async def char_ids(async_session: AsyncSession) -> list[int]:
+    """Two characteristics with violations every 6 hours over 5 days."""
+    site = await HierarchyRepository(async_session).create(
+        name="Site", type="Site", parent_id=None
+    )
+    chars = CharacteristicRepository(async_session)
+    samples = SampleRepository(async_session)
+    violations = ViolationRepository(async_session)
+    ids = []
+    for c in range(2):
+        char = await chars.create(hierarchy_id=site.id, name=f"C{c}", subgroup_size=1)
+        created = await samples.create_many_with_measurements([
+            {"char_id": char.id, "values": [10.0], "timestamp": START + timedelta(hours=6 * i)}
+            for i in range(20)
+        ])
+        await violations.create_many([
+            {
+                "sample_id": sample.id,
+                "char_id": char.id,
+                "rule_id": 1 + i % 3,
+                "severity": "CRITICAL" if i % 3 == 0 else "WARNING",
+                "acknowledged": i % 4 == 0,
+                "requires_acknowledgement": i % 5 != 0,
+            }
+            for i, sample in enumerate(created)
+        ])
+        ids.append(char.id)
+    await async_session.commit()
+    return ids
+
+
+async def _stats(session, use_rollup, **kwargs):
+    manager = AlertManager(
+        ViolationRepository(session), SampleRepository(session), use_rollup=use_rollup
+    )
+    return await manager.get_violation_stats(**kwargs)
+
+
+@pytest.mark.asyncio
+class TestViolationStats:
+
+    @pytest.mark.parametrize("use_rollup", [False, True])
+    async def test_counts(self, async_session, char_ids, use_rollup):
+        stats = await _stats(async_session, use_rollup, characteristic_id=char_ids[0])
+
+        assert stats.total == 20
+        assert stats.by_rule == {1: 7, 2: 7, 3: 6}
+        assert stats.by_severity == {"CRITICAL": 7, "WARNING": 13}
+        # Unacknowledged: i % 4 != 0; informational among them: i % 5 == 0
+        assert stats.unacknowledged == 12
+        assert stats.informational == 3
+
+    @pytest.mark.parametrize(
+        "start_date, end_date",
+        [
+            (None, None),
+            (START + timedelta(hours=7), START + timedelta(days=3, hours=13)),
+            (START + timedelta(days=1), START + timedelta(days=3)),
+            (START + timedelta(hours=5), START + timedelta(hours=20)),
+            (None, START + timedelta(days=2, hours=1)),
+            (START + timedelta(days=1, hours=12), None),
+        ],
+    )
+    async def test_rollup_matches_live_aggregation(
+        self, async_session, char_ids, start_date, end_date
+    ):
+        for char_id in (char_ids[1], None):
+            live = await _stats(
+                async_session, False,
+                characteristic_id=char_id, start_date=start_date, end_date=end_date,
+            )
+            rolled = await _stats(
+                async_session, True,
+                characteristic_id=char_id, start_date=start_date, end_date=end_date,
+            )
+
+            assert rolled == live
+
+    async def test_no_violation_rows_loaded(self, count_statements, async_session, char_ids):
+        with count_statements() as statements:
+            await _stats(async_session, False)
+
+        assert len(statements) == 1
+        assert "GROUP BY" in statements[0]
+
+    async def test_rollup_rows_per_day(self, async_session, char_ids):
+        rows = (await async_session.execute(
+            select(ViolationDailyRollup.day, ViolationDailyRollup.count)
+            .where(ViolationDailyRollup.char_id == char_ids[0])
+        )).all()
+
+        per_day: dict[date, int] = {}
+        for day, count in rows:
+            per_day[day] = per_day.get(day, 0) + count
+        assert per_day == {START.date() + timedelta(days=d): 4 for d in range(5)}
+
+    async def test_refresh_after_delete(self, async_session, char_ids):
+        sample_repo = SampleRepository(async_session)
+        samples = await sample_repo.get_by_characteristic(char_ids[0])
+        day_two = [s for s in samples if s.timestamp.day == 2]
+        for sample in day_two:
+            await async_session.delete(sample)
+        await ViolationRepository(async_session).refresh_rollup(
+            char_ids[0], day_two[0].timestamp, day_two[-1].timestamp
+        )
+        await async_session.commit()
+
+        rolled = await _stats(async_session, True, characteristic_id=char_ids[0])
+        live = await _stats(async_session, False, characteristic_id=char_ids[0])
+
+        assert rolled.total == live.total == 16
+        assert rolled == live
+
+    async def test_concurrent_rollup_insert_falls_back_to_update(
+        self, async_session, char_ids, monkeypatch
+    ):
+        day = START + timedelta(days=10)
+        [sample] = await SampleRepository(async_session).create_many_with_measurements(
+            [{"char_id": char_ids[0], "values": [10.0], "timestamp": day}]
+        )
+        execute = async_session.execute
+        raced = False
+
+        async def racing_execute(statement, *args, **kwargs):
+            nonlocal raced
+            if isinstance(statement, Update) and not raced:
+                # Another transaction creates the row after our UPDATE misses
+                raced = True
+                await execute(insert(ViolationDailyRollup).values(
+                    char_id=char_ids[0], day=day.date(), rule_id=1,
+                    severity="CRITICAL", count=5,
+                ))
+                return SimpleNamespace(rowcount=0)
+            return await execute(statement, *args, **kwargs)
+
+        monkeypatch.setattr(async_session, "execute", racing_execute)
+        await ViolationRepository(async_session).create(
+            sample_id=sample.id, char_id=char_ids[0], rule_id=1, severity="CRITICAL"
+        )
+        monkeypatch.undo()
+        await async_session.commit()
+
+        count = await async_session.scalar(
+            select(ViolationDailyRollup.count).where(
+                ViolationDailyRollup.char_id == char_ids[0],
+                ViolationDailyRollup.day == day.date(),
+            )
+        )
+        assert count == 6
+
+    async def test_alert_manager_rolls_up_sample_once(
+        self, async_session, char_ids, monkeypatch
+    ):
+        [sample] = await SampleRepository(async_session).create_many_with_measurements(
+            [{"char_id": char_ids[0], "values": [10.0], "timestamp": START + timedelta(days=10)}]
+        )
+        violation_repo = ViolationRepository(async_session)
+        add_to_rollup = AsyncMock(wraps=violation_repo.add_to_rollup)
+        monkeypatch.setattr(violation_repo, "add_to_rollup", add_to_rollup)
+        manager = AlertManager(violation_repo, SampleRepository(async_session))
+
+        violations = await manager.create_violations(
+            sample_id=sample.id,
+            characteristic_id=char_ids[0],
+            rule_results=[
+                RuleResult(
+                    rule_id=rule_id, rule_name=f"Rule {rule_id}", triggered=True,
+                    severity=Severity.WARNING, involved_sample_ids=[sample.id], message="",
+                )
+                for rule_id in (2, 3, 5)
+            ],
+        )
+        await async_session.commit()
+
+        add_to_rollup.assert_awaited_once_with(violations)
+        rolled = await _stats(async_session, True, characteristic_id=char_ids[0])
+        assert rolled == await _stats(async_session, False, characteristic_id=char_ids[0])
+        assert rolled.total == 23
+
+
+def test_sample_day_is_utc_on_postgresql():
+    sql = str(select(sample_day(Sample.timestamp)).compile(dialect=postgresql.dialect()))
+
+    assert "CAST(timezone('UTC', sample.timestamp) AS DATE)" in sql
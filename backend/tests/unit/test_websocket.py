@@ -4,6 +4,7 @@ Tests for the ConnectionManager, WebSocket endpoint, and notification helpers.
 """
 
 import asyncio
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -12,10 +13,13 @@ from fastapi import WebSocket
 
 from openspc.api.v1.websocket import (
     ConnectionManager,
+    OutboundQueue,
+    OverflowPolicy,
     WSConnection,
     notify_acknowledgment,
     notify_sample,
     notify_violation,
+    serialize_message,
 )
 
 
@@ -192,11 +196,12 @@ class TestConnectionManager:
 
         message = {"type": "test", "data": "hello"}
         await manager.broadcast_to_characteristic(1, message)
+        await manager.drain()
 
         # Only conn1 and conn2 should receive the message
-        ws1.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
-        ws3.send_json.assert_not_called()
+        ws1.send_text.assert_called_once_with(serialize_message(message))
+        ws2.send_text.assert_called_once_with(serialize_message(message))
+        ws3.send_text.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_broadcast_to_nonexistent_characteristic(self, manager):
@@ -210,7 +215,7 @@ class TestConnectionManager:
         """Test that dead connections are cleaned up during broadcast."""
         ws1 = AsyncMock(spec=WebSocket)
         ws2 = AsyncMock(spec=WebSocket)
-        ws2.send_json.side_effect = Exception("Connection dead")
+        ws2.send_text.side_effect = Exception("Connection dead")
         conn_id1 = "conn-1"
         conn_id2 = "conn-2"
 
@@ -221,6 +226,7 @@ class TestConnectionManager:
 
         message = {"type": "test", "data": "hello"}
         await manager.broadcast_to_characteristic(1, message)
+        await manager.drain()
 
         # conn2 should be disconnected
         assert conn_id1 in manager._connections
@@ -243,10 +249,12 @@ class TestConnectionManager:
 
         message = {"type": "test", "data": "broadcast"}
         await manager.broadcast_to_all(message)
+        await manager.drain()
 
-        ws1.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
-        ws3.send_json.assert_called_once_with(message)
+        payload = serialize_message(message)
+        ws1.send_text.assert_called_once_with(payload)
+        ws2.send_text.assert_called_once_with(payload)
+        ws3.send_text.assert_called_once_with(payload)
 
     @pytest.mark.asyncio
     async def test_update_heartbeat(self, manager, mock_websocket):
@@ -373,6 +381,185 @@ class TestConnectionManager:
         assert subscriptions == set()
 
 
+class TestBackpressuredFanOut:
+    """Tests for per-connection outbound queues and overflow policies."""
+
+    def test_queue_drop_oldest(self):
+        queue = OutboundQueue(maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+        for payload in ("a", "b", "c"):
+            assert queue.put(payload)
+
+        assert len(queue) == 2
+        assert queue.dropped == 1
+        assert list(p for _, p in queue._items) == ["b", "c"]
+
+    def test_queue_coalesce_replaces_same_key(self):
+        queue = OutboundQueue(maxsize=2, policy=OverflowPolicy.COALESCE)
+        queue.put("s1", key=("sample", 1))
+        queue.put("v1", key=None)
+        queue.put("s2", key=("sample", 1))
+
+        assert queue.coalesced == 1
+        assert queue.dropped == 0
+        assert list(p for _, p in queue._items) == ["s2", "v1"]
+
+        # No matching key: falls back to dropping the oldest
+        queue.put("x", key=("sample", 2))
+        assert queue.dropped == 1
+        assert list(p for _, p in queue._items) == ["v1", "x"]
+
+    def test_queue_disconnect_policy_rejects(self):
+        queue = OutboundQueue(maxsize=1, policy=OverflowPolicy.DISCONNECT)
+        assert queue.put("a")
+        assert not queue.put("b")
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self):
+        manager = ConnectionManager(send_queue_size=4)
+        release = asyncio.Event()
+
+        async def stalled_send(_payload):
+            await release.wait()
+
+        slow = AsyncMock(spec=WebSocket)
+        slow.send_text.side_effect = stalled_send
+        fast = AsyncMock(spec=WebSocket)
+        await manager.connect(slow, "slow")
+        await manager.connect(fast, "fast")
+        await manager.subscribe("slow", [1])
+        await manager.subscribe("fast", [1])
+
+        for i in range(10):
+            await asyncio.wait_for(
+                manager.broadcast_to_characteristic(1, {"type": "sample", "n": i}),
+                timeout=0.1,
+            )
+        await asyncio.sleep(0.01)
+
+        assert fast.send_text.call_count == 10
+        stats = manager.get_stats()
+        assert stats["max_queue_depth"] == 4
+        assert stats["messages_dropped"] == 5  # 1 in flight + 4 queued of 10
+
+        release.set()
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_closes_slow_client(self):
+        manager = ConnectionManager(
+            send_queue_size=1, overflow_policy=OverflowPolicy.DISCONNECT
+        )
+        async def stalled_send(_payload):
+            await asyncio.sleep(10)
+
+        slow = AsyncMock(spec=WebSocket)
+        slow.send_text.side_effect = stalled_send
+        await manager.connect(slow, "slow")
+        await manager.subscribe("slow", [1])
+
+        for i in range(3):
+            await manager.broadcast_to_characteristic(1, {"type": "sample", "n": i})
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+        assert "slow" not in manager._connections
+        assert manager.get_stats()["slow_consumer_disconnects"] == 1
+        slow.close.assert_called_once_with(code=1013)
+
+
+class TestBatchSubscriptions:
+    """Tests for "batch" mode subscriptions (samples_batch messages)."""
+
+    @pytest.fixture
+    def manager(self):
+        return ConnectionManager(batch_interval=60)
+
+    @staticmethod
+    def _sample(char_id: int, sample_id: int) -> dict:
+        return {
+            "type": "sample",
+            "characteristic_id": char_id,
+            "sample": {"id": sample_id, "characteristic_id": char_id},
+            "violations": [],
+        }
+
+    @staticmethod
+    def _sent(ws) -> list[dict]:
+        return [json.loads(c.args[0]) for c in ws.send_text.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_batch_mode_sends_one_message_per_tick(self, manager):
+        live = AsyncMock(spec=WebSocket)
+        batched = AsyncMock(spec=WebSocket)
+        await manager.connect(live, "live")
+        await manager.connect(batched, "batched")
+        await manager.subscribe("live", [1])
+        await manager.subscribe("batched", [1], mode="batch")
+
+        for sample_id in (10, 11, 12):
+            await manager.broadcast_to_characteristic(1, self._sample(1, sample_id))
+        await manager.broadcast_to_characteristic(
+            1, {"type": "violation", "violation": {"id": 5, "sample_id": 12}}
+        )
+        await manager.drain()
+
+        assert live.send_text.call_count == 4
+        batched.send_text.assert_not_called()
+
+        manager.flush_batches()
+        await manager.drain()
+
+        assert self._sent(batched) == [{
+            "type": "samples_batch",
+            "characteristic_id": 1,
+            "samples": [
+                {"id": 10, "characteristic_id": 1},
+                {"id": 11, "characteristic_id": 1},
+                {"id": 12, "characteristic_id": 1},
+            ],
+            "violations": [{"id": 5, "sample_id": 12}],
+        }]
+
+        # Next tick only carries what was raised since the last flush
+        await manager.broadcast_to_characteristic(1, self._sample(1, 13))
+        manager.flush_batches()
+        await manager.drain()
+        last = self._sent(batched)[-1]
+        assert [s["id"] for s in last["samples"]] == [13]
+        assert last["violations"] == []
+
+    @pytest.mark.asyncio
+    async def test_other_messages_flush_pending_batch_first(self, manager):
+        ws = AsyncMock(spec=WebSocket)
+        await manager.connect(ws, "conn")
+        await manager.subscribe("conn", [1], mode="batch")
+
+        await manager.broadcast_to_characteristic(1, self._sample(1, 10))
+        await manager.broadcast_to_characteristic(
+            1, {"type": "limits_update", "characteristic_id": 1, "ucl": 3.0}
+        )
+        await manager.drain()
+
+        assert [m["type"] for m in self._sent(ws)] == ["samples_batch", "limits_update"]
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_live_leaves_batch_mode(self, manager):
+        ws = AsyncMock(spec=WebSocket)
+        await manager.connect(ws, "conn")
+        await manager.subscribe("conn", [1], mode="batch")
+        await manager.subscribe("conn", [1])
+
+        await manager.broadcast_to_characteristic(1, self._sample(1, 10))
+        await manager.drain()
+
+        assert [m["type"] for m in self._sent(ws)] == ["sample"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_mode_rejected(self, manager):
+        with pytest.raises(ValueError, match="Unknown subscription mode"):
+            await manager.subscribe("conn", [1], mode="turbo")
+
+
 class TestNotificationHelpers:
     """Tests for notification helper functions."""
 
@@ -0,0 +1,132 @@
+"""Tests for bulk rolling-window loading.
+
+Covers the windowed multi-characteristic query, RollingWindowManager.warm_up(),
+coalescing of concurrent cold loads and SPCEngine.warm_up().
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openspc.core.engine.nelson_rules import NelsonRuleLibrary
+from openspc.core.engine.rolling_window import RollingWindowManager, classify_zone_codes
+from openspc.core.engine.spc_engine import SPCEngine
+from openspc.core.events import EventBus
+from openspc.db.repositories import (
+    CharacteristicRepository,
+    HierarchyRepository,
+    SampleRepository,
+    ViolationRepository,
+)
+
+
+@pytest.fixture
+async def char_ids(async_session: AsyncSession) -> list[int]:
+    """Three characteristics: with limits (n=1), without limits (n=3), empty."""
+    site = await HierarchyRepository(async_session).create(
+        name="Site", type="Site", parent_id=None
+    )
+    chars = CharacteristicRepository(async_session)
+    limited = await chars.create(
+        hierarchy_id=site.id, name="Temp", subgroup_size=1, ucl=106.0, lcl=94.0
+    )
+    subgroups = await chars.create(hierarchy_id=site.id, name="Width", subgroup_size=3)
+    empty = await chars.create(hierarchy_id=site.id, name="Idle", subgroup_size=1)
+
+    samples = SampleRepository(async_session)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(8):
+        sample = await samples.create_with_measurements(
+            char_id=limited.id, values=[100.0 + i], timestamp=start + timedelta(minutes=i)
+        )
+        if i == 6:
+            sample.is_excluded = True
+        await samples.create_with_measurements(
+            char_id=subgroups.id,
+            values=[10.0 + i, 11.0 + i, 12.0 + i],
+            timestamp=start + timedelta(minutes=i),
+        )
+    await async_session.commit()
+    return [limited.id, subgroups.id, empty.id]
+
+
+@pytest.mark.asyncio
+class TestRollingWindowDataMany:
+
+    async def test_matches_single_characteristic_query(self, async_session, char_ids):
+        repo = SampleRepository(async_session)
+
+        bulk = await repo.get_rolling_window_data_many(char_ids, window_size=5)
+
+        assert list(bulk) == char_ids
+        for char_id in char_ids:
+            single = await repo.get_rolling_window_data(char_id, window_size=5)
+            assert bulk[char_id] == single
+        assert [d["mean"] for d in bulk[char_ids[0]]] == [102.0, 103.0, 104.0, 105.0, 107.0]
+        assert (bulk[char_ids[1]][-1]["mean"], bulk[char_ids[1]][-1]["range_value"]) == (18.0, 2.0)
+        assert bulk[char_ids[2]] == []
+
+    async def test_excluded_samples_skipped(self, async_session, char_ids):
+        repo = SampleRepository(async_session)
+
+        data = await repo.get_rolling_window_data_many([char_ids[0]], window_size=3)
+
+        assert [d["mean"] for d in data[char_ids[0]]] == [104.0, 105.0, 107.0]
+
+
+@pytest.mark.asyncio
+class TestWarmUp:
+
+    async def test_warm_up_uses_one_query(self, count_statements, async_session, char_ids):
+        manager = RollingWindowManager(SampleRepository(async_session), window_size=5)
+
+        with count_statements() as statements:
+            loaded = await manager.warm_up(char_ids)
+
+        assert loaded == 3
+        assert len(statements) == 1
+        assert manager.cache_size == 3
+        # Cached windows are served without further queries
+        with count_statements() as statements:
+            window = await manager.get_window(char_ids[1])
+        assert statements == []
+        assert window.size == 5
+
+    async def test_warm_up_skips_cached_windows(self, async_session, char_ids):
+        manager = RollingWindowManager(SampleRepository(async_session))
+        window = await manager.get_window(char_ids[0])
+
+        assert await manager.warm_up(char_ids) == 2
+        assert await manager.get_window(char_ids[0]) is window
+
+    async def test_concurrent_misses_coalesce(self, count_statements, async_session, char_ids):
+        manager = RollingWindowManager(SampleRepository(async_session), window_size=5)
+
+        with count_statements() as statements:
+            windows = await asyncio.gather(*(manager.get_window(c) for c in char_ids))
+
+        assert len(statements) == 1
+        assert [w.size for w in windows] == [5, 5, 0]
+
+    async def test_engine_warm_up_classifies_limited_windows(self, async_session, char_ids):
+        sample_repo = SampleRepository(async_session)
+        manager = RollingWindowManager(sample_repo, window_size=5)
+        engine = SPCEngine(
+            sample_repo=sample_repo,
+            char_repo=CharacteristicRepository(async_session),
+            violation_repo=ViolationRepository(async_session),
+            window_manager=manager,
+            rule_library=NelsonRuleLibrary(),
+            event_bus=EventBus(),
+        )
+
+        assert await engine.warm_up(char_ids + [999]) == 3
+
+        limited = await manager.get_window(char_ids[0])
+        values = limited.get_column("value")
+        expected = classify_zone_codes(values, SPCEngine._boundaries_from_limits(106.0, 94.0))
+        assert limited.is_ready
+        assert limited.get_column("zone").tolist() == expected.tolist()
+        assert not (await manager.get_window(char_ids[1])).is_ready
@@ -378,15 +378,34 @@ export const characteristicApi = {
     limit?: number
     startDate?: string
     endDate?: string
+    maxPoints?: number
   }) => {
     const params = new URLSearchParams()
     if (options?.limit) params.set('limit', String(options.limit))
     if (options?.startDate) params.set('start_date', options.startDate)
     if (options?.endDate) params.set('end_date', options.endDate)
+    if (options?.maxPoints) params.set('max_points', String(options.maxPoints))
     const query = params.toString()
     return fetchApi<ChartData>(`/characteristics/${id}/chart-data${query ? `?${query}` : ''}`)
   },
 
+  getChartDataBatch: (ids: number[], options?: {
+    limit?: number
+    startDate?: string
+    endDate?: string
+    maxPoints?: number
+  }) =>
+    fetchApi<{ charts: ChartData[]; missing_ids: number[] }>('/characteristics/chart-data/batch', {
+      method: 'POST',
+      body: JSON.stringify({
+        characteristic_ids: ids,
+        limit: options?.limit,
+        start_date: options?.startDate,
+        end_date: options?.endDate,
+        max_points: options?.maxPoints,
+      }),
+    }),
+
   recalculateLimits: (id: number, options?: {
     excludeOoc?: boolean
     startDate?: string
@@ -219,6 +219,9 @@ export interface ChartData {
   nominal_subgroup_size: number
   decimal_precision: number
   stored_sigma: number | null
+  // Server-side downsampling (max_points)
+  total_points: number
+  downsampled: boolean
 }
 
 // Violation types
@@ -266,7 +269,9 @@ export interface WSViolationMessage {
 
 export interface WSAckMessage {
   type: 'ack_update'
-  violation_id: number
+  violation_id?: number
+  // Batch acknowledgements send all acknowledged IDs in one message
+  violation_ids?: number[]
   characteristic_id: number
   acknowledged: boolean
   ack_user: string